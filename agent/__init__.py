@@ -3,24 +3,33 @@
 This package contains multi-agent coordination, self-reflection, iterative improvement,
 feedback learning, parallel execution, chain-of-thought reasoning, task planning,
 performance analytics, and specialized agents.
+
+Submodules are imported on first attribute access, so importing the
+package doesn't pull in heavy dependencies (sentence-transformers, FAISS)
+until they are used.
 """
 
-from agent.multi_agent_coordinator import MultiAgentCoordinator
-from agent.self_reflection import SelfReflectionModule
-from agent.iterative_improvement import IterativeImprovementLoop
-from agent.feedback_learning import FeedbackLearningSystem
-from agent.parallel_executor import ParallelToolExecutor
-from agent.chain_of_thought import ChainOfThoughtReasoning
-from agent.task_planner import TaskPlanner
-from agent.performance_analytics import PerformanceAnalytics
+import importlib
+
+_EXPORTS = {
+    "MultiAgentCoordinator": "agent.multi_agent_coordinator",
+    "SelfReflectionModule": "agent.self_reflection",
+    "IterativeImprovementLoop": "agent.iterative_improvement",
+    "FeedbackLearningSystem": "agent.feedback_learning",
+    "ParallelToolExecutor": "agent.parallel_executor",
+    "ChainOfThoughtReasoning": "agent.chain_of_thought",
+    "TaskPlanner": "agent.task_planner",
+    "PerformanceAnalytics": "agent.performance_analytics",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "MultiAgentCoordinator",
-    "SelfReflectionModule",
-    "IterativeImprovementLoop",
-    "FeedbackLearningSystem",
-    "ParallelToolExecutor",
-    "ChainOfThoughtReasoning",
-    "TaskPlanner",
-    "PerformanceAnalytics"
-]
+def __getattr__(name):
+    """Import exports on first access so importing the package stays cheap."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
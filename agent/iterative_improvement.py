@@ -4,25 +4,37 @@ This module enables multi-iteration refinement of responses through continuous
 reflection and improvement cycles. Uses the self-reflection module to analyze
 quality and generate progressively better responses until satisfaction.
 
+Each improvement step is one structured generation that scores the current
+response and writes the improved one, so N iterations cost N + 1 LLM calls
+instead of 2N + 1. The loop stops early on convergence or when the next step
+would overrun a wall-clock budget, and records time and tokens per stage.
+All steps of a session are scored the same way (the combined generation
+also scores the last response, whose draft is dropped), so decline,
+threshold and convergence checks compare like with like.
+
 Example:
     >>> from agent.iterative_improvement import IterativeImprovementLoop
     >>> from agent.self_reflection import SelfReflectionModule
     >>> from core.models import ModelManager
     >>>
     >>> config = {"enabled": True, "max_iterations": 3, "quality_threshold": 0.85}
-    >>> loop = IterativeImprovementLoop(model_manager, reflection_module, config)
+    >>> loop = IterativeImprovementLoop(model_manager, reflection_module, config,
+    ...                                 analytics=analytics)
     >>>
-    >>> # Iteratively improve a response
+    >>> # Iteratively improve a response (recorded in analytics with its stages)
     >>> result = loop.iterate_until_satisfied(query, initial_response, context)
     >>> print(f"Final quality: {result['final_score']}, Iterations: {result['iterations']}")
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+import json
+import time
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
 from core.models import ModelManager
-from agent.self_reflection import SelfReflectionModule
+from agent.self_reflection import SelfReflectionModule, count_tokens, invoke_model
+from agent.performance_analytics import PerformanceAnalytics
 from utils.logger import setup_logger
 
 
@@ -36,6 +48,7 @@ class IterationRecord:
         quality_score: Quality score from reflection
         issues: Issues identified at this iteration
         suggestions: Improvement suggestions
+        scorer: Prompt and model that scored it, e.g. "combined:primary"
         timestamp: When iteration occurred
     """
     iteration: int
@@ -43,9 +56,79 @@ class IterationRecord:
     quality_score: float
     issues: List[str]
     suggestions: List[str]
+    scorer: str = ""
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+@dataclass
+class StageUsage:
+    """Time and tokens spent in one stage of the quality pipeline.
+
+    Attributes:
+        calls: LLM calls made
+        seconds: Wall-clock time
+        tokens: Prompt plus completion tokens
+    """
+    calls: int = 0
+    seconds: float = 0.0
+    tokens: int = 0
+
+
+class QualityBudget:
+    """Wall-clock budget and per-stage accounting for one improvement session.
+
+    Stages are "reflect" (scoring only), "improve" (rewrite only) and
+    "combined" (scoring and rewrite in one generation).
+    """
+
+    def __init__(self, time_budget: float = 0.0):
+        """Start the budget clock.
+
+        Args:
+            time_budget: Seconds allowed (0 = unlimited)
+        """
+        self.time_budget = time_budget
+        self.started = time.monotonic()
+        self.stages: Dict[str, StageUsage] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def record(self, stage: str, seconds: float, tokens: int) -> None:
+        """Add one LLM call to a stage."""
+        usage = self.stages.setdefault(stage, StageUsage())
+        usage.calls += 1
+        usage.seconds += seconds
+        usage.tokens += tokens
+
+    def exhausted(self, calls_needed: int = 1) -> bool:
+        """Whether the next step would overrun the budget.
+
+        The next step is estimated from the average call time so far, so the
+        loop stops before starting a generation it can't finish in time.
+
+        Args:
+            calls_needed: LLM calls the next step makes
+
+        Returns:
+            True if out of time
+        """
+        if not self.time_budget:
+            return False
+        calls = sum(usage.calls for usage in self.stages.values())
+        seconds = sum(usage.seconds for usage in self.stages.values())
+        estimate = seconds / calls * calls_needed if calls else 0.0
+        return self.elapsed + estimate > self.time_budget
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage usage, in the format ``PerformanceAnalytics.record_query(stages=...)`` takes."""
+        return {
+            stage: {**asdict(usage), "seconds": round(usage.seconds, 3)}
+            for stage, usage in self.stages.items()
+        }
+
+
 @dataclass
 class ImprovementSession:
     """Complete record of an improvement session.
@@ -60,6 +143,8 @@ class ImprovementSession:
         initial_score: Starting quality score
         final_score: Final quality score
         improvement: Total improvement (final - initial)
+        stages: Time and tokens per stage
+        budget_exhausted: Whether the time budget stopped the loop
     """
     query: str
     initial_response: str
@@ -70,6 +155,8 @@ class ImprovementSession:
     initial_score: float
     final_score: float
     improvement: float
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    budget_exhausted: bool = False
 
 
 class IterativeImprovementLoop:
@@ -83,7 +170,13 @@ class IterativeImprovementLoop:
     2. Quality excellent (score > threshold, default 0.85)
     3. Converged (improvement < convergence_threshold)
     4. No issues remaining
-    5. Quality declining (current < previous)
+    5. Time budget would be exceeded by the next step
+    6. Quality declining (current < previous)
+
+    With ``combined`` enabled, scoring a response and writing its improved
+    version is one structured generation. Models that don't return the JSON
+    fall back to separate reflect and improve calls for the rest of the
+    session.
 
     Attributes:
         model_manager: Model manager instance
@@ -94,6 +187,9 @@ class IterativeImprovementLoop:
         quality_threshold: Quality score to reach
         convergence_threshold: Min improvement to continue
         convergence_window: Number of scores to compare
+        model: Model alias for improvement generations
+        combined: Whether to score and improve in one generation
+        time_budget: Wall-clock seconds per session (0 = unlimited)
 
     Example:
         >>> loop = IterativeImprovementLoop(model_manager, reflection, config)
@@ -127,12 +223,39 @@ Important:
 
 Provide ONLY the improved response, no meta-commentary."""
 
+    # Combined scoring + improvement prompt template
+    COMBINED_PROMPT = """Review this response, then improve it.
+
+Query: {query}
+
+Response:
+{response}
+
+Context: {context}
+
+Score the response on completeness, clarity, correctness and conciseness
+(0.0-1.0). Possible issues: "incomplete_answer", "unclear_explanation",
+"unused_context", "too_verbose", "missing_code", "no_sources", "incorrect_info".
+
+If the score is below {threshold}, write an improved response that fixes the
+issues while keeping all correct information. Otherwise leave
+"improved_response" empty.
+
+Output ONLY valid JSON in this exact format (no additional text):
+{{
+  "quality_score": 0.7,
+  "issues": ["issue1"],
+  "suggestions": ["suggestion1"],
+  "improved_response": "..."
+}}"""
+
     def __init__(
         self,
         model_manager: ModelManager,
         reflection_module: SelfReflectionModule,
         config: Dict,
-        logging_config: Optional[Dict] = None
+        logging_config: Optional[Dict] = None,
+        analytics: Optional[PerformanceAnalytics] = None
     ):
         """Initialize the iterative improvement loop.
 
@@ -145,17 +268,26 @@ Provide ONLY the improved response, no meta-commentary."""
                 - quality_threshold: Score to reach (default 0.85)
                 - convergence_threshold: Min improvement (default 0.05)
                 - convergence_window: Scores to compare (default 2)
+                - model: Model alias for improvements (default "primary")
+                - combined: Score and improve in one generation (default True)
+                - time_budget: Seconds per session, 0 = unlimited (default 60)
             logging_config: Optional logging configuration dictionary
+            analytics: PerformanceAnalytics each finished session is recorded
+                in, with its per-stage usage (optional)
         """
         self.model_manager = model_manager
         self.reflection_module = reflection_module
         self.config = config
+        self.analytics = analytics
 
         # Configuration parameters
         self.max_iterations = config.get("max_iterations", 3)
         self.quality_threshold = config.get("quality_threshold", 0.85)
         self.convergence_threshold = config.get("convergence_threshold", 0.05)
         self.convergence_window = config.get("convergence_window", 2)
+        self.model = config.get("model", "primary")
+        self.combined = config.get("combined", True)
+        self.time_budget = config.get("time_budget", 60.0)
 
         # Improvement history
         self.improvement_history: List[ImprovementSession] = []
@@ -196,6 +328,9 @@ Provide ONLY the improved response, no meta-commentary."""
             - initial_score: float - Starting quality score
             - final_score: float - Final quality score
             - improvement: float - Total quality improvement
+            - stages: Dict - Calls, seconds and tokens per stage
+            - elapsed: float - Wall-clock seconds
+            - budget_exhausted: bool - Whether the time budget stopped the loop
 
         Example:
             >>> result = loop.iterate_until_satisfied(query, response, context)
@@ -212,20 +347,28 @@ Provide ONLY the improved response, no meta-commentary."""
         quality_scores: List[float] = []
         current_response = initial_response
         converged = False
+        budget = QualityBudget(self.time_budget)
+        # Combined sessions keep scoring on self.model if they fall back to reflection
+        session_state = {
+            "combined": self.combined,
+            "reflect_model": self.model if self.combined else None
+        }
 
-        # Iteration 0: Analyze initial response
-        initial_reflection = self.reflection_module.reflect_on_response(
-            query, current_response, context
+        # Iteration 0: Analyze initial response (and draft its improvement)
+        reflection, draft, scorer = self._assess(
+            query, current_response, context, 1, budget, session_state,
+            improve=max_iterations > 0
         )
-        initial_score = initial_reflection["quality_score"]
+        initial_score = reflection["quality_score"]
         quality_scores.append(initial_score)
 
         iteration_path.append(IterationRecord(
             iteration=0,
             response=current_response,
             quality_score=initial_score,
-            issues=initial_reflection["issues"],
-            suggestions=initial_reflection["suggestions"]
+            issues=reflection["issues"],
+            suggestions=reflection["suggestions"],
+            scorer=scorer
         ))
 
         if self.logger:
@@ -236,50 +379,46 @@ Provide ONLY the improved response, no meta-commentary."""
             if self.logger:
                 self.logger.info("Initial response already excellent, no improvement needed")
 
-            session = ImprovementSession(
-                query=query,
-                initial_response=initial_response,
-                final_response=current_response,
-                iterations=0,
-                improvement_path=iteration_path,
-                converged=True,
-                initial_score=initial_score,
-                final_score=initial_score,
-                improvement=0.0
+            return self._finish_session(
+                query, initial_response, current_response, iteration_path,
+                converged=True, budget=budget, budget_exhausted=False, context=context
             )
-            self.improvement_history.append(session)
-
-            return {
-                "final_response": current_response,
-                "iterations": 0,
-                "improvement_path": [self._iteration_to_dict(rec) for rec in iteration_path],
-                "converged": True,
-                "initial_score": initial_score,
-                "final_score": initial_score,
-                "improvement": 0.0
-            }
 
         # Improvement loop
+        budget_exhausted = False
         for iteration in range(1, max_iterations + 1):
             if self.logger:
                 self.logger.debug(f"Starting iteration {iteration}")
 
             # Check if should continue
-            last_reflection = initial_reflection if iteration == 1 else reflection
-            if not self._should_continue_iteration(iteration, last_reflection, quality_scores):
+            if not self._should_continue_iteration(iteration, reflection, quality_scores):
                 converged = True
                 if self.logger:
                     self.logger.info(f"Stopping at iteration {iteration}: conditions met")
                 break
 
-            # Generate improvement
-            improved_response = self._improve_iteration(
-                query, current_response, last_reflection, iteration
-            )
+            # A drafted improvement only needs scoring; otherwise improve, then score
+            if budget.exhausted(1 if draft is not None else 2):
+                budget_exhausted = True
+                if self.logger:
+                    self.logger.info(
+                        f"Stopping at iteration {iteration}: time budget "
+                        f"({self.time_budget:.0f}s) would be exceeded"
+                    )
+                break
 
-            # Reflect on improved response
-            reflection = self.reflection_module.reflect_on_response(
-                query, improved_response, context
+            # Generate improvement
+            if draft is not None:
+                improved_response = draft
+            else:
+                improved_response = self._improve_iteration(
+                    query, current_response, reflection, iteration, budget
+                )
+
+            # Reflect on improved response, drafting the next one unless this is the last
+            reflection, draft, scorer = self._assess(
+                query, improved_response, context, iteration + 1, budget, session_state,
+                improve=iteration < max_iterations
             )
             current_score = reflection["quality_score"]
             quality_scores.append(current_score)
@@ -290,7 +429,8 @@ Provide ONLY the improved response, no meta-commentary."""
                 response=improved_response,
                 quality_score=current_score,
                 issues=reflection["issues"],
-                suggestions=reflection["suggestions"]
+                suggestions=reflection["suggestions"],
+                scorer=scorer
             ))
 
             if self.logger:
@@ -315,40 +455,268 @@ Provide ONLY the improved response, no meta-commentary."""
                     self.logger.info(f"Quality threshold reached at iteration {iteration}")
                 break
 
-        # Final scores
-        final_score = quality_scores[-1]
+        return self._finish_session(
+            query, initial_response, current_response, iteration_path,
+            converged=converged, budget=budget, budget_exhausted=budget_exhausted, context=context
+        )
+
+    def _finish_session(
+        self,
+        query: str,
+        initial_response: str,
+        final_response: str,
+        iteration_path: List[IterationRecord],
+        converged: bool,
+        budget: QualityBudget,
+        budget_exhausted: bool,
+        context: Optional[Dict] = None
+    ) -> Dict:
+        """Record the session and build the result dictionary.
+
+        With an analytics instance, the session is also recorded there with
+        its per-stage usage.
+
+        Args:
+            query: Original user query
+            initial_response: Starting response
+            final_response: Response returned
+            iteration_path: Iteration records (iteration 0 first)
+            converged: Whether the loop converged
+            budget: Session budget with per-stage usage
+            budget_exhausted: Whether the time budget stopped the loop
+            context: Context of the query (its tool calls are recorded)
+
+        Returns:
+            Result dictionary of iterate_until_satisfied()
+        """
+        initial_score = iteration_path[0].quality_score
+        final_score = iteration_path[-1].quality_score
         improvement = final_score - initial_score
+        stages = budget.to_dict()
 
-        # Create session record
         session = ImprovementSession(
             query=query,
             initial_response=initial_response,
-            final_response=current_response,
+            final_response=final_response,
             iterations=len(iteration_path) - 1,  # Don't count iteration 0
             improvement_path=iteration_path,
             converged=converged,
             initial_score=initial_score,
             final_score=final_score,
-            improvement=improvement
+            improvement=improvement,
+            stages=stages,
+            budget_exhausted=budget_exhausted
         )
         self.improvement_history.append(session)
+        self._record_analytics(session, budget, context or {})
 
         if self.logger:
+            calls = sum(stage["calls"] for stage in stages.values())
             self.logger.info(
                 f"Improvement loop complete: {session.iterations} iterations, "
-                f"+{improvement:.2f} improvement"
+                f"+{improvement:.2f} improvement, {calls} LLM calls in {budget.elapsed:.1f}s"
             )
 
         return {
-            "final_response": current_response,
+            "final_response": final_response,
             "iterations": session.iterations,
             "improvement_path": [self._iteration_to_dict(rec) for rec in iteration_path],
             "converged": converged,
             "initial_score": initial_score,
             "final_score": final_score,
-            "improvement": improvement
+            "improvement": improvement,
+            "stages": stages,
+            "elapsed": budget.elapsed,
+            "budget_exhausted": budget_exhausted
         }
 
+    def _record_analytics(self, session: ImprovementSession, budget: QualityBudget, context: Dict) -> None:
+        """Record a finished session and its stages in the analytics (if any).
+
+        Args:
+            session: Finished session
+            budget: Session budget with per-stage usage
+            context: Context of the query
+        """
+        if self.analytics is None:
+            return
+
+        tools = [call.get("tool", "unknown") for call in context.get("tool_calls") or []]
+        try:
+            self.analytics.record_query(
+                query=session.query,
+                query_type=context.get("query_type", "complex"),
+                response_time=budget.elapsed,
+                tool_calls=tools,
+                tool_times={},
+                reflection_score=session.final_score,
+                iterations=session.iterations,
+                tokens_used=sum(stage["tokens"] for stage in session.stages.values()),
+                stages=session.stages
+            )
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Could not record improvement session: {e}")
+
+    def _assess(
+        self,
+        query: str,
+        response: str,
+        context: Dict,
+        iteration: int,
+        budget: QualityBudget,
+        session_state: Dict[str, bool],
+        improve: bool
+    ) -> Tuple[Dict, Optional[str], str]:
+        """Score a response and, when combined, draft its improvement.
+
+        A combined session runs the combined generation on every step, the
+        last one included, so all its scores come from the same prompt and
+        model.
+
+        Args:
+            query: Original user query
+            response: Response to score
+            context: Additional context
+            iteration: Iteration the draft would be
+            budget: Session budget to record usage in
+            session_state: {"combined": bool, "reflect_model": alias or None};
+                "combined" is cleared when the model doesn't return the
+                combined JSON
+            improve: Whether another improvement may follow (the draft is
+                dropped otherwise)
+
+        Returns:
+            Tuple of (reflection dict, drafted improvement or None, scorer)
+        """
+        if session_state["combined"]:
+            combined = self._reflect_and_improve(query, response, context, budget)
+            if combined is not None:
+                reflection, draft = combined
+                # Nothing to apply if the model left the improvement empty
+                return reflection, (draft or None) if improve else None, f"combined:{self.model}"
+            session_state["combined"] = False
+            if self.logger:
+                self.logger.warning("Combined output not parseable, using separate reflect/improve calls")
+
+        model = session_state["reflect_model"]
+        start = time.monotonic()
+        reflection = self.reflection_module.reflect_on_response(query, response, context, model=model)
+        budget.record("reflect", time.monotonic() - start, reflection.get("tokens", 0))
+        return reflection, None, f"reflect:{model}" if model else "reflect"
+
+    def _reflect_and_improve(
+        self,
+        query: str,
+        response: str,
+        context: Dict,
+        budget: QualityBudget
+    ) -> Optional[Tuple[Dict, str]]:
+        """Score a response and write its improvement in one generation.
+
+        Args:
+            query: Original user query
+            response: Response to score and improve
+            context: Additional context
+            budget: Session budget to record usage in
+
+        Returns:
+            Tuple of (reflection dict, improved response or ""), or None if
+            the call failed or its output wasn't the expected JSON
+        """
+        prompt = self.COMBINED_PROMPT.format(
+            query=query,
+            response=response,
+            context=self._format_context(context),
+            threshold=self.quality_threshold
+        )
+
+        start = time.monotonic()
+        try:
+            llm_response = invoke_model(self.model_manager, self.model, prompt)
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Combined reflection failed: {e}")
+            return None
+        budget.record("combined", time.monotonic() - start, count_tokens(llm_response, prompt))
+
+        data = self._parse_combined_output(llm_response)
+        if data is None:
+            return None
+
+        issues = data["issues"]
+        reflection = {
+            "quality_score": data["quality_score"],
+            "issues": issues,
+            "suggestions": data["suggestions"],
+            "should_improve": (
+                data["quality_score"] < self.quality_threshold or
+                any(issue in ["incomplete_answer", "incorrect_info"] for issue in issues)
+            )
+        }
+        return reflection, data["improved_response"].strip()
+
+    def _parse_combined_output(self, output: Any) -> Optional[Dict]:
+        """Parse the combined generation's JSON.
+
+        The improved response may contain code with braces, so objects are
+        decoded with ``json.JSONDecoder.raw_decode`` from each "{" rather
+        than matched with a regex.
+
+        Args:
+            output: LLM output
+
+        Returns:
+            Dictionary with quality_score, issues, suggestions and
+            improved_response, or None if no valid object was found
+        """
+        if not isinstance(output, str):
+            return None
+
+        decoder = json.JSONDecoder()
+        position = output.find("{")
+        while position != -1:
+            try:
+                data, _ = decoder.raw_decode(output, position)
+            except json.JSONDecodeError:
+                position = output.find("{", position + 1)
+                continue
+
+            score = data.get("quality_score") if isinstance(data, dict) else None
+            if isinstance(score, (int, float)) and isinstance(data.get("improved_response", ""), str):
+                return {
+                    "quality_score": max(0.0, min(1.0, float(score))),
+                    "issues": [str(i) for i in data.get("issues", []) or []],
+                    "suggestions": [str(s) for s in data.get("suggestions", []) or []],
+                    "improved_response": data.get("improved_response", "") or ""
+                }
+            position = output.find("{", position + 1)
+
+        return None
+
+    def _format_context(self, context: Dict) -> str:
+        """Summarize context (tools used, scalar values) for the combined prompt.
+
+        Args:
+            context: Context dictionary
+
+        Returns:
+            Formatted context string
+        """
+        if not context:
+            return "No additional context"
+
+        parts = []
+        tool_calls = context.get("tool_calls") or []
+        if tool_calls:
+            names = [call.get("tool", "unknown") for call in tool_calls[:3]]
+            parts.append(f"Tools used: {len(tool_calls)} ({', '.join(names)})")
+        for key, value in context.items():
+            if key != "tool_calls" and isinstance(value, (str, int, float)):
+                parts.append(f"{key}: {value}")
+
+        return "\n".join(parts) if parts else "No additional context"
+
     def _should_continue_iteration(
         self,
         iteration: int,
@@ -442,7 +810,8 @@ Provide ONLY the improved response, no meta-commentary."""
         query: str,
         response: str,
         reflection: Dict,
-        iteration: int
+        iteration: int,
+        budget: Optional[QualityBudget] = None
     ) -> str:
         """Generate improved response for current iteration.
 
@@ -451,6 +820,7 @@ Provide ONLY the improved response, no meta-commentary."""
             response: Current response to improve
             reflection: Reflection results with issues/suggestions
             iteration: Current iteration number
+            budget: Optional session budget to record usage in
 
         Returns:
             Improved response string
@@ -458,12 +828,14 @@ Provide ONLY the improved response, no meta-commentary."""
         # Generate iteration-specific prompt
         prompt = self._generate_improvement_prompt(query, response, reflection, iteration)
 
+        start = time.monotonic()
         try:
             # Get improved response from LLM
-            llm = self.model_manager.get_model("primary")
-            llm_response = llm.invoke(prompt)
+            llm_response = invoke_model(self.model_manager, self.model, prompt)
 
-            improved = llm_response.content.strip()
+            improved = llm_response.strip()
+            if budget is not None:
+                budget.record("improve", time.monotonic() - start, count_tokens(llm_response, prompt))
 
             if self.logger:
                 self.logger.debug(f"Generated improved response for iteration {iteration}")
@@ -547,6 +919,7 @@ Provide ONLY the improved response, no meta-commentary."""
             "quality_score": record.quality_score,
             "issues": record.issues,
             "suggestions": record.suggestions,
+            "scorer": record.scorer,
             "timestamp": record.timestamp
         }
 
@@ -7,6 +7,7 @@ Executes independent tools concurrently for faster responses through:
 - Parallel execution of independent tools using ThreadPoolExecutor
 - Sequential execution of dependent tools in correct order
 - Timeout handling and error recovery
+- Per-tool timeouts from learned latencies (optional LatencyModel)
 - Performance statistics tracking
 
 Example:
@@ -23,13 +24,21 @@ Example:
     # All 3 execute concurrently (~3x speedup)
 """
 
+import contextvars
 import time
 from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
-from typing import Dict, List, Any, Callable, Tuple, Set
+from typing import Dict, List, Any, Callable, Tuple, Set, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 import threading
 
+try:
+    from optimization.latency_model import LatencyModel, get_latency_model
+    LATENCY_MODEL_AVAILABLE = True
+except ImportError:
+    LATENCY_MODEL_AVAILABLE = False
+    LatencyModel = None
+
 
 @dataclass
 class ExecutionRecord:
@@ -75,12 +84,20 @@ class ParallelToolExecutor:
     # Tools that execute code (depend on file writes)
     EXECUTORS = {"code_executor"}
 
-    def __init__(self, tools: Dict[str, Callable], config: Dict):
+    def __init__(
+        self,
+        tools: Dict[str, Callable],
+        config: Dict,
+        latency_model: Optional["LatencyModel"] = None
+    ):
         """Initialize parallel tool executor.
 
         Args:
             tools: Dictionary mapping tool names to callable tools
             config: Configuration dictionary with parallel_execution settings
+            latency_model: Model for per-tool timeouts, fed with the measured
+                tool times (if None, the global one when adaptive_timeouts
+                and optimization.query_optimization.latency_model are on)
         """
         self.tools = tools
         self.config = config
@@ -91,6 +108,23 @@ class ParallelToolExecutor:
         self.timeout = parallel_config.get("timeout_per_tool", 30)
         self.fallback_to_sequential = parallel_config.get("fallback_to_sequential", True)
 
+        # Adaptive timeouts: learned p90 x multiplier, within [min_timeout, timeout_per_tool]
+        self.timeout_multiplier = parallel_config.get("timeout_multiplier", 3.0)
+        self.min_timeout = parallel_config.get("min_timeout", 5)
+        self.latency_model = latency_model
+        optimization_config = config.get("optimization", {})
+        query_opt_config = optimization_config.get("query_optimization", {})
+        latency_model_path = query_opt_config.get("latency_model_path") or None
+        self._save_latency_model = False  # Saved on shutdown if this config gives its path
+        if (latency_model is None and LATENCY_MODEL_AVAILABLE
+                and parallel_config.get("adaptive_timeouts", True)
+                and optimization_config.get("enabled", True)
+                and query_opt_config.get("enabled", True)
+                and query_opt_config.get("latency_model", True)):
+            # Same path as the agent's, so the model is persisted whoever creates it
+            self.latency_model = get_latency_model(latency_model_path)
+            self._save_latency_model = latency_model_path is not None
+
         # Thread pool for parallel execution
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
 
@@ -122,10 +156,10 @@ class ParallelToolExecutor:
             args = call.get("args", {})
 
             start_time = time.time()
-            result = self._execute_single_tool(tool_name, args, self.timeout)
+            result = self._execute_single_tool(tool_name, args, self.get_timeout(tool_name, args))
             execution_time = time.time() - start_time
 
-            self._record_tool_time(tool_name, execution_time)
+            self._record_tool_time(tool_name, execution_time, args)
 
             return {tool_name: result}
 
@@ -338,7 +372,7 @@ class ParallelToolExecutor:
             return {}
 
         # Submit all tasks
-        futures: Dict[str, Tuple[Future, Dict, float]] = {}
+        futures: Dict[str, Tuple[Future, Dict, float, float]] = {}
 
         for call in tool_calls:
             tool_name = call["tool"]
@@ -347,27 +381,30 @@ class ParallelToolExecutor:
             # Generate unique key for this call
             call_key = f"{tool_name}_{id(call)}"
 
+            timeout = self.get_timeout(tool_name, args)
             start_time = time.time()
+            # In a copy of the caller's context, so tool logs keep the query id
             future = self.executor.submit(
+                contextvars.copy_context().run,
                 self._execute_single_tool,
                 tool_name,
                 args,
-                self.timeout
+                timeout
             )
 
-            futures[call_key] = (future, call, start_time)
+            futures[call_key] = (future, call, start_time, timeout)
 
         # Collect results
         results = {}
 
-        for call_key, (future, call, start_time) in futures.items():
+        for call_key, (future, call, start_time, timeout) in futures.items():
             tool_name = call["tool"]
 
             try:
-                result = future.result(timeout=self.timeout + 5)
+                result = future.result(timeout=timeout + 5)
                 execution_time = time.time() - start_time
 
-                self._record_tool_time(tool_name, execution_time)
+                self._record_tool_time(tool_name, execution_time, call.get("args", {}))
 
                 # Use tool name as key (may overwrite if same tool called multiple times)
                 results[tool_name] = result
@@ -375,9 +412,10 @@ class ParallelToolExecutor:
             except FutureTimeoutError:
                 with self._lock:
                     self.timeout_count += 1
+                self._record_timeout(tool_name, time.time() - start_time, call.get("args", {}))
 
                 results[tool_name] = {
-                    "error": f"Timeout after {self.timeout}s",
+                    "error": f"Timeout after {timeout:g}s",
                     "tool": tool_name
                 }
             except Exception as e:
@@ -415,10 +453,10 @@ class ParallelToolExecutor:
             args = call.get("args", {})
 
             start_time = time.time()
-            result = self._execute_single_tool(tool_name, args, self.timeout)
+            result = self._execute_single_tool(tool_name, args, self.get_timeout(tool_name, args))
             execution_time = time.time() - start_time
 
-            self._record_tool_time(tool_name, execution_time)
+            self._record_tool_time(tool_name, execution_time, args)
             results[tool_name] = result
 
         return results
@@ -477,23 +515,69 @@ class ParallelToolExecutor:
             args = call.get("args", {})
 
             start_time = time.time()
-            result = self._execute_single_tool(tool_name, args, self.timeout)
+            result = self._execute_single_tool(tool_name, args, self.get_timeout(tool_name, args))
             execution_time = time.time() - start_time
 
-            self._record_tool_time(tool_name, execution_time)
+            self._record_tool_time(tool_name, execution_time, args)
             results[tool_name] = result
 
         return results
 
-    def _record_tool_time(self, tool_name: str, execution_time: float) -> None:
+    def get_timeout(self, tool_name: str, args: Optional[Dict] = None) -> float:
+        """Timeout for a tool call.
+
+        With a latency model, a margin over the tool's learned p90 latency,
+        never longer than timeout_per_tool; otherwise, and after a timeout
+        until the p90 covers the tool's calls again, timeout_per_tool.
+
+        Args:
+            tool_name: Name of tool
+            args: Arguments for the tool (their query, if any, is a model feature)
+
+        Returns:
+            Timeout in seconds
+        """
+        if self.latency_model is None:
+            return self.timeout
+        return self.latency_model.suggest_timeout(
+            tool_name,
+            self._query_of(args),
+            multiplier=self.timeout_multiplier,
+            minimum=min(self.min_timeout, self.timeout),
+            maximum=self.timeout
+        )
+
+    @staticmethod
+    def _query_of(args: Optional[Dict]) -> str:
+        """Query text in a tool call's arguments (empty if none)."""
+        if not isinstance(args, dict):
+            return ""
+        query = args.get("query", "")
+        return query if isinstance(query, str) else ""
+
+    def _record_tool_time(self, tool_name: str, execution_time: float, args: Optional[Dict] = None) -> None:
         """Record execution time for a tool.
 
         Args:
             tool_name: Name of tool
             execution_time: Execution time in seconds
+            args: Arguments the tool ran with
         """
         with self._lock:
             self.tool_execution_times[tool_name].append(execution_time)
+        if self.latency_model is not None and tool_name in self.tools:
+            self.latency_model.observe_tool(tool_name, execution_time, self._query_of(args))
+
+    def _record_timeout(self, tool_name: str, waited: float, args: Optional[Dict] = None) -> None:
+        """Feed a timed-out call to the latency model at the time waited.
+
+        Args:
+            tool_name: Name of tool
+            waited: Seconds waited before giving up (a lower bound of its latency)
+            args: Arguments the tool ran with
+        """
+        if self.latency_model is not None and tool_name in self.tools:
+            self.latency_model.observe_timeout(tool_name, waited, self._query_of(args))
 
     def _record_execution(
         self,
@@ -583,5 +667,10 @@ class ParallelToolExecutor:
             self.error_count = 0
 
     def shutdown(self) -> None:
-        """Shutdown the thread pool executor."""
+        """Shutdown the thread pool executor and persist the latency model."""
         self.executor.shutdown(wait=True)
+        if self._save_latency_model:
+            try:
+                self.latency_model.save()
+            except OSError:
+                pass  # Best effort: the timings are learned again
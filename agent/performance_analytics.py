@@ -8,14 +8,22 @@ Tracks and analyzes agent performance metrics including:
 - Success rates
 - Reflection scores
 - Iterative improvement iterations
+- Time and tokens per quality-pipeline stage (reflect, improve, combined)
+- Latency prediction learned from recorded response and tool times
 - Bottleneck detection
 - Trend analysis
+
+Dashboard aggregates are memoized in a versioned snapshot: every write to
+the metrics bumps ``version``, and ``get_snapshot()`` only rescans the
+metrics when the version changed since the last snapshot, so all Web UI
+charts and the ``/analytics`` endpoint share one computation.
 """
 
 import json
 import csv
 import uuid
 import time
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -24,6 +32,13 @@ from collections import defaultdict
 import tempfile
 import shutil
 
+try:
+    from optimization.latency_model import LatencyModel
+    LATENCY_MODEL_AVAILABLE = True
+except ImportError:
+    LATENCY_MODEL_AVAILABLE = False
+    LatencyModel = None
+
 
 @dataclass
 class MetricRecord:
@@ -40,6 +55,7 @@ class MetricRecord:
     tokens_used: Optional[int] = None  # If available
     success: bool = True
     error: Optional[str] = None
+    stages: Dict[str, Dict[str, float]] = field(default_factory=dict)  # Stage -> calls/seconds/tokens
 
 
 class PerformanceAnalytics:
@@ -64,6 +80,16 @@ class PerformanceAnalytics:
         self.session_start = datetime.now()
         self.metrics_file = self.storage_path / "metrics_db.json"
 
+        # Write counter: bumped under self.lock on every change to self.metrics
+        self.lock = threading.RLock()
+        self.version = 0
+        self._snapshot: Optional[Dict] = None
+        self._snapshot_time = 0.0
+        self._snapshot_lock = threading.Lock()
+        self.snapshot_builds = 0
+        self._metrics_mtime: Optional[int] = None  # Of the file as last loaded or saved
+        self._latency_model: Optional["LatencyModel"] = None
+
         self._load_metrics()
         self._prune_old_metrics()
 
@@ -78,7 +104,8 @@ class PerformanceAnalytics:
         iterations: int = 1,
         tokens_used: Optional[int] = None,
         success: bool = True,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        stages: Optional[Dict[str, Dict[str, float]]] = None
     ) -> str:
         """
         Record query metrics.
@@ -94,6 +121,9 @@ class PerformanceAnalytics:
             tokens_used: Tokens used (if available)
             success: Whether query succeeded
             error: Error message if failed
+            stages: Per-stage usage of the quality pipeline, e.g.
+                {"combined": {"calls": 2, "seconds": 14.2, "tokens": 3100}}
+                (the "stages" of ``iterate_until_satisfied()``)
 
         Returns:
             Metric ID (UUID)
@@ -112,14 +142,18 @@ class PerformanceAnalytics:
             iterations=iterations,
             tokens_used=tokens_used,
             success=success,
-            error=error
+            error=error,
+            stages=stages or {}
         )
 
-        self.metrics.append(record)
-        self._save_metrics()
+        with self.lock:
+            self.metrics.append(record)
+            self.version += 1
+            self._save_metrics()
+            export_due = len(self.metrics) % self.auto_export_interval == 0
 
         # Auto-export if threshold reached
-        if len(self.metrics) % self.auto_export_interval == 0:
+        if export_due:
             self._auto_export()
 
         return metric_id
@@ -129,7 +163,7 @@ class PerformanceAnalytics:
         Get comprehensive analytics dashboard.
 
         Returns:
-            Dashboard with overview, query types, tools, reflection, trends
+            Dashboard with overview, query types, tools, reflection, stages, trends
         """
         if not self.metrics:
             return self._empty_dashboard()
@@ -155,6 +189,9 @@ class PerformanceAnalytics:
         # Reflection analysis
         reflection = self._analyze_reflection()
 
+        # Quality pipeline stages
+        stages = self._analyze_stages()
+
         # Trends
         trends = self._analyze_trends()
 
@@ -163,9 +200,53 @@ class PerformanceAnalytics:
             "query_types": query_types,
             "tools": tools,
             "reflection": reflection,
+            "stages": stages,
             "trends": trends
         }
 
+    def get_snapshot(self, min_interval: float = 0.0) -> Dict:
+        """
+        Get the memoized analytics snapshot shared by all charts.
+
+        The snapshot is rebuilt only when ``version`` changed since the last
+        one. With ``min_interval``, a changed version is also ignored until
+        the snapshot is that old, so bursts of writes cost one rebuild per
+        refresh interval at most.
+
+        Args:
+            min_interval: Seconds a snapshot is reused even if metrics changed
+
+        Metrics written by another process (e.g. the CLI while the API
+        serves the snapshot) are picked up through the file's mtime.
+
+        Returns:
+            JSON-serializable dict with version, generated_at, dashboard and
+            bottlenecks. Shared between callers: do not modify it.
+        """
+        with self._snapshot_lock:
+            self._reload_if_changed()
+            snapshot = self._snapshot
+            if snapshot is not None:
+                if snapshot["version"] == self.version:
+                    return snapshot
+                if time.monotonic() - self._snapshot_time < min_interval:
+                    return snapshot
+
+            # Take the counter with the metrics: a later write forces the next rebuild
+            with self.lock:
+                version = self.version
+                dashboard = self.get_dashboard()
+            snapshot = {
+                "version": version,
+                "generated_at": datetime.now().isoformat(),
+                "dashboard": dashboard,
+                "bottlenecks": self._find_bottlenecks(dashboard["tools"]) if self.metrics else []
+            }
+            self._snapshot = snapshot
+            self._snapshot_time = time.monotonic()
+            self.snapshot_builds += 1
+            return snapshot
+
     def get_tool_performance(self, tool_name: Optional[str] = None) -> Dict:
         """
         Get detailed tool statistics.
@@ -276,13 +357,15 @@ class PerformanceAnalytics:
         Returns:
             List of detected issues
         """
-        bottlenecks = []
-
         if not self.metrics:
-            return bottlenecks
+            return []
+        return self._find_bottlenecks(self.get_tool_performance())
+
+    def _find_bottlenecks(self, tool_perf: Dict) -> List[Dict]:
+        """Detect bottlenecks given already computed tool statistics."""
+        bottlenecks = []
 
         # Check slow tools (> 10s average)
-        tool_perf = self.get_tool_performance()
         for tool, stats in tool_perf.items():
             if stats["avg_time"] > 10.0:
                 bottlenecks.append({
@@ -383,7 +466,7 @@ class PerformanceAnalytics:
                 fieldnames = [
                     "id", "timestamp", "query", "query_type", "response_time",
                     "tool_calls", "tool_times", "reflection_score", "iterations", "tokens_used",
-                    "success", "error"
+                    "success", "error", "stages"
                 ]
 
                 with open(filepath, 'w', newline='') as f:
@@ -395,6 +478,7 @@ class PerformanceAnalytics:
                         # Convert lists/dicts to strings for CSV
                         row["tool_calls"] = ",".join(metric.tool_calls)
                         row["tool_times"] = str(metric.tool_times)
+                        row["stages"] = json.dumps(metric.stages)
                         writer.writerow(row)
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -446,20 +530,23 @@ class PerformanceAnalytics:
 
     def _load_metrics(self) -> None:
         """Load metrics from disk."""
-        if not self.metrics_file.exists():
-            self.metrics = []
-            return
-
-        try:
-            with open(self.metrics_file, 'r') as f:
-                data = json.load(f)
-
-            self.metrics = [
-                MetricRecord(**record) for record in data
-            ]
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Failed to load metrics: {e}")
-            self.metrics = []
+        with self.lock:
+            self.version += 1
+            if not self.metrics_file.exists():
+                self.metrics = []
+                return
+
+            try:
+                with open(self.metrics_file, 'r') as f:
+                    data = json.load(f)
+
+                self.metrics = [
+                    MetricRecord(**record) for record in data
+                ]
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Failed to load metrics: {e}")
+                self.metrics = []
+            self._metrics_mtime = self._file_mtime()
 
     def _save_metrics(self) -> None:
         """Persist metrics to disk with atomic write."""
@@ -476,6 +563,21 @@ class PerformanceAnalytics:
 
         # Atomic rename
         shutil.move(tmp_path, self.metrics_file)
+        self._metrics_mtime = self._file_mtime()
+
+    def _file_mtime(self) -> Optional[int]:
+        """Modification time of the metrics file (None if missing)."""
+        try:
+            return self.metrics_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _reload_if_changed(self) -> None:
+        """Reload metrics another process wrote since the last load or save."""
+        mtime = self._file_mtime()
+        if mtime is not None and mtime != self._metrics_mtime:
+            self._load_metrics()
+            self._prune_old_metrics()
 
     def _prune_old_metrics(self) -> None:
         """Delete metrics older than retention_days."""
@@ -484,14 +586,16 @@ class PerformanceAnalytics:
 
         cutoff = datetime.now() - timedelta(days=self.retention_days)
 
-        original_count = len(self.metrics)
-        self.metrics = [
-            m for m in self.metrics
-            if datetime.fromisoformat(m.timestamp) > cutoff
-        ]
+        with self.lock:
+            original_count = len(self.metrics)
+            self.metrics = [
+                m for m in self.metrics
+                if datetime.fromisoformat(m.timestamp) > cutoff
+            ]
 
-        if len(self.metrics) < original_count:
-            self._save_metrics()
+            if len(self.metrics) < original_count:
+                self.version += 1
+                self._save_metrics()
 
     def _auto_export(self) -> None:
         """Auto-export metrics when threshold reached."""
@@ -544,6 +648,28 @@ class PerformanceAnalytics:
             "count": len(reflection_scores)
         }
 
+    def _analyze_stages(self) -> Dict:
+        """Analyze time and tokens per quality-pipeline stage."""
+        totals = defaultdict(lambda: {"queries": 0, "calls": 0, "seconds": 0.0, "tokens": 0})
+
+        for metric in self.metrics:
+            for stage, usage in metric.stages.items():
+                data = totals[stage]
+                data["queries"] += 1
+                data["calls"] += usage.get("calls", 0)
+                data["seconds"] += usage.get("seconds", 0.0)
+                data["tokens"] += usage.get("tokens", 0)
+
+        result = {}
+        for stage, data in totals.items():
+            result[stage] = {
+                **data,
+                "avg_seconds_per_call": data["seconds"] / data["calls"] if data["calls"] > 0 else 0.0,
+                "avg_tokens_per_query": data["tokens"] / data["queries"]
+            }
+
+        return result
+
     def _analyze_trends(self) -> Dict:
         """Analyze performance trends."""
         # Response time trend (last 10)
@@ -752,15 +878,36 @@ class PerformanceAnalytics:
             }
         }
 
+    def get_latency_model(self) -> Optional["LatencyModel"]:
+        """
+        Get a latency model fit on the recorded metrics.
+
+        The model is created on first use and then only fit on metrics it
+        hasn't seen, so repeated calls are cheap.
+
+        Returns:
+            LatencyModel, or None if the optimization package is unavailable
+        """
+        if not LATENCY_MODEL_AVAILABLE:
+            return None
+        if self._latency_model is None:
+            self._latency_model = LatencyModel()
+        self._latency_model.fit_metrics(self.metrics)
+        return self._latency_model
+
     def predict_performance(self, query: str) -> Dict:
         """
         Predict performance metrics for a query.
 
+        Times come from the latency model once it has learned from enough
+        metrics, and from averages per complexity before that.
+
         Args:
             query: Query text to analyze
 
         Returns:
-            Predicted performance metrics
+            Predicted performance metrics (estimated_time_p90 and
+            estimated_tool_times when the latency model is trained)
         """
         if not self.metrics:
             return {
@@ -811,13 +958,28 @@ class PerformanceAnalytics:
         # Calculate confidence based on historical data similarity
         confidence = min(len(similar_metrics) / 10.0, 1.0)  # Max confidence at 10 similar queries
 
-        return {
+        prediction = {
             "estimated_time": round(estimated_time, 2),
             "estimated_tools": estimated_tools if estimated_tools else ["unknown"],
             "complexity": complexity,
             "confidence": round(confidence, 2)
         }
 
+        # Learned latency distribution replaces the averages when trained
+        model = self.get_latency_model()
+        if model is not None:
+            learned = model.predict_query(query, estimated_tools)
+            if learned["source"] == "model":
+                prediction["estimated_time"] = round(learned["p50"], 2)
+                prediction["estimated_time_p90"] = round(learned["p90"], 2)
+                prediction["confidence"] = round(min(learned["samples"] / 20.0, 1.0), 2)
+            tool_times = {tool: model.predict_tool(tool, query) for tool in estimated_tools}
+            prediction["estimated_tool_times"] = {
+                tool: round(p["p50"], 2) for tool, p in tool_times.items() if p["source"] == "model"
+            }
+
+        return prediction
+
     def generate_report(self, period: str = "week") -> str:
         """
         Generate comprehensive analytics report.
@@ -1021,6 +1183,7 @@ class PerformanceAnalytics:
                 "improvement_rate": 0.0,
                 "count": 0
             },
+            "stages": {},
             "trends": {
                 "response_time_trend": [],
                 "success_rate_trend": [],
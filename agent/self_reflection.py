@@ -8,7 +8,7 @@ Example:
     >>> from agent.self_reflection import SelfReflectionModule
     >>> from core.models import ModelManager
     >>>
-    >>> config = {"enabled": True, "min_quality_threshold": 0.7, "max_iterations": 2}
+    >>> config = {"enabled": True, "min_quality_threshold": 0.7, "max_iterations": 2, "model": "quick"}
     >>> reflection = SelfReflectionModule(model_manager, config)
     >>>
     >>> # Reflect on a response
@@ -27,6 +27,49 @@ from core.models import ModelManager
 from utils.logger import setup_logger
 
 
+def invoke_model(model_manager: ModelManager, alias: str, prompt: str) -> str:
+    """Run a prompt on a model and return the generated text.
+
+    Args:
+        model_manager: Model manager instance
+        alias: Model alias ("primary", "quick", ...) or full name
+        prompt: Prompt to send
+
+    Returns:
+        Generated text (``OllamaLLM.invoke()`` returns a str)
+    """
+    llm = model_manager.get_llm(model_manager.resolve_alias(alias))
+    return llm.invoke(prompt)
+
+
+def count_tokens(llm_response: Any, prompt: str) -> int:
+    """Count the tokens an LLM call used.
+
+    Uses the counts the model reported (LangChain ``usage_metadata`` or
+    Ollama's ``eval_count``), else estimates ~4 characters per token.
+
+    Args:
+        llm_response: Text or message returned by ``llm.invoke()``
+        prompt: Prompt that was sent
+
+    Returns:
+        Prompt plus completion tokens
+    """
+    if isinstance(llm_response, str):
+        return (len(prompt) + len(llm_response)) // 4
+
+    usage = getattr(llm_response, "usage_metadata", None)
+    if isinstance(usage, dict) and usage.get("total_tokens"):
+        return int(usage["total_tokens"])
+
+    metadata = getattr(llm_response, "response_metadata", None)
+    if isinstance(metadata, dict) and "eval_count" in metadata:
+        return int(metadata.get("prompt_eval_count", 0)) + int(metadata["eval_count"])
+
+    content = getattr(llm_response, "content", "")
+    return (len(prompt) + (len(content) if isinstance(content, str) else 0)) // 4
+
+
 @dataclass
 class ReflectionRecord:
     """Record of a single reflection event.
@@ -67,6 +110,7 @@ class SelfReflectionModule:
         reflection_history: List of past reflections
         min_quality_threshold: Minimum acceptable quality score
         max_iterations: Maximum improvement attempts
+        model: Model alias used for scoring (quick model by default)
 
     Example:
         >>> reflection = SelfReflectionModule(model_manager, config)
@@ -135,6 +179,8 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
                 - min_quality_threshold: Score below which to improve (default 0.7)
                 - max_iterations: Maximum improvement attempts (default 2)
                 - auto_reflect_on: Conditions for automatic reflection
+                - model: Model alias for scoring (default "quick"; scoring
+                  doesn't need the primary model)
             logging_config: Optional logging configuration dictionary
         """
         self.model_manager = model_manager
@@ -144,6 +190,7 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
         self.min_quality_threshold = config.get("min_quality_threshold", 0.7)
         self.max_iterations = config.get("max_iterations", 2)
         self.auto_reflect_on = config.get("auto_reflect_on", {})
+        self.model = config.get("model", "quick")
 
         # Reflection history
         self.reflection_history: List[ReflectionRecord] = []
@@ -160,7 +207,8 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
         self,
         query: str,
         response: str,
-        context: Dict
+        context: Dict,
+        model: Optional[str] = None
     ) -> Dict:
         """Analyze response quality and identify issues.
 
@@ -172,6 +220,7 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
             query: Original user query
             response: Agent's response to analyze
             context: Additional context (tool calls, conversation history, etc.)
+            model: Model alias to score with (default: the configured model)
 
         Returns:
             Dictionary with:
@@ -179,6 +228,7 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
             - issues: List[str] of identified problems
             - suggestions: List[str] of improvement suggestions
             - should_improve: bool indicating if improvement needed
+            - tokens: int tokens the scoring call used
 
         Example:
             >>> result = reflection.reflect_on_response(query, response, context)
@@ -200,11 +250,10 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
 
         try:
             # Get LLM analysis
-            llm = self.model_manager.get_model("primary")
-            llm_response = llm.invoke(reflection_prompt)
+            llm_response = invoke_model(self.model_manager, model or self.model, reflection_prompt)
 
             # Parse JSON output
-            reflection_data = self._parse_reflection_output(llm_response.content)
+            reflection_data = self._parse_reflection_output(llm_response)
 
             # Determine if improvement needed
             quality_score = reflection_data.get("quality_score", 0.5)
@@ -234,7 +283,8 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
                 "quality_score": quality_score,
                 "issues": issues,
                 "suggestions": suggestions,
-                "should_improve": should_improve
+                "should_improve": should_improve,
+                "tokens": count_tokens(llm_response, reflection_prompt)
             }
 
         except Exception as e:
@@ -246,7 +296,8 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
                 "quality_score": 0.75,
                 "issues": [],
                 "suggestions": [],
-                "should_improve": False
+                "should_improve": False,
+                "tokens": 0
             }
 
     def improve_response(
@@ -287,10 +338,7 @@ Provide ONLY the improved response, no explanations or meta-commentary."""
 
         try:
             # Get improved response from LLM
-            llm = self.model_manager.get_model("primary")
-            llm_response = llm.invoke(improvement_prompt)
-
-            improved_response = llm_response.content.strip()
+            improved_response = invoke_model(self.model_manager, "primary", improvement_prompt).strip()
 
             # Update reflection history
             if self.reflection_history:
@@ -11,11 +11,26 @@ Example:
     >>> spawner = SubAgentSpawner(config, model_manager, tools)
     >>> agent = SubAgent.from_file(".meton/agents/code-reviewer.md")
     >>> result = spawner.spawn(agent, "Review the authentication module")
+    >>>
+    >>> # Independent delegations run concurrently (capped by subagents.max_concurrent)
+    >>> results = spawner.spawn_many([
+    ...     {"agent": "explorer", "task": "Find the retry logic"},
+    ...     {"agent": "code-reviewer", "task": "Review core/models.py"},
+    ... ])
+
+Agent instances are pooled: the compiled graph, tools and logger of a
+sub-agent are kept per (definition, tool set, model) and only the
+conversation is reset between uses.
 """
 
 import uuid
+import contextvars
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -107,12 +122,107 @@ class SubAgentResult:
         )
 
 
+class AgentPool:
+    """Idle sub-agent instances, reused instead of rebuilt per delegation.
+
+    Instances are keyed by (sub-agent definition, tool set, model). A key
+    can hold several idle instances so concurrent delegations to the same
+    sub-agent each get their own. At most ``max_idle`` instances are kept
+    across all keys; the least recently used are dropped first.
+
+    Example:
+        >>> pool = AgentPool(max_idle=4)
+        >>> instance = pool.acquire(key, build_agent)
+        >>> # ... run it ...
+        >>> pool.release(key, instance)
+    """
+
+    def __init__(self, max_idle: int = 8):
+        """Initialize the pool.
+
+        Args:
+            max_idle: Maximum idle instances kept (0 disables pooling)
+        """
+        self.max_idle = max_idle
+        self._idle: "OrderedDict[tuple, List[Any]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def acquire(self, key: tuple, factory) -> Any:
+        """Take an idle instance for a key, or build one.
+
+        Args:
+            key: Pool key
+            factory: Callable building a new instance
+
+        Returns:
+            Agent instance (owned by the caller until released)
+        """
+        with self.lock:
+            instances = self._idle.get(key)
+            if instances:
+                instance = instances.pop()
+                if not instances:
+                    del self._idle[key]
+                self.reused += 1
+                return instance
+
+        # Built outside the lock: compiling a graph shouldn't block other keys
+        instance = factory()
+        with self.lock:
+            self.created += 1
+        return instance
+
+    def release(self, key: tuple, instance: Any) -> None:
+        """Return an instance for reuse.
+
+        Args:
+            key: Key the instance was acquired with
+            instance: Agent instance
+        """
+        with self.lock:
+            self._idle.setdefault(key, []).append(instance)
+            self._idle.move_to_end(key)
+            while self.size() > self.max_idle:
+                oldest_key = next(iter(self._idle))
+                self._idle[oldest_key].pop(0)
+                if not self._idle[oldest_key]:
+                    del self._idle[oldest_key]
+                self.evicted += 1
+
+    def size(self) -> int:
+        """Number of idle instances."""
+        return sum(len(instances) for instances in self._idle.values())
+
+    def clear(self) -> None:
+        """Drop all idle instances."""
+        with self.lock:
+            self._idle.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pool statistics.
+
+        Returns:
+            Idle, created, reused and evicted instance counts
+        """
+        with self.lock:
+            return {
+                "idle": self.size(),
+                "keys": len(self._idle),
+                "created": self.created,
+                "reused": self.reused,
+                "evicted": self.evicted,
+            }
+
+
 class SubAgentSpawner:
     """Spawns and manages sub-agent executions.
 
-    The spawner creates isolated agent instances for each sub-agent
-    execution, with their own conversation context and optionally
-    restricted tools.
+    Each execution gets an isolated conversation and optionally restricted
+    tools. Agent instances come from an AgentPool and are reset between
+    uses; completed results are kept in a bounded history.
 
     Example:
         >>> spawner = SubAgentSpawner(config, model_manager, tools)
@@ -142,6 +252,13 @@ class SubAgentSpawner:
 
         self.logger = logging.getLogger("meton.subagent_spawner")
 
+        subagents_config = config.config.subagents
+        self.pool = AgentPool(max_idle=subagents_config.pool_size)
+        self.max_concurrent = subagents_config.max_concurrent
+        self.history_size = subagents_config.history_size
+        self._agent_logger = None  # Shared by pooled instances, set up on first spawn
+        self._lock = threading.Lock()
+
         # Create tool name -> tool mapping
         self.tool_map = {tool.name: tool for tool in tools}
 
@@ -149,9 +266,9 @@ class SubAgentSpawner:
         self.loader = SubAgentLoader()
         self.loader.discover()
 
-        # Track active and completed executions
-        self.active_agents: Dict[str, SubAgentResult] = {}
-        self.completed_agents: Dict[str, SubAgentResult] = {}
+        # Track running executions (id -> agent name) and recent results
+        self.active_agents: Dict[str, str] = {}
+        self.completed_agents: "OrderedDict[str, SubAgentResult]" = OrderedDict()
 
     def spawn(
         self,
@@ -161,8 +278,9 @@ class SubAgentSpawner:
     ) -> SubAgentResult:
         """Spawn a sub-agent to execute a task.
 
-        Creates an isolated agent instance with its own context and
-        executes the given task.
+        Takes a pooled agent instance for the sub-agent (building one on
+        first use), runs the task with a fresh conversation and returns the
+        instance to the pool.
 
         Args:
             agent: SubAgent definition to use
@@ -170,11 +288,8 @@ class SubAgentSpawner:
             context: Optional additional context to provide
 
         Returns:
-            SubAgentResult with execution results
-
-        Raises:
-            SubAgentSpawnError: If agent cannot be spawned
-            SubAgentExecutionError: If execution fails
+            SubAgentResult with execution results (failures are reported in
+            the result, not raised)
         """
         import time
 
@@ -184,52 +299,30 @@ class SubAgentSpawner:
         self.logger.info(f"Spawning sub-agent '{agent.name}' (id={agent_id})")
 
         start_time = time.time()
+        model_name = self._resolve_model(agent.model)
 
-        try:
-            # Determine which model to use
-            model_name = self._resolve_model(agent.model)
+        with self._lock:
+            self.active_agents[agent_id] = agent.name
 
+        try:
             # Get effective tools for this agent
             effective_tools = self._get_effective_tools(agent)
-
-            # Create isolated conversation
-            isolated_conversation = self._create_isolated_conversation(agent)
-
-            # Create the agent instance
-            from core.agent import MetonAgent
-
-            sub_agent_instance = MetonAgent(
-                config=self.config,
-                model_manager=self.model_manager,
-                conversation=isolated_conversation,
-                tools=effective_tools,
-                verbose=self.verbose
+            key = self._pool_key(agent, effective_tools, model_name)
+            instance = self.pool.acquire(
+                key, lambda: self._create_agent_instance(agent, effective_tools, model_name)
             )
 
-            # Override the system prompt with sub-agent's prompt
-            original_get_system_prompt = sub_agent_instance._get_system_prompt
-
-            def custom_system_prompt():
-                base_prompt = original_get_system_prompt()
-                # Prepend the sub-agent's custom instructions
-                return f"""# Sub-Agent: {agent.name}
-
-{agent.system_prompt}
-
----
-
-{base_prompt}
-"""
-
-            sub_agent_instance._get_system_prompt = custom_system_prompt
-
             # Build full task with context
             full_task = task
             if context:
                 full_task = f"Context:\n{context}\n\nTask:\n{task}"
 
             # Execute the task
-            result = sub_agent_instance.run(full_task)
+            # If run() raises, the instance's state is unknown and it isn't pooled again
+            instance.conversation.clear()
+            result = instance.run(full_task)
+            instance.conversation.clear()
+            self.pool.release(key, instance)
 
             duration = time.time() - start_time
 
@@ -239,21 +332,19 @@ class SubAgentSpawner:
                 agent_name=agent.name,
                 task=task,
                 output=result.get("output", ""),
-                success=True,
+                success=result.get("success", True),
+                error=result.get("error"),
                 tool_calls=result.get("tool_calls", []),
                 iterations=result.get("iterations", 0),
                 duration_seconds=duration,
                 model_used=model_name
             )
 
-            self.completed_agents[agent_id] = agent_result
             self.logger.info(
                 f"Sub-agent '{agent.name}' completed (id={agent_id}, "
                 f"iterations={agent_result.iterations}, duration={duration:.2f}s)"
             )
 
-            return agent_result
-
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(f"Sub-agent '{agent.name}' failed: {e}")
@@ -266,11 +357,55 @@ class SubAgentSpawner:
                 success=False,
                 error=str(e),
                 duration_seconds=duration,
-                model_used=self._resolve_model(agent.model)
+                model_used=model_name
             )
 
-            self.completed_agents[agent_id] = agent_result
-            return agent_result
+        self._record(agent_result)
+        return agent_result
+
+    def spawn_many(
+        self,
+        delegations: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None
+    ) -> List[SubAgentResult]:
+        """Run independent delegations concurrently.
+
+        Args:
+            delegations: Dicts with "agent" (name or SubAgent), "task" and
+                optional "context"
+            max_concurrent: Cap on delegations running at once
+                (default: subagents.max_concurrent)
+
+        Returns:
+            SubAgentResult per delegation, in input order
+
+        Raises:
+            SubAgentSpawnError: If a named agent doesn't exist or is disabled
+                (checked before anything runs)
+        """
+        # Resolve every agent up front so a typo doesn't leave half the work running
+        resolved: List[Tuple[SubAgent, str, Optional[str]]] = []
+        for delegation in delegations:
+            agent = delegation.get("agent")
+            if not isinstance(agent, SubAgent):
+                agent = self._get_agent(agent)
+            resolved.append((agent, delegation.get("task", ""), delegation.get("context")))
+
+        if not resolved:
+            return []
+
+        workers = max(1, min(max_concurrent or self.max_concurrent, len(resolved)))
+        if workers == 1:
+            return [self.spawn(agent, task, context) for agent, task, context in resolved]
+
+        self.logger.info(f"Spawning {len(resolved)} sub-agents ({workers} concurrent)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="subagent") as executor:
+            # Each sub-agent runs in a copy of the caller's context, so its logs keep the query id
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.spawn, agent, task, context)
+                for agent, task, context in resolved
+            ]
+            return [future.result() for future in futures]
 
     def spawn_by_name(
         self,
@@ -291,6 +426,20 @@ class SubAgentSpawner:
         Raises:
             SubAgentSpawnError: If agent not found
         """
+        return self.spawn(self._get_agent(agent_name), task, context)
+
+    def _get_agent(self, agent_name: str) -> SubAgent:
+        """Load an enabled sub-agent definition by name.
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            SubAgent definition
+
+        Raises:
+            SubAgentSpawnError: If agent not found or disabled
+        """
         # Load agent if not already loaded
         agent = self.loader.get_agent(agent_name)
         if not agent:
@@ -302,7 +451,57 @@ class SubAgentSpawner:
         if not agent.enabled:
             raise SubAgentSpawnError(f"Sub-agent is disabled: {agent_name}")
 
-        return self.spawn(agent, task, context)
+        return agent
+
+    def _pool_key(self, agent: SubAgent, tools: List[BaseTool], model_name: str) -> tuple:
+        """Pool key for a sub-agent definition, tool set and model.
+
+        The prompt is hashed so an edited definition gets fresh instances.
+        """
+        prompt_hash = hashlib.sha1(agent.system_prompt.encode("utf-8")).hexdigest()[:12]
+        return (agent.name, agent.version, prompt_hash, tuple(tool.name for tool in tools), model_name)
+
+    def _create_agent_instance(self, agent: SubAgent, tools: List[BaseTool], model_name: str):
+        """Build an agent instance for a sub-agent.
+
+        Args:
+            agent: SubAgent definition
+            tools: Tools the agent can use
+            model_name: Model to reason with
+
+        Returns:
+            MetonAgent with an isolated conversation
+        """
+        from core.agent import MetonAgent
+        from utils.logger import setup_logger
+
+        with self._lock:
+            if self._agent_logger is None:
+                self._agent_logger = setup_logger(
+                    name="meton_subagent",
+                    config=self.config.config.logging.model_dump()
+                )
+
+        return MetonAgent(
+            config=self.config,
+            model_manager=self.model_manager,
+            conversation=self._create_isolated_conversation(agent),
+            tools=tools,
+            verbose=self.verbose,
+            enable_routing=False,  # Delegated tasks always need the full loop
+            model_name=model_name,
+            role_prompt=f"# Sub-Agent: {agent.name}\n\n{agent.system_prompt}",
+            enable_memory=False,  # The delegating agent stores the interaction
+            logger=self._agent_logger
+        )
+
+    def _record(self, result: SubAgentResult) -> None:
+        """Move a finished execution into the bounded result history."""
+        with self._lock:
+            self.active_agents.pop(result.agent_id, None)
+            self.completed_agents[result.agent_id] = result
+            while len(self.completed_agents) > self.history_size:
+                self.completed_agents.popitem(last=False)
 
     def _resolve_model(self, model_choice: str) -> str:
         """Resolve model choice to actual model name.
@@ -366,6 +565,9 @@ class SubAgentSpawner:
             logger=self.logger
         )
 
+        # Sub-agent scratch conversations aren't sessions: keep them off disk
+        isolated_conversation.auto_save = False
+
         # Start fresh session
         isolated_conversation.clear()
 
@@ -405,12 +607,13 @@ class SubAgentSpawner:
         return None
 
     def get_completed_results(self) -> Dict[str, SubAgentResult]:
-        """Get all completed agent results.
+        """Get recent completed agent results (up to subagents.history_size).
 
         Returns:
-            Dictionary of agent_id -> SubAgentResult
+            Dictionary of agent_id -> SubAgentResult, oldest first
         """
-        return self.completed_agents.copy()
+        with self._lock:
+            return dict(self.completed_agents)
 
     def get_result(self, agent_id: str) -> Optional[SubAgentResult]:
         """Get result for a specific agent execution.
@@ -445,7 +648,8 @@ class SubAgentSpawner:
         return (
             f"<SubAgentSpawner("
             f"available={len(self.loader.discovered)}, "
-            f"completed={len(self.completed_agents)})>"
+            f"completed={len(self.completed_agents)}, "
+            f"pooled={self.pool.size()})>"
         )
 
 
@@ -496,6 +700,22 @@ class SubAgentManager:
         """
         return self.spawner.spawn_by_name(agent_name, task, context)
 
+    def delegate_many(
+        self,
+        delegations: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None
+    ) -> List[SubAgentResult]:
+        """Delegate independent tasks to sub-agents concurrently.
+
+        Args:
+            delegations: Dicts with "agent", "task" and optional "context"
+            max_concurrent: Cap on delegations running at once
+
+        Returns:
+            SubAgentResult per delegation, in input order
+        """
+        return self.spawner.spawn_many(delegations, max_concurrent)
+
     def auto_delegate(
         self,
         task: str,
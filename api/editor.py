@@ -0,0 +1,333 @@
+"""
+Editor Service - Low-latency completion and hover for the VS Code extension.
+
+Completions and hovers fire on nearly every keystroke and cursor move, so
+they skip the agent entirely: one quick-model call with a compact prompt,
+no tools, no memory retrieval and nothing written to the conversation.
+
+- A newer request from the same client supersedes older ones of the same
+  kind; superseded requests stop reading the model stream and return
+  ``cancelled``.
+- Results are kept in a small LRU keyed on (file hash, cursor context).
+- Hovers are answered from the symbol index when the word is a known
+  definition, without calling the model.
+- Latency percentiles are reported per kind for ``/status``.
+
+Example:
+    >>> service = EditorService(generate)
+    >>> service.complete(prefix="def add(a, b):\\n    ", language="python")
+    {'items': ['return a + b'], 'cached': False, 'cancelled': False, ...}
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PREFIX_CHARS = 1500  # Code before the cursor sent to the model
+SUFFIX_CHARS = 400  # Code after the cursor sent to the model
+CURSOR = "<CURSOR>"
+KINDS = ("complete", "hover")
+
+
+class EditorServiceError(Exception):
+    """Editor request cannot be served."""
+    pass
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """
+    Nearest-rank percentile.
+
+    Args:
+        values: Samples
+        pct: Percentile (0-100)
+
+    Returns:
+        The percentile, or None without samples
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _digest(*parts: str) -> str:
+    """Short stable hash of text parts."""
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(part.encode("utf-8", "replace"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+def _strip_fences(text: str) -> str:
+    """Remove a surrounding Markdown code fence from a model reply."""
+    lines = text.strip("\n").splitlines()
+    if lines and lines[0].lstrip().startswith("```"):
+        lines = lines[1:]
+        if lines and lines[-1].strip().startswith("```"):
+            lines = lines[:-1]
+    return "\n".join(lines).rstrip()
+
+
+class EditorService:
+    """
+    Completion and hover answers for editors, outside the ReAct loop.
+
+    The model is reached through ``generate(prompt, max_tokens, stop)``,
+    which must return an iterator of text chunks (a streamed quick-model
+    call), so superseded requests can stop early.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str, int, List[str]], Iterable[str]],
+        symbol_lookup: Optional[Callable[[str], List[Dict[str, Any]]]] = None,
+        cache_size: int = 256,
+        completion_max_tokens: int = 64,
+        hover_max_tokens: int = 160,
+        latency_window: int = 200
+    ):
+        """
+        Initialize the editor service.
+
+        Args:
+            generate: Streaming model call (prompt, max_tokens, stop) -> chunks
+            symbol_lookup: Optional name -> definitions lookup used for hovers
+            cache_size: Maximum cached answers
+            completion_max_tokens: Token limit for completions
+            hover_max_tokens: Token limit for hover explanations
+            latency_window: Recent requests kept per kind for percentiles
+        """
+        self.generate = generate
+        self.symbol_lookup = symbol_lookup
+        self.cache_size = cache_size
+        self.completion_max_tokens = completion_max_tokens
+        self.hover_max_tokens = hover_max_tokens
+
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._latest: Dict[tuple, int] = {}
+        self._latencies = {kind: deque(maxlen=latency_window) for kind in KINDS}
+        self._counts = {kind: {"requests": 0, "cache_hits": 0, "cancelled": 0, "errors": 0} for kind in KINDS}
+        self._symbol_hits = 0
+        self.lock = threading.Lock()
+
+    # ========== Requests ==========
+
+    def complete(
+        self,
+        prefix: str,
+        suffix: str = "",
+        language: str = "",
+        file_path: str = "",
+        file_hash: Optional[str] = None,
+        client_id: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Complete the code at the cursor.
+
+        Args:
+            prefix: Text before the cursor
+            suffix: Text after the cursor
+            language: Editor language id
+            file_path: Document path (for cache keys without a file hash)
+            file_hash: Hash of the whole document, sent by the client
+            client_id: Requests from one client supersede each other
+
+        Returns:
+            Dictionary with items, cached, cancelled and latency_ms
+
+        Raises:
+            EditorServiceError: If the model call fails
+        """
+        prefix, suffix = prefix[-PREFIX_CHARS:], suffix[:SUFFIX_CHARS]
+        key = ("complete", file_hash or _digest(file_path, prefix, suffix), _digest(language, prefix, suffix))
+        prompt = (
+            f"Complete the {language or 'code'} at {CURSOR}. "
+            f"Reply with only the code to insert, without explanation or repeating existing code.\n\n"
+            f"{prefix}{CURSOR}{suffix}"
+        )
+
+        def build(text: str) -> Dict[str, Any]:
+            completion = _strip_fences(text)
+            return {"items": [completion] if completion.strip() else []}
+
+        return self._serve("complete", client_id, key, prompt, self.completion_max_tokens,
+                           [CURSOR, "\n\n\n"], build, {"items": []})
+
+    def hover(
+        self,
+        word: str,
+        line: str = "",
+        language: str = "",
+        file_path: str = "",
+        file_hash: Optional[str] = None,
+        client_id: str = "default",
+        use_symbols: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Explain the word under the cursor.
+
+        Args:
+            word: Identifier under the cursor
+            line: Line containing the word
+            language: Editor language id
+            file_path: Document path (for cache keys without a file hash)
+            file_hash: Hash of the whole document, sent by the client
+            client_id: Requests from one client supersede each other
+            use_symbols: Answer from the symbol index when the word is a known definition
+
+        Returns:
+            Dictionary with contents, source ("symbols" or "model"), cached,
+            cancelled and latency_ms
+
+        Raises:
+            EditorServiceError: If the model call fails
+        """
+        if use_symbols and self.symbol_lookup:
+            start = time.perf_counter()
+            try:
+                definitions = self.symbol_lookup(word)
+            except Exception:
+                definitions = []  # Stale or unbuilt index: ask the model instead
+            if definitions:
+                latency = (time.perf_counter() - start) * 1000
+                with self.lock:
+                    # Supersedes a model hover still running for this client
+                    channel = (client_id, "hover")
+                    self._latest[channel] = self._latest.get(channel, 0) + 1
+                    self._counts["hover"]["requests"] += 1
+                    self._symbol_hits += 1
+                    self._latencies["hover"].append(latency)
+                return {"contents": self._format_definitions(definitions), "source": "symbols",
+                        "cached": False, "cancelled": False, "latency_ms": round(latency, 2)}
+
+        line = line.strip()[:300]
+        key = ("hover", file_hash or _digest(file_path, line), _digest(language, word, line))
+        prompt = (
+            f"In one or two sentences, explain what `{word}` is or does in this {language or 'code'} line. "
+            f"No preamble.\n\n{line}"
+        )
+
+        def build(text: str) -> Dict[str, Any]:
+            return {"contents": text.strip(), "source": "model"}
+
+        return self._serve("hover", client_id, key, prompt, self.hover_max_tokens,
+                           ["\n\n"], build, {"contents": "", "source": "model"})
+
+    def _serve(
+        self,
+        kind: str,
+        client_id: str,
+        key: tuple,
+        prompt: str,
+        max_tokens: int,
+        stop: List[str],
+        build: Callable[[str], Dict[str, Any]],
+        empty: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Answer from the cache or one streamed model call, honoring supersession."""
+        start = time.perf_counter()
+        channel = (client_id, kind)
+
+        with self.lock:
+            seq = self._latest.get(channel, 0) + 1
+            self._latest[channel] = seq
+            self._counts[kind]["requests"] += 1
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._counts[kind]["cache_hits"] += 1
+
+        if cached is not None:
+            return self._finish(kind, start, dict(cached, cached=True, cancelled=False))
+
+        chunks = []
+        stream = None
+        if self._latest.get(channel) != seq:
+            return self._cancel(kind, start, empty)  # Superseded while waiting for a worker
+        try:
+            stream = iter(self.generate(prompt, max_tokens, stop))
+            for chunk in stream:
+                if self._latest.get(channel) != seq:
+                    return self._cancel(kind, start, empty)
+                chunks.append(chunk)
+        except Exception as e:
+            with self.lock:
+                self._counts[kind]["errors"] += 1
+            raise EditorServiceError(f"Model call failed: {e}")
+        finally:
+            # Stop reading the model stream (closes the HTTP response)
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+        if self._latest.get(channel) != seq:
+            return self._cancel(kind, start, empty)
+
+        result = build("".join(chunks))
+        with self.lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return self._finish(kind, start, dict(result, cached=False, cancelled=False))
+
+    def _cancel(self, kind: str, start: float, empty: Dict[str, Any]) -> Dict[str, Any]:
+        """Result for a request superseded by a newer one (not counted in latency)."""
+        with self.lock:
+            self._counts[kind]["cancelled"] += 1
+        return dict(empty, cached=False, cancelled=True,
+                    latency_ms=round((time.perf_counter() - start) * 1000, 2))
+
+    def _finish(self, kind: str, start: float, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Record latency and attach it to the result."""
+        latency = (time.perf_counter() - start) * 1000
+        with self.lock:
+            self._latencies[kind].append(latency)
+        result["latency_ms"] = round(latency, 2)
+        return result
+
+    @staticmethod
+    def _format_definitions(definitions: List[Dict[str, Any]]) -> str:
+        """Markdown hover text for symbol index entries."""
+        parts = []
+        for definition in definitions[:3]:
+            text = f"```\n{definition.get('signature') or definition['name']}\n```"
+            if definition.get("docstring"):
+                text += f"\n{definition['docstring'].strip()}"
+            text += f"\n\n*{definition.get('file', '')}:{definition.get('line', '')}*"
+            parts.append(text)
+        return "\n\n---\n\n".join(parts)
+
+    # ========== Stats ==========
+
+    def clear_cache(self) -> None:
+        """Drop all cached answers."""
+        with self.lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request counts and latency percentiles.
+
+        Returns:
+            Per-kind counts with p50/p95 latency (ms), cache size and symbol hits
+        """
+        with self.lock:
+            stats: Dict[str, Any] = {}
+            for kind in KINDS:
+                samples = list(self._latencies[kind])
+                p50, p95 = percentile(samples, 50), percentile(samples, 95)
+                stats[kind] = dict(
+                    self._counts[kind],
+                    p50_ms=round(p50, 2) if p50 is not None else None,
+                    p95_ms=round(p95, 2) if p95 is not None else None
+                )
+            stats["hover"]["symbol_hits"] = self._symbol_hits
+            stats["cache_entries"] = len(self._cache)
+            return stats
@@ -15,18 +15,24 @@ from typing import Optional, Dict, Any, List
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 
 # Import Meton components
+from agent.performance_analytics import PerformanceAnalytics
+from api.editor import EditorService, EditorServiceError
 from cli import MetonCLI
 from core.agent import MetonAgent
 from core.config import ConfigLoader
+from core.models import ModelManager, ModelNotFoundError
 from rag.indexer import CodebaseIndexer
 from rag.embeddings import EmbeddingModel
 from rag.vector_store import VectorStore
 from rag.metadata_store import MetadataStore
+from optimization.resource_monitor import get_resource_monitor, configure_resource_monitor
+from tools.symbol_lookup import SymbolLookupTool
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -48,6 +54,8 @@ app.add_middleware(
 config_loader = ConfigLoader()
 agent: Optional[MetonAgent] = None
 indexer: Optional[CodebaseIndexer] = None
+editor: Optional[EditorService] = None
+analytics: Optional[PerformanceAnalytics] = None
 
 # Pydantic models
 class QueryRequest(BaseModel):
@@ -71,15 +79,93 @@ class SearchRequest(BaseModel):
 class SearchResponse(BaseModel):
     results: List[Dict[str, Any]]
 
+class CompleteRequest(BaseModel):
+    prefix: str
+    suffix: str = ""
+    language: str = ""
+    file_path: str = ""
+    file_hash: Optional[str] = None
+    client_id: str = "default"
+
+class CompleteResponse(BaseModel):
+    items: List[str]
+    cached: bool
+    cancelled: bool
+    latency_ms: float
+
+class HoverRequest(BaseModel):
+    word: str
+    line: str = ""
+    language: str = ""
+    file_path: str = ""
+    file_hash: Optional[str] = None
+    client_id: str = "default"
+    use_symbols: bool = True
+
+class HoverResponse(BaseModel):
+    contents: str
+    source: str
+    cached: bool
+    cancelled: bool
+    latency_ms: float
+
+
+def create_editor_service(loader: ConfigLoader) -> EditorService:
+    """Build the completion/hover service on the quick model, outside the agent.
+
+    The model is resolved and verified once here: requests arrive per
+    keystroke, so they go straight to generation without listing models.
+    """
+    editor_config = loader.config.editor
+    model_manager = ModelManager(loader)
+    model_name = model_manager.resolve_alias(editor_config.model)
+    if not model_manager.check_model_available(model_name):
+        raise ModelNotFoundError(
+            f"Model '{model_name}' not found.\n"
+            f"Pull it with: ollama pull {model_name}"
+        )
+
+    def generate(prompt: str, max_tokens: int, stop: List[str]):
+        return model_manager.generate(
+            prompt, model=model_name, stream=True, verify=False,
+            options={"num_predict": max_tokens, "temperature": 0.2, "stop": stop}
+        )
+
+    symbol_lookup = None
+    if editor_config.hover_symbols:
+        symbol_lookup = SymbolLookupTool(loader).find_definitions
+
+    return EditorService(
+        generate,
+        symbol_lookup=symbol_lookup,
+        cache_size=editor_config.cache_size,
+        completion_max_tokens=editor_config.completion_max_tokens,
+        hover_max_tokens=editor_config.hover_max_tokens
+    )
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize Meton agent on startup."""
-    global agent, indexer
+    global agent, indexer, editor, analytics
 
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
+    # Editor endpoints don't depend on the agent
+    try:
+        editor = create_editor_service(config_loader)
+        logger.info("Editor service initialized")
+    except Exception as e:
+        logger.warning(f"Editor service unavailable: {e}")
+
+    analytics_config = config_loader.config.analytics
+    if analytics_config.enabled:
+        analytics = PerformanceAnalytics(
+            storage_path=analytics_config.storage_path,
+            config=analytics_config.model_dump()
+        )
+
     try:
         # Initialize agent
         config = config_loader.config
@@ -102,6 +188,9 @@ async def startup_event():
         )
         logger.info("Codebase indexer initialized")
 
+        if config.optimization.enabled:
+            configure_resource_monitor(config.optimization.resource_monitoring)
+
     except Exception as e:
         logger.error(f"Failed to initialize Meton: {e}")
         raise
@@ -113,7 +202,8 @@ async def health_check():
     return {
         "status": "ok",
         "agent_initialized": agent is not None,
-        "indexer_initialized": indexer is not None
+        "indexer_initialized": indexer is not None,
+        "editor_initialized": editor is not None
     }
 
 
@@ -135,6 +225,30 @@ async def process_query(request: QueryRequest):
         raise HTTPException(status_code=500, detail=f"Query processing failed: {str(e)}")
 
 
+@app.post("/complete", response_model=CompleteResponse)
+async def complete_code(request: CompleteRequest):
+    """Complete code at the cursor with one quick-model call (no agent loop)."""
+    if not editor:
+        raise HTTPException(status_code=503, detail="Editor service not initialized")
+
+    try:
+        return await run_in_threadpool(editor.complete, **request.model_dump())
+    except EditorServiceError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+@app.post("/hover", response_model=HoverResponse)
+async def hover_info(request: HoverRequest):
+    """Explain the word under the cursor from the symbol index or the quick model."""
+    if not editor:
+        raise HTTPException(status_code=503, detail="Editor service not initialized")
+
+    try:
+        return await run_in_threadpool(editor.hover, **request.model_dump())
+    except EditorServiceError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
 @app.post("/index", response_model=IndexResponse)
 async def index_workspace(request: IndexRequest):
     """Index a codebase directory."""
@@ -197,12 +311,31 @@ async def get_status():
             "file_ops": config.tools.file_ops.enabled,
             "code_executor": config.tools.code_executor.enabled,
             "web_search": config.tools.web_search.enabled,
-            "codebase_search": config.tools.codebase_search.enabled,
-            "git_operations": config.tools.git_operations.enabled
-        }
+            "codebase_search": config.tools.codebase_search.enabled
+        },
+        "editor": editor.get_stats() if editor else None
     }
 
 
+@app.get("/analytics")
+async def get_analytics():
+    """Get the analytics snapshot (dashboard and bottlenecks) the Web UI charts use."""
+    if not analytics:
+        raise HTTPException(status_code=503, detail="Analytics not enabled")
+
+    refresh_interval = config_loader.config.web_ui.analytics.refresh_interval
+    return await run_in_threadpool(analytics.get_snapshot, refresh_interval)
+
+
+@app.get("/resources")
+async def get_resources():
+    """Get process, per-component memory and growth profile."""
+    try:
+        return get_resource_monitor().get_profile()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Resource profiling failed: {str(e)}")
+
+
 def start_server(host: str = "127.0.0.1", port: int = 8000):
     """Start the FastAPI server."""
     uvicorn.run(app, host=host, port=port)
@@ -10,7 +10,7 @@ import signal
 import os
 import json
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from rich.console import Console
@@ -18,6 +18,7 @@ from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.table import Table
 from rich.syntax import Syntax
+from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
 
 from core.config import Config
@@ -36,6 +37,7 @@ from skills.skill_manager import SkillManager
 from agents.subagent_spawner import SubAgentManager
 from hooks import HookManager, HookLoader, Hook, HookType
 from utils.logger import setup_logger
+from optimization.lazy_loader import get_lazy_registry
 
 
 class MetonCLI:
@@ -82,6 +84,7 @@ class MetonCLI:
         self.last_indexed_time: Optional[datetime] = None
         self.indexed_files_count: int = 0
         self.indexed_chunks_count: int = 0
+        self.index_watcher = None  # rag.file_watcher.IndexWatcher while live updates are on
 
         # Setup signal handler
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -165,6 +168,21 @@ class MetonCLI:
                 hook_manager=self.hook_manager
             )
             
+            # Sample process and component memory in the background
+            if self.config.config.optimization.enabled:
+                from optimization.resource_monitor import configure_resource_monitor
+                configure_resource_monitor(self.config.config.optimization.resource_monitoring)
+
+            # The search index (embedding model + FAISS) loads on first search;
+            # register it so it can be prewarmed once the prompt is up
+            if self.config.config.rag.enabled and self.config.config.tools.codebase_search.enabled:
+                get_lazy_registry().register("codebase_index", self.codebase_search_tool._load_indexer)
+
+            # Keep the index current as files change
+            rag_config = self.config.config.rag
+            if rag_config.watch and rag_config.enabled and rag_config.watch_root:
+                self.start_index_watch(rag_config.watch_root, quiet=True)
+
             self.console.print("[green]✓ Initialization complete![/green]\n")
             return True
             
@@ -226,6 +244,7 @@ class MetonCLI:
         table.add_row("/save", "Save conversation")
         table.add_row("/history", "Show conversation history")
         table.add_row("/search <keyword>", "Search conversation history")
+        table.add_row("/search all <query>", "Search all saved conversations (filters: role: since: until: session: source:)")
         table.add_row("/reload", "Reload configuration")
         table.add_row("/tools", "List available tools with status")
         table.add_row("/web [on|off|status]", "Control web search tool")
@@ -237,6 +256,7 @@ class MetonCLI:
         table.add_row("/index status", "Show indexing status and statistics")
         table.add_row("/index clear", "Clear the current index")
         table.add_row("/index refresh", "Re-index the last indexed path")
+        table.add_row("/index watch [on|off]", "Reindex edited files live (or show watcher status)")
         table.add_row("/csearch <query>", "Test semantic code search")
         table.add_row("/find <symbol>", "Find symbol definition (function, class, method)")
 
@@ -308,6 +328,7 @@ class MetonCLI:
         table.add_row("/skill reload <name>", "Reload a skill")
         table.add_row("/skill info <name>", "Show skill information")
         table.add_row("/skill discover", "Rediscover available skills")
+        table.add_row("/skill batch <skill> <dir|glob>", "Run review/refactor/docs over many files")
 
         # Add sub-agents commands section
         table.add_section()
@@ -462,10 +483,12 @@ class MetonCLI:
         elif cmd == '/history':
             self.show_history()
         elif cmd == '/search':
-            if args:
+            if args and args[0].split(maxsplit=1)[0].lower() == 'all':
+                self.search_saved_conversations(args[0][3:].strip())
+            elif args:
                 self.search_conversation(args[0])
             else:
-                self.console.print("[yellow]Usage: /search <keyword>[/yellow]")
+                self.console.print("[yellow]Usage: /search <keyword> | /search all <query> " + escape("[filters]") + "[/yellow]")
         elif cmd == '/reload':
             self.reload_config()
         elif cmd == '/index':
@@ -478,6 +501,8 @@ class MetonCLI:
                     self.index_clear()
                 elif arg == 'refresh' or arg == 'reload':
                     self.index_refresh()
+                elif arg == 'watch':
+                    self.index_watch(args[1] if len(args) > 1 else None)
                 else:
                     # Assume it's a path
                     self.index_codebase(arg)
@@ -791,6 +816,77 @@ class MetonCLI:
         self.console.print(f"[dim]Total matches: {len(matches)}/{len(messages)} messages[/dim]")
         self.console.print()
 
+    def search_saved_conversations(self, args: str):
+        """Search all saved CLI conversations and Web UI sessions."""
+        if not self.conversation:
+            self.console.print("[red]❌ Conversation manager not initialized[/red]")
+            return
+
+        # Split "key:value" filters from query words
+        filter_keys = {'role', 'since', 'until', 'session', 'source'}
+        filters = {}
+        words = []
+        for token in args.split():
+            key, sep, value = token.partition(':')
+            if sep and key.lower() in filter_keys and value:
+                filters['session_id' if key.lower() == 'session' else key.lower()] = value
+            else:
+                words.append(token)
+
+        query = " ".join(words)
+        if not query:
+            self.console.print("[yellow]Usage: /search all <query> " + escape("[role:<role>] [since:<date>] [until:<date>] [session:<id>] [source:cli|web]") + "[/yellow]")
+            return
+
+        search_index = self.conversation.get_search_index()
+        if search_index is None:
+            self.console.print("[yellow]Conversation search index is disabled (conversation.search_index)[/yellow]")
+            return
+
+        try:
+            # Pick up Web UI sessions saved since the last search
+            try:
+                from web.session_manager import SEARCH_SOURCE, read_session_file
+                web_path = Path(self.config.config.web_ui.sessions.storage_path)
+                if web_path.exists():
+                    search_index.sync_files(SEARCH_SOURCE, web_path.glob("session_*.json"), read_session_file)
+            except ImportError:
+                pass
+
+            hits = self.conversation.search_saved(query, **filters)
+        except Exception as e:
+            self.console.print(f"[red]❌ Search failed: {str(e)}[/red]")
+            return
+
+        if not hits:
+            self.console.print(f"[yellow]No saved messages match '{escape(query)}'[/yellow]")
+            return
+
+        from core.conversation_index import SNIPPET_START, SNIPPET_END
+
+        self.console.print()
+        self.console.print(f"[bold cyan]Saved Conversations matching '{escape(query)}' ({len(hits)} results)[/bold cyan]")
+        self.console.print()
+
+        role_colors = {"USER": "cyan", "ASSISTANT": "green", "SYSTEM": "blue", "TOOL": "yellow"}
+        for i, hit in enumerate(hits, 1):
+            role = hit['role'].upper()
+            color = role_colors.get(role, "white")
+
+            # Highlight matched terms without letting message text inject markup
+            snippet = ""
+            for part in hit['snippet'].replace("\n", " ").split(SNIPPET_START):
+                match, sep, rest = part.partition(SNIPPET_END)
+                snippet += f"[bold yellow]{escape(match)}[/bold yellow]{escape(rest)}" if sep else escape(part)
+
+            when = hit['timestamp'][:16].replace('T', ' ')
+            self.console.print(
+                f"[{color}]{i}. {role}[/{color}] [dim]{hit['source']} {hit['session_id'][:8]} {when}[/dim]"
+            )
+            self.console.print(f"   {snippet}")
+
+        self.console.print()
+
     def reload_config(self):
         """Reload configuration from file."""
         try:
@@ -1225,7 +1321,11 @@ class MetonCLI:
             return
         
         try:
-            with self.console.status("[cyan]🤔 Thinking...[/cyan]", spinner="dots"):
+            status = "[cyan]🤔 Thinking...[/cyan]"
+            eta = self.agent.estimate_eta(query)
+            if eta:
+                status += f" [dim](ETA ~{eta['p50']:.0f}s, up to {eta['p90']:.0f}s)[/dim]"
+            with self.console.status(status, spinner="dots"):
                 result = self.agent.run(query)
             
             if result['success']:
@@ -1289,10 +1389,15 @@ class MetonCLI:
             self.console.print(f"[red]❌ Path is not a directory: {path}[/red]")
             return
 
-        # Check for Python files
-        py_files = list(Path(path).rglob("*.py"))
-        if not py_files:
-            self.console.print(f"[yellow]⚠ Warning: No Python files found in {path}[/yellow]")
+        # Check for source files in any supported language
+        from rag.indexer import find_source_files
+        source_files = find_source_files(path)
+        has_documents = False
+        if not source_files and self.config.config.rag.index_documents:
+            from rag.document_ingest import DocumentIngester
+            has_documents = bool(DocumentIngester.find_documents(path))
+        if not source_files and not has_documents:
+            self.console.print(f"[yellow]⚠ Warning: No source files found in {path}[/yellow]")
             response = Prompt.ask("Continue anyway?", choices=["y", "n"], default="n")
             if response.lower() != 'y':
                 return
@@ -1301,7 +1406,7 @@ class MetonCLI:
             start_time = datetime.now()
 
             self.console.print(f"\n[cyan]🔍 Indexing {path}...[/cyan]")
-            self.console.print(f"[dim]Found {len(py_files)} Python files[/dim]\n")
+            self.console.print(f"[dim]Found {len(source_files)} source files[/dim]\n")
 
             # Import RAG components
             from rag.embeddings import EmbeddingModel
@@ -1318,7 +1423,8 @@ class MetonCLI:
                 embedder=embedder,
                 vector_store=vector_store,
                 metadata_store=metadata_store,
-                verbose=False
+                verbose=False,
+                batch_size=self.config.config.rag.embedding_batch_size
             )
 
             # Index with progress display
@@ -1330,7 +1436,7 @@ class MetonCLI:
                 TimeElapsedColumn(),
                 console=self.console
             ) as progress:
-                task = progress.add_task("Processing files...", total=len(py_files))
+                task = progress.add_task("Processing files...", total=len(source_files))
 
                 # Index the codebase
                 stats = indexer.index_directory(
@@ -1338,8 +1444,23 @@ class MetonCLI:
                     recursive=True
                 )
 
+                # Documents (Markdown, text, PDF, ...) go into the same index
+                rag_config = self.config.config.rag
+                if rag_config.index_documents:
+                    from rag.document_ingest import DocumentIngester
+                    ingester = DocumentIngester(
+                        embedder=embedder,
+                        vector_store=indexer.vector_store,
+                        metadata_store=metadata_store,
+                        chunk_size=rag_config.document_chunk_size,
+                        overlap=rag_config.document_chunk_overlap,
+                        batch_size=rag_config.embedding_batch_size
+                    )
+                    doc_stats = ingester.ingest_directory(path)
+                    stats['chunks_created'] += doc_stats['chunks_created']
+
                 # Update progress to 100%
-                progress.update(task, completed=len(py_files))
+                progress.update(task, completed=len(source_files))
 
             # Save the index
             index_path = os.path.join(self.config.config.rag.index_path, "faiss.index")
@@ -1355,17 +1476,31 @@ class MetonCLI:
             self.indexed_files_count = stats['files_processed']
             self.indexed_chunks_count = stats['chunks_created']
 
-            # Enable RAG and tool
+            # Enable RAG and tool; searches use the freshly built index
             self.config.config.rag.enabled = True
             object.__setattr__(self.codebase_search_tool, '_rag_enabled', True)
+            object.__setattr__(self.codebase_search_tool, '_indexer', indexer)
             self.codebase_search_tool.enable()
 
             # Update config and persist
             self.config.config.tools.codebase_search.enabled = True
+            self.config.config.rag.watch_root = path
             self.config.save()
 
+            if self.config.config.rag.watch:
+                self.start_index_watch(path)
+
             # Display success
             self.console.print(f"\n[green]✅ Complete! Indexed {stats['files_processed']} files, {stats['chunks_created']} chunks in {duration:.1f}s[/green]")
+            languages = stats.get('languages', {})
+            if len(languages) > 1:
+                summary = ", ".join(f"{lang} {count}" for lang, count in sorted(languages.items()))
+                self.console.print(f"[dim]Languages: {summary}[/dim]")
+            if rag_config.index_documents and doc_stats['files_processed']:
+                self.console.print(
+                    f"[dim]Including {doc_stats['files_processed']} documents "
+                    f"({doc_stats['chunks_per_sec']} chunks/s)[/dim]"
+                )
             self.console.print("[dim]RAG enabled ✅[/dim]")
             self.console.print("[dim]Codebase search enabled ✅[/dim]\n")
 
@@ -1403,6 +1538,9 @@ class MetonCLI:
             if os.path.exists(index_path):
                 size_mb = os.path.getsize(index_path) / (1024 * 1024)
                 status_text += f"\n[cyan]Index Size:[/cyan]       {size_mb:.2f} MB"
+
+            if self.index_watcher is not None:
+                status_text += f"\n[cyan]Live Updates:[/cyan]     ✅ {self.index_watcher.backend}"
         else:
             status_text += "\n\n[yellow]No codebase has been indexed yet[/yellow]"
             status_text += "\n[dim]Use /index <path> to index a codebase[/dim]"
@@ -1431,6 +1569,8 @@ class MetonCLI:
             return
 
         try:
+            self.stop_index_watch()
+
             # Clear the index files
             index_path = os.path.join(self.config.config.rag.index_path, "faiss.index")
             metadata_path = self.config.config.rag.metadata_path
@@ -1477,6 +1617,99 @@ class MetonCLI:
         self.console.print(f"[cyan]Re-indexing {self.last_indexed_path}...[/cyan]\n")
         self.index_codebase(self.last_indexed_path)
 
+    def start_index_watch(self, path: str, quiet: bool = False) -> bool:
+        """Start reindexing edited files under path as they change.
+
+        Args:
+            path: Indexed directory to watch
+            quiet: Only print failures
+
+        Returns:
+            True if the watcher is running
+        """
+        from rag.file_watcher import IndexWatcher, FileWatcherError
+
+        self.stop_index_watch()
+        rag_config = self.config.config.rag
+        try:
+            self.index_watcher = IndexWatcher(
+                path,
+                indexer_provider=self.codebase_search_tool._load_indexer if self.codebase_search_tool else None,
+                symbol_tool=self.symbol_lookup_tool,
+                debounce=rag_config.watch_debounce,
+                poll_interval=rag_config.watch_poll_interval,
+                max_queue=rag_config.watch_queue_size,
+                backend=rag_config.watch_backend,
+                save_path=os.path.join(rag_config.index_path, "faiss.index"),
+                save_interval=rag_config.watch_save_interval
+            )
+            self.index_watcher.start()
+        except FileWatcherError as e:
+            self.index_watcher = None
+            self.console.print(f"[yellow]⚠ Live index updates unavailable: {e}[/yellow]")
+            return False
+
+        if self.symbol_lookup_tool:
+            self.symbol_lookup_tool.set_live_updates(True)
+        if not quiet:
+            self.console.print(f"[dim]Watching {path} for changes ({self.index_watcher.backend})[/dim]")
+        return True
+
+    def stop_index_watch(self):
+        """Stop live index updates (saving any unsaved changes)."""
+        if self.index_watcher is None:
+            return
+        self.index_watcher.stop()
+        self.index_watcher = None
+        if self.symbol_lookup_tool:
+            self.symbol_lookup_tool.set_live_updates(False)
+
+    def index_watch(self, action: Optional[str] = None):
+        """Turn live index updates on/off or show their status."""
+        rag_config = self.config.config.rag
+
+        if action in ("on", "start"):
+            path = self.last_indexed_path or rag_config.watch_root
+            if not path:
+                self.console.print("[yellow]No previous index found. Use /index <path> first[/yellow]")
+                return
+            if self.start_index_watch(path):
+                rag_config.watch = True
+                rag_config.watch_root = path
+                self.config.save()
+            return
+
+        if action in ("off", "stop"):
+            self.stop_index_watch()
+            rag_config.watch = False
+            self.config.save()
+            self.console.print("[dim]Live index updates off[/dim]")
+            return
+
+        if action is not None:
+            self.console.print("[yellow]Usage: /index watch " + escape("[on|off]") + "[/yellow]")
+            return
+
+        if self.index_watcher is None:
+            self.console.print("[dim]Live index updates off. Use /index watch on[/dim]")
+            return
+
+        stats = self.index_watcher.get_stats()
+        table = Table(title=f"Index Watcher ({stats['backend']})", show_header=False)
+        table.add_column("", style="cyan")
+        table.add_column("")
+        table.add_row("Root", stats["root"])
+        table.add_row("Watched files", str(stats["watched_files"]))
+        table.add_row("Pending", str(stats["pending"]))
+        table.add_row("Files updated / removed", f"{stats['files_updated']} / {stats['files_removed']}")
+        table.add_row("Chunks embedded / reused", f"{stats['chunks_embedded']} / {stats['chunks_reused']}")
+        table.add_row("Dropped events / rescans", f"{stats['dropped']} / {stats['rescans']}")
+        if stats["last_latency"] is not None:
+            table.add_row("Last update latency", f"{stats['last_latency']:.2f}s")
+        if stats["last_error"]:
+            table.add_row("Last error", f"[yellow]{escape(stats['last_error'])}[/yellow]")
+        self.console.print(table)
+
     def search_codebase(self, query: str):
         """Test semantic code search."""
         if not self.codebase_search_tool:
@@ -2745,6 +2978,20 @@ class MetonCLI:
             self.console.print(f"  Memory: {usage['memory_mb']:.1f} MB ({usage['memory_percent']:.1f}%)")
             self.console.print(f"  Total Samples: {mon_stats['total_samples']}")
 
+            # Lazy loading stats
+            lazy_stats = get_lazy_registry().get_stats()
+            self.console.print("\n[bold]Startup:[/bold]")
+            if lazy_stats["time_to_prompt"] is not None:
+                self.console.print(f"  Time to Prompt: {lazy_stats['time_to_prompt']:.2f}s")
+            for name, component in lazy_stats["components"].items():
+                if not component["loaded"]:
+                    state = "prewarming" if lazy_stats["prewarming"] else "not loaded"
+                elif component["error"]:
+                    state = f"failed ({component['error']})"
+                else:
+                    state = f"loaded in {component['load_seconds']:.2f}s"
+                self.console.print(f"  {name}: {state}")
+
             # Bottlenecks
             bottlenecks = profiler.identify_bottlenecks(threshold_seconds=2.0)
             if bottlenecks:
@@ -2798,15 +3045,52 @@ class MetonCLI:
             self.console.print(table)
             self.console.print()
 
+            # Process and per-component memory
+            profile = monitor.get_profile()
+            process = profile["process"]
+            if "error" not in process:
+                self.console.print("[bold]Process:[/bold]")
+                self.console.print(f"  RSS: {process['rss_mb']:.1f} MB")
+                self.console.print(f"  CPU Time: {process['cpu_user_seconds']:.1f}s user, "
+                                   f"{process['cpu_system_seconds']:.1f}s system")
+                self.console.print(f"  Threads: {process['num_threads']}")
+                for thread in process["threads"][:5]:
+                    self.console.print(f"    {thread['name'] or thread['id']}: {thread['cpu_seconds']:.2f}s")
+                self.console.print()
+
+            if profile["components"]:
+                comp_table = Table(show_header=True, header_style="bold cyan")
+                comp_table.add_column("Component", style="cyan")
+                comp_table.add_column("Estimated", style="green", justify="right")
+                comp_table.add_column("Growth", justify="right")
+                for name, size_mb in profile["components"].items():
+                    growth = profile["growth"].get(name)
+                    comp_table.add_row(
+                        name, f"{size_mb:.1f} MB",
+                        f"{growth['growth_mb']:+.1f} MB" if growth else "-"
+                    )
+                if profile["unaccounted_mb"] is not None:
+                    comp_table.add_row("[dim]unaccounted[/dim]", f"{profile['unaccounted_mb']:.1f} MB", "")
+                self.console.print(comp_table)
+                self.console.print()
+
             # Show peak if monitoring
             peak = monitor.get_peak_usage()
             if peak:
                 self.console.print("[bold]Peak Usage:[/bold]")
                 self.console.print(f"  CPU: {peak['peak_cpu_percent']:.1f}%")
                 self.console.print(f"  Memory: {peak['peak_memory_mb']:.1f} MB ({peak['peak_memory_percent']:.1f}%)")
+                self.console.print(f"  Process RSS: {peak['peak_process_rss_mb']:.1f} MB")
                 self.console.print(f"  Samples: {peak['samples']}")
                 self.console.print()
 
+            growth_alerts = [a for a in profile["alerts"] if a["type"] == "growth"]
+            if growth_alerts:
+                self.console.print("[bold yellow]⚠️  Memory Growth:[/bold yellow]")
+                for alert in growth_alerts:
+                    self.console.print(f"  • {alert['message']}")
+                self.console.print()
+
         except Exception as e:
             self.console.print(f"[red]❌ Failed to get resource usage: {str(e)}[/red]\n")
 
@@ -2925,9 +3209,12 @@ class MetonCLI:
                 total = manager.get_available_count()
                 self.console.print(f"[green]✓ Discovered {new_count} new skills ({total} total)[/green]")
 
+            elif subcommand == 'batch':
+                self.run_skill_batch(args)
+
             else:
                 self.console.print(f"[red]❌ Unknown skill subcommand: {subcommand}[/red]")
-                self.console.print("[dim]Available: list, load, unload, reload, info, discover[/dim]")
+                self.console.print("[dim]Available: list, load, unload, reload, info, discover, batch[/dim]")
 
         except Exception as e:
             self.console.print(f"[red]❌ Skill command failed: {str(e)}[/red]")
@@ -3000,6 +3287,67 @@ class MetonCLI:
         except Exception as e:
             self.console.print(f"[red]❌ Failed to get skill info: {str(e)}[/red]\n")
 
+    def run_skill_batch(self, args: List[str]):
+        """Run a code skill over a directory or glob, streaming per-file results.
+
+        Usage: /skill batch <review|refactor|docs> <dir|glob> [--workers N] [--no-cache]
+        """
+        from skills.batch import BatchError, SkillBatchRunner, describe
+
+        usage = "[yellow]Usage: /skill batch <review|refactor|docs> <dir|glob> [--workers N] [--no-cache][/yellow]"
+        positional, workers, use_cache = [], None, True
+        i = 0
+        while i < len(args):
+            if args[i] == '--workers' and i + 1 < len(args) and args[i + 1].isdigit():
+                workers = int(args[i + 1])
+                i += 1
+            elif args[i] == '--no-cache':
+                use_cache = False
+            else:
+                positional.append(args[i])
+            i += 1
+        if len(positional) != 2:
+            self.console.print(usage)
+            return
+
+        skills_config = self.config.config.skills
+        try:
+            runner = SkillBatchRunner(
+                positional[0],
+                workers=workers if workers is not None else skills_config.batch_workers,
+                cache_path=skills_config.batch_cache_path if use_cache else None,
+                cache_size=skills_config.batch_cache_size
+            )
+            self.console.print(f"\n[cyan]📦 {runner.skill_name} on {positional[1]} "
+                               f"({runner.workers} workers)[/cyan]\n")
+            for file_result in runner.run(positional[1]):
+                progress = runner.progress
+                mark = "[green]✓[/green]" if file_result.success else "[red]✗[/red]"
+                source = " [dim](cached)[/dim]" if file_result.cached else ""
+                self.console.print(f"  [dim]{progress.done}/{progress.total}[/dim] {mark} "
+                                   f"{file_result.path}: {describe(file_result)}{source}")
+        except BatchError as e:
+            self.console.print(f"[red]❌ {e}[/red]")
+            return
+
+        summary = runner.summarize()
+        progress = summary["progress"]
+        self.console.print(
+            f"\n[bold]{progress['done']} files[/bold] in {progress['elapsed']:.1f}s "
+            f"({progress['files_per_second']} files/s, {progress['lines_per_second']:.0f} lines/s), "
+            f"{progress['cached']} from cache, {progress['failed']} failed"
+        )
+        if "average_score" in summary:
+            self.console.print(f"Average score: {summary['average_score']}, "
+                               f"{summary['total_issues']} issues {summary['by_severity']}")
+            for path, score in summary["lowest_scores"]:
+                self.console.print(f"  [yellow]{score:>3}[/yellow] {path}")
+        elif "total_suggestions" in summary:
+            self.console.print(f"{summary['total_suggestions']} suggestions {summary['by_type']}")
+        elif "documented_items" in summary:
+            self.console.print(f"{summary['documented_items']} items documented")
+        self.console.print()
+
     # ========== End Skill Commands ==========
 
     # ========== Sub-Agent Commands ==========
@@ -3090,13 +3438,16 @@ class MetonCLI:
             self.console.print(f"\n[cyan]🤖 Spawning sub-agent: {agent_name}[/cyan]")
             self.console.print(f"[dim]Task: {task}[/dim]\n")
 
-            # Create spawner
-            spawner = SubAgentSpawner(
-                config=self.config,
-                model_manager=self.model_manager,
-                tools=self.agent.tools if self.agent else [],
-                verbose=self.verbose
-            )
+            # Reuse the manager's spawner so pooled sub-agent instances carry over
+            if self.subagent_manager:
+                spawner = self.subagent_manager.spawner
+            else:
+                spawner = SubAgentSpawner(
+                    config=self.config,
+                    model_manager=self.model_manager,
+                    tools=self.agent.tools if self.agent else [],
+                    verbose=self.verbose
+                )
 
             # Run the agent
             with Progress(
@@ -3184,10 +3535,38 @@ class MetonCLI:
 
     def show_agent_history(self):
         """Show recent sub-agent executions."""
+        if not self.subagent_manager:
+            self.console.print("[red]❌ Sub-agent manager not initialized[/red]")
+            return
+
         try:
-            # We'd need to store history somewhere - for now, just note it's not implemented yet
-            self.console.print("[yellow]⚠ Agent execution history is stored per session.[/yellow]")
-            self.console.print("[dim]Use /agent run to execute an agent and see results.[/dim]\n")
+            spawner = self.subagent_manager.spawner
+            results = list(spawner.get_completed_results().values())[-10:]
+            if not results:
+                self.console.print("[yellow]No sub-agent executions yet[/yellow]")
+                self.console.print("[dim]Use /agent run to execute an agent and see results.[/dim]\n")
+                return
+
+            table = Table(title="Recent Sub-Agent Executions", show_header=True, header_style="bold cyan")
+            table.add_column("ID", style="dim")
+            table.add_column("Agent", style="cyan")
+            table.add_column("Status")
+            table.add_column("Iterations", justify="right")
+            table.add_column("Duration", justify="right")
+            table.add_column("Task")
+
+            for result in reversed(results):
+                status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
+                task = result.task if len(result.task) <= 50 else result.task[:47] + "..."
+                table.add_row(result.agent_id, result.agent_name, status, str(result.iterations),
+                              f"{result.duration_seconds:.1f}s", escape(task))
+
+            self.console.print(table)
+            pool = spawner.pool.get_stats()
+            self.console.print(
+                f"[dim]Pooled instances: {pool['idle']} idle, {pool['created']} built, "
+                f"{pool['reused']} reused[/dim]\n"
+            )
 
         except Exception as e:
             self.console.print(f"[red]❌ Failed to show history: {str(e)}[/red]\n")
@@ -3511,19 +3890,33 @@ class MetonCLI:
     def shutdown(self):
         """Clean shutdown."""
         self.console.print("\n[cyan]🔄 Shutting down...[/cyan]")
+
+        self.stop_index_watch()
         
         if self.conversation and self.config.config.conversation.auto_save:
             try:
-                self.conversation.save()
+                self.conversation.close()
                 self.console.print("[dim]  ✓ Conversation saved[/dim]")
             except Exception as e:
                 self.console.print(f"[yellow]  ⚠ Save failed: {str(e)}[/yellow]")
         
         self.console.print("\n[cyan]👋 Goodbye![/cyan]\n")
 
+    def start_prewarm(self):
+        """Record time-to-prompt and prewarm lazy components in the background."""
+        registry = get_lazy_registry()
+        time_to_prompt = registry.mark_prompt_ready()
+        self.console.print(f"[dim]Ready in {time_to_prompt:.2f}s[/dim]")
+
+        optimization = self.config.config.optimization
+        lazy_config = optimization.lazy_loading
+        if optimization.enabled and lazy_config.enabled and lazy_config.prewarm:
+            registry.prewarm(delay=lazy_config.prewarm_delay)
+
     def run(self):
         """Main CLI loop."""
         self.display_welcome()
+        self.start_prewarm()
         
         while self.running:
             try:
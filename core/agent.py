@@ -26,7 +26,8 @@ from langgraph.graph import StateGraph, END
 from core.models import ModelManager
 from core.conversation import ConversationManager
 from core.config import ConfigLoader
-from utils.logger import setup_logger
+from utils.logger import setup_logger, query_context
+from optimization.lazy_loader import get_lazy_registry
 
 try:
     from memory.long_term_memory import LongTermMemory
@@ -35,6 +36,30 @@ except ImportError:
     MEMORY_AVAILABLE = False
     LongTermMemory = None
 
+try:
+    from optimization.query_router import QueryRouter, RoutingDecision, ROUTE_FAST_PATH, ROUTE_FULL
+    ROUTER_AVAILABLE = True
+except ImportError:
+    ROUTER_AVAILABLE = False
+    QueryRouter = None
+    RoutingDecision = Any
+    ROUTE_FAST_PATH, ROUTE_FULL = "fast_path", "full"
+
+try:
+    from optimization.tool_prefetch import ToolPrefetcher, PrefetchRun
+    PREFETCH_AVAILABLE = True
+except ImportError:
+    PREFETCH_AVAILABLE = False
+    ToolPrefetcher = None
+    PrefetchRun = Any
+
+try:
+    from optimization.latency_model import LatencyModel, get_latency_model
+    LATENCY_MODEL_AVAILABLE = True
+except ImportError:
+    LATENCY_MODEL_AVAILABLE = False
+    LatencyModel = None
+
 
 # Custom Exceptions
 class AgentError(Exception):
@@ -98,7 +123,13 @@ class MetonAgent:
         verbose: bool = False,
         skill_tool: Optional[Any] = None,
         subagent_tool: Optional[Any] = None,
-        hook_manager: Optional[Any] = None
+        hook_manager: Optional[Any] = None,
+        enable_routing: bool = True,
+        model_name: Optional[str] = None,
+        role_prompt: Optional[str] = None,
+        enable_memory: bool = True,
+        logger: Optional[Any] = None,
+        long_term_memory: Optional[Any] = None
     ):
         """Initialize Meton agent.
 
@@ -111,6 +142,13 @@ class MetonAgent:
             skill_tool: Optional SkillInvocationTool for skill awareness
             subagent_tool: Optional SubAgentTool for sub-agent awareness
             hook_manager: Optional HookManager for hook execution
+            enable_routing: Whether to route queries through the fast-path router
+            model_name: Model to reason with (default: the model manager's current model)
+            role_prompt: Instructions placed before the standard system prompt (sub-agents)
+            enable_memory: Whether to retrieve and store long-term memories
+            logger: Logger to use instead of setting up the "meton_agent" logger
+            long_term_memory: Memory system shared with other agents, used
+                instead of building one (requires enable_memory)
         """
         self.config = config
         self.model_manager = model_manager
@@ -127,34 +165,62 @@ class MetonAgent:
         self.max_iterations = agent_config.max_iterations
         self.verbose = verbose or agent_config.verbose
 
+        self.model_name = model_name
+        self.role_prompt = role_prompt
+
         # Create tool name → tool mapping
         self.tool_map = {tool.name: tool for tool in tools}
 
         # Setup logger
-        self.logger = setup_logger(
+        self.logger = logger or setup_logger(
             name="meton_agent",
             config=config.config.logging.model_dump()
         )
 
-        # Initialize long-term memory if enabled
+        # Initialize long-term memory if enabled. With lazy loading the
+        # embedding model and FAISS index are built on first use instead.
         self.long_term_memory = None
-        if MEMORY_AVAILABLE and config.config.long_term_memory.enabled:
-            try:
-                memory_config = config.config.long_term_memory
-                self.long_term_memory = LongTermMemory(
-                    storage_path=memory_config.storage_path,
-                    max_memories=memory_config.max_memories,
-                    consolidation_threshold=memory_config.consolidation_threshold,
-                    decay_rate=memory_config.decay_rate,
-                    auto_consolidate=memory_config.auto_consolidate,
-                    auto_decay=memory_config.auto_decay,
-                    min_importance_for_retrieval=memory_config.min_importance_for_retrieval
+        optimization_config = config.config.optimization
+        if enable_memory and long_term_memory is not None:
+            self.long_term_memory = long_term_memory
+        elif MEMORY_AVAILABLE and enable_memory and config.config.long_term_memory.enabled:
+            if optimization_config.enabled and optimization_config.lazy_loading.enabled:
+                self.long_term_memory = get_lazy_registry().register(
+                    "long_term_memory", self._create_long_term_memory
                 )
-                if self.logger:
-                    self.logger.info("Long-term memory system initialized")
-            except Exception as e:
-                if self.logger:
-                    self.logger.warning(f"Failed to initialize long-term memory: {e}")
+            else:
+                self.long_term_memory = self._create_long_term_memory()
+
+        # Latency model learned from query and tool timings (ETAs, estimates)
+        self.latency_model: Optional[LatencyModel] = None
+        query_opt_config = optimization_config.query_optimization
+        if (LATENCY_MODEL_AVAILABLE and optimization_config.enabled
+                and query_opt_config.enabled and query_opt_config.latency_model):
+            self.latency_model = get_latency_model(query_opt_config.latency_model_path or None)
+
+        # Initialize query router (fast path + relevant tool selection)
+        self.router: Optional[QueryRouter] = None
+        self._prompt_tool_names: Optional[List[str]] = None
+        if (ROUTER_AVAILABLE and enable_routing
+                and optimization_config.enabled and query_opt_config.enabled):
+            self.router = QueryRouter(
+                fast_path_enabled=query_opt_config.fast_path,
+                filter_tools=query_opt_config.auto_optimize_tools,
+                max_fast_path_words=query_opt_config.fast_path_max_words,
+                latency_model=self.latency_model
+            )
+            self.fast_path_model = query_opt_config.fast_path_model
+
+        # Speculative prefetch of predicted read-only tools (opt-in)
+        self.prefetcher: Optional[ToolPrefetcher] = None
+        self._prefetch: Optional[PrefetchRun] = None
+        if (PREFETCH_AVAILABLE and optimization_config.enabled
+                and query_opt_config.enabled and query_opt_config.speculative_prefetch):
+            self.prefetcher = ToolPrefetcher(
+                self.tool_map,
+                max_workers=query_opt_config.prefetch_workers,
+                max_symbols=query_opt_config.prefetch_max_symbols
+            )
 
         # Build the LangGraph StateGraph
         # Set recursion limit higher than default (25) to allow multi-step reasoning
@@ -167,6 +233,31 @@ class MetonAgent:
             self.logger.debug(f"Max iterations: {self.max_iterations}")
             self.logger.debug(f"Recursion limit: {self.recursion_limit}")
 
+    def _create_long_term_memory(self) -> Optional["LongTermMemory"]:
+        """Build the long-term memory system from config.
+
+        Returns:
+            LongTermMemory instance, or None if it failed to initialize
+        """
+        try:
+            memory_config = self.config.config.long_term_memory
+            memory = LongTermMemory(
+                storage_path=memory_config.storage_path,
+                max_memories=memory_config.max_memories,
+                consolidation_threshold=memory_config.consolidation_threshold,
+                decay_rate=memory_config.decay_rate,
+                auto_consolidate=memory_config.auto_consolidate,
+                auto_decay=memory_config.auto_decay,
+                min_importance_for_retrieval=memory_config.min_importance_for_retrieval
+            )
+            if self.logger:
+                self.logger.info("Long-term memory system initialized")
+            return memory
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to initialize long-term memory: {e}")
+            return None
+
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph StateGraph for ReAct pattern.
 
@@ -222,9 +313,14 @@ class MetonAgent:
         """
         from pathlib import Path
 
+        # Narrow tool descriptions to the tools selected by the router
+        prompt_tools = self.tools
+        if self._prompt_tool_names:
+            prompt_tools = [t for t in self.tools if t.name in self._prompt_tool_names] or self.tools
+
         tool_descriptions = "\n".join([
             f"- {tool.name}: {tool.description}"
-            for tool in self.tools
+            for tool in prompt_tools
         ])
 
         # Get current working directory
@@ -236,7 +332,7 @@ class MetonAgent:
             for path in self.config.config.tools.file_ops.allowed_paths
         ])
 
-        return f"""You are Meton, a local AI coding assistant with wisdom and action.
+        return f"""{self._get_role_prompt_section()}You are Meton, a local AI coding assistant with wisdom and action.
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 CRITICAL FILE ACCESS INFORMATION:
@@ -1175,6 +1271,16 @@ The examples above show the COMPLETE flow - notice how ANSWER is provided AFTER
 {self._get_skill_prompt_section()}
 {self._get_subagent_prompt_section()}"""
 
+    def _get_role_prompt_section(self) -> str:
+        """Get the role instructions placed before the system prompt.
+
+        Returns:
+            Role prompt followed by a separator, or empty string
+        """
+        if not self.role_prompt:
+            return ""
+        return f"{self.role_prompt}\n\n---\n\n"
+
     def _get_skill_prompt_section(self) -> str:
         """Generate system prompt section for available skills.
 
@@ -1316,7 +1422,7 @@ RIGHT: "The agent/ directory contains X.py and Y.py which implement [specific fu
 Your evidence-based answer (NO speculation):"""
 
             # Call LLM to synthesize
-            llm = self.model_manager.get_llm()
+            llm = self.model_manager.get_llm(self.model_name)
             response = llm.invoke(synthesis_prompt)
 
             # Clean up response
@@ -1493,7 +1599,7 @@ CRITICAL RULES:
 4. Only use ACTION: NONE when you're ready to give the final ANSWER"""
 
             # Get LLM response
-            llm = self.model_manager.get_llm()
+            llm = self.model_manager.get_llm(self.model_name)
             response = llm.invoke(prompt)
 
             # Parse response
@@ -1556,7 +1662,7 @@ Provide a concise answer:"""
 
                         # Call LLM with focused extraction prompt
                         try:
-                            llm = self.model_manager.get_llm()
+                            llm = self.model_manager.get_llm(self.model_name)
                             extraction_response = llm.invoke(extraction_prompt)
 
                             # Use the full response as answer (it should be focused)
@@ -1707,6 +1813,8 @@ Provide a concise answer:"""
         Returns:
             Updated state with tool results
         """
+        import time as time_module
+
         try:
             # Get the most recent tool call that hasn't been executed
             pending_calls = [tc for tc in state["tool_calls"] if tc["output"] is None]
@@ -1733,12 +1841,24 @@ Provide a concise answer:"""
                     self.logger.warning(error_msg)
                 return state
 
-            # Execute tool
+            # Execute tool (answered from the prefetch cache when predicted)
             try:
-                result = tool._run(tool_input)
+                tool_start = time_module.time()
+                if self._prefetch is not None:
+                    result, prefetched = self._prefetch.execute(tool, tool_input)
+                else:
+                    result, prefetched = tool._run(tool_input), False
                 tool_call["output"] = result
 
+                # Prefetched calls only measure the wait, not the tool
+                if self.latency_model is not None and not prefetched:
+                    self.latency_model.observe_tool(
+                        tool_name, time_module.time() - tool_start, state["messages"][0]
+                    )
+
                 if self.verbose:
+                    if prefetched:
+                        print("⚡ Prefetched")
                     print(f"✓ Result: {result[:200]}..." if len(result) > 200 else f"✓ Result: {result}")
 
                 # Log to conversation
@@ -1829,13 +1949,23 @@ Provide a concise answer:"""
 
         return "reasoning"
 
-    def _build_conversation_context(self) -> str:
+    def _build_conversation_context(self, exclude_current: bool = False) -> str:
         """Build conversation context from recent messages.
 
+        Args:
+            exclude_current: Leave out the trailing user message (for prompts
+                that add the current message themselves)
+
         Returns:
             Formatted conversation history
         """
-        messages = self.conversation.get_messages(limit=5)
+        if exclude_current:
+            messages = self.conversation.get_messages(limit=6)
+            if messages and messages[-1]['role'] == 'user':
+                messages = messages[:-1]
+            messages = messages[-5:]
+        else:
+            messages = self.conversation.get_messages(limit=5)
         if not messages:
             return ""
 
@@ -1880,6 +2010,8 @@ Provide a concise answer:"""
     def run(self, user_input: str) -> Dict[str, Any]:
         """Run the agent with user input.
 
+        Log records emitted while the query runs carry its correlation id.
+
         Args:
             user_input: User's question or command
 
@@ -1891,6 +2023,18 @@ Provide a concise answer:"""
             >>> print(result['output'])
             >>> print(result['thoughts'])
         """
+        with query_context():
+            return self._run_query(user_input)
+
+    def _run_query(self, user_input: str) -> Dict[str, Any]:
+        """Run one query (see run()).
+
+        Args:
+            user_input: User's question or command
+
+        Returns:
+            Dictionary with output, thoughts, tool_calls, success, and error (if any)
+        """
         import time as time_module
 
         start_time = time_module.time()
@@ -1927,6 +2071,20 @@ Provide a concise answer:"""
             # Add user message to conversation
             self.conversation.add_user_message(user_input)
 
+            # Route the query: conversational/general-knowledge queries skip the ReAct loop entirely
+            decision = self._route_query(user_input)
+            if decision and decision.is_fast_path:
+                fast_result = self._run_fast_path(user_input, decision, start_time)
+                if fast_result is not None:
+                    return fast_result
+
+            # Narrow the tool section of the system prompt for this run
+            self._prompt_tool_names = decision.tools if decision else None
+
+            # Start predicted read-only tools while the first LLM call runs
+            if self.prefetcher:
+                self._prefetch = self.prefetcher.start(user_input)
+
             # Initialize state
             initial_state: AgentState = {
                 "messages": [user_input],
@@ -1979,7 +2137,7 @@ Provide a concise answer:"""
                 "thoughts": len(final_state["thoughts"]),
                 "tool_calls": len(final_state["tool_calls"]),
                 "iterations": final_state["iteration"],
-                "model": self.model_manager.current_model
+                "model": self.model_name or self.model_manager.current_model
             }
             self.conversation.add_assistant_message(output, metadata)
 
@@ -2031,24 +2189,22 @@ Provide a concise answer:"""
 
             # Execute post-query hooks (success case)
             duration = time_module.time() - start_time
-            if self.hook_manager:
-                try:
-                    from hooks.base import HookType, HookContext
-                    post_context = HookContext(
-                        hook_type=HookType.POST_QUERY,
-                        input_data=user_input,
-                        output_data=output,
-                        success=True,
-                        duration_seconds=duration,
-                        session_id=self.conversation.session_id if hasattr(self.conversation, 'session_id') else None,
-                        metadata={
-                            "iterations": final_state["iteration"],
-                            "tool_calls_count": len(final_state["tool_calls"]),
-                        }
-                    )
-                    self.hook_manager.execute(post_context)
-                except ImportError:
-                    pass  # Hooks not available
+            self._execute_post_query_hooks(
+                user_input,
+                duration,
+                output=output,
+                metadata={
+                    "iterations": final_state["iteration"],
+                    "tool_calls_count": len(final_state["tool_calls"]),
+                }
+            )
+
+            if self.router and decision:
+                self.router.record_latency(ROUTE_FULL, duration, user_input)
+            self._save_latency_model()
+
+            if self._prefetch is not None:
+                result["prefetch"] = self._finish_prefetch()
 
             return result
 
@@ -2077,23 +2233,212 @@ Provide a concise answer:"""
 
             # Execute post-query hooks (error case)
             duration = time_module.time() - start_time
-            if self.hook_manager:
-                try:
-                    from hooks.base import HookType, HookContext
-                    post_context = HookContext(
-                        hook_type=HookType.POST_QUERY,
-                        input_data=user_input,
-                        success=False,
-                        error=str(e),
-                        duration_seconds=duration,
-                        session_id=self.conversation.session_id if hasattr(self.conversation, 'session_id') else None,
-                    )
-                    self.hook_manager.execute(post_context)
-                except ImportError:
-                    pass  # Hooks not available
+            self._execute_post_query_hooks(user_input, duration, success=False, error=str(e))
 
             return result
 
+        finally:
+            self._prompt_tool_names = None
+            if self._prefetch is not None:
+                self._finish_prefetch()
+
+    def estimate_eta(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """Predict how long a query will take, from learned latencies.
+
+        Args:
+            user_input: User's question or command
+
+        Returns:
+            Dictionary with route, p50 and p90 (seconds), or None until the
+            latency model has learned the query's route
+        """
+        if self.latency_model is None:
+            return None
+
+        route = ROUTE_FULL
+        if self.router:
+            try:
+                route = self.router.route(user_input, self.get_tool_names()).route
+            except Exception:
+                pass
+
+        prediction = self.latency_model.predict_query(user_input, route=route)
+        if prediction["source"] != "model":
+            return None
+        return {"route": route, "p50": prediction["p50"], "p90": prediction["p90"]}
+
+    def _save_latency_model(self) -> None:
+        """Persist the latency model (no-op without a configured path)."""
+        if self.latency_model is None:
+            return
+        try:
+            self.latency_model.save()
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Could not save latency model: {e}")
+
+    def _finish_prefetch(self) -> Dict[str, Any]:
+        """End the run's prefetch, dropping unused results.
+
+        Returns:
+            The run's prefetch statistics
+        """
+        stats = self._prefetch.finish()
+        self._prefetch = None
+        if self.logger and stats["prefetched"]:
+            self.logger.info(
+                f"Prefetch: {stats['hits']}/{stats['prefetched']} used, "
+                f"{stats['wasted']} wasted, ~{stats['saved_seconds']:.2f}s saved"
+            )
+        return stats
+
+    def _route_query(self, user_input: str) -> Optional[RoutingDecision]:
+        """Decide whether a query takes the fast path or the full ReAct loop.
+
+        Args:
+            user_input: User's question or command
+
+        Returns:
+            RoutingDecision, or None if routing is disabled
+        """
+        if not self.router:
+            return None
+
+        try:
+            decision = self.router.route(user_input, self.get_tool_names())
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Query routing failed, using full loop: {e}")
+            return None
+
+        if self.logger:
+            tools = ", ".join(decision.tools) if decision.tools else "all"
+            self.logger.info(
+                f"Routing: {decision.route} (type={decision.query_type}, "
+                f"reason={decision.reason}, tools={tools})"
+            )
+
+        return decision
+
+    def _run_fast_path(
+        self,
+        user_input: str,
+        decision: RoutingDecision,
+        start_time: float
+    ) -> Optional[Dict[str, Any]]:
+        """Answer a simple query with a single quick-model call.
+
+        Args:
+            user_input: User's question or command
+            decision: Routing decision for the query
+            start_time: Time the query started (for latency accounting)
+
+        Returns:
+            Result dictionary in the same shape as run(), or None to fall back
+            to the full ReAct loop
+        """
+        import time as time_module
+
+        # The current message was already added to the conversation; it goes last
+        conversation_context = self._build_conversation_context(exclude_current=True)
+        prompt = f"""You are Meton, a local AI coding assistant running entirely on the user's machine.
+Reply to the user's message directly, concisely and conversationally.
+If answering would require reading files, searching code or running tools, say so briefly.
+
+{conversation_context}
+
+User: {user_input}
+Assistant:"""
+
+        try:
+            model_name = self.model_manager.resolve_alias(self.fast_path_model)
+            llm = self.model_manager.get_llm(model_name)
+            output = llm.invoke(prompt).strip()
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Fast path failed, falling back to full loop: {e}")
+            self.router.record_fallback()
+            return None
+
+        if not output:
+            self.router.record_fallback()
+            return None
+
+        metadata = {
+            "thoughts": 0,
+            "tool_calls": 0,
+            "iterations": 0,
+            "model": model_name,
+            "route": ROUTE_FAST_PATH
+        }
+        self.conversation.add_assistant_message(output, metadata)
+
+        duration = time_module.time() - start_time
+        saved = self.router.estimate_savings(duration, user_input)
+        self.router.record_latency(ROUTE_FAST_PATH, duration, user_input)
+        self._save_latency_model()
+
+        if self.logger:
+            savings = f", ~{saved:.2f}s saved vs full loop" if saved is not None else ""
+            self.logger.info(f"Fast path answered in {duration:.2f}s ({decision.reason}{savings})")
+
+        if self.verbose:
+            print(f"\n⚡ Fast path ({decision.reason}) answered with {model_name} in {duration:.2f}s")
+
+        self._execute_post_query_hooks(
+            user_input,
+            duration,
+            output=output,
+            metadata={"iterations": 0, "tool_calls_count": 0, "route": ROUTE_FAST_PATH}
+        )
+
+        return {
+            "output": output,
+            "thoughts": [],
+            "tool_calls": [],
+            "iterations": 0,
+            "success": True,
+            "route": ROUTE_FAST_PATH
+        }
+
+    def _execute_post_query_hooks(
+        self,
+        user_input: str,
+        duration: float,
+        output: Optional[str] = None,
+        success: bool = True,
+        error: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Execute post-query hooks if a hook manager is configured.
+
+        Args:
+            user_input: User's question or command
+            duration: Query duration in seconds
+            output: Final answer (success case)
+            success: Whether the query succeeded
+            error: Error message (error case)
+            metadata: Optional hook metadata
+        """
+        if not self.hook_manager:
+            return
+
+        try:
+            from hooks.base import HookType, HookContext
+            post_context = HookContext(
+                hook_type=HookType.POST_QUERY,
+                input_data=user_input,
+                output_data=output,
+                success=success,
+                error=error,
+                duration_seconds=duration,
+                session_id=self.conversation.session_id if hasattr(self.conversation, 'session_id') else None,
+                metadata=metadata or {}
+            )
+            self.hook_manager.execute(post_context)
+        except ImportError:
+            pass  # Hooks not available
+
     def get_tool_names(self) -> List[str]:
         """Get names of available tools.
 
@@ -2159,11 +2504,14 @@ Provide a concise answer:"""
             >>> print(info['tools'])
         """
         return {
-            "model": self.model_manager.current_model,
+            "model": self.model_name or self.model_manager.current_model,
             "tools": self.get_tool_names(),
             "max_iterations": self.max_iterations,
             "verbose": self.verbose,
-            "conversation_messages": self.conversation.get_message_count()
+            "conversation_messages": self.conversation.get_message_count(),
+            "routing": self.router.get_stats() if self.router else None,
+            "prefetch": self.prefetcher.get_stats() if self.prefetcher else None,
+            "latency_model": self.latency_model.get_stats() if self.latency_model else None
         }
 
     # Long-term memory helper methods
@@ -167,6 +167,8 @@ class FileOpsToolConfig(BaseModel):
     allowed_paths: List[str] = Field(default_factory=list)
     blocked_paths: List[str] = Field(default_factory=list)
     max_file_size_mb: int = Field(default=10, ge=1)
+    max_read_lines: int = Field(default=2000, ge=1)  # Lines returned per read call
+    line_index_cache_size: int = Field(default=32, ge=1)  # Files with cached line offsets
 
     @model_validator(mode='after')
     def validate_paths(self) -> 'FileOpsToolConfig':
@@ -185,6 +187,11 @@ class CodeExecutorToolConfig(BaseModel):
     enabled: bool = True
     timeout: int = Field(default=5, ge=1)
     max_output_length: int = Field(default=10000, ge=100)
+    use_pool: bool = True  # Run code in warm worker processes
+    pool_size: int = Field(default=2, ge=1)
+    max_runs_per_worker: int = Field(default=50, ge=1)  # Recycle workers after this many runs
+    memory_limit_mb: int = Field(default=512, ge=0)  # Per-worker address space limit (0 = unlimited)
+    preload_modules: List[str] = Field(default_factory=lambda: ["math", "json", "datetime", "collections", "re"])
 
 
 class WebSearchToolConfig(BaseModel):
@@ -200,6 +207,9 @@ class CodebaseSearchToolConfig(BaseModel):
     top_k: int = Field(default=5, ge=1, le=50)
     similarity_threshold: float = Field(default=0.3, ge=0.0, le=1.0)
     max_code_length: int = Field(default=500, ge=100, le=10000)
+    rerank: str = Field(default="auto", pattern="^(auto|always|never)$")  # auto = QueryOptimizer decides
+    rerank_multiplier: int = Field(default=5, ge=1, le=20)  # Candidates fetched per result when reranking
+    rerank_model: Optional[str] = None  # Cross-encoder model; None = lexical scorer
 
 
 class ToolsConfig(BaseModel):
@@ -215,6 +225,9 @@ class ConversationConfig(BaseModel):
     max_history: int = Field(default=20, ge=1)
     save_path: str = "./conversations/"
     auto_save: bool = True
+    flush_interval: float = Field(default=1.0, ge=0.0)  # Seconds to batch auto-save writes
+    search_index: bool = True  # Full-text index of saved conversations
+    search_index_path: Optional[str] = None  # Defaults to <save_path>/search_index.db
 
 
 class CLIConfig(BaseModel):
@@ -234,6 +247,10 @@ class LoggingConfig(BaseModel):
     use_rich: bool = True
     suppress_library_logs: bool = True
     max_log_files: int = Field(default=30, ge=1)  # Keep last N daily log files
+    async_logging: bool = True  # Format and write logs on a background thread
+    format: str = Field(default="text", pattern="^(text|json)$")  # json = JSON lines with query ids
+    debug_rate_limit: float = Field(default=100.0, ge=0.0)  # DEBUG records/second per logger (0 = unlimited)
+    debug_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)  # Fraction of DEBUG records kept
 
 
 class RAGConfig(BaseModel):
@@ -245,6 +262,17 @@ class RAGConfig(BaseModel):
     dimensions: int = Field(default=768, ge=1)
     top_k: int = Field(default=10, ge=1, le=100)
     similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
+    index_documents: bool = True  # /index also ingests non-Python documents
+    document_chunk_size: int = Field(default=1500, ge=200, le=20000)  # Characters per document chunk
+    document_chunk_overlap: int = Field(default=200, ge=0, le=5000)
+    embedding_batch_size: int = Field(default=64, ge=1, le=1024)  # Chunks embedded per model call
+    watch: bool = False  # Reindex edited files as they change
+    watch_root: Optional[str] = None  # Directory watched (set by /index)
+    watch_backend: str = Field(default="auto", pattern="^(auto|watchdog|poll)$")
+    watch_debounce: float = Field(default=0.5, ge=0.0, le=60.0)  # Seconds a file must be quiet
+    watch_poll_interval: float = Field(default=1.0, ge=0.1, le=60.0)
+    watch_queue_size: int = Field(default=256, ge=1)  # Pending files before falling back to a rescan
+    watch_save_interval: float = Field(default=30.0, ge=0.0)  # Seconds between index saves
 
 
 class SkillsConfig(BaseModel):
@@ -252,6 +280,9 @@ class SkillsConfig(BaseModel):
     enabled: bool = True
     auto_load: bool = True
     directory: str = "./skills/"
+    batch_workers: int = Field(default=0, ge=0)  # Processes for /skill batch (0 = one per CPU)
+    batch_cache_path: str = "./cache/skill_batch.json"  # Batch results by file content hash
+    batch_cache_size: int = Field(default=10000, ge=0)  # Cached file results kept
 
 
 class CacheConfig(BaseModel):
@@ -274,6 +305,14 @@ class QueryOptimizationConfig(BaseModel):
     enabled: bool = True
     auto_optimize_tools: bool = True
     auto_optimize_rag: bool = True
+    fast_path: bool = True  # Answer conversational/general-knowledge queries with the quick model, skipping the ReAct loop
+    fast_path_model: str = "quick"  # Model name or alias used for fast-path answers
+    fast_path_max_words: int = Field(default=12, ge=1)
+    speculative_prefetch: bool = False  # Run predicted read-only tools while the first LLM call runs
+    prefetch_workers: int = Field(default=2, ge=1)
+    prefetch_max_symbols: int = Field(default=3, ge=0)
+    latency_model: bool = True  # Learn query/tool latencies for ETAs, timeouts and estimates
+    latency_model_path: str = "./cache/latency_model.json"  # Empty to keep it in memory only
 
 
 class ParallelConfig(BaseModel):
@@ -286,6 +325,8 @@ class LazyLoadingConfig(BaseModel):
     """Lazy loading configuration."""
     enabled: bool = True
     preload_skills: List[str] = ["code_explainer"]
+    prewarm: bool = True  # Build lazy components in the background once the prompt is up
+    prewarm_delay: float = Field(default=1.0, ge=0)  # Seconds to wait before prewarming
 
 
 class ResourceMonitoringConfig(BaseModel):
@@ -294,6 +335,8 @@ class ResourceMonitoringConfig(BaseModel):
     sample_interval: int = 5
     alert_cpu_threshold: int = 90
     alert_memory_threshold: int = 90
+    alert_growth_mb: float = Field(default=256, gt=0)  # Steady growth in the window that raises a leak alert
+    growth_window: int = Field(default=60, ge=2)  # Samples inspected for growth alerts
 
 
 class OptimizationConfig(BaseModel):
@@ -315,6 +358,13 @@ class MultiAgentConfig(BaseModel):
     parallel_execution: bool = False
 
 
+class SubAgentsConfig(BaseModel):
+    """Sub-agent spawning configuration."""
+    pool_size: int = Field(default=8, ge=0)  # Idle compiled sub-agents kept for reuse
+    max_concurrent: int = Field(default=3, ge=1)  # Cap for spawn_many
+    history_size: int = Field(default=100, ge=1)  # Completed results kept
+
+
 class ReflectionConfig(BaseModel):
     """Self-reflection configuration."""
     enabled: bool = False
@@ -325,6 +375,7 @@ class ReflectionConfig(BaseModel):
         "multi_tool_usage": True,
         "long_responses": True
     })
+    model: str = "quick"  # Scoring doesn't need the primary model
 
 
 class IterativeImprovementConfig(BaseModel):
@@ -334,6 +385,9 @@ class IterativeImprovementConfig(BaseModel):
     quality_threshold: float = Field(default=0.85, ge=0.0, le=1.0)
     convergence_threshold: float = Field(default=0.05, ge=0.0, le=1.0)
     convergence_window: int = Field(default=2, ge=1)
+    model: str = "primary"
+    combined: bool = True  # Score and improve in one generation
+    time_budget: float = Field(default=60.0, ge=0.0)  # Seconds per answer, 0 = unlimited
 
 
 class FeedbackLearningConfig(BaseModel):
@@ -351,6 +405,9 @@ class ParallelExecutionConfig(BaseModel):
     max_parallel_tools: int = Field(default=3, ge=1)
     timeout_per_tool: int = Field(default=30, ge=1)
     fallback_to_sequential: bool = True
+    adaptive_timeouts: bool = True  # Learned p90 x timeout_multiplier, capped at timeout_per_tool (needs query_optimization.latency_model)
+    timeout_multiplier: float = Field(default=3.0, gt=0)
+    min_timeout: int = Field(default=5, ge=1)
 
 
 class ChainOfThoughtConfig(BaseModel):
@@ -375,6 +432,8 @@ class WebUISessionsConfig(BaseModel):
     storage_path: str = "./web_sessions"
     max_age_hours: int = Field(default=24, ge=1)
     auto_cleanup: bool = True
+    max_agents: int = Field(default=8, ge=1)  # Live per-session agents before idle ones are evicted
+    flush_interval: float = Field(default=5.0, ge=0.0)  # Seconds activity updates are coalesced
 
 
 class WebUIAnalyticsConfig(BaseModel):
@@ -393,6 +452,8 @@ class WebUIConfig(BaseModel):
     auth: Optional[str] = None
     theme: str = "soft"
     max_file_size_mb: int = Field(default=10, ge=1)
+    max_concurrent: int = Field(default=2, ge=1)  # Agent runs at once across sessions
+    queue_size: int = Field(default=32, ge=1)  # Requests waiting in the Gradio queue
     sessions: WebUISessionsConfig = Field(default_factory=WebUISessionsConfig)
     analytics: WebUIAnalyticsConfig = Field(default_factory=WebUIAnalyticsConfig)
 
@@ -450,6 +511,22 @@ class ExportConfig(BaseModel):
     backup_dir: str = "./backups"
 
 
+class DaemonConfig(BaseModel):
+    """Background daemon configuration."""
+    socket_path: str = "~/.meton/meton.sock"  # Clients also honor METON_SOCKET
+    reset_conversation: bool = True  # Start each client query with a fresh conversation
+    prewarm: bool = True  # Build lazy components (index, memory) before accepting queries
+
+
+class EditorConfig(BaseModel):
+    """Editor completion/hover endpoints (api/server.py)."""
+    model: str = "quick"  # Model name or alias; one call per request, no agent loop
+    cache_size: int = Field(default=256, ge=0)
+    completion_max_tokens: int = Field(default=64, ge=1)
+    hover_max_tokens: int = Field(default=160, ge=1)
+    hover_symbols: bool = True  # Answer hovers for known definitions from the symbol index
+
+
 class ProjectConfig(BaseModel):
     """Project metadata."""
     name: str = "Meton"
@@ -469,6 +546,7 @@ class MetonConfig(BaseModel):
     rag: RAGConfig = Field(default_factory=RAGConfig)
     skills: SkillsConfig = Field(default_factory=SkillsConfig)
     multi_agent: MultiAgentConfig = Field(default_factory=MultiAgentConfig)
+    subagents: SubAgentsConfig = Field(default_factory=SubAgentsConfig)
     reflection: ReflectionConfig = Field(default_factory=ReflectionConfig)
     iterative_improvement: IterativeImprovementConfig = Field(default_factory=IterativeImprovementConfig)
     feedback_learning: FeedbackLearningConfig = Field(default_factory=FeedbackLearningConfig)
@@ -482,6 +560,8 @@ class MetonConfig(BaseModel):
     templates: TemplatesConfig = Field(default_factory=TemplatesConfig)
     profiles: ProfilesConfig = Field(default_factory=ProfilesConfig)
     export: ExportConfig = Field(default_factory=ExportConfig)
+    daemon: DaemonConfig = Field(default_factory=DaemonConfig)
+    editor: EditorConfig = Field(default_factory=EditorConfig)
     optimization: OptimizationConfig = Field(default_factory=OptimizationConfig)
     parameter_profiles: Optional[Dict[str, ParameterProfile]] = Field(default_factory=dict)
 
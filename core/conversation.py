@@ -19,16 +19,41 @@ Example:
     >>>
     >>> # Save conversation
     >>> path = manager.save()
+    >>>
+    >>> # Flush pending writes and compact the session log
+    >>> manager.close()
+
+Persistence:
+    With auto-save enabled, each session appends its messages to a single
+    ``session_<start>_<id>.jsonl`` log. Writes are buffered and flushed by a
+    background thread after ``conversation.flush_interval`` seconds, so a burst
+    of tool messages costs one append instead of one full rewrite each.
+    ``close()`` compacts the log into a ``session_<start>_<id>.json`` snapshot.
+    A small ``sessions_index.jsonl`` file records per-session metadata so listing
+    saved conversations doesn't need to open every session file.
+
+    Flushed messages are also fed to a full-text search index
+    (``core.conversation_index``) so past sessions can be searched with
+    ``search_saved()``.
 """
 
+import atexit
 import json
+import os
 import uuid
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from threading import Lock
+from threading import Lock, Event, Thread
 from pydantic import BaseModel, Field
 
+from core.conversation_index import (
+    ConversationSearchIndex,
+    ConversationIndexError,
+    get_search_index
+)
+
 
 # Custom Exceptions
 class ConversationError(Exception):
@@ -61,6 +86,162 @@ class Message(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class SessionIndex:
+    """Append-only index of saved conversation sessions.
+
+    Each line holds the latest known metadata for one session (later lines
+    win), so listing sessions reads one small file instead of parsing every
+    conversation on disk.
+
+    Attributes:
+        path: Path to the index file
+    """
+
+    FILENAME = "sessions_index.jsonl"
+
+    def __init__(self, save_path: Path):
+        """Initialize session index.
+
+        Args:
+            save_path: Directory holding conversation files
+        """
+        self.save_path = save_path
+        self.path = save_path / self.FILENAME
+        self._lock = Lock()
+
+    def update(self, entry: Dict[str, Any]) -> None:
+        """Record metadata for a session.
+
+        Args:
+            entry: Metadata dict with at least 'session_id' and 'file'
+        """
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get the latest metadata for every indexed session.
+
+        Returns:
+            Dict mapping session ID to its metadata
+        """
+        if not self.path.exists():
+            return {}
+
+        result: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partial line from an interrupted write
+                    if "session_id" in entry:
+                        result[entry["session_id"]] = entry
+        return result
+
+    def compact(self) -> None:
+        """Rewrite the index keeping only the latest entry per session."""
+        entries = self.entries()
+        with self._lock:
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+
+    def rebuild(self) -> int:
+        """Rebuild the index by scanning conversation files on disk.
+
+        Used once when the index is missing (e.g. conversations saved by
+        older versions or restored from a backup).
+
+        Returns:
+            Number of sessions indexed
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+        files = list(self.save_path.glob("session_*.json")) + list(self.save_path.glob("session_*.jsonl"))
+
+        for filepath in sorted(files, key=lambda p: p.stat().st_mtime):
+            try:
+                data = _read_conversation_file(filepath)
+            except Exception:
+                continue
+            entries[data["session_id"]] = {
+                "session_id": data["session_id"],
+                "file": filepath.name,
+                "start_time": data.get("start_time"),
+                "end_time": data.get("end_time") or datetime.fromtimestamp(filepath.stat().st_mtime).isoformat(),
+                "message_count": len(data.get("messages", [])),
+            }
+
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                for entry in entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        return len(entries)
+
+
+# Managers with a background writer, flushed at interpreter exit
+_live_managers: "weakref.WeakSet[ConversationManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    """Flush pending conversation writes before the interpreter exits."""
+    for manager in list(_live_managers):
+        try:
+            manager.flush()
+        except Exception:
+            pass
+
+
+def _read_conversation_file(filepath: Path) -> Dict[str, Any]:
+    """Read a conversation snapshot (.json) or session log (.jsonl).
+
+    Session logs are replayed record by record, so a log left behind by a
+    crashed process still loads everything that was flushed.
+
+    Args:
+        filepath: Path to conversation file
+
+    Returns:
+        Conversation data in snapshot format
+    """
+    if filepath.suffix != ".jsonl":
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    data: Dict[str, Any] = {"messages": []}
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partial line from an interrupted write
+
+            record_type = record.pop("type", "message")
+            if record_type == "session":
+                data.update(record)
+            elif record_type == "clear":
+                data["messages"] = []
+            else:
+                data["messages"].append(record)
+
+    if data["messages"]:
+        data["end_time"] = data["messages"][-1].get("timestamp")
+    data["message_count"] = len(data["messages"])
+    return data
+
+
 class ConversationManager:
     """Manages conversation history and persistence.
 
@@ -78,6 +259,9 @@ class ConversationManager:
         logger: Optional logger instance
     """
 
+    # Background writer exits after this long without new messages
+    WRITER_IDLE_SECONDS = 30.0
+
     def __init__(self, config, session_id: Optional[str] = None, logger=None):
         """Initialize conversation manager.
 
@@ -111,9 +295,27 @@ class ConversationManager:
         self.max_history = config.get('conversation.max_history', 20)
         self.save_path = Path(config.get('conversation.save_path', './conversations/'))
         self.auto_save = config.get('conversation.auto_save', True)
+        self.flush_interval = config.get('conversation.flush_interval', 1.0)
 
         # Ensure save directory exists
         self.save_path.mkdir(parents=True, exist_ok=True)
+        self.index = SessionIndex(self.save_path)
+
+        # Full-text search index, opened on first use
+        self.search_index_enabled = config.get('conversation.search_index', True)
+        self.search_index_path = Path(
+            config.get('conversation.search_index_path', None)
+            or self.save_path / "search_index.db"
+        )
+        self._search_index: Optional[ConversationSearchIndex] = None
+
+        # Incremental persistence state (see module docstring)
+        self._pending: List[Dict[str, Any]] = []  # Records not yet written to the log
+        self._write_lock = Lock()  # Serializes disk writes (never held with _lock while writing)
+        self._flush_event = Event()  # Set when records are pending
+        self._stop_event = Event()  # Set by close() to stop the writer
+        self._writer: Optional[Thread] = None
+        self._log_path: Optional[Path] = None
 
         if self.logger:
             self.logger.info(f"ConversationManager initialized with session: {self.session_id}")
@@ -152,13 +354,9 @@ class ConversationManager:
             if self.logger:
                 self.logger.debug(f"Added {role} message (total: {len(self.messages)})")
 
-            # Auto-save if enabled - use internal method to avoid deadlock
+            # Auto-save if enabled - queue for the background writer
             if self.auto_save:
-                try:
-                    self._save_internal()
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Auto-save failed: {e}")
+                self._enqueue_record({"type": "message", **message.model_dump()})
 
     def add_user_message(self, content: str) -> None:
         """Add a user message.
@@ -306,9 +504,297 @@ class ConversationManager:
         with self._lock:
             self.messages = []
 
+            if self.auto_save:
+                if self._log_path is None:
+                    self._pending = []  # Nothing on disk yet - nothing to clear
+                else:
+                    self._enqueue_record({"type": "clear"})
+
             if self.logger:
                 self.logger.info("Conversation cleared")
 
+    def _session_filename(self, suffix: str) -> str:
+        """Build the stable per-session filename.
+
+        Args:
+            suffix: File suffix ('.json' snapshot or '.jsonl' log)
+
+        Returns:
+            Filename based on session start time and ID
+        """
+        try:
+            timestamp = datetime.fromisoformat(self.start_time).strftime("%Y%m%d_%H%M%S")
+        except ValueError:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"session_{timestamp}_{self.session_id[:8]}{suffix}"
+
+    def _enqueue_record(self, record: Dict[str, Any]) -> None:
+        """Queue a log record for the background writer.
+
+        IMPORTANT: This method assumes the lock is already acquired!
+
+        Args:
+            record: Log record to append
+        """
+        self._pending.append(record)
+
+        if self._writer is None:
+            self._stop_event.clear()
+            self._writer = Thread(
+                target=self._writer_loop,
+                name=f"conversation-writer-{self.session_id[:8]}",
+                daemon=True
+            )
+            self._writer.start()
+            _live_managers.add(self)
+
+        self._flush_event.set()
+
+    def _writer_loop(self) -> None:
+        """Background loop that batches and flushes pending records.
+
+        Exits after WRITER_IDLE_SECONDS without new records; the next
+        message starts a fresh writer.
+        """
+        while True:
+            if not self._flush_event.wait(self.WRITER_IDLE_SECONDS):
+                with self._lock:
+                    if not self._pending:
+                        self._writer = None
+                        return
+                continue
+
+            # Let messages arriving within the interval share one write
+            if not self._stop_event.is_set() and self.flush_interval > 0:
+                self._stop_event.wait(self.flush_interval)
+
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(f"Auto-save failed: {e}")
+
+            if self._stop_event.is_set():
+                with self._lock:
+                    self._writer = None
+                return
+
+    def flush(self) -> Optional[Path]:
+        """Append pending messages to the session log.
+
+        Returns:
+            Path of the session log, or None if nothing has been written
+
+        Raises:
+            ConversationSaveError: If the write fails
+        """
+        with self._write_lock:
+            with self._lock:
+                records = self._pending
+                self._pending = []
+                message_count = len(self.messages)
+
+                new_log = self._log_path is None
+                if records and new_log:
+                    # A new log is self-contained: header plus every current message
+                    # (covers sessions continued after load() or close())
+                    records = [{
+                        "type": "session",
+                        "session_id": self.session_id,
+                        "start_time": self.start_time,
+                        "max_history": self.max_history
+                    }] + [{"type": "message", **msg.model_dump()} for msg in self.messages]
+
+            if not records:
+                return self._log_path
+
+            if new_log:
+                self._log_path = self.save_path / self._session_filename(".jsonl")
+
+            try:
+                lines = [json.dumps(r, ensure_ascii=False) for r in records]
+                with open(self._log_path, 'w' if new_log else 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+            except Exception as e:
+                # Put records back so a later flush can retry them
+                with self._lock:
+                    if new_log:
+                        # Any pending record makes the next flush rebuild the full log
+                        self._log_path = None
+                        self._pending = [{"type": "clear"}] + self._pending
+                    else:
+                        self._pending = records + self._pending
+                raise ConversationSaveError(f"Failed to write session log: {e}") from e
+
+            if new_log:
+                self._update_index(self._log_path, message_count)
+            self._index_records(records, self._log_path)
+
+            if self.logger:
+                self.logger.debug(f"Flushed {len(records)} record(s) to {self._log_path}")
+
+            return self._log_path
+
+    def close(self) -> Optional[Path]:
+        """Flush pending writes and compact the session log into a snapshot.
+
+        Safe to call more than once. The manager can keep adding messages
+        afterwards; they start a new log that the next close() compacts.
+
+        Returns:
+            Path of the compacted snapshot, or None if nothing was persisted
+        """
+        writer = self._writer
+        self._stop_event.set()
+        self._flush_event.set()
+        if writer is not None and writer.is_alive():
+            writer.join(timeout=max(self.flush_interval, 0) + 5)
+        _live_managers.discard(self)
+
+        if self.flush() is None:
+            return None
+
+        # Snapshot and drop the log under the write lock so no flush can
+        # append to the log between the two steps
+        with self._write_lock:
+            snapshot = self.save()
+            try:
+                if self._log_path is not None and self._log_path.exists():
+                    self._log_path.unlink()
+            except OSError:
+                pass
+            self._log_path = None
+
+        # Keep the index small: drop superseded entries
+        try:
+            entries = self.index.entries()
+            with open(self.index.path, 'r', encoding='utf-8') as f:
+                line_count = sum(1 for _ in f)
+            if line_count > 2 * len(entries) + 100:
+                self.index.compact()
+        except OSError:
+            pass
+
+        return snapshot
+
+    def _update_index(self, filepath: Path, message_count: int) -> None:
+        """Record session metadata in the session index.
+
+        Args:
+            filepath: Current file holding the session
+            message_count: Number of messages in the session
+        """
+        if filepath.parent.resolve() != self.save_path.resolve():
+            return  # Custom save locations aren't indexed
+
+        try:
+            self.index.update({
+                "session_id": self.session_id,
+                "file": filepath.name,
+                "start_time": self.start_time,
+                "end_time": datetime.now().isoformat(),
+                "message_count": message_count
+            })
+        except OSError as e:
+            if self.logger:
+                self.logger.warning(f"Failed to update session index: {e}")
+
+    def get_search_index(self) -> Optional[ConversationSearchIndex]:
+        """Get the full-text search index, opening it on first use.
+
+        Returns:
+            Search index, or None if disabled or unavailable
+        """
+        if not self.search_index_enabled:
+            return None
+
+        if self._search_index is None:
+            try:
+                self._search_index = get_search_index(str(self.search_index_path))
+            except ConversationIndexError as e:
+                # Don't retry on every flush - persistence works without search
+                self.search_index_enabled = False
+                if self.logger:
+                    self.logger.warning(f"Conversation search disabled: {e}")
+                return None
+
+        return self._search_index
+
+    def _index_records(self, records: List[Dict[str, Any]], filepath: Path) -> None:
+        """Feed records just written to the session log into the search index.
+
+        Args:
+            records: Log records in write order
+            filepath: Session log the records were written to
+        """
+        search_index = self.get_search_index()
+        if search_index is None:
+            return
+
+        try:
+            batch: List[Dict[str, Any]] = []
+            replace = False
+            for record in records:
+                if record["type"] == "message":
+                    batch.append(record)
+                    continue
+                # Session header or clear: following messages replace the indexed ones
+                if batch or replace:
+                    search_index.add_messages("cli", self.session_id, batch, replace=replace)
+                batch, replace = [], True
+            search_index.add_messages("cli", self.session_id, batch, replace=replace)
+            search_index.record_file("cli", self.session_id, filepath)
+        except ConversationIndexError as e:
+            if self.logger:
+                self.logger.warning(f"Failed to update conversation search index: {e}")
+
+    def sync_search_index(self) -> int:
+        """Index saved sessions the search index hasn't seen yet.
+
+        Covers sessions saved before the index existed and sessions written
+        by other processes. Unchanged files are skipped.
+
+        Returns:
+            Number of session files (re)indexed
+        """
+        search_index = self.get_search_index()
+        if search_index is None:
+            return 0
+
+        def read_session(path: Path):
+            data = _read_conversation_file(path)
+            return data["session_id"], data.get("messages", [])
+
+        files = [
+            p for p in self.save_path.glob("session_*.json*")
+            if p.suffix in (".json", ".jsonl")
+        ]
+        return search_index.sync_files("cli", files, read_session)
+
+    def search_saved(self, query: str, **filters) -> List[Dict[str, Any]]:
+        """Search messages of all saved conversations.
+
+        Args:
+            query: Words to search for
+            **filters: role, source, session_id, since, until, limit
+                (see ``ConversationSearchIndex.search``)
+
+        Returns:
+            Matching messages as dictionaries, best match first
+
+        Example:
+            >>> hits = manager.search_saved("vector store", role="assistant")
+            >>> print(hits[0]["snippet"])
+        """
+        search_index = self.get_search_index()
+        if search_index is None:
+            return []
+
+        self.flush()  # Include the current session's latest messages
+        self.sync_search_index()
+        return [hit.to_dict() for hit in search_index.search(query, **filters)]
+
     def _save_internal(self, filepath: Optional[Path] = None) -> Path:
         """Internal save method without lock acquisition.
 
@@ -326,10 +812,8 @@ class ConversationManager:
         """
         try:
             if filepath is None:
-                # Generate filename with session ID and timestamp
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"session_{timestamp}_{self.session_id[:8]}.json"
-                filepath = self.save_path / filename
+                # One snapshot per session, overwritten on each save
+                filepath = self.save_path / self._session_filename(".json")
 
             # Prepare conversation data
             conversation_data = {
@@ -341,9 +825,19 @@ class ConversationManager:
                 "messages": [msg.model_dump() for msg in self.messages]
             }
 
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Save to file (write-then-rename so a crash never leaves a torn snapshot)
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, filepath)
+
+            self._update_index(filepath, len(self.messages))
+
+            if filepath.parent.resolve() == self.save_path.resolve():
+                self._index_records(
+                    [{"type": "session"}] + [{"type": "message", **m.model_dump()} for m in self.messages],
+                    filepath
+                )
 
             if self.logger:
                 self.logger.debug(f"Conversation saved to {filepath}")
@@ -379,7 +873,8 @@ class ConversationManager:
     def load(self, filepath: Path) -> bool:
         """Load conversation from disk.
 
-        Loads a saved conversation and restores all messages.
+        Loads a saved conversation and restores all messages. Accepts both
+        compacted snapshots (.json) and session logs (.jsonl).
 
         Args:
             filepath: Path to conversation file
@@ -403,8 +898,7 @@ class ConversationManager:
                     )
 
                 # Load conversation data
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _read_conversation_file(filepath)
 
                 # Restore session data
                 self.session_id = data.get("session_id", self.session_id)
@@ -415,6 +909,10 @@ class ConversationManager:
                     Message(**msg) for msg in data.get("messages", [])
                 ]
 
+                # Continue the loaded session in its own log
+                self._pending = []
+                self._log_path = filepath if filepath.suffix == ".jsonl" else None
+
                 if self.logger:
                     self.logger.info(
                         f"Loaded conversation: {len(self.messages)} messages "
@@ -535,20 +1033,56 @@ class ConversationManager:
     def list_saved_conversations(self) -> List[Path]:
         """List all saved conversation files.
 
+        Uses the session index; the index is rebuilt from disk once if missing.
+
         Returns:
-            List of conversation file paths sorted by modification time
+            List of conversation file paths, most recently active first
 
         Example:
             >>> conversations = manager.list_saved_conversations()
             >>> for path in conversations:
             ...     print(path.name)
         """
-        return sorted(
-            self.save_path.glob("session_*.json"),
-            key=lambda p: p.stat().st_mtime,
+        if not self.index.path.exists():
+            self.index.rebuild()
+
+        entries = sorted(
+            self.index.entries().values(),
+            key=lambda e: e.get("end_time") or "",
             reverse=True
         )
 
+        paths = []
+        for entry in entries:
+            path = self.save_path / entry["file"]
+            if path.exists():
+                paths.append(path)
+        return paths
+
+    def find_saved_conversation(self, session_id: str) -> Optional[Path]:
+        """Find the file holding a saved session.
+
+        Args:
+            session_id: Full session ID
+
+        Returns:
+            Path to the session file, or None if not found
+
+        Example:
+            >>> path = manager.find_saved_conversation(session_id)
+            >>> if path:
+            ...     manager.load(path)
+        """
+        if not self.index.path.exists():
+            self.index.rebuild()
+
+        entry = self.index.entries().get(session_id)
+        if entry:
+            path = self.save_path / entry["file"]
+            if path.exists():
+                return path
+        return None
+
     def get_langchain_format(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
         """Get messages in LangChain chat format.
 
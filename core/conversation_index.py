@@ -0,0 +1,499 @@
+"""Full-text search over saved conversations for Meton.
+
+This module keeps a persistent SQLite inverted index of conversation
+messages so past sessions can be searched without opening every session
+file. CLI conversations (``ConversationManager``) and Web UI sessions
+(``web.session_manager.SessionManager``) feed it incrementally as they
+persist messages; ``sync_files()`` backfills sessions written before the
+index existed or by another process.
+
+Example:
+    >>> from core.conversation_index import ConversationSearchIndex
+    >>>
+    >>> index = ConversationSearchIndex("./conversations/search_index.db")
+    >>> index.add_messages("cli", session_id, [{"role": "user", "content": "fix the parser"}])
+    >>>
+    >>> for hit in index.search("parser", role="user", since="2026-01-01"):
+    ...     print(hit.session_id, hit.snippet)
+
+Ranking uses SQLite FTS5 with BM25 when available. Builds of SQLite without
+FTS5 fall back to a plain table scanned with LIKE, which returns the same
+results but is linear in the number of messages.
+"""
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Markers wrapped around matched terms in snippets
+SNIPPET_START = "[["
+SNIPPET_END = "]]"
+
+# Reads a session file into (session_id, messages)
+SessionReader = Callable[[Path], Tuple[str, List[Dict[str, Any]]]]
+
+
+class ConversationIndexError(Exception):
+    """Search index could not be read or updated."""
+    pass
+
+
+@dataclass
+class SearchHit:
+    """Single message matching a search query."""
+    source: str  # "cli" or "web"
+    session_id: str
+    role: str
+    timestamp: str
+    snippet: str  # Matched terms wrapped in SNIPPET_START/SNIPPET_END
+    score: float  # Lower is better (BM25)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class ConversationSearchIndex:
+    """Persistent full-text index of conversation messages.
+
+    Thread-safe: a single connection is shared behind a lock, so the
+    conversation writer thread and the UI thread can use one instance.
+
+    Attributes:
+        db_path: Path to the SQLite database
+        fts_enabled: Whether SQLite FTS5 backs the index
+    """
+
+    SNIPPET_TOKENS = 16  # Words of context around matches
+
+    def __init__(self, db_path: str):
+        """
+        Initialize search index, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file
+
+        Raises:
+            ConversationIndexError: If the database cannot be opened
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = Lock()
+
+        try:
+            self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=10)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.fts_enabled = self._create_schema()
+        except sqlite3.Error as e:
+            raise ConversationIndexError(f"Failed to open search index {self.db_path}: {e}") from e
+
+    def _create_schema(self) -> bool:
+        """Create tables, preferring FTS5. Returns whether FTS5 is used."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS indexed_files (
+                path TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+
+        # Messages live in a plain table (cheap per-session deletes and
+        # filters); FTS5 indexes its content as an external-content table
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS message_rows (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                role TEXT,
+                timestamp TEXT,
+                content TEXT
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_message_rows_session ON message_rows(source, session_id)"
+        )
+
+        try:
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    content,
+                    content = 'message_rows',
+                    content_rowid = 'id',
+                    tokenize = 'porter unicode61'
+                )
+            """)
+        except sqlite3.OperationalError:
+            self.conn.commit()
+            return False
+
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS message_rows_ai AFTER INSERT ON message_rows BEGIN
+                INSERT INTO messages_fts(rowid, content) VALUES (new.id, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS message_rows_ad AFTER DELETE ON message_rows BEGIN
+                INSERT INTO messages_fts(messages_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END;
+        """)
+        self.conn.commit()
+        return True
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add_messages(
+        self,
+        source: str,
+        session_id: str,
+        messages: Iterable[Dict[str, Any]],
+        replace: bool = False
+    ) -> int:
+        """
+        Index messages for a session.
+
+        Args:
+            source: Store the session belongs to ("cli" or "web")
+            session_id: Session ID
+            messages: Message dicts with role, content and timestamp
+            replace: Drop previously indexed messages of the session first
+
+        Returns:
+            Number of messages indexed
+        """
+        rows = [
+            (
+                str(msg.get("content", "")),
+                source,
+                session_id,
+                str(msg.get("role", "")),
+                str(msg.get("timestamp", ""))
+            )
+            for msg in messages
+            if msg.get("content")
+        ]
+
+        with self.lock:
+            try:
+                with self.conn:
+                    if replace:
+                        self._delete_session(source, session_id)
+                    self.conn.executemany(
+                        "INSERT INTO message_rows (content, source, session_id, role, timestamp) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                raise ConversationIndexError(f"Failed to index messages: {e}") from e
+
+        return len(rows)
+
+    def delete_session(self, source: str, session_id: str) -> None:
+        """
+        Remove a session from the index.
+
+        Args:
+            source: Store the session belongs to
+            session_id: Session ID
+        """
+        with self.lock:
+            try:
+                with self.conn:
+                    self._delete_session(source, session_id)
+                    self.conn.execute(
+                        "DELETE FROM indexed_files WHERE source = ? AND session_id = ?",
+                        (source, session_id)
+                    )
+            except sqlite3.Error as e:
+                raise ConversationIndexError(f"Failed to delete session: {e}") from e
+
+    def _delete_session(self, source: str, session_id: str) -> None:
+        """Delete indexed messages of a session (lock must be held)."""
+        self.conn.execute(
+            "DELETE FROM message_rows WHERE source = ? AND session_id = ?",
+            (source, session_id)
+        )
+
+    def record_file(self, source: str, session_id: str, path: Path) -> None:
+        """
+        Mark a session file as indexed at its current size and mtime.
+
+        Called after feeding messages incrementally, so the next
+        ``sync_files()`` doesn't re-read a file the index already covers.
+
+        Args:
+            source: Store the session belongs to
+            session_id: Session ID
+            path: Session file on disk
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+
+        with self.lock:
+            try:
+                with self.conn:
+                    self.conn.execute(
+                        "INSERT OR REPLACE INTO indexed_files (path, source, session_id, mtime, size) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (str(path.resolve()), source, session_id, stat.st_mtime, stat.st_size)
+                    )
+            except sqlite3.Error as e:
+                raise ConversationIndexError(f"Failed to record indexed file: {e}") from e
+
+    def sync_files(self, source: str, files: Iterable[Path], reader: SessionReader) -> int:
+        """
+        Bring the index in line with session files on disk.
+
+        Files unchanged since they were last indexed are skipped, so this is
+        one ``stat()`` per file once the index is warm. Sessions whose files
+        have all disappeared are dropped from the index.
+
+        Args:
+            source: Store the files belong to
+            files: Session files currently on disk
+            reader: Reads a file into (session_id, messages)
+
+        Returns:
+            Number of files (re)indexed
+        """
+        with self.lock:
+            known = {
+                row[0]: (row[1], row[2], row[3])
+                for row in self.conn.execute(
+                    "SELECT path, session_id, mtime, size FROM indexed_files WHERE source = ?",
+                    (source,)
+                )
+            }
+
+        current: Dict[str, Tuple[Path, os.stat_result]] = {}
+        for path in files:
+            try:
+                current[str(path.resolve())] = (path, path.stat())
+            except OSError:
+                continue
+
+        # Oldest first, so the newest file of a session is indexed last and wins
+        changed = sorted(
+            (
+                (key, path, stat) for key, (path, stat) in current.items()
+                if key not in known
+                or known[key][1] != stat.st_mtime
+                or known[key][2] != stat.st_size
+            ),
+            key=lambda item: item[2].st_mtime
+        )
+
+        reindexed = 0
+        for key, path, stat in changed:
+            try:
+                session_id, messages = reader(path)
+            except Exception:
+                continue  # Unreadable or partially written file - retry next sync
+            self.add_messages(source, session_id, messages, replace=True)
+            self.record_file(source, session_id, path)
+            reindexed += 1
+
+        # Drop files that disappeared; drop their sessions if no file remains
+        removed = [key for key in known if key not in current]
+        if removed:
+            with self.lock, self.conn:
+                for key in removed:
+                    self.conn.execute("DELETE FROM indexed_files WHERE path = ?", (key,))
+                for session_id in {known[key][0] for key in removed}:
+                    remaining = self.conn.execute(
+                        "SELECT 1 FROM indexed_files WHERE source = ? AND session_id = ? LIMIT 1",
+                        (source, session_id)
+                    ).fetchone()
+                    if remaining is None:
+                        self._delete_session(source, session_id)
+
+        return reindexed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        role: Optional[str] = None,
+        source: Optional[str] = None,
+        session_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """
+        Search indexed messages.
+
+        Every word of the query must match (prefix matching on the last
+        word). Date bounds compare against ISO 8601 timestamps, so
+        ``"2026-01-15"`` and full timestamps both work.
+
+        Args:
+            query: Words to search for
+            role: Only messages with this role
+            source: Only sessions from this store ("cli" or "web")
+            session_id: Only this session (a unique prefix is enough)
+            since: Only messages at or after this timestamp
+            until: Only messages before this timestamp (dates are inclusive)
+            limit: Maximum number of hits
+
+        Returns:
+            Hits ordered by relevance
+        """
+        terms = re.findall(r"\w+", query, flags=re.UNICODE)
+        if not terms:
+            return []
+
+        filters = []
+        params: List[Any] = []
+        if role:
+            filters.append("role = ?")
+            params.append(role)
+        if source:
+            filters.append("source = ?")
+            params.append(source)
+        if session_id:
+            filters.append("session_id LIKE ?")
+            params.append(f"{session_id}%")
+        if since:
+            filters.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            # A bare date includes the whole day
+            filters.append("timestamp < ?")
+            params.append(until + "~" if len(until) == 10 else until)
+
+        with self.lock:
+            try:
+                if self.fts_enabled:
+                    return self._search_fts(terms, filters, params, limit)
+                return self._search_like(terms, filters, params, limit)
+            except sqlite3.Error as e:
+                raise ConversationIndexError(f"Search failed: {e}") from e
+
+    def _search_fts(
+        self,
+        terms: List[str],
+        filters: List[str],
+        params: List[Any],
+        limit: int
+    ) -> List[SearchHit]:
+        """Ranked search using FTS5 (lock must be held)."""
+        match = " ".join(f'"{t}"' for t in terms[:-1])
+        match = f'{match} "{terms[-1]}"*'.strip()
+
+        where = " AND ".join(["messages_fts MATCH ?"] + [f"r.{f}" for f in filters])
+        rows = self.conn.execute(
+            f"""
+            SELECT r.source, r.session_id, r.role, r.timestamp,
+                   snippet(messages_fts, 0, ?, ?, '...', ?), bm25(messages_fts)
+            FROM messages_fts
+            JOIN message_rows r ON r.id = messages_fts.rowid
+            WHERE {where}
+            ORDER BY bm25(messages_fts)
+            LIMIT ?
+            """,
+            [SNIPPET_START, SNIPPET_END, self.SNIPPET_TOKENS, match, *params, limit]
+        ).fetchall()
+
+        return [SearchHit(*row) for row in rows]
+
+    def _search_like(
+        self,
+        terms: List[str],
+        filters: List[str],
+        params: List[Any],
+        limit: int
+    ) -> List[SearchHit]:
+        """Unranked substring search for SQLite builds without FTS5 (lock must be held)."""
+        conditions = ["content LIKE ?" for _ in terms] + filters
+        rows = self.conn.execute(
+            f"""
+            SELECT source, session_id, role, timestamp, content
+            FROM message_rows
+            WHERE {" AND ".join(conditions)}
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            [*(f"%{t}%" for t in terms), *params, limit]
+        ).fetchall()
+
+        return [
+            SearchHit(src, sid, role, ts, self._make_snippet(content, terms), 0.0)
+            for src, sid, role, ts, content in rows
+        ]
+
+    def _make_snippet(self, content: str, terms: List[str]) -> str:
+        """Build a highlighted snippet around the first matched term."""
+        pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+        match = pattern.search(content)
+        start = max(0, match.start() - 60) if match else 0
+        excerpt = content[start:start + 160]
+        excerpt = pattern.sub(lambda m: f"{SNIPPET_START}{m.group(0)}{SNIPPET_END}", excerpt)
+        prefix = "..." if start > 0 else ""
+        suffix = "..." if start + 160 < len(content) else ""
+        return f"{prefix}{excerpt}{suffix}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary with message, session and file counts
+        """
+        with self.lock:
+            messages = self.conn.execute("SELECT COUNT(*) FROM message_rows").fetchone()[0]
+            sessions = self.conn.execute(
+                "SELECT COUNT(*) FROM (SELECT DISTINCT source, session_id FROM message_rows)"
+            ).fetchone()[0]
+            files = self.conn.execute("SELECT COUNT(*) FROM indexed_files").fetchone()[0]
+
+        return {
+            "messages": messages,
+            "sessions": sessions,
+            "files": files,
+            "fts_enabled": self.fts_enabled,
+            "db_path": str(self.db_path)
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.conn.close()
+
+
+# Shared instances, one per database file
+_indexes: Dict[str, ConversationSearchIndex] = {}
+_indexes_lock = Lock()
+
+
+def get_search_index(db_path: str) -> ConversationSearchIndex:
+    """
+    Get the shared search index for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        ConversationSearchIndex instance
+
+    Raises:
+        ConversationIndexError: If the database cannot be opened
+    """
+    key = str(Path(db_path).resolve())
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = ConversationSearchIndex(db_path)
+        return _indexes[key]
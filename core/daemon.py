@@ -0,0 +1,478 @@
+"""Background daemon that keeps Meton warm behind a Unix domain socket.
+
+Every ``meton.py --query`` run normally pays full startup: importing
+langchain, loading the embedding models, FAISS index and metadata, and
+connecting to Ollama. The daemon does that once and then answers queries
+from thin clients over a local socket.
+
+Example:
+    >>> # Terminal 1
+    >>> # python meton.py --daemon
+    >>>
+    >>> from core.daemon import DaemonClient
+    >>> client = DaemonClient()
+    >>> result = client.query("Where is the config loaded?",
+    ...                       on_event=lambda e: print(e["event"]))
+    >>> print(result["output"])
+
+Protocol:
+    Newline-delimited JSON. A client connects, sends one request line, and
+    reads event lines until a ``result`` or ``error`` event. Requests:
+
+    - ``{"type": "ping"}``
+    - ``{"type": "status"}``
+    - ``{"type": "query", "query": "...", "reset": true}``
+    - ``{"type": "reload"}`` (reload the codebase index from disk)
+    - ``{"type": "shutdown"}``
+
+    Queries stream ``started``, ``tool_start`` and ``tool_end`` events
+    before the final ``result``.
+
+This module only uses the standard library at import time, so clients
+start in milliseconds; the server imports the CLI when it is built.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+DEFAULT_SOCKET_PATH = "~/.meton/meton.sock"
+SOCKET_ENV = "METON_SOCKET"
+PROTOCOL_VERSION = 1
+HOOK_PREFIX = "daemon_stream"
+
+
+class DaemonError(Exception):
+    """Base exception for daemon errors."""
+    pass
+
+
+class DaemonNotRunningError(DaemonError):
+    """No daemon is listening on the socket."""
+    pass
+
+
+def resolve_socket_path(socket_path: Optional[str] = None) -> Path:
+    """Resolve the daemon socket path.
+
+    Args:
+        socket_path: Explicit path; falls back to $METON_SOCKET, then the default
+
+    Returns:
+        Expanded socket path
+    """
+    path = socket_path or os.environ.get(SOCKET_ENV) or DEFAULT_SOCKET_PATH
+    return Path(path).expanduser()
+
+
+def _send(wfile, message: Dict[str, Any]) -> None:
+    """Write one JSON message line and flush it."""
+    wfile.write((json.dumps(message, default=str) + "\n").encode("utf-8"))
+    wfile.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one request line and streams the daemon's events back."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        def emit(message: Dict[str, Any]) -> None:
+            _send(self.wfile, message)
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            emit({"event": "error", "message": f"Invalid request: {e}"})
+            return
+
+        try:
+            self.server.meton_daemon.handle_request(request, emit)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away mid-stream
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded Unix socket server; handler threads don't block exit."""
+
+    daemon_threads = True
+
+
+class MetonDaemon:
+    """Serves queries from thin clients using one warm MetonCLI.
+
+    Connections are handled concurrently, but queries run one at a time
+    because the agent and its conversation aren't thread-safe. Tool
+    progress is streamed to the client that owns the running query through
+    PRE_TOOL/POST_TOOL hooks.
+
+    Attributes:
+        cli: Initialized MetonCLI whose agent and tools answer queries
+        socket_path: Unix socket the daemon listens on
+        reset_conversation: Clear the conversation before each query by default
+    """
+
+    def __init__(self, cli, socket_path: Optional[str] = None, reset_conversation: bool = True):
+        """Initialize daemon.
+
+        Args:
+            cli: Initialized MetonCLI instance
+            socket_path: Socket path (default: $METON_SOCKET or ~/.meton/meton.sock)
+            reset_conversation: Start each query with a fresh conversation
+        """
+        self.cli = cli
+        self.socket_path = resolve_socket_path(socket_path)
+        self.reset_conversation = reset_conversation
+
+        self.server: Optional[_UnixServer] = None
+        self.server_thread: Optional[threading.Thread] = None
+        self.started_at: Optional[float] = None
+        self.queries_served = 0
+
+        self._query_lock = threading.Lock()
+        self._emit: Optional[Callable[[Dict[str, Any]], None]] = None
+        self._stopped = threading.Event()
+
+    # ========== Lifecycle ==========
+
+    def start(self) -> None:
+        """Bind the socket and serve requests in a background thread.
+
+        Raises:
+            DaemonError: If another daemon is already listening on the socket
+        """
+        self._claim_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+        # Queries can read and run code: the socket is owner-only from bind()
+        old_umask = os.umask(0o177)
+        try:
+            self.server = _UnixServer(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+        self.server.meton_daemon = self
+
+        self._register_hooks()
+        self.started_at = time.time()
+        self._stopped.clear()
+        self.server_thread = threading.Thread(
+            target=self.server.serve_forever, name="meton-daemon", daemon=True
+        )
+        self.server_thread.start()
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket file, refusing if a daemon still answers on it."""
+        if not self.socket_path.exists():
+            return
+        if DaemonClient(str(self.socket_path), timeout=2).is_running():
+            raise DaemonError(f"A daemon is already running on {self.socket_path}")
+        self.socket_path.unlink()
+
+    def wait(self) -> None:
+        """Block until the daemon is stopped (by a client or a signal)."""
+        self._stopped.wait()
+
+    def stop(self) -> None:
+        """Stop serving, remove the socket and unregister stream hooks."""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+        self._unregister_hooks()
+        self._stopped.set()
+
+    # ========== Requests ==========
+
+    def handle_request(self, request: Dict[str, Any], emit: Callable[[Dict[str, Any]], None]) -> None:
+        """Dispatch one client request.
+
+        Args:
+            request: Decoded request object
+            emit: Sends one event to the client
+        """
+        request_type = request.get("type")
+
+        if request_type == "ping":
+            emit({"event": "result", "pong": True, "protocol": PROTOCOL_VERSION})
+        elif request_type == "status":
+            emit({"event": "result", **self.get_status()})
+        elif request_type == "query":
+            query = str(request.get("query", "")).strip()
+            if not query:
+                emit({"event": "error", "message": "Query is empty"})
+                return
+            self._run_query(query, request.get("reset", self.reset_conversation), emit)
+        elif request_type == "reload":
+            tool = getattr(self.cli, "codebase_search_tool", None)
+            reloaded = bool(tool and tool.reload_index())
+            emit({"event": "result", "reloaded": reloaded})
+        elif request_type == "shutdown":
+            emit({"event": "result", "stopping": True})
+            # Stop from another thread: shutdown() waits for serve_forever
+            threading.Thread(target=self.stop, daemon=True).start()
+        else:
+            emit({"event": "error", "message": f"Unknown request type: {request_type}"})
+
+    def _run_query(self, query: str, reset: bool, emit: Callable[[Dict[str, Any]], None]) -> None:
+        """Run a query through the agent, streaming tool events to the client.
+
+        Args:
+            query: User query
+            reset: Clear the conversation first
+            emit: Sends one event to the client
+        """
+        from utils.logger import query_context
+
+        if self._query_lock.locked():
+            emit({"event": "queued"})
+
+        with self._query_lock, query_context() as query_id:
+            start = time.time()
+            self._emit = emit
+            try:
+                emit({"event": "started", "query_id": query_id})
+                if reset and self.cli.conversation:
+                    self.cli.conversation.clear()
+                result = self.cli.agent.run(query)
+            except Exception as e:
+                emit({"event": "error", "message": str(e)})
+                return
+            finally:
+                self._emit = None
+                self.queries_served += 1
+
+        emit({
+            "event": "result",
+            "success": result.get("success", False),
+            "output": result.get("output", ""),
+            "error": result.get("error"),
+            "iterations": result.get("iterations", 0),
+            "tool_calls": len(result.get("tool_calls", [])),
+            "duration": round(time.time() - start, 3),
+            "query_id": query_id
+        })
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get daemon status.
+
+        Returns:
+            PID, socket, uptime, queries served, model, lazy component and index watcher state
+        """
+        from optimization.lazy_loader import get_lazy_registry
+
+        model_manager = getattr(self.cli, "model_manager", None)
+        watcher = getattr(self.cli, "index_watcher", None)
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.time() - self.started_at, 1) if self.started_at else 0.0,
+            "queries_served": self.queries_served,
+            "busy": self._query_lock.locked(),
+            "model": getattr(model_manager, "current_model", None),
+            "components": get_lazy_registry().get_stats()["components"],
+            "index_watcher": watcher.get_stats() if watcher is not None else None,
+        }
+
+    # ========== Tool event streaming ==========
+
+    def _register_hooks(self) -> None:
+        """Stream tool start/end events through the CLI's hook manager."""
+        from hooks import Hook, HookType
+
+        hook_manager = getattr(self.cli, "hook_manager", None)
+        if not hook_manager:
+            return
+        for hook_type in (HookType.PRE_TOOL, HookType.POST_TOOL):
+            hook_manager.register(Hook(
+                name=f"{HOOK_PREFIX}_{hook_type.value}",
+                hook_type=hook_type,
+                func=self._on_tool_event,
+                blocking=False,
+                description="Stream tool progress to daemon clients",
+                source="daemon"
+            ))
+
+    def _unregister_hooks(self) -> None:
+        """Remove the stream hooks."""
+        from hooks import HookType
+
+        hook_manager = getattr(self.cli, "hook_manager", None)
+        if not hook_manager:
+            return
+        for hook_type in (HookType.PRE_TOOL, HookType.POST_TOOL):
+            hook_manager.unregister(f"{HOOK_PREFIX}_{hook_type.value}", hook_type)
+
+    def _on_tool_event(self, context):
+        """Forward a tool hook to the client of the running query."""
+        from hooks import HookResult, HookType
+
+        emit = self._emit
+        if emit is not None:
+            if context.hook_type == HookType.PRE_TOOL:
+                event = {"event": "tool_start", "name": context.name}
+            else:
+                event = {
+                    "event": "tool_end",
+                    "name": context.name,
+                    "success": context.success,
+                    "duration": round(context.duration_seconds, 3)
+                }
+            try:
+                emit(event)
+            except OSError:
+                pass  # Client disconnected; the query still finishes
+        return HookResult(success=True)
+
+
+class DaemonClient:
+    """Thin client for a running MetonDaemon.
+
+    Example:
+        >>> client = DaemonClient()
+        >>> if client.is_running():
+        ...     print(client.query("Explain core/agent.py")["output"])
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: Optional[float] = None):
+        """Initialize client.
+
+        Args:
+            socket_path: Socket path (default: $METON_SOCKET or ~/.meton/meton.sock)
+            timeout: Socket timeout in seconds (None waits for long queries)
+        """
+        self.socket_path = resolve_socket_path(socket_path)
+        self.timeout = timeout
+
+    def _request(self, request: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Send a request and yield the daemon's events.
+
+        Raises:
+            DaemonNotRunningError: If nothing is listening on the socket
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            try:
+                sock.connect(str(self.socket_path))
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                raise DaemonNotRunningError(f"No daemon on {self.socket_path}") from e
+
+            sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as rfile:
+                for line in rfile:
+                    yield json.loads(line)
+        finally:
+            sock.close()
+
+    def _call(self, request: Dict[str, Any],
+              on_event: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Send a request and return its final result event.
+
+        Raises:
+            DaemonError: If the daemon reports an error or closes early
+        """
+        for message in self._request(request):
+            event = message.get("event")
+            if event == "result":
+                return message
+            if event == "error":
+                raise DaemonError(message.get("message", "Unknown daemon error"))
+            if on_event:
+                on_event(message)
+        raise DaemonError("Daemon closed the connection without a result")
+
+    def is_running(self) -> bool:
+        """Check whether a daemon answers on the socket.
+
+        Returns:
+            True if a ping succeeded
+        """
+        try:
+            return bool(self._call({"type": "ping"}).get("pong"))
+        except (DaemonError, OSError, ValueError):
+            return False
+
+    def query(self, query: str, on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+              reset: Optional[bool] = None) -> Dict[str, Any]:
+        """Run a query on the daemon.
+
+        Args:
+            query: User query
+            on_event: Called with each progress event (started, tool_start, tool_end)
+            reset: Clear the conversation first (None uses the daemon's default)
+
+        Returns:
+            Result event with success, output, error, iterations, tool_calls, duration
+        """
+        request = {"type": "query", "query": query}
+        if reset is not None:
+            request["reset"] = reset
+        return self._call(request, on_event)
+
+    def status(self) -> Dict[str, Any]:
+        """Get daemon status."""
+        return self._call({"type": "status"})
+
+    def reload(self) -> bool:
+        """Reload the daemon's codebase index from disk."""
+        return bool(self._call({"type": "reload"}).get("reloaded"))
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop."""
+        self._call({"type": "shutdown"})
+
+
+def run_daemon(socket_path: Optional[str] = None) -> int:
+    """Initialize Meton and serve queries until stopped.
+
+    Args:
+        socket_path: Socket path override (default: daemon.socket_path from config)
+
+    Returns:
+        Process exit code
+    """
+    from cli import MetonCLI
+    from optimization.lazy_loader import get_lazy_registry
+
+    cli = MetonCLI()
+    if not cli.initialize():
+        return 1
+
+    daemon_config = cli.config.config.daemon
+    if daemon_config.prewarm:
+        cli.console.print("[dim]Prewarming components...[/dim]")
+        get_lazy_registry().prewarm(background=False)
+
+    daemon = MetonDaemon(
+        cli,
+        socket_path=socket_path or os.environ.get(SOCKET_ENV) or daemon_config.socket_path,
+        reset_conversation=daemon_config.reset_conversation
+    )
+    try:
+        daemon.start()
+    except DaemonError as e:
+        cli.console.print(f"[red]❌ {e}[/red]")
+        return 1
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: daemon.stop())
+
+    cli.console.print(f"[green]✓ Meton daemon listening on {daemon.socket_path}[/green]")
+    daemon.wait()
+    cli.shutdown()
+    return 0
@@ -298,7 +298,8 @@ class ModelManager:
         prompt: str,
         model: Optional[str] = None,
         stream: bool = False,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        verify: bool = True
     ) -> Union[str, Iterator[str]]:
         """Generate text from a prompt.
 
@@ -307,6 +308,8 @@ class ModelManager:
             model: Model name or alias (uses current if None)
             stream: Whether to stream response chunks
             options: Optional dict to override generation parameters
+            verify: Check the model is available first (one ollama.list()
+                round trip); callers that verified it once can skip this
 
         Returns:
             Generated text (complete string if stream=False, iterator if stream=True)
@@ -331,7 +334,7 @@ class ModelManager:
             model_name = self.resolve_alias(model)
 
         # Verify model exists
-        if not self.check_model_available(model_name):
+        if verify and not self.check_model_available(model_name):
             raise ModelNotFoundError(
                 f"Model '{model_name}' not found.\n"
                 f"Pull it with: ollama pull {model_name}"
@@ -1,16 +1,30 @@
 """
 Long-term memory system for cross-session learning.
+
+Submodules are imported on first attribute access, so importing the
+package doesn't pull in heavy dependencies (sentence-transformers, FAISS)
+until they are used.
 """
 
-from .long_term_memory import LongTermMemory, Memory
-from .memory_embeddings import MemoryEmbeddings
-from .cross_session_learning import CrossSessionLearning, Pattern, Insight
+import importlib
+
+_EXPORTS = {
+    "LongTermMemory": ".long_term_memory",
+    "Memory": ".long_term_memory",
+    "MemoryEmbeddings": ".memory_embeddings",
+    "CrossSessionLearning": ".cross_session_learning",
+    "Pattern": ".cross_session_learning",
+    "Insight": ".cross_session_learning",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "LongTermMemory",
-    "Memory",
-    "MemoryEmbeddings",
-    "CrossSessionLearning",
-    "Pattern",
-    "Insight"
-]
+def __getattr__(name):
+    """Import exports on first access so importing the package stays cheap."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -6,6 +6,7 @@ Persistent memory system for cross-session learning with semantic search,
 consolidation, and decay mechanisms.
 """
 
+import importlib.util
 import json
 import math
 import uuid
@@ -17,12 +18,12 @@ from typing import List, Dict, Optional, Tuple
 import numpy as np
 
 from .memory_embeddings import MemoryEmbeddings
+from optimization.resource_monitor import (
+    get_resource_monitor, estimate_size, estimate_model_bytes, faiss_index_bytes
+)
 
-try:
-    import faiss
-    FAISS_AVAILABLE = True
-except ImportError:
-    FAISS_AVAILABLE = False
+# Imported in _initialize so importing this module stays cheap
+FAISS_AVAILABLE = importlib.util.find_spec("faiss") is not None
 
 
 @dataclass
@@ -109,6 +110,10 @@ class LongTermMemory:
 
         self._initialize()
 
+        monitor = get_resource_monitor()
+        monitor.register_component("long_term_memory", self.estimate_memory)
+        monitor.register_component("memory_embedding_model", self.estimate_model_memory)
+
     def _initialize(self):
         """Initialize embeddings model, vector store, and load memories."""
         # Initialize embeddings
@@ -127,6 +132,8 @@ class LongTermMemory:
                 "Install with: pip install faiss-cpu"
             )
 
+        import faiss
+
         dimension = self.embeddings_model.dimension
         # Use HNSW index for better performance with large datasets
         self.vector_store = faiss.IndexHNSWFlat(dimension, 32)
@@ -470,6 +477,25 @@ class LongTermMemory:
 
             return decayed_count
 
+    def estimate_memory(self) -> int:
+        """
+        Estimate memory held by stored memories and the FAISS index.
+
+        Returns:
+            Estimated size in bytes
+        """
+        return estimate_size(self.memories) + faiss_index_bytes(self.vector_store)
+
+    def estimate_model_memory(self) -> int:
+        """
+        Estimate memory held by the embedding model's weights.
+
+        Returns:
+            Size in bytes
+        """
+        model = getattr(self.embeddings_model, "model", None)
+        return estimate_model_bytes(model) if model is not None else 0
+
     def get_memory_stats(self) -> Dict:
         """
         Get statistics about memory system.
@@ -650,6 +676,8 @@ class LongTermMemory:
 
     def _rebuild_vector_store(self):
         """Rebuild FAISS index from all memories."""
+        import faiss
+
         dimension = self.embeddings_model.dimension
         self.vector_store = faiss.IndexHNSWFlat(dimension, 32)
 
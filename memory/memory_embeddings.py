@@ -5,14 +5,13 @@ Memory Embeddings Module.
 Handles embedding generation for long-term memories using sentence transformers.
 """
 
+import importlib.util
 from typing import List
 import numpy as np
 
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# sentence-transformers (and torch) take seconds to import; check for it
+# here and import it only when a model is actually built.
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
 
 
 class MemoryEmbeddings:
@@ -31,6 +30,8 @@ class MemoryEmbeddings:
                 "Install with: pip install sentence-transformers"
             )
 
+        from sentence_transformers import SentenceTransformer
+
         self.model_name = model_name
         self.model = SentenceTransformer(model_name)
         self.dimension = self.model.get_sentence_embedding_dimension()
@@ -8,6 +8,7 @@ Everything runs on your hardware - no external API calls, no data leaving your m
 """
 
 import sys
+import argparse
 import logging
 from pathlib import Path
 
@@ -15,16 +16,138 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Load config and set up logging early (before other imports)
-from core.config import Config
-from utils.logger import setup_logger
+# Standard library only: thin clients must not pay for config or model imports
+from core.daemon import DaemonClient, DaemonError, DaemonNotRunningError
 
-config = Config()
-logging_config = config.config.logging
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Meton - Local AI Coding Assistant")
+    parser.add_argument("--query", "-q", help="Answer one query and exit")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Answer --query in this process even if a daemon is running")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Run the background daemon (keeps models and indexes warm)")
+    parser.add_argument("--daemon-status", action="store_true", help="Show daemon status")
+    parser.add_argument("--daemon-stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--daemon-reload", action="store_true",
+                        help="Reload the daemon's codebase index after re-indexing")
+    parser.add_argument("--socket", help="Daemon socket (default: $METON_SOCKET or ~/.meton/meton.sock)")
+    parser.add_argument("--batch", nargs=2, metavar=("SKILL", "TARGET"),
+                        help="Run review/refactor/docs over a directory or glob and exit")
+    parser.add_argument("--workers", type=int, help="Worker processes for --batch (default: from config)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached --batch results")
+    parser.add_argument("--json", action="store_true",
+                        help="Print --batch results as JSON lines (one per file, then the summary)")
+    return parser.parse_args(argv)
 
-def configure_logging() -> None:
+
+def print_event(event: dict) -> None:
+    """Print daemon progress events to stderr."""
+    if event["event"] == "queued":
+        print("⏳ Waiting for the daemon to finish another query...", file=sys.stderr)
+    elif event["event"] == "tool_start":
+        print(f"  🔧 {event['name']}...", file=sys.stderr)
+    elif event["event"] == "tool_end":
+        mark = "✓" if event.get("success") else "✗"
+        print(f"  {mark} {event['name']} ({event.get('duration', 0):.2f}s)", file=sys.stderr)
+
+
+def query_daemon(args: argparse.Namespace):
+    """Forward --query to a running daemon.
+
+    Returns:
+        Exit code, or None if no daemon is running
+    """
+    client = DaemonClient(args.socket)
+    try:
+        result = client.query(args.query, on_event=print_event)
+    except DaemonNotRunningError:
+        return None
+    except DaemonError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if not result["success"]:
+        print(f"❌ Query failed: {result.get('error') or 'Unknown error'}", file=sys.stderr)
+        return 1
+    print(result["output"])
+    return 0
+
+
+def control_daemon(args: argparse.Namespace) -> int:
+    """Handle --daemon-status, --daemon-stop and --daemon-reload."""
+    client = DaemonClient(args.socket, timeout=10)
+    try:
+        if args.daemon_stop:
+            client.shutdown()
+            print("👋 Daemon stopped")
+        elif args.daemon_reload:
+            print("✓ Index reloaded" if client.reload() else "⚠ No index to reload")
+        else:
+            status = client.status()
+            print(f"Meton daemon (pid {status['pid']}) on {status['socket']}")
+            print(f"  Model:   {status['model']}")
+            print(f"  Uptime:  {status['uptime_seconds']:.0f}s")
+            print(f"  Queries: {status['queries_served']}{' (busy)' if status['busy'] else ''}")
+            for name, component in status["components"].items():
+                print(f"  {name}: {'loaded' if component['loaded'] else 'not loaded'}")
+            watcher = status.get("index_watcher")
+            if watcher:
+                print(f"  Watching: {watcher['root']} ({watcher['backend']}, "
+                      f"{watcher['files_updated']} files updated, {watcher['pending']} pending)")
+        return 0
+    except DaemonNotRunningError:
+        print(f"No daemon running on {client.socket_path}")
+        return 1
+    except DaemonError as e:
+        print(f"❌ {e}")
+        return 1
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """Handle --batch: stream per-file results, then the summary."""
+    import json
+    from core.config import Config
+    from skills.batch import BatchError, SkillBatchRunner, describe
+
+    skills_config = Config().config.skills
+    skill_name, target = args.batch
+    try:
+        runner = SkillBatchRunner(
+            skill_name,
+            workers=args.workers if args.workers is not None else skills_config.batch_workers,
+            cache_path=None if args.no_cache else skills_config.batch_cache_path,
+            cache_size=skills_config.batch_cache_size
+        )
+        for file_result in runner.run(target):
+            if args.json:
+                print(json.dumps(file_result.to_dict()), flush=True)
+            else:
+                progress = runner.progress
+                mark = "✓" if file_result.success else "✗"
+                source = " (cached)" if file_result.cached else ""
+                print(f"[{progress.done}/{progress.total}] {mark} {file_result.path}: "
+                      f"{describe(file_result)}{source}", flush=True)
+    except BatchError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    summary = runner.summarize()
+    if args.json:
+        print(json.dumps({"summary": summary}))
+    else:
+        progress = summary["progress"]
+        print(f"\n{progress['done']} files in {progress['elapsed']:.1f}s "
+              f"({progress['files_per_second']} files/s, {progress['lines_per_second']:.0f} lines/s), "
+              f"{progress['cached']} from cache, {progress['failed']} failed")
+    return 1 if summary["failed"] else 0
+
+
+def configure_logging(logging_config) -> logging.Logger:
     """Configure logging based on config.yaml settings."""
+    from utils.logger import setup_logger
+
     # Suppress noisy library logs if configured
     if logging_config.suppress_library_logs:
         noisy_loggers = [
@@ -53,21 +176,54 @@ def configure_logging() -> None:
     return logger
 
 
-# Configure logging before importing CLI
-logger = configure_logging()
+def main(argv=None) -> int:
+    """Run Meton: interactive CLI, one-shot query, or daemon."""
+    args = parse_args(argv)
 
-from cli import main
+    # Thin client paths: answered by the daemon without loading anything
+    if args.daemon_status or args.daemon_stop or args.daemon_reload:
+        return control_daemon(args)
+    if args.query and not args.no_daemon and not args.daemon:
+        exit_code = query_daemon(args)
+        if exit_code is not None:
+            return exit_code
 
+    # Batch mode only needs the skills, not the models
+    if args.batch:
+        return run_batch(args)
+
+    # Load config and set up logging before importing the CLI
+    from core.config import Config
+    logger = configure_logging(Config().config.logging)
 
-if __name__ == "__main__":
     try:
+        if args.daemon:
+            from core.daemon import run_daemon
+            logger.info("Starting Meton daemon")
+            return run_daemon(args.socket)
+
+        if args.query:
+            from cli import MetonCLI
+            cli = MetonCLI()
+            if not cli.initialize():
+                return 1
+            cli.process_query(args.query)
+            cli.shutdown()
+            return 0
+
+        from cli import main as cli_main
         logger.info("Starting Meton")
-        main()
+        cli_main()
+        return 0
     except KeyboardInterrupt:
         logger.info("User interrupted - shutting down")
         print("\n\n👋 Goodbye!")
-        sys.exit(0)
+        return 0
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         print(f"\n\n❌ Fatal error: {e}")
-        sys.exit(1)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
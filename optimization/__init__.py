@@ -5,25 +5,51 @@ Provides performance optimization capabilities including:
 - Performance profiling
 - Intelligent caching
 - Query optimization
+- Query routing (fast path)
+- Speculative tool prefetch
+- Learned latency prediction
 - Resource monitoring
+- Lazy component loading
+
+Submodules are imported on first attribute access, so importing the
+package doesn't pull in heavy dependencies (sentence-transformers, FAISS)
+until they are used.
 """
 
-from optimization.profiler import PerformanceProfiler, get_profiler, timed, TimingContext
-from optimization.cache_manager import CacheManager, get_cache_manager, EmbeddingCache, QueryCache
-from optimization.query_optimizer import QueryOptimizer, get_optimizer
-from optimization.resource_monitor import ResourceMonitor, get_resource_monitor
+import importlib
+
+_EXPORTS = {
+    "PerformanceProfiler": "optimization.profiler",
+    "get_profiler": "optimization.profiler",
+    "timed": "optimization.profiler",
+    "TimingContext": "optimization.profiler",
+    "CacheManager": "optimization.cache_manager",
+    "get_cache_manager": "optimization.cache_manager",
+    "EmbeddingCache": "optimization.cache_manager",
+    "QueryCache": "optimization.cache_manager",
+    "QueryOptimizer": "optimization.query_optimizer",
+    "get_optimizer": "optimization.query_optimizer",
+    "QueryRouter": "optimization.query_router",
+    "RoutingDecision": "optimization.query_router",
+    "ToolPrefetcher": "optimization.tool_prefetch",
+    "PrefetchRun": "optimization.tool_prefetch",
+    "LatencyModel": "optimization.latency_model",
+    "get_latency_model": "optimization.latency_model",
+    "ResourceMonitor": "optimization.resource_monitor",
+    "get_resource_monitor": "optimization.resource_monitor",
+    "LazyComponent": "optimization.lazy_loader",
+    "LazyRegistry": "optimization.lazy_loader",
+    "get_lazy_registry": "optimization.lazy_loader",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "PerformanceProfiler",
-    "get_profiler",
-    "timed",
-    "TimingContext",
-    "CacheManager",
-    "get_cache_manager",
-    "EmbeddingCache",
-    "QueryCache",
-    "QueryOptimizer",
-    "get_optimizer",
-    "ResourceMonitor",
-    "get_resource_monitor",
-]
+def __getattr__(name):
+    """Import exports on first access so importing the package stays cheap."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Latency Model - Learn per-tool and per-query latency from recorded timings.
+
+Features:
+- Online quantile regression (p50/p90) on simple query features
+- One model per tool and per route ("query:full", "query:fast_path")
+- Incremental fitting from PerformanceAnalytics metrics (each metric once)
+- Adaptive tool timeouts and ETAs from the learned p90/p50, suspended after
+  a timed-out call until the p90 covers the tool's calls again
+- Prediction error tracking over time (MAE, relative error, p90 coverage)
+
+Latencies are modeled in log space: ``log(seconds) ≈ w_q · x`` per quantile q,
+fit with one stochastic gradient step on the pinball loss per observation.
+Until a key has ``min_samples`` observations, predictions fall back to the
+QueryOptimizer's hard-coded estimates (``source: "prior"``).
+"""
+
+from typing import List, Dict, Any, Optional, Iterable
+from collections import deque
+from pathlib import Path
+import copy
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+import time
+
+from optimization.query_optimizer import QueryOptimizer, get_optimizer
+
+
+QUANTILES = (0.5, 0.9)
+
+# Query-level model keys
+QUERY_KEY = "query:{route}"
+DEFAULT_ROUTE = "full"
+
+# Predictions since a timeout that decide whether the p90 covers a tool again
+RECOVERY_WINDOW = 20
+
+# Mentions of local code/files (tool calls tend to be slower for these)
+CODE_REFERENCE = re.compile(r"`[^`]+`|[\w\-/]+\.\w{1,4}\b|\b\w+\(\)")
+
+
+class QuantileModel:
+    """Online linear quantile regression in log-latency space."""
+
+    def __init__(
+        self,
+        n_features: int,
+        quantiles: Iterable[float] = QUANTILES,
+        learning_rate: float = 0.2,
+        min_learning_rate: float = 0.02
+    ):
+        """
+        Initialize quantile model.
+
+        Args:
+            n_features: Length of the feature vectors
+            quantiles: Quantiles to estimate
+            learning_rate: Initial SGD step size (decays with 1/sqrt(n))
+            min_learning_rate: Step size floor, so the model keeps tracking drift
+        """
+        self.quantiles = tuple(quantiles)
+        self.learning_rate = learning_rate
+        self.min_learning_rate = min_learning_rate
+        self.weights: Dict[float, List[float]] = {q: [0.0] * n_features for q in self.quantiles}
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def predict(self, features: List[float]) -> Dict[float, float]:
+        """Predict latency in seconds for each quantile."""
+        result = {}
+        for q, weights in self.weights.items():
+            log_value = sum(w * x for w, x in zip(weights, features))
+            result[q] = math.exp(min(log_value, 20.0))
+        # Quantiles trained independently can cross; keep them ordered
+        ordered = sorted(result.values())
+        return dict(zip(sorted(result), ordered))
+
+    def update(self, features: List[float], seconds: float) -> None:
+        """Take one pinball-loss gradient step toward an observed latency."""
+        target = math.log(max(seconds, 1e-3))
+
+        if self.count == 0:
+            # Start from the first observation instead of e^0 = 1s
+            for weights in self.weights.values():
+                weights[0] = target
+
+        rate = max(self.min_learning_rate, self.learning_rate / math.sqrt(1 + self.count))
+        norm = sum(x * x for x in features) or 1.0
+        for q, weights in self.weights.items():
+            residual = target - sum(w * x for w, x in zip(weights, features))
+            gradient = q if residual > 0 else q - 1.0
+            step = rate * gradient / norm
+            for i, x in enumerate(features):
+                weights[i] += step * x
+
+        self.count += 1
+        self.total_seconds += seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the model state."""
+        return {
+            "count": self.count,
+            "total_seconds": self.total_seconds,
+            "weights": {str(q): w for q, w in self.weights.items()}
+        }
+
+    def load_dict(self, data: Dict[str, Any]) -> None:
+        """Restore state saved by to_dict() (ignored if the features changed)."""
+        weights = {float(q): list(w) for q, w in data.get("weights", {}).items()}
+        if set(weights) != set(self.quantiles):
+            return
+        if any(len(w) != len(self.weights[q]) for q, w in weights.items()):
+            return
+        self.weights = weights
+        self.count = int(data.get("count", 0))
+        self.total_seconds = float(data.get("total_seconds", 0.0))
+
+
+class LatencyModel:
+    """Predict tool and query latency distributions from recorded timings."""
+
+    def __init__(
+        self,
+        optimizer: Optional[QueryOptimizer] = None,
+        min_samples: int = 5,
+        error_window: int = 200,
+        path: Optional[str] = None,
+        min_coverage: float = 0.8
+    ):
+        """
+        Initialize latency model.
+
+        Args:
+            optimizer: QueryOptimizer for query classification and prior
+                estimates (global one if None)
+            min_samples: Observations a key needs before its predictions
+                replace the prior
+            error_window: Recent prediction errors kept for trend statistics
+            path: JSON file the model is loaded from and saved to (optional)
+            min_coverage: p90 coverage a tool needs after a timeout before
+                its timeouts adapt again
+        """
+        self.optimizer = optimizer or get_optimizer()
+        self.min_samples = min_samples
+        self.min_coverage = min_coverage
+        self.path = Path(path) if path else None
+        self.query_types = list(self.optimizer.classification_patterns)
+
+        self.lock = threading.RLock()
+        self.models: Dict[str, QuantileModel] = {}
+        self.seen_metrics: set = set()  # PerformanceAnalytics metric IDs already fit
+
+        # Prediction error, cumulative per key and recent overall
+        self.errors: Dict[str, Dict[str, float]] = {}
+        self.recent_errors: deque = deque(maxlen=error_window)
+
+        # p90 coverage of each prediction since a key's last timeout
+        self.recovering: Dict[str, List[bool]] = {}
+
+        if self.path and self.path.exists():
+            self.load()
+
+    # ------------------------------------------------------------------
+    # Features
+    # ------------------------------------------------------------------
+
+    def features(self, query: str) -> List[float]:
+        """
+        Feature vector for a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            [bias, log word count, query type one-hot..., mentions code]
+        """
+        query_type = self.optimizer.classify_query(query) if query else "general"
+        return (
+            [1.0, math.log1p(len(query.split()))]
+            + [1.0 if query_type == t else 0.0 for t in self.query_types]
+            + [1.0 if CODE_REFERENCE.search(query or "") else 0.0]
+        )
+
+    def _model_for(self, key: str) -> QuantileModel:
+        model = self.models.get(key)
+        if model is None:
+            model = self.models[key] = QuantileModel(len(self.query_types) + 3)
+        return model
+
+    # ------------------------------------------------------------------
+    # Learning
+    # ------------------------------------------------------------------
+
+    def observe_tool(self, tool: str, seconds: float, query: str = "") -> None:
+        """
+        Record how long a tool call took.
+
+        Args:
+            tool: Tool name
+            seconds: Execution time
+            query: Query the call was made for
+        """
+        self._observe(tool, query, seconds)
+
+    def observe_timeout(self, tool: str, seconds: float, query: str = "") -> None:
+        """
+        Record a tool call abandoned after ``seconds``.
+
+        The call took at least that long, so it is observed at that value.
+        Until the p90 covers the tool's calls again, suggest_timeout()
+        returns its maximum for the tool.
+
+        Args:
+            tool: Tool name
+            seconds: Time waited before giving up
+            query: Query the call was made for
+        """
+        self._observe(tool, query, seconds)
+        with self.lock:
+            self.recovering[tool] = []
+
+    def observe_query(self, query: str, seconds: float, route: str = DEFAULT_ROUTE) -> None:
+        """
+        Record how long a query took end to end.
+
+        Args:
+            query: Query text
+            seconds: Response time
+            route: Route the query took (QueryRouter route name)
+        """
+        self._observe(QUERY_KEY.format(route=route), query, seconds)
+
+    def _observe(self, key: str, query: str, seconds: float) -> None:
+        if seconds is None or seconds < 0:
+            return
+        features = self.features(query)
+        with self.lock:
+            model = self._model_for(key)
+            if model.count >= self.min_samples:
+                self._record_error(key, model.predict(features), seconds)
+            model.update(features, seconds)
+
+    def fit_metrics(self, metrics: Iterable[Any]) -> int:
+        """
+        Fit on PerformanceAnalytics metrics not seen before.
+
+        Args:
+            metrics: MetricRecord objects (query, response_time, tool_times)
+
+        Returns:
+            Number of new metrics fit
+        """
+        fitted = 0
+        with self.lock:
+            for metric in metrics:
+                if metric.id in self.seen_metrics:
+                    continue
+                self.seen_metrics.add(metric.id)
+                if metric.success:
+                    self.observe_query(metric.query, metric.response_time)
+                for tool, seconds in (metric.tool_times or {}).items():
+                    self.observe_tool(tool, seconds, metric.query)
+                fitted += 1
+        return fitted
+
+    # ------------------------------------------------------------------
+    # Prediction
+    # ------------------------------------------------------------------
+
+    def predict_tool(self, tool: str, query: str = "") -> Dict[str, Any]:
+        """
+        Predict a tool call's latency distribution.
+
+        Args:
+            tool: Tool name
+            query: Query the call is made for
+
+        Returns:
+            Dictionary with p50, p90 (seconds), samples and source
+            ("model" or "prior")
+        """
+        prior = QueryOptimizer.TOOL_TIME_ESTIMATES.get(tool, QueryOptimizer.DEFAULT_TOOL_TIME)
+        return self._predict(tool, query, prior)
+
+    def predict_query(
+        self,
+        query: str,
+        tools: Optional[List[str]] = None,
+        route: str = DEFAULT_ROUTE
+    ) -> Dict[str, Any]:
+        """
+        Predict a query's end-to-end latency distribution.
+
+        Args:
+            query: Query text
+            tools: Tools expected to run (used by the prior only)
+            route: Route the query will take
+
+        Returns:
+            Dictionary with p50, p90 (seconds), samples and source
+        """
+        if tools is None:
+            tools = self.optimizer.optimize_tool_selection(query)
+        prior = self.optimizer.heuristic_execution_time(query, tools)
+        return self._predict(QUERY_KEY.format(route=route), query, prior)
+
+    def _predict(self, key: str, query: str, prior: float) -> Dict[str, Any]:
+        with self.lock:
+            model = self.models.get(key)
+            samples = model.count if model else 0
+            if samples < self.min_samples:
+                return {"p50": prior, "p90": prior * 2, "samples": samples, "source": "prior"}
+            predicted = model.predict(self.features(query))
+        return {"p50": predicted[0.5], "p90": predicted[0.9], "samples": samples, "source": "model"}
+
+    def suggest_timeout(
+        self,
+        tool: str,
+        query: str = "",
+        multiplier: float = 3.0,
+        minimum: float = 5.0,
+        maximum: float = 30.0
+    ) -> float:
+        """
+        Timeout for a tool call: a margin over its learned p90.
+
+        Args:
+            tool: Tool name
+            query: Query the call is made for
+            multiplier: Margin applied to the p90
+            minimum: Shortest timeout returned
+            maximum: Longest timeout returned (also used without enough data)
+
+        Returns:
+            Timeout in seconds, within [min(minimum, maximum), maximum];
+            the maximum while the tool recovers from a timeout
+        """
+        prediction = self.predict_tool(tool, query)
+        if prediction["source"] != "model" or tool in self.recovering:
+            return maximum
+        return min(maximum, max(minimum, prediction["p90"] * multiplier))
+
+    # ------------------------------------------------------------------
+    # Error tracking
+    # ------------------------------------------------------------------
+
+    def _record_error(self, key: str, predicted: Dict[float, float], actual: float) -> None:
+        """Score a prediction made before the model saw the observation."""
+        error = abs(predicted[0.5] - actual)
+        relative = error / max(actual, 1e-3)
+        covered = actual <= predicted[0.9]
+
+        stats = self.errors.setdefault(key, {
+            "count": 0, "abs_error": 0.0, "relative_error": 0.0, "covered": 0
+        })
+        stats["count"] += 1
+        stats["abs_error"] += error
+        stats["relative_error"] += relative
+        stats["covered"] += int(covered)
+
+        coverage = self.recovering.get(key)
+        if coverage is not None:
+            coverage.append(covered)
+            del coverage[:-RECOVERY_WINDOW]
+            if len(coverage) >= self.min_samples and sum(coverage) / len(coverage) >= self.min_coverage:
+                del self.recovering[key]
+
+        self.recent_errors.append({
+            "time": time.time(), "key": key, "predicted": predicted[0.5],
+            "actual": actual, "error": error, "covered": covered
+        })
+
+    def get_error_stats(self) -> Dict[str, Any]:
+        """
+        Get prediction error statistics.
+
+        Returns:
+            Dictionary with overall and per-key mae (seconds), mean relative
+            error and p90 coverage (should approach 0.9), plus recent and
+            previous MAE over the error window to show the trend
+        """
+        with self.lock:
+            per_key = {
+                key: {
+                    "predictions": stats["count"],
+                    "mae": stats["abs_error"] / stats["count"],
+                    "relative_error": stats["relative_error"] / stats["count"],
+                    "p90_coverage": stats["covered"] / stats["count"]
+                }
+                for key, stats in self.errors.items() if stats["count"]
+            }
+            recent = list(self.recent_errors)
+            total = sum(s["count"] for s in self.errors.values())
+            abs_error = sum(s["abs_error"] for s in self.errors.values())
+            covered = sum(s["covered"] for s in self.errors.values())
+
+        half = len(recent) // 2
+        older, newer = recent[:half], recent[half:]
+        return {
+            "predictions": total,
+            "mae": abs_error / total if total else 0.0,
+            "p90_coverage": covered / total if total else 0.0,
+            "previous_mae": sum(e["error"] for e in older) / len(older) if older else None,
+            "recent_mae": sum(e["error"] for e in newer) / len(newer) if newer else None,
+            "keys": per_key
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get model statistics.
+
+        Returns:
+            Dictionary with per-key sample counts, mean latency and whether
+            the key is recovering from a timeout, and the prediction error
+            statistics
+        """
+        with self.lock:
+            models = {
+                key: {"samples": m.count, "mean": m.total_seconds / m.count if m.count else 0.0,
+                      "ready": m.count >= self.min_samples, "recovering": key in self.recovering}
+                for key, m in self.models.items()
+            }
+        return {"models": models, "errors": self.get_error_stats()}
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> bool:
+        """Write the model to its path (atomically). Returns False without a path."""
+        if not self.path:
+            return False
+        # Copied under the lock: other threads keep observing while this serializes
+        with self.lock:
+            data = copy.deepcopy({
+                "version": 1,
+                "query_types": self.query_types,
+                "models": {key: m.to_dict() for key, m in self.models.items()},
+                "errors": self.errors,
+                "recent_errors": list(self.recent_errors),
+                "recovering": self.recovering
+            })
+
+        # Unique temp file, so concurrent saves don't replace each other's
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.path.parent, prefix=self.path.name + ".", suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                json.dump(data, tmp_file)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return True
+
+    def load(self) -> bool:
+        """Load the model from its path. Returns False if missing or unreadable."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return False
+        if data.get("query_types") != self.query_types:
+            return False  # Features changed: start over
+
+        with self.lock:
+            for key, state in data.get("models", {}).items():
+                self._model_for(key).load_dict(state)
+            self.errors = data.get("errors", {})
+            self.recent_errors.extend(data.get("recent_errors", []))
+            self.recovering = data.get("recovering", {})
+        return True
+
+
+# Global model instance
+_global_model: Optional[LatencyModel] = None
+_global_lock = threading.Lock()
+
+
+def get_latency_model(path: Optional[str] = None) -> LatencyModel:
+    """
+    Get the global latency model.
+
+    The first call creates it (loading ``path`` if given) and attaches it to
+    the global QueryOptimizer, so ``estimate_execution_time()`` uses learned
+    latencies.
+    """
+    global _global_model
+    with _global_lock:
+        if _global_model is None:
+            _global_model = LatencyModel(path=path)
+            get_optimizer().latency_model = _global_model
+        return _global_model
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Lazy Loader - Build expensive components on first use.
+
+Features:
+- Proxies that import and construct a component the first time it's used
+- Registry of lazy components with load timings
+- Optional background prewarming once the prompt is up
+- Time-to-prompt measurement
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+
+class LazyComponent:
+    """
+    Proxy that builds a component on first attribute access.
+
+    The factory runs at most once, under a lock, so concurrent first uses
+    (e.g. a query racing the background prewarm) share one instance. A
+    factory that raises or returns None leaves the proxy falsy, so code
+    written as ``if self.long_term_memory:`` keeps working. The proxy's own
+    API (get, is_loaded, load_seconds, load_error) shadows attributes of
+    the same name on the component.
+
+    Example:
+        >>> memory = LazyComponent("long_term_memory", lambda: LongTermMemory())
+        >>> memory.is_loaded
+        False
+        >>> memory.retrieve_relevant("query")  # Builds LongTermMemory here
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any]):
+        """
+        Initialize lazy component.
+
+        Args:
+            name: Component name (used in stats and errors)
+            factory: Zero-argument callable that imports and builds the component
+        """
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_loaded", False)
+        object.__setattr__(self, "_error", None)
+        object.__setattr__(self, "_load_seconds", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the factory has run (successfully or not)."""
+        return self._loaded
+
+    @property
+    def load_seconds(self) -> Optional[float]:
+        """Time the factory took, or None if not loaded yet."""
+        return self._load_seconds
+
+    @property
+    def load_error(self) -> Optional[str]:
+        """Factory error message, if building failed."""
+        return self._error
+
+    def get(self) -> Any:
+        """
+        Build the component if needed and return it.
+
+        Returns:
+            The component, or None if the factory failed
+        """
+        if self._loaded:
+            return self._instance
+
+        with self._lock:
+            if not self._loaded:
+                start = time.perf_counter()
+                try:
+                    object.__setattr__(self, "_instance", self._factory())
+                except Exception as e:
+                    object.__setattr__(self, "_error", str(e))
+                object.__setattr__(self, "_load_seconds", time.perf_counter() - start)
+                object.__setattr__(self, "_loaded", True)
+        return self._instance
+
+    def __getattr__(self, attr: str) -> Any:
+        instance = self.get()
+        if instance is None:
+            raise AttributeError(
+                f"Lazy component '{self._name}' is unavailable: {self._error or 'factory returned None'}"
+            )
+        return getattr(instance, attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.get(), attr, value)
+
+    def __bool__(self) -> bool:
+        return self.get() is not None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._loaded else "pending"
+        return f"<LazyComponent {self._name} ({state})>"
+
+
+class LazyRegistry:
+    """Registry of lazy components with prewarming and startup timing."""
+
+    def __init__(self):
+        """Initialize lazy registry."""
+        self.components: Dict[str, LazyComponent] = {}
+        self.prewarm_order: List[str] = []
+        self.lock = threading.Lock()
+        self.prewarm_thread: Optional[threading.Thread] = None
+        self.time_to_prompt: Optional[float] = None
+
+    def register(self, name: str, factory: Callable[[], Any], prewarm: bool = True) -> LazyComponent:
+        """
+        Register a component built on first use.
+
+        Re-registering a name replaces the previous proxy.
+
+        Args:
+            name: Component name
+            factory: Zero-argument callable building the component
+            prewarm: Whether prewarm() builds it in the background
+
+        Returns:
+            Proxy for the component
+        """
+        component = LazyComponent(name, factory)
+        with self.lock:
+            self.components[name] = component
+            if name in self.prewarm_order:
+                self.prewarm_order.remove(name)
+            if prewarm:
+                self.prewarm_order.append(name)
+        return component
+
+    def get(self, name: str) -> Any:
+        """
+        Build (if needed) and return a registered component.
+
+        Args:
+            name: Component name
+
+        Returns:
+            The component, or None if building failed
+
+        Raises:
+            KeyError: If no component is registered under the name
+        """
+        with self.lock:
+            component = self.components[name]
+        return component.get()
+
+    def is_loaded(self, name: str) -> bool:
+        """
+        Check whether a component has been built.
+
+        Args:
+            name: Component name
+
+        Returns:
+            True if built, False if pending or not registered
+        """
+        component = self.components.get(name)
+        return component is not None and component.is_loaded
+
+    def prewarm(self, names: Optional[List[str]] = None, delay: float = 0.0,
+                background: bool = True) -> Optional[threading.Thread]:
+        """
+        Build pending components ahead of first use.
+
+        Args:
+            names: Components to build (defaults to those registered with prewarm=True)
+            delay: Seconds to wait before starting (lets the prompt render first)
+            background: Build in a daemon thread instead of blocking
+
+        Returns:
+            The prewarm thread when running in the background
+        """
+        with self.lock:
+            targets = [self.components[n] for n in (names or self.prewarm_order) if n in self.components]
+
+        def run():
+            if delay:
+                time.sleep(delay)
+            for component in targets:
+                component.get()
+
+        if not background:
+            run()
+            return None
+
+        self.prewarm_thread = threading.Thread(target=run, name="meton-prewarm", daemon=True)
+        self.prewarm_thread.start()
+        return self.prewarm_thread
+
+    def mark_prompt_ready(self) -> float:
+        """
+        Record time-to-prompt, measured from process start.
+
+        Returns:
+            Seconds from process start until the prompt is ready
+        """
+        if self.time_to_prompt is None:
+            self.time_to_prompt = time.time() - psutil.Process().create_time()
+        return self.time_to_prompt
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lazy loading statistics.
+
+        Returns:
+            Time-to-prompt and per-component load state/timing
+        """
+        with self.lock:
+            components = dict(self.components)
+
+        return {
+            "time_to_prompt": self.time_to_prompt,
+            "registered": len(components),
+            "loaded": sum(1 for c in components.values() if c.is_loaded),
+            "prewarming": bool(self.prewarm_thread and self.prewarm_thread.is_alive()),
+            "components": {
+                name: {
+                    "loaded": component.is_loaded,
+                    "load_seconds": component.load_seconds,
+                    "error": component.load_error
+                }
+                for name, component in components.items()
+            }
+        }
+
+
+# Global registry instance
+_global_registry = LazyRegistry()
+
+
+def get_lazy_registry() -> LazyRegistry:
+    """Get global lazy component registry."""
+    return _global_registry
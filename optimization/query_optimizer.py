@@ -18,8 +18,20 @@ from collections import defaultdict
 class QueryOptimizer:
     """Optimize query processing."""
 
+    # Prior execution time estimates (seconds), used until latencies are learned
+    BASE_QUERY_TIME = 1.0
+    DEFAULT_TOOL_TIME = 1.0
+    TOOL_TIME_ESTIMATES = {
+        "file_operations": 0.5,
+        "code_executor": 2.0,
+        "web_search": 3.0,
+        "codebase_search": 1.5,
+        "git_operations": 1.0
+    }
+
     def __init__(self):
         """Initialize query optimizer."""
+        self.latency_model = None  # LatencyModel attached by get_latency_model()
         self.query_patterns: Dict[str, Dict[str, Any]] = {}
         self.tool_dependencies: Dict[str, Set[str]] = {
             "file_operations": set(),
@@ -253,6 +265,9 @@ class QueryOptimizer:
         """
         Estimate query execution time.
 
+        Uses the learned latency model when one is attached and has enough
+        samples, and the hard-coded estimates otherwise.
+
         Args:
             query: Query string
             tools: Tools to be used
@@ -260,22 +275,25 @@ class QueryOptimizer:
         Returns:
             Estimated time in seconds
         """
-        # Base time for query processing
-        base_time = 1.0
-
-        # Tool execution times (estimates)
-        tool_times = {
-            "file_operations": 0.5,
-            "code_executor": 2.0,
-            "web_search": 3.0,
-            "codebase_search": 1.5,
-            "git_operations": 1.0
-        }
+        if self.latency_model is not None:
+            return self.latency_model.predict_query(query, tools)["p50"]
+        return self.heuristic_execution_time(query, tools)
+
+    def heuristic_execution_time(self, query: str, tools: List[str]) -> float:
+        """
+        Estimate query execution time from hard-coded per-tool times.
+
+        Args:
+            query: Query string
+            tools: Tools to be used
 
-        # Sum tool times
-        total_time = base_time
+        Returns:
+            Estimated time in seconds
+        """
+        # Base time for query processing, plus tool execution times
+        total_time = self.BASE_QUERY_TIME
         for tool in tools:
-            total_time += tool_times.get(tool, 1.0)
+            total_time += self.TOOL_TIME_ESTIMATES.get(tool, self.DEFAULT_TOOL_TIME)
 
         # Adjust for query complexity
         word_count = len(query.split())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Query Router - Route queries to the cheapest capable execution path.
+
+Features:
+- Fast-path detection for conversational and general-knowledge queries
+- Relevant tool selection for tool-heavy queries
+- Routing decision logging
+- Latency savings tracking per route
+- Learned per-route ETAs (optional LatencyModel)
+"""
+
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field, asdict
+import re
+import threading
+
+from optimization.query_optimizer import QueryOptimizer, get_optimizer
+
+
+# Route names
+ROUTE_FAST_PATH = "fast_path"
+ROUTE_FULL = "full"
+
+
+@dataclass
+class RoutingDecision:
+    """Result of routing a single query."""
+    route: str  # fast_path or full
+    query_type: str  # Classification from QueryOptimizer
+    reason: str
+    tools: List[str] = field(default_factory=list)  # Tools to describe in prompt (empty = all)
+    eta: Optional[float] = None  # Predicted p50 latency of the route (seconds, learned only)
+    eta_p90: Optional[float] = None
+
+    @property
+    def is_fast_path(self) -> bool:
+        """Whether the query should skip the ReAct loop."""
+        return self.route == ROUTE_FAST_PATH
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class QueryRouter:
+    """Route queries between the quick-model fast path and the full agent loop."""
+
+    # Purely conversational messages that never need tools
+    CONVERSATIONAL_PATTERNS = [
+        r"^(hi|hello|hey|howdy|greetings|good (morning|afternoon|evening))\b",
+        r"^(thanks|thank you|thx|cheers|great|awesome|nice|perfect|ok|okay|cool)\b",
+        r"^(bye|goodbye|see you|good night)\b",
+        r"^(who|what) are you\b",
+        r"^what can you do\b",
+        r"^how are you\b",
+    ]
+
+    # General-knowledge questions answerable without looking at the project
+    GENERAL_KNOWLEDGE_PATTERNS = [
+        r"^(what|what's|whats) (is|are)? ?(a|an)\b",
+        r"^(what's|what is|what are) the differences? between\b",
+        r"^what (is|are) (?!the\b|this\b|that\b|these\b|those\b|it\b|my\b|our\b|your\b)\w+( \w+)?\??$",
+        r"^what does \w+ stand for\b",
+        r"^(define|definition of)\b",
+        r"^explain the (concept|idea) of\b",
+    ]
+
+    # Signals that the query is about the local project and needs tools
+    PROJECT_INDICATORS = [
+        r"[\w\-/]+\.(py|md|txt|json|ya?ml|toml|cfg|ini|js|ts|go|sql|sh)\b",
+        r"`[^`]+`",
+        r"\b(file|files|directory|folder|path|repo|repository|codebase|project|readme)\b",
+        r"\b(this|our|my|the) (code|module|class|function|method|tool|agent|config)\b",
+        r"\b(run|execute|search|find|read|open|list|index|commit|commits|diff|git|changes)\b",
+        r"\b(def|class|import)\s+\w+",
+        r"\b[a-z]\w*_\w+\b",  # snake_case identifiers
+        r"\b\w+\(",  # calls
+        r"\b(implemented|defined|tests?|logic|fail|fails|failing|calculate|compute)\b",
+    ]
+
+    # Tools that are always described when the prompt is narrowed
+    CORE_TOOLS = ["file_operations"]
+
+    def __init__(
+        self,
+        optimizer: Optional[QueryOptimizer] = None,
+        fast_path_enabled: bool = True,
+        filter_tools: bool = True,
+        max_fast_path_words: int = 12,
+        latency_model: Optional[Any] = None
+    ):
+        """
+        Initialize query router.
+
+        Args:
+            optimizer: QueryOptimizer used for classification (global one if None)
+            fast_path_enabled: Allow routing conversational/general-knowledge queries to the quick model
+            filter_tools: Narrow tool descriptions for tool-heavy queries
+            max_fast_path_words: Longest query eligible for the fast path
+            latency_model: LatencyModel for route ETAs and per-query savings
+                estimates; fed by record_latency() (optional)
+        """
+        self.optimizer = optimizer or get_optimizer()
+        self.fast_path_enabled = fast_path_enabled
+        self.filter_tools = filter_tools
+        self.max_fast_path_words = max_fast_path_words
+        self.latency_model = latency_model
+
+        self._conversational = [re.compile(p) for p in self.CONVERSATIONAL_PATTERNS]
+        self._general_knowledge = [re.compile(p) for p in self.GENERAL_KNOWLEDGE_PATTERNS]
+        self._project = [re.compile(p) for p in self.PROJECT_INDICATORS]
+
+        # Per-route latency statistics
+        self.lock = threading.Lock()
+        self.route_counts: Dict[str, int] = {ROUTE_FAST_PATH: 0, ROUTE_FULL: 0}
+        self.route_times: Dict[str, float] = {ROUTE_FAST_PATH: 0.0, ROUTE_FULL: 0.0}
+        self.fallbacks = 0
+
+    def route(self, query: str, available_tools: Optional[List[str]] = None) -> RoutingDecision:
+        """
+        Decide how a query should be executed.
+
+        Args:
+            query: User query
+            available_tools: Names of tools registered on the agent
+
+        Returns:
+            RoutingDecision for the query, with an ETA once the latency
+            model has learned the route
+        """
+        decision = self._decide(query, available_tools)
+        if self.latency_model is not None:
+            prediction = self.latency_model.predict_query(query, decision.tools or None, route=decision.route)
+            if prediction["source"] == "model":
+                decision.eta, decision.eta_p90 = prediction["p50"], prediction["p90"]
+        return decision
+
+    def _decide(self, query: str, available_tools: Optional[List[str]]) -> RoutingDecision:
+        """Pick the route and tools for a query."""
+        query_lower = query.strip().lower()
+        query_type = self.optimizer.classify_query(query)
+        needs_project = any(p.search(query_lower) for p in self._project)
+
+        if self.fast_path_enabled and not needs_project:
+            if any(p.search(query_lower) for p in self._conversational):
+                return RoutingDecision(
+                    route=ROUTE_FAST_PATH,
+                    query_type=query_type,
+                    reason="conversational"
+                )
+
+            # Short isn't enough: "why does login fail?" is short but needs the repo
+            if (len(query_lower.split()) <= self.max_fast_path_words
+                    and any(p.search(query_lower) for p in self._general_knowledge)):
+                return RoutingDecision(
+                    route=ROUTE_FAST_PATH,
+                    query_type=query_type,
+                    reason="general knowledge question"
+                )
+
+        tools = self._select_tools(query, available_tools) if self.filter_tools else []
+
+        return RoutingDecision(
+            route=ROUTE_FULL,
+            query_type=query_type,
+            reason="project context required" if needs_project else f"{query_type} query",
+            tools=tools
+        )
+
+    def _select_tools(self, query: str, available_tools: Optional[List[str]]) -> List[str]:
+        """
+        Pick the tools whose descriptions belong in the prompt.
+
+        Args:
+            query: User query
+            available_tools: Names of tools registered on the agent
+
+        Returns:
+            Tool names to describe, or empty list to describe all tools
+        """
+        if not available_tools:
+            return []
+
+        predicted = self.optimizer.optimize_tool_selection(query)
+        selected = [t for t in self.CORE_TOOLS + predicted if t in available_tools]
+
+        # Nothing the optimizer knows about is registered - keep the full prompt
+        if not any(t in available_tools for t in predicted):
+            return []
+
+        # Preserve order, drop duplicates
+        return list(dict.fromkeys(selected))
+
+    def record_latency(self, route: str, duration: float, query: Optional[str] = None) -> None:
+        """
+        Record how long a routed query took.
+
+        Args:
+            route: Route that was executed
+            duration: Wall-clock duration in seconds
+            query: Query text, to train the latency model (optional)
+        """
+        with self.lock:
+            self.route_counts[route] = self.route_counts.get(route, 0) + 1
+            self.route_times[route] = self.route_times.get(route, 0.0) + duration
+        if query is not None and self.latency_model is not None:
+            self.latency_model.observe_query(query, duration, route=route)
+
+    def record_fallback(self) -> None:
+        """Record a fast-path attempt that fell back to the full loop."""
+        with self.lock:
+            self.fallbacks += 1
+
+    def estimate_savings(self, duration: float, query: Optional[str] = None) -> Optional[float]:
+        """
+        Estimate time saved by a fast-path query versus the full loop.
+
+        Args:
+            duration: Fast-path duration in seconds
+            query: Query text; with a trained latency model the full loop's
+                predicted latency for this query replaces the average
+
+        Returns:
+            Estimated seconds saved, or None without full-loop history
+        """
+        if query is not None and self.latency_model is not None:
+            prediction = self.latency_model.predict_query(query, route=ROUTE_FULL)
+            if prediction["source"] == "model":
+                return prediction["p50"] - duration
+
+        with self.lock:
+            full_count = self.route_counts[ROUTE_FULL]
+            if full_count == 0:
+                return None
+            return self.route_times[ROUTE_FULL] / full_count - duration
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get routing statistics.
+
+        Returns:
+            Dictionary with per-route counts, average latency and savings
+        """
+        with self.lock:
+            stats: Dict[str, Any] = {"fallbacks": self.fallbacks}
+            for route in (ROUTE_FAST_PATH, ROUTE_FULL):
+                count = self.route_counts[route]
+                stats[f"{route}_count"] = count
+                stats[f"{route}_avg_time"] = self.route_times[route] / count if count else 0.0
+
+            fast_count = self.route_counts[ROUTE_FAST_PATH]
+            if fast_count and self.route_counts[ROUTE_FULL]:
+                saved_per_query = stats[f"{ROUTE_FULL}_avg_time"] - stats[f"{ROUTE_FAST_PATH}_avg_time"]
+                stats["estimated_time_saved"] = max(0.0, saved_per_query * fast_count)
+            else:
+                stats["estimated_time_saved"] = 0.0
+
+        if self.latency_model is not None:
+            stats["latency_prediction"] = self.latency_model.get_error_stats()
+        return stats
@@ -1,31 +1,128 @@
 #!/usr/bin/env python3
 """
-Resource Monitor - Monitor system resource usage.
+Resource Monitor - Monitor system and process resource usage.
 
 Features:
 - CPU and memory monitoring
+- Process RSS and per-thread CPU time
+- Per-component memory accounting via registered size estimators
 - Disk usage tracking
-- Alert thresholds
+- Alert thresholds, including steady memory growth (leaks)
 - Historical metrics
-- Thread-safe monitoring loop
+- Thread-safe, non-blocking monitoring loop
 """
 
 import psutil
+import sys
 import threading
 import time
+import weakref
+from itertools import islice
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 from collections import deque
 
 
+SIZE_SAMPLE = 100  # Containers with more items are estimated from a sample
+GROWTH_RISING_RATIO = 0.75  # Share of samples that must rise for a growth alert
+PROCESS_SERIES = "process"  # Growth series name for process RSS
+MONITOR_SETTINGS = (
+    "sample_interval", "alert_cpu_threshold", "alert_memory_threshold",
+    "alert_growth_mb", "growth_window"
+)
+
+MB = 1024 * 1024
+
+
+def estimate_size(obj: Any, sample: int = SIZE_SAMPLE, _depth: int = 0) -> int:
+    """
+    Estimate the deep size of an object in bytes.
+
+    Containers are walked recursively. Containers with more than `sample`
+    items are extrapolated from their first `sample` items, so estimating a
+    dict with a million entries costs the same as one with a hundred.
+
+    Args:
+        obj: Object to measure
+        sample: Maximum items inspected per container
+
+    Returns:
+        Estimated size in bytes
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return size
+
+    nbytes = getattr(obj, "nbytes", None)  # numpy arrays
+    if isinstance(nbytes, int):
+        return max(size, nbytes)
+
+    if _depth > 8:
+        return size
+
+    if isinstance(obj, dict):
+        items = [x for pair in islice(obj.items(), sample) for x in pair]
+        count = len(obj)
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        items = list(islice(obj, sample))
+        count = len(obj)
+    elif hasattr(obj, "__dict__"):
+        return size + estimate_size(vars(obj), sample, _depth + 1)
+    else:
+        return size
+
+    if not count:
+        return size
+
+    sampled = sum(estimate_size(item, sample, _depth + 1) for item in items)
+    inspected = len(items) // 2 if isinstance(obj, dict) else len(items)
+    return size + int(sampled * count / max(inspected, 1))
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """
+    Estimate the memory held by a loaded torch model's parameters and buffers.
+
+    Args:
+        model: Model exposing torch-style parameters()/buffers()
+
+    Returns:
+        Size in bytes, or 0 if the model isn't a torch module
+    """
+    try:
+        tensors = list(model.parameters())
+        if hasattr(model, "buffers"):
+            tensors += list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except Exception:
+        return 0
+
+
+def faiss_index_bytes(index: Any) -> int:
+    """
+    Estimate the memory held by a FAISS index's float32 vectors.
+
+    Args:
+        index: FAISS index (or None)
+
+    Returns:
+        ntotal * d * 4 bytes
+    """
+    if index is None:
+        return 0
+    return int(index.ntotal) * int(index.d) * 4
+
+
 class ResourceMonitor:
-    """Monitor system resource usage."""
+    """Monitor system and process resource usage."""
 
     def __init__(
         self,
         sample_interval: int = 5,
         alert_cpu_threshold: int = 90,
-        alert_memory_threshold: int = 90
+        alert_memory_threshold: int = 90,
+        alert_growth_mb: float = 256,
+        growth_window: int = 60
     ):
         """
         Initialize resource monitor.
@@ -34,10 +131,14 @@ class ResourceMonitor:
             sample_interval: Sampling interval in seconds
             alert_cpu_threshold: CPU usage alert threshold (percentage)
             alert_memory_threshold: Memory usage alert threshold (percentage)
+            alert_growth_mb: Steady growth (MB) within the window that raises a leak alert
+            growth_window: Number of samples inspected for growth alerts
         """
         self.sample_interval = sample_interval
         self.alert_cpu_threshold = alert_cpu_threshold
         self.alert_memory_threshold = alert_memory_threshold
+        self.alert_growth_mb = alert_growth_mb
+        self.growth_window = growth_window
 
         self.monitoring = False
         self.metrics: deque = deque(maxlen=1000)  # Keep last 1000 samples
@@ -45,22 +146,49 @@ class ResourceMonitor:
 
         self.lock = threading.Lock()
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
         # Alert callbacks
         self.alert_callbacks: List[Callable] = []
 
+        # Component name -> size estimator (bound methods are held weakly)
+        self.components: Dict[str, Callable] = {}
+        self._growth_alerted: Dict[str, float] = {}  # series -> last alert timestamp
+
+        self.process = psutil.Process()
+        # Prime the CPU counters so non-blocking reads return real values
+        psutil.cpu_percent(interval=None)
+        self.process.cpu_percent(interval=None)
+
+    def configure(self, **settings: Any) -> None:
+        """
+        Update monitor settings.
+
+        Args:
+            **settings: Any of sample_interval, alert_cpu_threshold,
+                alert_memory_threshold, alert_growth_mb, growth_window
+        """
+        for key, value in settings.items():
+            if key not in MONITOR_SETTINGS:
+                raise ValueError(f"Unknown resource monitor setting: {key}")
+            setattr(self, key, value)
+
     def start_monitoring(self) -> None:
         """Start resource monitoring."""
         if self.monitoring:
             return
 
         self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._stop_event.clear()
+        self.monitor_thread = threading.Thread(
+            target=self._monitor_loop, name="meton-resource-monitor", daemon=True
+        )
         self.monitor_thread.start()
 
     def stop_monitoring(self) -> None:
         """Stop resource monitoring."""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=self.sample_interval + 1)
 
@@ -68,27 +196,44 @@ class ResourceMonitor:
         """Monitoring loop."""
         while self.monitoring:
             try:
-                # Collect metrics
-                metric = {
-                    "timestamp": time.time(),
-                    "datetime": datetime.now().isoformat(),
-                    "cpu_percent": psutil.cpu_percent(interval=1),
-                    "memory_mb": psutil.virtual_memory().used / 1024 / 1024,
-                    "memory_percent": psutil.virtual_memory().percent,
-                    "disk_usage_percent": psutil.disk_usage('/').percent
-                }
-
-                with self.lock:
-                    self.metrics.append(metric)
-
-                # Check for alerts
-                self._check_alerts(metric)
-
+                self.sample()
             except Exception as e:
                 print(f"Warning: Resource monitoring error: {e}")
 
-            # Wait for next sample
-            time.sleep(self.sample_interval)
+            # Wait for next sample (returns early on stop)
+            self._stop_event.wait(self.sample_interval)
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Take one sample, record it and check alerts.
+
+        CPU percentages are measured since the previous sample, so sampling
+        never blocks.
+
+        Returns:
+            The recorded metric
+        """
+        memory = psutil.virtual_memory()
+        metric = {
+            "timestamp": time.time(),
+            "datetime": datetime.now().isoformat(),
+            "cpu_percent": psutil.cpu_percent(interval=None),
+            "memory_mb": memory.used / MB,
+            "memory_percent": memory.percent,
+            "disk_usage_percent": psutil.disk_usage('/').percent,
+            "process_rss_mb": self.process.memory_info().rss / MB,
+            "process_cpu_percent": self.process.cpu_percent(interval=None),
+            "components": {
+                name: size / MB for name, size in self.get_component_usage().items()
+            }
+        }
+
+        with self.lock:
+            self.metrics.append(metric)
+
+        # Check for alerts
+        self._check_alerts(metric)
+        return metric
 
     def _check_alerts(self, metric: Dict[str, Any]) -> None:
         """
@@ -119,6 +264,8 @@ class ResourceMonitor:
                 "message": f"High memory usage: {metric['memory_percent']:.1f}%"
             })
 
+        alerts.extend(self._check_growth(metric))
+
         # Add alerts and trigger callbacks
         if alerts:
             with self.lock:
@@ -127,6 +274,64 @@ class ResourceMonitor:
             for alert in alerts:
                 self._trigger_alert_callbacks(alert)
 
+    def _check_growth(self, metric: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Check process RSS and each component for steady growth.
+
+        A series alerts when it grew by at least alert_growth_mb across the
+        last growth_window samples and rose in most of them (a leak rather
+        than a one-off allocation). Each series alerts at most once per window.
+
+        Args:
+            metric: Current metric values
+
+        Returns:
+            Growth alerts
+        """
+        alerts = []
+        for series, values, window_start in self._growth_series():
+            if len(values) < max(self.growth_window, 2):
+                continue
+
+            growth = values[-1] - values[0]
+            steps = list(zip(values, values[1:]))
+            rising = sum(1 for a, b in steps if b > a) / len(steps)
+            if growth < self.alert_growth_mb or rising < GROWTH_RISING_RATIO:
+                continue
+            if self._growth_alerted.get(series, 0) >= window_start:
+                continue
+
+            self._growth_alerted[series] = metric["timestamp"]
+            label = "Process RSS" if series == PROCESS_SERIES else f"Component '{series}'"
+            alerts.append({
+                "type": "growth",
+                "component": series,
+                "timestamp": metric["datetime"],
+                "value": round(growth, 1),
+                "threshold": self.alert_growth_mb,
+                "message": f"{label} grew {growth:.1f} MB over the last {len(values)} samples"
+            })
+        return alerts
+
+    def _growth_series(self) -> List[tuple]:
+        """
+        Collect the recent growth window for process RSS and each component.
+
+        Returns:
+            List of (series name, MB values oldest first, window start timestamp)
+        """
+        with self.lock:
+            window = list(self.metrics)[-self.growth_window:] if self.growth_window else []
+        if not window:
+            return []
+
+        series = [(PROCESS_SERIES, [m["process_rss_mb"] for m in window if "process_rss_mb" in m])]
+        names = set().union(*(m.get("components", {}) for m in window))
+        for name in sorted(names):
+            series.append((name, [m["components"][name] for m in window
+                                  if name in m.get("components", {})]))
+        return [(name, values, window[0]["timestamp"]) for name, values in series]
+
     def _trigger_alert_callbacks(self, alert: Dict[str, Any]) -> None:
         """
         Trigger alert callbacks.
@@ -149,6 +354,154 @@ class ResourceMonitor:
         """
         self.alert_callbacks.append(callback)
 
+    def register_component(self, name: str, estimator: Callable[[], int]) -> str:
+        """
+        Register a size estimator for a component.
+
+        Bound methods are held through a weak reference, so registering
+        doesn't keep the component alive; it drops out of the registry once
+        collected. If the name is taken by a live component, a numeric
+        suffix is added.
+
+        Args:
+            name: Component name (e.g. "vector_store")
+            estimator: Callable returning the component's size in bytes
+
+        Returns:
+            The name the component was registered under
+        """
+        ref = weakref.WeakMethod(estimator) if hasattr(estimator, "__self__") else None
+
+        with self.lock:
+            self._prune_components()
+            registered, suffix = name, 2
+            while registered in self.components:
+                registered = f"{name}#{suffix}"
+                suffix += 1
+            self.components[registered] = ref if ref is not None else (lambda: estimator)
+        return registered
+
+    def unregister_component(self, name: str) -> None:
+        """
+        Remove a component from the registry.
+
+        Args:
+            name: Registered component name
+        """
+        with self.lock:
+            self.components.pop(name, None)
+
+    def _prune_components(self) -> None:
+        """Drop components whose owners were garbage collected (lock held)."""
+        for name in [n for n, ref in self.components.items() if ref() is None]:
+            del self.components[name]
+
+    def get_component_usage(self) -> Dict[str, int]:
+        """
+        Estimate memory used by each registered component.
+
+        Returns:
+            Component name -> estimated bytes, largest first
+        """
+        with self.lock:
+            self._prune_components()
+            estimators = [(name, ref()) for name, ref in self.components.items()]
+
+        usage = {}
+        for name, estimator in estimators:
+            if estimator is None:
+                continue
+            try:
+                usage[name] = int(estimator())
+            except Exception:
+                continue  # A component mid-reload shouldn't break sampling
+
+        return dict(sorted(usage.items(), key=lambda item: item[1], reverse=True))
+
+    def get_process_usage(self) -> Dict[str, Any]:
+        """
+        Get resource usage of this process.
+
+        Returns:
+            RSS/VMS, CPU times and per-thread CPU seconds (busiest first)
+        """
+        try:
+            with self.process.oneshot():
+                memory = self.process.memory_info()
+                cpu_times = self.process.cpu_times()
+                threads = self.process.threads()
+
+            names = {getattr(t, "native_id", None): t.name for t in threading.enumerate()}
+            return {
+                "pid": self.process.pid,
+                "rss_mb": memory.rss / MB,
+                "vms_mb": memory.vms / MB,
+                "cpu_percent": self.process.cpu_percent(interval=None),
+                "cpu_user_seconds": cpu_times.user,
+                "cpu_system_seconds": cpu_times.system,
+                "num_threads": len(threads),
+                "threads": sorted(
+                    (
+                        {
+                            "id": t.id,
+                            "name": names.get(t.id, ""),
+                            "cpu_seconds": t.user_time + t.system_time
+                        }
+                        for t in threads
+                    ),
+                    key=lambda t: t["cpu_seconds"],
+                    reverse=True
+                )
+            }
+        except Exception as e:
+            return {"error": str(e)}
+
+    def get_growth(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get memory growth over the recent window for process RSS and components.
+
+        Returns:
+            Series name -> start/end MB, growth MB and MB per minute
+        """
+        growth = {}
+        with self.lock:
+            window = list(self.metrics)[-self.growth_window:] if self.growth_window else []
+        elapsed_min = (window[-1]["timestamp"] - window[0]["timestamp"]) / 60 if window else 0
+
+        for series, values, _ in self._growth_series():
+            if len(values) < 2:
+                continue
+            delta = values[-1] - values[0]
+            growth[series] = {
+                "start_mb": values[0],
+                "end_mb": values[-1],
+                "growth_mb": delta,
+                "mb_per_min": delta / elapsed_min if elapsed_min else 0.0
+            }
+        return growth
+
+    def get_profile(self) -> Dict[str, Any]:
+        """
+        Get a full resource profile: system, process, components and growth.
+
+        Returns:
+            Profile dictionary (JSON-serializable)
+        """
+        components = self.get_component_usage()
+        process = self.get_process_usage()
+        return {
+            "system": self.get_current_usage(),
+            "process": process,
+            "components": {name: size / MB for name, size in components.items()},
+            "components_total_mb": sum(components.values()) / MB,
+            "unaccounted_mb": (
+                process["rss_mb"] - sum(components.values()) / MB if "rss_mb" in process else None
+            ),
+            "growth": self.get_growth(),
+            "alerts": self.get_alerts()[-10:],
+            "stats": self.get_stats()
+        }
+
     def get_current_usage(self) -> Dict[str, Any]:
         """
         Get current resource usage.
@@ -157,13 +510,16 @@ class ResourceMonitor:
             Current usage metrics
         """
         try:
+            memory = psutil.virtual_memory()
+            disk = psutil.disk_usage('/')
             return {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
-                "memory_mb": psutil.virtual_memory().used / 1024 / 1024,
-                "memory_percent": psutil.virtual_memory().percent,
-                "memory_available_mb": psutil.virtual_memory().available / 1024 / 1024,
-                "disk_usage_percent": psutil.disk_usage('/').percent,
-                "disk_free_gb": psutil.disk_usage('/').free / 1024 / 1024 / 1024
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_mb": memory.used / MB,
+                "memory_percent": memory.percent,
+                "memory_available_mb": memory.available / MB,
+                "disk_usage_percent": disk.percent,
+                "disk_free_gb": disk.free / 1024 / 1024 / 1024,
+                "process_rss_mb": self.process.memory_info().rss / MB
             }
         except Exception as e:
             return {"error": str(e)}
@@ -183,6 +539,7 @@ class ResourceMonitor:
                 "peak_cpu_percent": max(m["cpu_percent"] for m in self.metrics),
                 "peak_memory_mb": max(m["memory_mb"] for m in self.metrics),
                 "peak_memory_percent": max(m["memory_percent"] for m in self.metrics),
+                "peak_process_rss_mb": max(m.get("process_rss_mb", 0) for m in self.metrics),
                 "samples": len(self.metrics)
             }
 
@@ -240,6 +597,7 @@ class ResourceMonitor:
         """Clear all metrics."""
         with self.lock:
             self.metrics.clear()
+            self._growth_alerted.clear()
 
     def clear_alerts(self) -> None:
         """Clear all alerts."""
@@ -260,7 +618,10 @@ class ResourceMonitor:
                 "total_samples": len(self.metrics),
                 "total_alerts": len(self.alerts),
                 "alert_cpu_threshold": self.alert_cpu_threshold,
-                "alert_memory_threshold": self.alert_memory_threshold
+                "alert_memory_threshold": self.alert_memory_threshold,
+                "alert_growth_mb": self.alert_growth_mb,
+                "growth_window": self.growth_window,
+                "components": len(self.components)
             }
 
     def generate_report(self) -> str:
@@ -296,6 +657,25 @@ class ResourceMonitor:
         else:
             report.append(f"Error: {current['error']}")
 
+        # Process and components
+        process = self.get_process_usage()
+        if "error" not in process:
+            report.append("\nPROCESS:")
+            report.append("-" * 80)
+            report.append(f"RSS:     {process['rss_mb']:.1f} MB")
+            report.append(f"CPU:     {process['cpu_user_seconds']:.1f}s user, "
+                          f"{process['cpu_system_seconds']:.1f}s system")
+            report.append(f"Threads: {process['num_threads']}")
+            for thread in process["threads"][:5]:
+                report.append(f"  {thread['name'] or thread['id']:<30} {thread['cpu_seconds']:.2f}s")
+
+        components = self.get_component_usage()
+        if components:
+            report.append("\nCOMPONENTS (estimated):")
+            report.append("-" * 80)
+            for name, size in components.items():
+                report.append(f"{name:<30} {size / MB:.1f} MB")
+
         # Peak usage
         if peak:
             report.append("\nPEAK USAGE:")
@@ -332,6 +712,28 @@ def get_resource_monitor() -> ResourceMonitor:
     return _global_monitor
 
 
+def configure_resource_monitor(settings: Any) -> ResourceMonitor:
+    """
+    Apply resource monitoring config to the global monitor and start it if enabled.
+
+    Args:
+        settings: ResourceMonitoringConfig (or any object with the same fields)
+
+    Returns:
+        The global monitor
+    """
+    _global_monitor.configure(
+        sample_interval=settings.sample_interval,
+        alert_cpu_threshold=settings.alert_cpu_threshold,
+        alert_memory_threshold=settings.alert_memory_threshold,
+        alert_growth_mb=settings.alert_growth_mb,
+        growth_window=settings.growth_window
+    )
+    if settings.enabled:
+        _global_monitor.start_monitoring()
+    return _global_monitor
+
+
 if __name__ == "__main__":
     # Example usage
     monitor = ResourceMonitor(sample_interval=2, alert_cpu_threshold=50, alert_memory_threshold=50)
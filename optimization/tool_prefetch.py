@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Tool Prefetch - Speculatively run predicted read-only tools.
+
+Features:
+- Predicts tool calls from the query (QueryOptimizer tool selection, identifiers)
+- Runs them on a thread pool while the first LLM call is in flight
+- Per-run cache the agent's tool execution checks first
+- Hit rate, time saved and wasted work tracking per tool
+
+Only read-only tools are prefetched, so a wrong prediction costs CPU time but
+never changes state. Predictions:
+
+- ``codebase_search`` with the query itself, when the optimizer predicts the
+  tool for the query's type ("general" queries get the optimizer's default
+  tool list, which isn't a prediction, so they're skipped)
+- ``symbol_lookup`` for identifiers in the query (backticked names, ``name()``,
+  CamelCase and snake_case words)
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future
+import contextvars
+import json
+import re
+import threading
+import time
+
+from optimization.query_optimizer import QueryOptimizer, get_optimizer
+
+
+# Tools safe to run speculatively
+READ_ONLY_TOOLS = ("codebase_search", "symbol_lookup")
+
+# Optional inputs with their defaults, so {"symbol": "X"} and
+# {"symbol": "X", "type": "all"} are the same call
+INPUT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "symbol_lookup": {"type": "all", "scope": "all", "path": None},
+}
+
+# Identifiers worth looking up, most specific first
+IDENTIFIER_PATTERNS = [
+    r"`([A-Za-z_][\w.]*)(?:\(\))?`",  # `name`, `Class.method`, `func()`
+    r"\b([A-Za-z_][\w.]*)\(\)",  # func()
+    r"\b([A-Z][a-z0-9]+(?:[A-Z][a-z0-9]*)+)\b",  # CamelCase
+    r"\b([a-z][a-z0-9]*(?:_[a-z0-9]+)+)\b",  # snake_case
+]
+
+
+def canonical_input(tool_name: str, tool_input: str) -> str:
+    """Normalize a tool input so equivalent calls share a cache key.
+
+    Args:
+        tool_name: Tool name
+        tool_input: Tool input (JSON string, usually)
+
+    Returns:
+        Canonical input string
+    """
+    try:
+        data = json.loads(tool_input)
+    except (TypeError, ValueError):
+        return " ".join(str(tool_input).split())
+    if not isinstance(data, dict):
+        return json.dumps(data, sort_keys=True)
+
+    defaults = INPUT_DEFAULTS.get(tool_name, {})
+    normalized = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        if key in defaults and value == defaults[key]:
+            continue
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True)
+
+
+def extract_identifiers(query: str, limit: int = 3) -> List[str]:
+    """Find code identifiers mentioned in a query.
+
+    Args:
+        query: User query
+        limit: Most identifiers to return
+
+    Returns:
+        Identifiers in order of appearance (dotted names reduced to the last part)
+    """
+    found: List[Tuple[int, str]] = []
+    seen = set()
+    for pattern in IDENTIFIER_PATTERNS:
+        for match in re.finditer(pattern, query):
+            name = match.group(1).rstrip(".").split(".")[-1]
+            if name and name not in seen and not name.isdigit():
+                seen.add(name)
+                found.append((match.start(), name))
+    return [name for _, name in sorted(found)][:limit]
+
+
+class PrefetchRun:
+    """Prefetched tool results for one agent run."""
+
+    def __init__(self, prefetcher: "ToolPrefetcher"):
+        """
+        Initialize the run.
+
+        Args:
+            prefetcher: Prefetcher that owns the thread pool and statistics
+        """
+        self.prefetcher = prefetcher
+        self.entries: Dict[Tuple[str, str], Future] = {}
+        self.used: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self.saved_seconds = 0.0
+        self.finished = False
+
+    def submit(self, tool: Any, tool_input: str) -> None:
+        """Start a tool call in the background."""
+        key = (tool.name, canonical_input(tool.name, tool_input))
+        if key not in self.entries:
+            self.entries[key] = self.prefetcher._submit(tool, tool_input)
+
+    def execute(self, tool: Any, tool_input: str) -> Tuple[str, bool]:
+        """Answer a tool call from the cache, or run it.
+
+        A prefetch still in flight is waited for: it started earlier than
+        a fresh call would, so waiting is never slower.
+
+        Args:
+            tool: Tool to call
+            tool_input: Tool input
+
+        Returns:
+            Tuple of (result, whether it came from the prefetch cache)
+        """
+        key = (tool.name, canonical_input(tool.name, tool_input))
+        future = self.entries.get(key)
+        if future is not None and key not in self.used:
+            wait_start = time.monotonic()
+            try:
+                result, seconds = future.result()
+            except Exception:
+                result = None  # Failed speculatively: run it for real below
+            if result is not None:
+                waited = time.monotonic() - wait_start
+                self.used.add(key)
+                self.hits += 1
+                self.saved_seconds += max(0.0, seconds - waited)
+                self.prefetcher._record_hit(tool.name, max(0.0, seconds - waited))
+                return result, True
+
+        if tool.name in self.prefetcher.tools:
+            self.misses += 1
+            self.prefetcher._record_miss(tool.name)
+        return self.prefetcher._run_tool(tool, tool_input)[0], False
+
+    def finish(self) -> Dict[str, Any]:
+        """End the run: cancel queued prefetches and count unused ones as waste.
+
+        Returns:
+            This run's prefetched, hits, misses, wasted and saved_seconds
+        """
+        if self.finished:
+            return self.get_stats()
+        self.finished = True
+
+        for key, future in self.entries.items():
+            if key in self.used:
+                continue
+            if future.cancel():
+                self.prefetcher._record_cancelled(key[0])
+            else:
+                self.wasted += 1
+                future.add_done_callback(
+                    lambda f, tool_name=key[0]: self.prefetcher._record_waste(tool_name, f)
+                )
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get this run's statistics."""
+        return {
+            "prefetched": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "saved_seconds": self.saved_seconds
+        }
+
+
+class ToolPrefetcher:
+    """Speculatively execute predicted read-only tools at query start."""
+
+    def __init__(
+        self,
+        tool_map: Dict[str, Any],
+        optimizer: Optional[QueryOptimizer] = None,
+        max_workers: int = 2,
+        max_symbols: int = 3,
+        tools: Tuple[str, ...] = READ_ONLY_TOOLS
+    ):
+        """
+        Initialize tool prefetcher.
+
+        Args:
+            tool_map: Agent's tool name → tool mapping
+            optimizer: QueryOptimizer used for prediction (global one if None)
+            max_workers: Threads running prefetched tools
+            max_symbols: Most identifiers looked up per query
+            tools: Tools allowed to run speculatively (must be read-only)
+        """
+        self.tool_map = tool_map
+        self.optimizer = optimizer or get_optimizer()
+        self.max_workers = max_workers
+        self.max_symbols = max_symbols
+        self.tools = tuple(tools)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # One call per tool at a time: prefetch and agent calls share tool instances
+        self._tool_locks = {name: threading.Lock() for name in self.tools}
+
+        # Statistics per tool
+        self.lock = threading.Lock()
+        self.runs = 0
+        self.tool_stats: Dict[str, Dict[str, float]] = {}
+
+    def predict(self, query: str) -> List[Tuple[str, str]]:
+        """
+        Predict the read-only tool calls a query will make.
+
+        Args:
+            query: User query
+
+        Returns:
+            List of (tool name, tool input) for registered prefetchable tools
+        """
+        calls: List[Tuple[str, str]] = []
+
+        if "codebase_search" in self.tools and "codebase_search" in self.tool_map:
+            if (self.optimizer.classify_query(query) != "general"
+                    and "codebase_search" in self.optimizer.optimize_tool_selection(query)):
+                calls.append(("codebase_search", json.dumps({"query": query.strip()})))
+
+        if "symbol_lookup" in self.tools and "symbol_lookup" in self.tool_map:
+            for name in extract_identifiers(query, self.max_symbols):
+                calls.append(("symbol_lookup", json.dumps({"symbol": name})))
+
+        return calls
+
+    def start(self, query: str) -> PrefetchRun:
+        """
+        Start prefetching the predicted tool calls for a query.
+
+        Args:
+            query: User query
+
+        Returns:
+            PrefetchRun to check tool calls against; call finish() when the
+            agent run ends
+        """
+        run = PrefetchRun(self)
+        for tool_name, tool_input in self.predict(query):
+            run.submit(self.tool_map[tool_name], tool_input)
+        with self.lock:
+            self.runs += 1
+        return run
+
+    def _submit(self, tool: Any, tool_input: str) -> Future:
+        """Run a tool call on the thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="meton-prefetch"
+            )
+        self._stats_for(tool.name)["prefetched"] += 1
+        # In a copy of the caller's context, so tool logs keep the query id
+        return self._executor.submit(contextvars.copy_context().run, self._run_tool, tool, tool_input)
+
+    def _run_tool(self, tool: Any, tool_input: str) -> Tuple[str, float]:
+        """Run a tool, serialized per prefetchable tool.
+
+        Returns:
+            Tuple of (result, seconds)
+        """
+        lock = self._tool_locks.get(tool.name)
+        start = time.monotonic()
+        if lock is None:
+            return tool._run(tool_input), time.monotonic() - start
+        with lock:
+            start = time.monotonic()
+            return tool._run(tool_input), time.monotonic() - start
+
+    def _stats_for(self, tool_name: str) -> Dict[str, float]:
+        with self.lock:
+            return self.tool_stats.setdefault(tool_name, {
+                "prefetched": 0, "hits": 0, "misses": 0, "wasted": 0, "cancelled": 0,
+                "saved_seconds": 0.0, "wasted_seconds": 0.0
+            })
+
+    def _record_hit(self, tool_name: str, saved: float) -> None:
+        stats = self._stats_for(tool_name)
+        with self.lock:
+            stats["hits"] += 1
+            stats["saved_seconds"] += saved
+
+    def _record_miss(self, tool_name: str) -> None:
+        stats = self._stats_for(tool_name)
+        with self.lock:
+            stats["misses"] += 1
+
+    def _record_cancelled(self, tool_name: str) -> None:
+        stats = self._stats_for(tool_name)
+        with self.lock:
+            stats["cancelled"] += 1
+
+    def _record_waste(self, tool_name: str, future: Future) -> None:
+        """Count a finished, unused prefetch (called when it completes)."""
+        try:
+            _, seconds = future.result()
+        except Exception:
+            seconds = 0.0
+        stats = self._stats_for(tool_name)
+        with self.lock:
+            stats["wasted"] += 1
+            stats["wasted_seconds"] += seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dictionary with totals and per-tool counts. hit_rate is the share
+            of prefetches the agent used; coverage is the share of the agent's
+            calls to prefetchable tools answered from the cache
+        """
+        with self.lock:
+            per_tool = {name: dict(stats) for name, stats in self.tool_stats.items()}
+            runs = self.runs
+
+        totals = {key: sum(stats[key] for stats in per_tool.values())
+                  for key in ("prefetched", "hits", "misses", "wasted", "cancelled",
+                              "saved_seconds", "wasted_seconds")}
+        calls = totals["hits"] + totals["misses"]
+        return {
+            "runs": runs,
+            **totals,
+            "hit_rate": totals["hits"] / totals["prefetched"] if totals["prefetched"] else 0.0,
+            "coverage": totals["hits"] / calls if calls else 0.0,
+            "tools": per_tool
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool (queued prefetches are dropped)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -3,7 +3,9 @@
 Query Ingested Books - Helper Script
 
 Makes it easier to query books ingested with ingest_document.py
-Automatically uses semantic search on indexed documents.
+Automatically uses semantic search on indexed documents. If a Meton
+daemon is running (python meton.py --daemon) the query is answered by it
+without reloading models or the index.
 
 Usage:
     python query_book.py "What are the main prompting techniques?"
@@ -27,33 +29,37 @@ def main():
         sys.exit(1)
 
     query = " ".join(sys.argv[1:])
+    prompt = build_prompt(query)
 
-    # Check if documents directory exists
-    docs_dir = Path("documents")
-    if not docs_dir.exists() or not list(docs_dir.glob("*.py")):
+    from core.daemon import DaemonClient, DaemonError
+    client = DaemonClient()
+    if client.is_running():
+        print(f"📚 Querying indexed books (daemon)...")
+        print(f"❓ Question: {query}")
+        print()
+        try:
+            result = client.query(prompt)
+        except DaemonError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(result["output"] if result["success"] else f"❌ {result.get('error')}")
+        return
+
+    # Check that documents have been ingested
+    from core.config import ConfigLoader
+    from rag.metadata_store import MetadataStore
+    metadata_store = MetadataStore(ConfigLoader().config.rag.metadata_path)
+    if not metadata_store.search_by_field("chunk_type", "document"):
         print("❌ No documents found!")
         print()
         print("First ingest your book:")
         print("  python ingest_document.py ~/path/to/book.pdf")
-        print()
-        print("Then index it in Meton:")
-        print("  python meton.py")
-        print("  > /index documents/")
         sys.exit(1)
 
     print(f"📚 Querying indexed books...")
     print(f"❓ Question: {query}")
     print()
 
-    # Create a prompt that explicitly uses semantic search
-    prompt = f"""Based on the indexed documents in the documents/ directory, please answer this question:
-
-{query}
-
-Important: Use the codebase_search tool to find relevant information from the indexed book content. Do not list files or directories - search the actual content of the indexed documents.
-
-Provide a comprehensive answer based on what you find in the indexed content."""
-
     # Write prompt to temp file
     import tempfile
     with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
@@ -64,12 +70,12 @@ Provide a comprehensive answer based on what you find in the indexed content."""
     print("=" * 60)
     print()
 
-    # Run Meton with the prompt
-    # Note: This creates an interactive session, user will see the response
+    # Run Meton with the prompt in a new process
     try:
         subprocess.run([
             sys.executable, "meton.py",
-            "--query", prompt
+            "--query", prompt,
+            "--no-daemon"
         ])
     except FileNotFoundError:
         # Fallback: print instructions
@@ -84,5 +90,16 @@ Provide a comprehensive answer based on what you find in the indexed content."""
         print(f"  2. Copy the above question and paste it")
 
 
+def build_prompt(query: str) -> str:
+    """Create a prompt that explicitly uses semantic search."""
+    return f"""Based on the indexed documents, please answer this question:
+
+{query}
+
+Important: Use the codebase_search tool to find relevant information from the indexed book content. Do not list files or directories - search the actual content of the indexed documents.
+
+Provide a comprehensive answer based on what you find in the indexed content."""
+
+
 if __name__ == '__main__':
     main()
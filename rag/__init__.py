@@ -4,10 +4,14 @@ This package provides:
 - Embedding model wrapper for sentence-transformers
 - FAISS vector store for similarity search
 - Metadata store for code chunk information
+- Second-stage reranker for search results
+- Document ingestion (text, Markdown, reST, PDF) into the same index
 """
 
 from rag.embeddings import EmbeddingModel
 from rag.vector_store import VectorStore
 from rag.metadata_store import MetadataStore
+from rag.reranker import Reranker
+from rag.document_ingest import DocumentIngester
 
-__all__ = ["EmbeddingModel", "VectorStore", "MetadataStore"]
+__all__ = ["EmbeddingModel", "VectorStore", "MetadataStore", "Reranker", "DocumentIngester"]
@@ -0,0 +1,357 @@
+"""
+Commit Search - Semantic search over a repository's commit history.
+
+Builds a dedicated FAISS index next to the commit metadata index
+(``.git/meton/commit_vectors.faiss``) with two kinds of documents per
+commit:
+
+- the message: subject, body and the list of touched files
+- one summary per touched file: path, line counts, the hunk headers git
+  reports (enclosing function/class) and the first changed lines
+
+Only commits missing from the vector index are embedded, in batches,
+after each update of the commit metadata index; commits dropped from the
+history by a rebase are removed. Queries combine vector similarity with
+the path and date filters of the metadata index.
+
+Example:
+    >>> from git import Repo
+    >>> from tools.git_index import CommitIndex
+    >>> from rag.commit_search import CommitSearchIndex
+    >>>
+    >>> commits = CommitIndex(Repo("."))
+    >>> commits.update()
+    >>> index = CommitSearchIndex(commits, embedder)
+    >>> index.update()
+    >>> index.search("when did we change the retry logic", path="core/")
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from rag.vector_store import VectorStore
+from tools.git_index import RECORD_SEP, parse_date
+
+INDEX_VERSION = 1
+MAX_FILE_DOCS = 50  # Larger commits (mass renames, vendoring) only get a message document
+MAX_CONTEXTS = 8  # Hunk headers kept per file summary
+MAX_CHANGED_LINES = 6  # Changed lines kept per file summary
+DIFF_BATCH = 32  # Commits per `git show` call
+
+_HUNK_RE = re.compile(r"^@@ [^@]+ @@ ?(.*)$")
+
+
+class CommitSearchError(Exception):
+    """Commit vector index cannot be built or queried."""
+    pass
+
+
+def path_matches(file_path: str, path: str) -> bool:
+    """
+    Whether a file is the given path or lies under it.
+
+    Args:
+        file_path: Repository-relative file path
+        path: File or directory filter
+
+    Returns:
+        True if the file matches the filter
+    """
+    path = path.strip("/")
+    if path in ("", "."):
+        return True
+    return file_path == path or file_path.startswith(path + "/")
+
+
+def parse_diff_summaries(output: str) -> Iterator[Tuple[str, Dict[str, Dict[str, List[str]]]]]:
+    """
+    Parse ``git show -U0 --format=<RECORD_SEP>%H`` output into per-file summaries.
+
+    Args:
+        output: Raw git show output for one or more commits
+
+    Yields:
+        (sha, {path: {"contexts": [...], "lines": [...]}}) per commit
+    """
+    for record in output.split(RECORD_SEP)[1:]:
+        sha, _, patch = record.partition("\n")
+        files: Dict[str, Dict[str, List[str]]] = {}
+        current, source, in_header = None, None, False
+        for line in patch.splitlines():
+            if line.startswith("diff --git "):
+                current, source, in_header = None, None, True
+            elif in_header and line.startswith("--- "):
+                source = line[6:] if line.startswith("--- a/") else None
+            elif in_header and line.startswith("+++ "):
+                # Deleted files report "+++ /dev/null"; keep the old path
+                target = line[6:] if line.startswith("+++ b/") else source
+                if target:
+                    current = files.setdefault(target, {"contexts": [], "lines": []})
+            elif current is None:
+                continue
+            elif line.startswith("@@"):
+                in_header = False
+                match = _HUNK_RE.match(line)
+                context = match.group(1).strip() if match else ""
+                if context and context not in current["contexts"] and len(current["contexts"]) < MAX_CONTEXTS:
+                    current["contexts"].append(context)
+            elif line[:1] in ("+", "-") and len(current["lines"]) < MAX_CHANGED_LINES:
+                text = line[1:].strip()
+                if len(text) > 3:
+                    current["lines"].append(text[:120])
+        yield sha.strip(), files
+
+
+class CommitSearchIndex:
+    """
+    Embedded commit messages and per-file diff summaries.
+
+    Document ids are ``<sha>`` for messages and ``<sha>:<path>`` for file
+    summaries, so results map straight back to the commit metadata index
+    without a separate metadata store.
+    """
+
+    def __init__(self, commit_index, embedder, index_dir: Optional[str] = None, batch_size: int = 64):
+        """
+        Initialize the commit vector index.
+
+        Args:
+            commit_index: tools.git_index.CommitIndex providing commit metadata
+            embedder: Embedding model (EmbeddingModel or compatible)
+            index_dir: Directory to persist to (default: next to the commit index)
+            batch_size: Documents per embedding batch
+        """
+        self.commit_index = commit_index
+        self.embedder = embedder
+        self.batch_size = batch_size
+        index_dir = Path(index_dir) if index_dir else Path(commit_index.index_path).parent
+        self.vector_path = index_dir / "commit_vectors.faiss"
+        self.state_path = index_dir / "commit_vectors.json"
+        self.model_name = getattr(embedder, "model_name", type(embedder).__name__)
+        self.head: Optional[str] = None
+        self.store = VectorStore(dimension=embedder.get_dimension())
+        self.lock = threading.RLock()
+        self._load()
+
+    # ========== Persistence ==========
+
+    def _load(self) -> None:
+        """Load the persisted vectors if they were built with the same model."""
+        if not (self.state_path.exists() and self.vector_path.exists()):
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") != INDEX_VERSION or state.get("model") != self.model_name:
+                return
+            store = VectorStore(dimension=self.store.dimension)
+            store.load(str(self.vector_path))
+        except (OSError, ValueError, RuntimeError, KeyError):
+            return  # Rebuilt on next update
+        if store.dimension == self.store.dimension:
+            self.store = store
+            self.head = state.get("head")
+
+    def save(self) -> None:
+        """Write the vectors and index state to disk."""
+        with self.lock:
+            self.store.save(str(self.vector_path))
+            tmp_path = self.state_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "head": self.head, "model": self.model_name}, f)
+            os.replace(tmp_path, self.state_path)
+
+    # ========== Updates ==========
+
+    def indexed_commits(self) -> set:
+        """SHAs of commits with an embedded message."""
+        return {doc_id for doc_id in self.store.chunk_id_to_idx if ":" not in doc_id}
+
+    def update(self) -> int:
+        """
+        Embed commits added to the commit index since the last update.
+
+        Returns:
+            Number of commits embedded
+
+        Raises:
+            CommitSearchError: If git show or embedding fails
+        """
+        with self.lock:
+            if self.head is not None and self.head == self.commit_index.head:
+                return 0
+
+            with self.commit_index.lock:
+                commits = list(self.commit_index.commits)
+                head = self.commit_index.head
+            indexed = self.indexed_commits()
+            live = {commit["sha"] for commit in commits}
+            new_commits = [commit for commit in commits if commit["sha"] not in indexed]
+
+            # Commits rewritten away by a rebase or reset, and leftovers of interrupted updates
+            pending = {commit["sha"] for commit in new_commits}
+            stale = [
+                doc_id for doc_id in self.store.chunk_id_to_idx
+                if doc_id.split(":", 1)[0] not in live or doc_id.split(":", 1)[0] in pending
+            ]
+            self.store.remove(stale)
+
+            if new_commits:
+                self._embed(self._documents(new_commits))
+            self.head = head
+
+        try:
+            self.save()
+        except OSError:
+            pass  # Read-only .git: keep the in-memory index
+        return len(new_commits)
+
+    def _documents(self, commits: List[Dict[str, Any]]) -> Iterator[Tuple[str, str]]:
+        """Build (doc_id, text) pairs for commits, reading diffs in batches."""
+        for start in range(0, len(commits), DIFF_BATCH):
+            batch = commits[start:start + DIFF_BATCH]
+            diffs = self._diff_summaries([c["sha"] for c in batch if 0 < len(c["files"]) <= MAX_FILE_DOCS])
+
+            for commit in batch:
+                message = commit["subject"]
+                if commit["body"]:
+                    message += "\n\n" + commit["body"]
+                paths = [path for path, _, _ in commit["files"]]
+                if paths:
+                    shown = ", ".join(paths[:20]) + (f" and {len(paths) - 20} more" if len(paths) > 20 else "")
+                    message += f"\n\nFiles: {shown}"
+
+                summaries = diffs.get(commit["sha"], {})
+                for path, added, deleted in commit["files"][:MAX_FILE_DOCS] if summaries else []:
+                    summary = summaries.get(path, {"contexts": [], "lines": []})
+                    text = f"{commit['subject']}\n{path} (+{added} -{deleted})"
+                    if summary["contexts"]:
+                        text += "\nIn: " + "; ".join(summary["contexts"])
+                    if summary["lines"]:
+                        text += "\n" + "\n".join(summary["lines"])
+                    yield f"{commit['sha']}:{path}", text
+
+                # Message last: an interrupted update re-embeds the whole commit
+                yield commit["sha"], message
+
+    def _diff_summaries(self, shas: List[str]) -> Dict[str, Dict[str, Dict[str, List[str]]]]:
+        """Per-file hunk headers and changed lines for several commits in one git call."""
+        if not shas:
+            return {}
+        try:
+            output = self.commit_index.repo.git.show(
+                *shas, "-U0", "--no-renames", "--no-color", f"--format={RECORD_SEP}%H"
+            )
+        except Exception as e:
+            raise CommitSearchError(f"git show failed: {e}")
+        return dict(parse_diff_summaries(output))
+
+    def _embed(self, documents: Iterator[Tuple[str, str]]) -> None:
+        """Embed documents in batches and add them to the vector store."""
+        batch_ids, batch_texts = [], []
+
+        def flush():
+            try:
+                embeddings = self.embedder.encode_batch(batch_texts)
+            except Exception as e:
+                raise CommitSearchError(f"Embedding failed: {e}")
+            self.store.add_batch(embeddings, batch_ids)
+            batch_ids.clear()
+            batch_texts.clear()
+
+        for doc_id, text in documents:
+            batch_ids.append(doc_id)
+            batch_texts.append(text)
+            if len(batch_ids) >= self.batch_size:
+                flush()
+        if batch_ids:
+            flush()
+
+    # ========== Queries ==========
+
+    def search(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None,
+        max_results: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the commits most similar to a query.
+
+        Args:
+            query: Natural-language description of the change
+            path: Only commits touching this file or directory
+            since: Only commits at or after this date (ISO string or datetime)
+            until: Only commits at or before this date
+            max_results: Maximum commits to return
+
+        Returns:
+            Commit dictionaries with ``similarity`` (1 / (1 + L2 distance))
+            and ``matched_files`` (files whose summaries matched), best first
+
+        Raises:
+            CommitSearchError: If the query can't be embedded
+        """
+        since_ts, until_ts = parse_date(since), parse_date(until)
+        try:
+            query_embedding = self.embedder.encode(query)
+        except Exception as e:
+            raise CommitSearchError(f"Embedding failed: {e}")
+
+        with self.lock:
+            total = self.store.size()
+            fetch = min(max(max_results * 4, 20), total)
+            best: Dict[str, Dict[str, Any]] = {}
+
+            while fetch:
+                best.clear()
+                for doc_id, distance in self.store.search(query_embedding, top_k=fetch):
+                    sha, _, doc_path = doc_id.partition(":")
+                    commit = self.commit_index.get(sha)
+                    if commit is None:
+                        continue
+                    if since_ts is not None and commit["date"] < since_ts:
+                        continue
+                    if until_ts is not None and commit["date"] > until_ts:
+                        continue
+                    if path:
+                        if doc_path and not path_matches(doc_path, path):
+                            continue
+                        if not doc_path and not any(path_matches(f[0], path) for f in commit["files"]):
+                            continue
+
+                    match = best.setdefault(sha, dict(commit, similarity=0.0, matched_files=[]))
+                    match["similarity"] = max(match["similarity"], 1.0 / (1.0 + distance))
+                    if doc_path:
+                        match["matched_files"].append(doc_path)
+
+                # Widen the search until filters leave enough commits
+                if len(best) >= max_results or fetch >= total:
+                    break
+                fetch = min(fetch * 4, total)
+
+        results = sorted(best.values(), key=lambda c: c["similarity"], reverse=True)
+        return results[:max_results]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Indexed HEAD, commit and document counts and the index location
+        """
+        with self.lock:
+            return {
+                "head": self.head,
+                "commits": len(self.indexed_commits()),
+                "documents": self.store.size(),
+                "model": self.model_name,
+                "index_path": str(self.vector_path)
+            }
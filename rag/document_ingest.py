@@ -0,0 +1,586 @@
+"""
+Document Ingestion - Index text documents alongside code.
+
+Reads books, PDFs, Markdown/reStructuredText and source files in languages
+without a dedicated parser, splits them into overlapping text chunks and
+stores them in the same VectorStore/MetadataStore as the code index, so
+``codebase_search`` finds them without any conversion step.
+
+Documents are processed as a stream: readers yield one section (page,
+heading section or block of paragraphs) at a time, chunks are embedded in
+batches of ``batch_size`` and only the current batch is held in memory.
+
+Example:
+    >>> from rag.document_ingest import DocumentIngester
+    >>>
+    >>> ingester = DocumentIngester(embedder, vector_store, metadata_store)
+    >>> stats = ingester.ingest_file("books/prompting.pdf")
+    >>> print(stats["chunks_created"], stats["mb_per_sec"])
+"""
+
+import os
+import re
+import time
+import uuid
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rag.embeddings import EmbeddingModel
+from rag.vector_store import VectorStore
+from rag.metadata_store import MetadataStore
+from rag.indexer import EXCLUDED_DIRS
+from rag.language_chunkers import get_chunker
+
+try:
+    from pypdf import PdfReader as _PdfReader
+    PDF_AVAILABLE = True
+except ImportError:
+    try:
+        from PyPDF2 import PdfReader as _PdfReader
+        PDF_AVAILABLE = True
+    except ImportError:
+        PDF_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+SECTION_CHARS = 16 * 1024  # Sections longer than this are split at a blank line
+
+
+class DocumentIngestionError(Exception):
+    """Document cannot be read or ingested."""
+    pass
+
+
+@dataclass
+class DocumentSection:
+    """Contiguous part of a document (a page, a heading section, a block of text)."""
+    text: str
+    title: str
+    start_line: int  # 1-based; for PDFs, lines within the page
+    end_line: int
+    page: Optional[int] = None
+
+
+@dataclass
+class TextChunk:
+    """Chunk of a section, ready to embed."""
+    text: str
+    title: str
+    start_line: int
+    end_line: int
+    page: Optional[int] = None
+
+
+class DocumentReader(ABC):
+    """Reads a document format as a stream of sections.
+
+    Subclasses set ``extensions`` and ``format`` and are registered with
+    ``register_reader`` to handle those file types.
+    """
+
+    extensions: Tuple[str, ...] = ()
+    format: str = "text"
+
+    @abstractmethod
+    def read_sections(self, path: Path) -> Iterator[DocumentSection]:
+        """
+        Yield the document's sections in order.
+
+        Args:
+            path: Document to read
+
+        Yields:
+            DocumentSection objects
+
+        Raises:
+            DocumentIngestionError: If the document cannot be read
+        """
+
+
+class TextDocumentReader(DocumentReader):
+    """Line-based reader for plain text.
+
+    Starts a new section at each heading (see ``heading``) and splits long
+    stretches of text at blank lines so a section never grows far past
+    SECTION_CHARS.
+    """
+
+    extensions = (".txt", ".text")
+    format = "text"
+
+    def heading(self, line: str, previous: Optional[str]) -> Optional[Tuple[str, bool]]:
+        """
+        Detect a heading.
+
+        Args:
+            line: Current line
+            previous: Line before it (None at the start of a section)
+
+        Returns:
+            None, or (title, starts_at_previous) where starts_at_previous
+            means the previous line belongs to the new section
+        """
+        return None
+
+    def read_sections(self, path: Path) -> Iterator[DocumentSection]:
+        title = path.name
+        lines: List[str] = []
+        start = 1
+        size = 0
+
+        def flush(end_line: int) -> Optional[DocumentSection]:
+            text = "".join(lines)
+            if not text.strip():
+                return None
+            return DocumentSection(text, title, start, end_line)
+
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for lineno, line in enumerate(f, 1):
+                    found = self.heading(line, lines[-1] if lines else None)
+                    if found is not None:
+                        new_title, starts_at_previous = found
+                        carried = [lines.pop()] if starts_at_previous and lines else []
+                        section = flush(lineno - 1 - len(carried))
+                        if section:
+                            yield section
+                        title = new_title
+                        lines = carried
+                        start = lineno - len(carried)
+                        size = sum(len(l) for l in lines)
+                    elif size >= SECTION_CHARS and (not line.strip() or size >= 2 * SECTION_CHARS):
+                        section = flush(lineno - 1)
+                        if section:
+                            yield section
+                        lines = []
+                        start = lineno
+                        size = 0
+
+                    lines.append(line)
+                    size += len(line)
+
+                if lines:
+                    section = flush(start + len(lines) - 1)
+                    if section:
+                        yield section
+        except OSError as e:
+            raise DocumentIngestionError(f"Cannot read {path}: {e}") from e
+
+
+class MarkdownReader(TextDocumentReader):
+    """Markdown reader: one section per ATX heading (``#`` .. ``######``)."""
+
+    extensions = (".md", ".markdown")
+    format = "markdown"
+
+    _HEADING = re.compile(r"^#{1,6}\s+(.+?)\s*#*\s*$")
+    _FENCE = re.compile(r"^\s*(```|~~~)")
+
+    def read_sections(self, path: Path) -> Iterator[DocumentSection]:
+        self._in_fence = False  # Headings inside fenced code blocks don't count
+        yield from super().read_sections(path)
+
+    def heading(self, line: str, previous: Optional[str]) -> Optional[Tuple[str, bool]]:
+        if self._FENCE.match(line):
+            self._in_fence = not self._in_fence
+            return None
+        if self._in_fence:
+            return None
+        match = self._HEADING.match(line)
+        return (match.group(1), False) if match else None
+
+
+class RstReader(TextDocumentReader):
+    """reStructuredText reader: one section per underlined title."""
+
+    extensions = (".rst",)
+    format = "rst"
+
+    _UNDERLINE = re.compile(r"^([=\-~^\"'`#*+:.])\1{2,}\s*$")
+
+    def heading(self, line: str, previous: Optional[str]) -> Optional[Tuple[str, bool]]:
+        if previous is None or not self._UNDERLINE.match(line):
+            return None
+        title = previous.strip()
+        if not title or len(line.rstrip()) < len(title) or self._UNDERLINE.match(previous):
+            return None
+        return title, True
+
+
+class SourceCodeReader(TextDocumentReader):
+    """Plain-text reader for source files without a dedicated parser."""
+
+    # Extension -> language name recorded in chunk metadata
+    LANGUAGES = {
+        ".js": "javascript", ".jsx": "javascript", ".ts": "typescript", ".tsx": "typescript",
+        ".go": "go", ".rs": "rust", ".java": "java", ".kt": "kotlin", ".c": "c", ".h": "c",
+        ".cpp": "cpp", ".hpp": "cpp", ".cs": "csharp", ".rb": "ruby", ".php": "php",
+        ".sh": "shell", ".sql": "sql", ".yaml": "yaml", ".yml": "yaml", ".toml": "toml",
+    }
+    extensions = tuple(LANGUAGES)
+    format = "code"
+
+
+class PdfDocumentReader(DocumentReader):
+    """PDF reader yielding one section per page (requires pypdf or PyPDF2).
+
+    Pages are extracted one at a time, so the whole document's text is
+    never in memory at once.
+    """
+
+    extensions = (".pdf",)
+    format = "pdf"
+
+    def read_sections(self, path: Path) -> Iterator[DocumentSection]:
+        if not PDF_AVAILABLE:
+            raise DocumentIngestionError(
+                "PDF support requires pypdf. Install with: pip install pypdf"
+            )
+
+        try:
+            with open(path, "rb") as f:
+                reader = _PdfReader(f)
+                for number, page in enumerate(reader.pages, 1):
+                    text = page.extract_text() or ""
+                    if text.strip():
+                        yield DocumentSection(
+                            text=text,
+                            title=f"{path.stem} (page {number})",
+                            start_line=1,
+                            end_line=text.count("\n") + 1,
+                            page=number
+                        )
+        except DocumentIngestionError:
+            raise
+        except Exception as e:
+            raise DocumentIngestionError(f"Cannot read PDF {path}: {e}") from e
+
+
+# Extension -> reader
+READERS: Dict[str, DocumentReader] = {}
+
+
+def register_reader(reader: DocumentReader) -> DocumentReader:
+    """
+    Register a reader for its file extensions (replacing earlier ones).
+
+    Args:
+        reader: Reader instance
+
+    Returns:
+        The reader
+    """
+    for ext in reader.extensions:
+        READERS[ext.lower()] = reader
+    return reader
+
+
+def get_reader(path: Path) -> Optional[DocumentReader]:
+    """
+    Get the reader for a file.
+
+    Args:
+        path: Document path
+
+    Returns:
+        Registered reader, or None if the type isn't supported
+    """
+    return READERS.get(Path(path).suffix.lower())
+
+
+for _reader in (TextDocumentReader(), MarkdownReader(), RstReader(), SourceCodeReader(), PdfDocumentReader()):
+    register_reader(_reader)
+
+
+class TextChunker:
+    """Splits sections into overlapping chunks, preferring sentence breaks."""
+
+    def __init__(self, chunk_size: int = 1500, overlap: int = 200):
+        """
+        Initialize chunker.
+
+        Args:
+            chunk_size: Target characters per chunk
+            overlap: Characters repeated at the start of the next chunk
+
+        Raises:
+            ValueError: If overlap is not smaller than chunk_size
+        """
+        if overlap >= chunk_size:
+            raise ValueError(f"Overlap ({overlap}) must be smaller than chunk size ({chunk_size})")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+
+    def chunk(self, section: DocumentSection) -> Iterator[TextChunk]:
+        """
+        Split one section.
+
+        Args:
+            section: Section to split
+
+        Yields:
+            TextChunk objects with line ranges within the document
+        """
+        text = section.text
+        start = 0
+        while start < len(text):
+            end = start + self.chunk_size
+
+            # Try to break at sentence boundary
+            if end < len(text):
+                for i in range(end, max(start, end - 200), -1):
+                    if text[i - 1] in '.!?\n' and text[i] in ' \n':
+                        end = i
+                        break
+
+            piece = text[start:end].strip()
+            if piece:
+                first = section.start_line + text.count("\n", 0, text.index(piece, start))
+                last = first + piece.count("\n")
+                yield TextChunk(piece, section.title, first, last, section.page)
+
+            if end >= len(text):
+                break
+            start = max(end - self.overlap, start + 1)
+
+
+class DocumentIngester:
+    """
+    Ingests documents into the RAG index.
+
+    Shares the embedder and stores with CodebaseIndexer: document chunks
+    are stored with ``chunk_type="document"`` next to code chunks.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingModel,
+        vector_store: VectorStore,
+        metadata_store: MetadataStore,
+        chunk_size: int = 1500,
+        overlap: int = 200,
+        batch_size: int = 64,
+        verbose: bool = False
+    ):
+        """
+        Initialize the document ingester.
+
+        Args:
+            embedder: Embedding model for generating vectors
+            vector_store: FAISS vector store for similarity search
+            metadata_store: Metadata store for chunk information
+            chunk_size: Target characters per chunk
+            overlap: Characters shared between neighbouring chunks
+            batch_size: Chunks embedded per model call
+            verbose: Enable verbose logging
+        """
+        self.embedder = embedder
+        self.vector_store = vector_store
+        self.metadata_store = metadata_store
+        self.chunker = TextChunker(chunk_size, overlap)
+        self.batch_size = max(1, batch_size)
+        self.verbose = verbose
+        self.logger = logger
+        self.stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "files_processed": 0,
+            "files_skipped": 0,
+            "files_failed": 0,
+            "chunks_created": 0,
+            "bytes_read": 0,
+            "seconds": 0.0,
+            "errors": []
+        }
+
+    def _ingested_versions(self) -> Dict[str, float]:
+        """Modification times of documents already in the metadata store."""
+        versions = {}
+        for metadata in self.metadata_store.get_all().values():
+            if metadata.get("chunk_type") == "document":
+                versions[metadata["file_path"]] = metadata.get("file_mtime", 0.0)
+        return versions
+
+    def _remove_document(self, file_path: str) -> None:
+        """Drop a document's chunks from the metadata store.
+
+        Their vectors stay in FAISS (it has no removal), but search skips
+        vectors without metadata.
+        """
+        for metadata in self.metadata_store.search_by_field("file_path", file_path):
+            if metadata.get("chunk_type") == "document":
+                self.metadata_store.delete(metadata["chunk_id"])
+
+    def _store_batch(self, chunks: List[Dict[str, Any]]) -> None:
+        """Embed and store a batch of chunk metadata."""
+        texts = [f"document: {c['name']}\n\n{c['code']}" for c in chunks]
+        embeddings = self.embedder.encode_batch(texts)
+        self.vector_store.add_batch(embeddings, [c["chunk_id"] for c in chunks])
+        for chunk in chunks:
+            self.metadata_store.add(chunk["chunk_id"], chunk)
+
+    def ingest_file(self, filepath: str, _versions: Optional[Dict[str, float]] = None) -> int:
+        """
+        Read, chunk, embed and store one document.
+
+        Unchanged documents that are already ingested are skipped; changed
+        ones replace their previous chunks.
+
+        Args:
+            filepath: Document to ingest
+
+        Returns:
+            Number of chunks created
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If no reader handles the file type
+        """
+        path = Path(filepath)
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        reader = get_reader(path)
+        if reader is None:
+            raise ValueError(f"Unsupported document type: {path.suffix or path.name}")
+
+        file_path = str(path.resolve())
+        stat = path.stat()
+        versions = _versions if _versions is not None else self._ingested_versions()
+        if versions.get(file_path) == stat.st_mtime:
+            self.stats["files_skipped"] += 1
+            return 0
+        if file_path in versions:
+            self._remove_document(file_path)
+
+        language = getattr(reader, "LANGUAGES", {}).get(path.suffix.lower(), reader.format)
+        started = time.perf_counter()
+        created = 0
+        batch: List[Dict[str, Any]] = []
+
+        try:
+            for section in reader.read_sections(path):
+                for chunk in self.chunker.chunk(section):
+                    batch.append({
+                        "chunk_id": str(uuid.uuid4()),
+                        "file_path": file_path,
+                        "chunk_type": "document",
+                        "name": chunk.title,
+                        "language": language,
+                        "page": chunk.page,
+                        "start_line": chunk.start_line,
+                        "end_line": chunk.end_line,
+                        "file_mtime": stat.st_mtime,
+                        "code": chunk.text,
+                        "docstring": "",
+                    })
+                    if len(batch) >= self.batch_size:
+                        self._store_batch(batch)
+                        created += len(batch)
+                        batch = []
+
+            if batch:
+                self._store_batch(batch)
+                created += len(batch)
+        except Exception as e:
+            # Keep the index consistent: drop the partial document
+            self._remove_document(file_path)
+            self.logger.error(f"Error ingesting {filepath}: {e}")
+            self.stats["files_failed"] += 1
+            self.stats["errors"].append({"file": filepath, "error": str(e)})
+            return 0
+        finally:
+            self.stats["seconds"] += time.perf_counter() - started
+
+        self.stats["files_processed"] += 1
+        self.stats["chunks_created"] += created
+        self.stats["bytes_read"] += stat.st_size
+
+        if self.verbose:
+            self.logger.info(f"Ingested {filepath}: {created} chunks")
+
+        return created
+
+    def ingest_directory(self, dirpath: str, recursive: bool = True) -> Dict[str, Any]:
+        """
+        Ingest every supported document in a directory.
+
+        Source files with a registered language chunker (Python, TypeScript,
+        Go, SQL, ...) are left to CodebaseIndexer.
+
+        Args:
+            dirpath: Directory to ingest
+            recursive: Whether to descend into subdirectories
+
+        Returns:
+            Statistics (see get_stats)
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            ValueError: If path is not a directory
+        """
+        if not os.path.exists(dirpath):
+            raise FileNotFoundError(f"Directory not found: {dirpath}")
+        if not os.path.isdir(dirpath):
+            raise ValueError(f"Not a directory: {dirpath}")
+
+        self.stats = self._empty_stats()
+        versions = self._ingested_versions()
+
+        for filepath in self.find_documents(dirpath, recursive):
+            try:
+                self.ingest_file(filepath, versions)
+            except (FileNotFoundError, ValueError) as e:
+                self.stats["files_failed"] += 1
+                self.stats["errors"].append({"file": filepath, "error": str(e)})
+
+        stats = self.get_stats()
+        self.logger.info(
+            f"Ingestion complete: {stats['files_processed']} documents, "
+            f"{stats['chunks_created']} chunks, {stats['mb_per_sec']} MB/s"
+        )
+        return stats
+
+    @staticmethod
+    def find_documents(dirpath: str, recursive: bool = True) -> List[str]:
+        """
+        Find files with a registered reader and no code chunker, skipping
+        excluded directories.
+
+        Args:
+            dirpath: Directory to search
+            recursive: Whether to search recursively
+
+        Returns:
+            List of file paths
+        """
+        documents = []
+        for root, dirs, files in os.walk(dirpath):
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS] if recursive else []
+            for filename in sorted(files):
+                if get_reader(Path(filename)) is not None and get_chunker(filename) is None:
+                    documents.append(os.path.join(root, filename))
+        return documents
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get ingestion statistics.
+
+        Returns:
+            Dictionary with file/chunk counts, bytes read, time spent and
+            throughput (chunks_per_sec, mb_per_sec)
+        """
+        seconds = self.stats["seconds"]
+        return {
+            **self.stats,
+            "seconds": round(seconds, 3),
+            "chunks_per_sec": round(self.stats["chunks_created"] / seconds, 1) if seconds else 0.0,
+            "mb_per_sec": round(self.stats["bytes_read"] / seconds / (1024 * 1024), 2) if seconds else 0.0,
+            "total_chunks": self.vector_store.size(),
+        }
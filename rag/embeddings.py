@@ -4,6 +4,8 @@ from typing import List, Union
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from optimization.resource_monitor import get_resource_monitor, estimate_model_bytes
+
 
 class EmbeddingModel:
     """Wrapper for sentence-transformers embedding model.
@@ -33,6 +35,8 @@ class EmbeddingModel:
         self._model = None
         self._dimension = 768  # all-mpnet-base-v2 produces 768-dim vectors
 
+        get_resource_monitor().register_component("embedding_model", self.estimate_memory)
+
     @property
     def model(self) -> SentenceTransformer:
         """Lazy-load the model on first use.
@@ -93,6 +97,19 @@ class EmbeddingModel:
         embeddings = self.model.encode(processed_texts, convert_to_numpy=True, show_progress_bar=False)
         return embeddings.astype(np.float32)
 
+    def estimate_memory(self) -> int:
+        """Estimate memory held by the loaded model's weights.
+
+        Returns:
+            Size in bytes (0 until the model is loaded)
+
+        Example:
+            >>> embedder = EmbeddingModel()
+            >>> embedder.estimate_memory()
+            0
+        """
+        return estimate_model_bytes(self._model) if self._model is not None else 0
+
     def get_dimension(self) -> int:
         """Get embedding dimension.
 
@@ -0,0 +1,408 @@
+"""
+File Watcher - Keep the code and symbol indexes current as files change.
+
+Watches an indexed directory (inotify/FSEvents through ``watchdog`` when it
+is installed, mtime polling otherwise), debounces bursts of events per file
+and sends only the changed files through CodebaseIndexer.reindex_file() and
+SymbolLookupTool.update_files(). Searches see an edit within roughly
+``debounce`` (plus ``poll_interval`` when polling) seconds.
+
+Pending work is a bounded set of paths: repeated events for a file coalesce
+into one entry, and once ``max_queue`` distinct files are waiting further
+events are dropped and the worker falls back to a single mtime rescan of
+the tree instead of growing without bound (e.g. during a branch switch).
+
+Example:
+    >>> from rag.file_watcher import IndexWatcher
+    >>>
+    >>> watcher = IndexWatcher("/path/to/project", indexer_provider=lambda: indexer,
+    ...                        symbol_tool=symbol_lookup_tool)
+    >>> watcher.start()
+    >>> # ... edit files; searches pick the changes up ...
+    >>> watcher.stop()
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rag.indexer import EXCLUDED_DIRS, find_source_files
+from rag.language_chunkers import CHUNKERS
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+BACKENDS = ("auto", "watchdog", "poll")
+
+
+class FileWatcherError(Exception):
+    """File watcher cannot be started."""
+    pass
+
+
+if WATCHDOG_AVAILABLE:
+    class _EventHandler(FileSystemEventHandler):
+        """Forwards file events to IndexWatcher.notify()."""
+
+        def __init__(self, watcher: "IndexWatcher"):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event) -> None:
+            if event.is_directory:
+                return
+            self.watcher.notify(event.src_path)
+            dest_path = getattr(event, "dest_path", None)
+            if dest_path:
+                self.watcher.notify(dest_path)
+
+
+class IndexWatcher:
+    """
+    Debounced, bounded file watcher feeding incremental index updates.
+
+    A single worker thread applies updates, so the indexer only ever has
+    one writer; searches run concurrently under the indexer's lock.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        indexer_provider: Optional[Callable[[], Any]] = None,
+        symbol_tool: Optional[Any] = None,
+        debounce: float = 0.5,
+        poll_interval: float = 1.0,
+        max_queue: int = 256,
+        backend: str = "auto",
+        save_path: Optional[str] = None,
+        save_interval: float = 30.0
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            root: Directory to watch (as it was indexed)
+            indexer_provider: Returns the CodebaseIndexer to update (or None if no index)
+            symbol_tool: SymbolLookupTool whose symbol table to update
+            debounce: Seconds a file must be quiet before it's reindexed
+            poll_interval: Seconds between scans with the polling backend
+            max_queue: Distinct files waiting before events are dropped for a rescan
+            backend: "watchdog", "poll" or "auto" (watchdog when installed)
+            save_path: FAISS index path to save updates to (None to keep them in memory)
+            save_interval: Minimum seconds between saves
+
+        Raises:
+            FileWatcherError: If root isn't a directory or the backend is unavailable
+        """
+        if not os.path.isdir(root):
+            raise FileWatcherError(f"Not a directory: {root}")
+        if backend not in BACKENDS:
+            raise FileWatcherError(f"Unknown watch backend: {backend} (expected one of {', '.join(BACKENDS)})")
+        if backend == "watchdog" and not WATCHDOG_AVAILABLE:
+            raise FileWatcherError("watchdog is not installed (pip install watchdog)")
+
+        self.root = os.path.abspath(root)
+        self.indexer_provider = indexer_provider
+        self.symbol_tool = symbol_tool
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_queue = max(1, max_queue)
+        self.backend = "watchdog" if backend == "auto" and WATCHDOG_AVAILABLE else (
+            "poll" if backend == "auto" else backend
+        )
+        self.save_path = save_path
+        self.save_interval = save_interval
+
+        self._pending: Dict[str, Tuple[float, float]] = {}  # path -> (first event, last event)
+        self._overflow = False
+        self._busy = False
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._observer = None
+        self._mtimes: Dict[str, float] = {}  # Snapshot of files as last indexed
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+        self.stats = {
+            "events": 0,
+            "dropped": 0,
+            "rescans": 0,
+            "files_updated": 0,
+            "files_removed": 0,
+            "chunks_embedded": 0,
+            "chunks_reused": 0,
+            "chunks_removed": 0,
+            "saves": 0,
+            "errors": 0,
+            "last_latency": None,
+            "last_error": None
+        }
+
+    # ========== Lifecycle ==========
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watcher has been started and not stopped."""
+        return bool(self._threads) and not self._stop_event.is_set()
+
+    def start(self) -> None:
+        """Take a snapshot of the tree and start watching."""
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._mtimes = self._scan()
+
+        if self.backend == "watchdog":
+            self._observer = Observer()
+            self._observer.schedule(_EventHandler(self), self.root, recursive=True)
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._threads.append(threading.Thread(target=self._poll_loop, name="meton-watch-poll", daemon=True))
+
+        self._threads.append(threading.Thread(target=self._worker_loop, name="meton-watch", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Watching {self.root} ({self.backend})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop watching, apply nothing further and save unsaved updates.
+
+        Args:
+            timeout: Seconds to wait for each thread
+        """
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout)
+            self._observer = None
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+        if self._dirty:
+            self._save()
+
+    def wait_idle(self, timeout: float = 10.0) -> bool:
+        """
+        Block until no changes are pending or being applied.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if idle, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._overflow or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(remaining, 0.05))
+        return True
+
+    # ========== Events ==========
+
+    def _is_watched(self, path: str) -> bool:
+        """Whether a path is an indexable source file outside excluded directories."""
+        if os.path.splitext(path)[1].lower() not in CHUNKERS:
+            return False
+        relative = os.path.relpath(path, self.root)
+        parts = relative.split(os.sep)
+        return parts[0] != os.pardir and not any(part in EXCLUDED_DIRS for part in parts[:-1])
+
+    def notify(self, path: str) -> bool:
+        """
+        Record that a file was created, modified or deleted.
+
+        Args:
+            path: Changed file path
+
+        Returns:
+            True if queued (or coalesced), False if ignored or dropped
+        """
+        path = os.path.abspath(path)
+        if not self._is_watched(path):
+            return False
+
+        now = time.monotonic()
+        with self._cond:
+            self.stats["events"] += 1
+            if path in self._pending:
+                self._pending[path] = (self._pending[path][0], now)
+            elif len(self._pending) < self.max_queue:
+                self._pending[path] = (now, now)
+            else:
+                # Queue full: drop the event and reconcile with a rescan later
+                self.stats["dropped"] += 1
+                self._overflow = True
+                self._cond.notify_all()
+                return False
+            self._cond.notify_all()
+        return True
+
+    def _scan(self) -> Dict[str, float]:
+        """Get modification times of all watched files."""
+        mtimes = {}
+        for path in find_source_files(self.root):
+            try:
+                mtimes[os.path.abspath(path)] = os.path.getmtime(path)
+            except OSError:
+                continue  # Deleted while scanning
+        return mtimes
+
+    @staticmethod
+    def _diff(old: Dict[str, float], new: Dict[str, float]) -> List[str]:
+        """Paths created, modified or deleted between two scans."""
+        changed = [path for path, mtime in new.items() if old.get(path) != mtime]
+        return changed + [path for path in old if path not in new]
+
+    def _poll_loop(self) -> None:
+        """Polling backend: diff mtimes every poll_interval."""
+        snapshot = dict(self._mtimes)
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._scan()
+            for path in self._diff(snapshot, current):
+                self.notify(path)
+            snapshot = current
+
+    # ========== Updates ==========
+
+    def _worker_loop(self) -> None:
+        """Apply debounced changes until stopped."""
+        while not self._stop_event.is_set():
+            with self._cond:
+                ready, overflow = self._take_ready()
+                if not ready and not overflow:
+                    self._cond.wait(self.debounce if self._pending else None)
+                    continue
+                self._busy = True
+
+            try:
+                if overflow:
+                    self.stats["rescans"] += 1
+                    current = self._scan()
+                    changed = self._diff(self._mtimes, current)
+                    for start in range(0, len(changed), self.max_queue):
+                        self._apply(changed[start:start + self.max_queue], {})
+                else:
+                    self._apply(sorted(ready), ready)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _take_ready(self) -> Tuple[Dict[str, float], bool]:
+        """
+        Remove and return files quiet for at least `debounce` seconds.
+
+        Must be called with the condition held. On overflow, everything
+        pending is folded into one rescan once events have been quiet.
+
+        Returns:
+            (path -> first event time, whether to rescan)
+        """
+        now = time.monotonic()
+        quiet = all(now - last >= self.debounce for _, last in self._pending.values())
+
+        if self._overflow:
+            if not quiet:
+                return {}, False
+            self._pending.clear()
+            self._overflow = False
+            return {}, True
+
+        ready = {path: first for path, (first, last) in self._pending.items() if now - last >= self.debounce}
+        for path in ready:
+            del self._pending[path]
+        return ready, False
+
+    def _apply(self, paths: List[str], first_seen: Dict[str, float]) -> None:
+        """
+        Reindex changed files and drop deleted ones from both indexes.
+
+        Args:
+            paths: Changed or deleted file paths
+            first_seen: First event time per path (for latency stats)
+        """
+        indexer = self.indexer_provider() if self.indexer_provider else None
+
+        for path in paths:
+            try:
+                if os.path.exists(path):
+                    if indexer is not None:
+                        result = indexer.reindex_file(path)
+                        self.stats["chunks_embedded"] += result["embedded"]
+                        self.stats["chunks_reused"] += result["reused"]
+                        self.stats["chunks_removed"] += result["removed"]
+                    self.stats["files_updated"] += 1
+                    self._mtimes[path] = os.path.getmtime(path)
+                else:
+                    if indexer is not None:
+                        self.stats["chunks_removed"] += indexer.remove_file(path)
+                    self.stats["files_removed"] += 1
+                    self._mtimes.pop(path, None)
+                self._dirty = self._dirty or indexer is not None
+            except Exception as e:
+                # Typically a file saved mid-edit with a syntax error: keep the old chunks
+                self.stats["errors"] += 1
+                self.stats["last_error"] = f"{path}: {e}"
+                logger.warning(f"Live index update failed for {path}: {e}")
+
+        if self.symbol_tool is not None:
+            self.symbol_tool.update_files(paths)
+
+        if first_seen:
+            self.stats["last_latency"] = round(time.monotonic() - min(first_seen.values()), 3)
+
+        if self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self._save()
+
+    def _save(self) -> None:
+        """Persist the updated index."""
+        indexer = self.indexer_provider() if self.indexer_provider else None
+        if indexer is None or not self.save_path:
+            return
+        try:
+            indexer.save(self.save_path)
+            self.stats["saves"] += 1
+            self._dirty = False
+        except Exception as e:
+            self.stats["errors"] += 1
+            self.stats["last_error"] = f"save: {e}"
+            logger.warning(f"Saving live index updates failed: {e}")
+        self._last_save = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get watcher statistics.
+
+        Returns:
+            Backend, state, queue depth and update counters
+        """
+        with self._cond:
+            pending = len(self._pending)
+        return {
+            "root": self.root,
+            "backend": self.backend,
+            "running": self.is_running,
+            "pending": pending,
+            "watched_files": len(self._mtimes),
+            **self.stats
+        }
@@ -1,17 +1,20 @@
 """
 Codebase Indexer - Main orchestrator for parsing, chunking, and indexing code.
 
-Walks directory tree, parses Python files, creates chunks, generates embeddings,
-and stores in FAISS vector store and metadata store.
+Walks directory tree, chunks source files with the chunker registered for
+their language, generates embeddings in batches, and stores them in FAISS
+vector store and metadata store.
 """
 
 import os
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
 from rag.code_parser import CodeParser
 from rag.chunker import CodeChunker
+from rag.language_chunkers import CHUNKERS, get_chunker
 from rag.embeddings import EmbeddingModel
 from rag.vector_store import VectorStore
 from rag.metadata_store import MetadataStore
@@ -42,6 +45,38 @@ EXCLUDED_DIRS = {
 }
 
 
+def find_source_files(dirpath: str, recursive: bool = True) -> List[str]:
+    """
+    Find all files with a registered chunker, excluding excluded directories.
+
+    Args:
+        dirpath: Directory path to search
+        recursive: Whether to search recursively
+
+    Returns:
+        List of paths to source files
+    """
+    source_files = []
+
+    if recursive:
+        # Use os.walk for recursive search
+        for root, dirs, files in os.walk(dirpath):
+            # Remove excluded directories from dirs (in-place modification)
+            # This prevents os.walk from descending into them
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+
+            for filename in files:
+                if os.path.splitext(filename)[1].lower() in CHUNKERS:
+                    source_files.append(os.path.join(root, filename))
+    else:
+        # Non-recursive: only check immediate directory
+        for entry in os.scandir(dirpath):
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in CHUNKERS:
+                source_files.append(entry.path)
+
+    return source_files
+
+
 class CodebaseIndexer:
     """
     Main orchestrator for codebase indexing.
@@ -55,7 +90,8 @@ class CodebaseIndexer:
         embedder: EmbeddingModel,
         vector_store: VectorStore,
         metadata_store: MetadataStore,
-        verbose: bool = False
+        verbose: bool = False,
+        batch_size: int = 64
     ):
         """
         Initialize the codebase indexer.
@@ -65,11 +101,15 @@ class CodebaseIndexer:
             vector_store: FAISS vector store for similarity search
             metadata_store: Metadata store for chunk information
             verbose: Enable verbose logging
+            batch_size: Chunks embedded per model call (batches span files)
         """
         self.embedder = embedder
         self.vector_store = vector_store
         self.metadata_store = metadata_store
         self.verbose = verbose
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Dict[str, Any]] = []  # Chunks waiting for a full batch
+        self.lock = threading.RLock()  # Serializes live updates with searches
 
         # Initialize parser and chunker
         self.parser = CodeParser()
@@ -87,37 +127,50 @@ class CodebaseIndexer:
 
     def index_file(self, filepath: str) -> int:
         """
-        Parse, chunk, embed, and store a single Python file.
+        Chunk, embed, and store a single source file.
 
         Args:
-            filepath: Path to Python file to index
+            filepath: Path to a source file in a supported language
 
         Returns:
             Number of chunks created from this file
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            ValueError: If file is not a Python file
+            ValueError: If no chunker is registered for the file type
+        """
+        created = self._chunk_file(filepath)
+        self._flush()
+        return created
+
+    def _chunk_file(self, filepath: str) -> int:
+        """
+        Chunk a file and queue its chunks for embedding.
+
+        Returns:
+            Number of chunks queued
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If no chunker is registered for the file type
         """
         # Validate file
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"File not found: {filepath}")
 
-        if not filepath.endswith(".py"):
-            raise ValueError(f"Not a Python file: {filepath}")
+        chunker = get_chunker(filepath)
+        if chunker is None:
+            raise ValueError(f"Unsupported file type: {filepath}")
 
-        # Skip empty __init__.py files
-        if filepath.endswith("__init__.py"):
-            file_size = os.path.getsize(filepath)
-            if file_size == 0:
-                if self.verbose:
-                    self.logger.debug(f"Skipping empty __init__.py: {filepath}")
-                return 0
+        # Skip empty files (e.g. empty __init__.py)
+        if os.path.getsize(filepath) == 0:
+            if self.verbose:
+                self.logger.debug(f"Skipping empty file: {filepath}")
+            return 0
 
         try:
-            # Parse the file
-            parsed_data = self.parser.parse_file(filepath)
-            if parsed_data is None:
+            chunks = chunker.chunk_file(filepath)
+            if chunks is None:
                 self.logger.warning(f"Failed to parse {filepath}")
                 self.stats["files_failed"] += 1
                 self.stats["errors"].append({
@@ -126,28 +179,20 @@ class CodebaseIndexer:
                 })
                 return 0
 
-            # Create chunks
-            chunks = self.chunker.create_chunks(parsed_data, filepath)
-
             if not chunks:
                 if self.verbose:
                     self.logger.debug(f"No chunks created from {filepath}")
                 return 0
 
-            # Generate embeddings for all chunks
-            chunk_texts = [self.chunker.get_chunk_text(chunk) for chunk in chunks]
-            embeddings = self.embedder.encode_batch(chunk_texts)
-
-            # Store in vector store and metadata store
-            chunk_ids = [chunk["chunk_id"] for chunk in chunks]
-            self.vector_store.add_batch(embeddings, chunk_ids)
-
-            for chunk in chunks:
-                self.metadata_store.add(chunk["chunk_id"], chunk)
+            self._pending.extend(chunks)
+            self._flush(partial=False)
 
             # Update statistics
             self.stats["files_processed"] += 1
             self.stats["chunks_created"] += len(chunks)
+            language = chunker.language
+            self.stats.setdefault("languages", {})
+            self.stats["languages"][language] = self.stats["languages"].get(language, 0) + 1
 
             if self.verbose:
                 self.logger.info(f"Indexed {filepath}: {len(chunks)} chunks")
@@ -163,6 +208,32 @@ class CodebaseIndexer:
             })
             return 0
 
+    def _flush(self, partial: bool = True) -> None:
+        """
+        Embed and store queued chunks, batch_size at a time.
+
+        Args:
+            partial: Also store a final batch smaller than batch_size
+        """
+        while len(self._pending) >= self.batch_size or (partial and self._pending):
+            batch = self._pending[:self.batch_size]
+            del self._pending[:self.batch_size]
+
+            try:
+                # Generate embeddings for the batch
+                chunk_texts = [self.chunker.get_chunk_text(chunk) for chunk in batch]
+                embeddings = self.embedder.encode_batch(chunk_texts)
+
+                # Store in vector store and metadata store
+                self.vector_store.add_batch(embeddings, [chunk["chunk_id"] for chunk in batch])
+                for chunk in batch:
+                    self.metadata_store.add(chunk["chunk_id"], chunk)
+            except Exception as e:
+                self.logger.error(f"Error embedding batch of {len(batch)} chunks: {e}")
+                self.stats["chunks_created"] -= len(batch)
+                for filepath in sorted({chunk["file_path"] for chunk in batch}):
+                    self.stats["errors"].append({"file": filepath, "error": str(e)})
+
     def index_directory(
         self,
         dirpath: str,
@@ -170,12 +241,12 @@ class CodebaseIndexer:
         file_pattern: str = "*.py"
     ) -> Dict[str, Any]:
         """
-        Index all Python files in a directory.
+        Index all supported source files in a directory.
 
         Args:
             dirpath: Path to directory to index
             recursive: Whether to recursively index subdirectories
-            file_pattern: File pattern to match (default: "*.py")
+            file_pattern: Unused; files are selected by registered chunkers
 
         Returns:
             Dictionary with statistics:
@@ -203,22 +274,22 @@ class CodebaseIndexer:
             "errors": []
         }
 
-        # Collect all Python files
-        python_files = self._find_python_files(dirpath, recursive)
+        # Collect all source files
+        source_files = self._find_source_files(dirpath, recursive)
 
-        if not python_files:
-            self.logger.warning(f"No Python files found in {dirpath}")
+        if not source_files:
+            self.logger.warning(f"No source files found in {dirpath}")
             return self.stats
 
-        self.logger.info(f"Found {len(python_files)} Python files to index")
+        self.logger.info(f"Found {len(source_files)} source files to index")
 
-        # Index each file
-        for i, filepath in enumerate(python_files, 1):
+        # Chunk each file; embedding batches span file boundaries
+        for i, filepath in enumerate(source_files, 1):
             if self.verbose:
-                self.logger.info(f"[{i}/{len(python_files)}] Indexing {filepath}")
+                self.logger.info(f"[{i}/{len(source_files)}] Indexing {filepath}")
 
             try:
-                self.index_file(filepath)
+                self._chunk_file(filepath)
             except Exception as e:
                 self.logger.error(f"Error indexing {filepath}: {e}")
                 self.stats["files_failed"] += 1
@@ -227,6 +298,8 @@ class CodebaseIndexer:
                     "error": str(e)
                 })
 
+        self._flush()
+
         # Log summary
         self.logger.info(
             f"Indexing complete: {self.stats['files_processed']} files, "
@@ -236,6 +309,23 @@ class CodebaseIndexer:
 
         return self.stats
 
+    def _find_source_files(self, dirpath: str, recursive: bool) -> List[str]:
+        """
+        Find all files with a registered chunker, excluding excluded directories.
+
+        Args:
+            dirpath: Directory path to search
+            recursive: Whether to search recursively
+
+        Returns:
+            List of paths to source files
+        """
+        try:
+            return find_source_files(dirpath, recursive)
+        except PermissionError:
+            self.logger.warning(f"Permission denied: {dirpath}")
+            return []
+
     def _find_python_files(self, dirpath: str, recursive: bool) -> List[str]:
         """
         Find all Python files in a directory, excluding excluded directories.
@@ -245,32 +335,9 @@ class CodebaseIndexer:
             recursive: Whether to search recursively
 
         Returns:
-            List of absolute paths to Python files
+            List of paths to Python files
         """
-        python_files = []
-
-        if recursive:
-            # Use os.walk for recursive search
-            for root, dirs, files in os.walk(dirpath):
-                # Remove excluded directories from dirs (in-place modification)
-                # This prevents os.walk from descending into them
-                dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-
-                # Add Python files
-                for filename in files:
-                    if filename.endswith(".py"):
-                        filepath = os.path.join(root, filename)
-                        python_files.append(filepath)
-        else:
-            # Non-recursive: only check immediate directory
-            try:
-                for entry in os.scandir(dirpath):
-                    if entry.is_file() and entry.name.endswith(".py"):
-                        python_files.append(entry.path)
-            except PermissionError:
-                self.logger.warning(f"Permission denied: {dirpath}")
-
-        return python_files
+        return [f for f in self._find_source_files(dirpath, recursive) if f.endswith(".py")]
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -298,11 +365,12 @@ class CodebaseIndexer:
         Args:
             vector_store_path: Path to save FAISS index
         """
-        self.logger.info("Saving vector store...")
-        self.vector_store.save(vector_store_path)
+        with self.lock:
+            self.logger.info("Saving vector store...")
+            self.vector_store.save(vector_store_path)
 
-        self.logger.info("Saving metadata store...")
-        self.metadata_store.save()
+            self.logger.info("Saving metadata store...")
+            self.metadata_store.save()
 
         self.logger.info("Save complete")
 
@@ -335,6 +403,7 @@ class CodebaseIndexer:
         self.logger.warning("Clearing all indexed data...")
         self.vector_store = VectorStore(dimension=self.embedder.get_dimension())
         self.metadata_store.clear()
+        self._pending = []
         self.stats = {
             "files_processed": 0,
             "files_failed": 0,
@@ -343,23 +412,99 @@ class CodebaseIndexer:
         }
         self.logger.info("Clear complete")
 
-    def reindex_file(self, filepath: str) -> int:
+    def file_chunks(self, filepath: str) -> List[Dict[str, Any]]:
         """
-        Reindex a single file by removing old chunks and adding new ones.
+        Get the stored chunks of a file.
 
         Args:
-            filepath: Path to file to reindex
+            filepath: Path as it was indexed
 
         Returns:
-            Number of chunks created
+            List of chunk metadata dictionaries
+        """
+        return self.metadata_store.search_by_field("file_path", filepath)
 
-        Note:
-            This is a simplified implementation that doesn't actually remove
-            old chunks. For production use, implement proper chunk removal.
+    def remove_file(self, filepath: str) -> int:
         """
-        # TODO: Implement proper removal of old chunks
-        # For now, just index the file (may create duplicates)
-        return self.index_file(filepath)
+        Remove a file's chunks from the index.
+
+        Args:
+            filepath: Path as it was indexed
+
+        Returns:
+            Number of chunks removed
+        """
+        with self.lock:
+            chunk_ids = [chunk["chunk_id"] for chunk in self.file_chunks(filepath)]
+            self.vector_store.remove(chunk_ids)
+            for chunk_id in chunk_ids:
+                self.metadata_store.delete(chunk_id)
+            return len(chunk_ids)
+
+    def reindex_file(self, filepath: str) -> Dict[str, int]:
+        """
+        Reindex a single file in place.
+
+        Chunks whose text is unchanged keep their vectors (only metadata
+        such as line numbers is refreshed), so an edit re-embeds just the
+        chunks it touched. Chunks that disappeared are removed.
+
+        Args:
+            filepath: Path to file to reindex (as it was indexed)
+
+        Returns:
+            Dictionary with "embedded", "reused" and "removed" chunk counts
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If no chunker is registered for the file type
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        chunker = get_chunker(filepath)
+        if chunker is None:
+            raise ValueError(f"Unsupported file type: {filepath}")
+
+        chunks = chunker.chunk_file(filepath) if os.path.getsize(filepath) else []
+        if chunks is None:
+            raise ValueError(f"Failed to parse {filepath}")
+
+        old_ids: Dict[str, List[str]] = {}
+        for old in self.file_chunks(filepath):
+            old_ids.setdefault(self.chunker.get_chunk_text(old), []).append(old["chunk_id"])
+
+        fresh, reused = [], []
+        for chunk in chunks:
+            ids = old_ids.get(self.chunker.get_chunk_text(chunk))
+            if ids:
+                chunk["chunk_id"] = ids.pop()
+                reused.append(chunk)
+            else:
+                fresh.append(chunk)
+        stale = [chunk_id for ids in old_ids.values() for chunk_id in ids]
+
+        # Embed outside the lock so searches aren't blocked on the model
+        embeddings = []
+        for start in range(0, len(fresh), self.batch_size):
+            batch = fresh[start:start + self.batch_size]
+            embeddings.append(self.embedder.encode_batch([self.chunker.get_chunk_text(c) for c in batch]))
+
+        with self.lock:
+            for start, batch_embeddings in zip(range(0, len(fresh), self.batch_size), embeddings):
+                batch = fresh[start:start + self.batch_size]
+                self.vector_store.add_batch(batch_embeddings, [chunk["chunk_id"] for chunk in batch])
+            for chunk in fresh + reused:
+                self.metadata_store.add(chunk["chunk_id"], chunk)
+            self.vector_store.remove(stale)
+            for chunk_id in stale:
+                self.metadata_store.delete(chunk_id)
+
+        if self.verbose:
+            self.logger.info(
+                f"Reindexed {filepath}: {len(fresh)} embedded, {len(reused)} reused, {len(stale)} removed"
+            )
+        return {"embedded": len(fresh), "reused": len(reused), "removed": len(stale)}
 
     def search(self, query: str, top_k: int = 10) -> List[Tuple[Dict[str, Any], float]]:
         """
@@ -375,14 +520,15 @@ class CodebaseIndexer:
         # Generate query embedding
         query_embedding = self.embedder.encode(query)
 
-        # Search vector store
-        results = self.vector_store.search(query_embedding, top_k=top_k)
+        with self.lock:
+            # Search vector store
+            results = self.vector_store.search(query_embedding, top_k=top_k)
 
-        # Retrieve metadata for each result
-        results_with_metadata = []
-        for chunk_id, distance in results:
-            metadata = self.metadata_store.get(chunk_id)
-            if metadata:
-                results_with_metadata.append((metadata, distance))
+            # Retrieve metadata for each result
+            results_with_metadata = []
+            for chunk_id, distance in results:
+                metadata = self.metadata_store.get(chunk_id)
+                if metadata:
+                    results_with_metadata.append((metadata, distance))
 
         return results_with_metadata
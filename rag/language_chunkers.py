@@ -0,0 +1,577 @@
+"""
+Language Chunkers - Split source files in any language into indexable chunks.
+
+Python files keep their AST-based parser (CodeParser + CodeChunker). Other
+languages use a generic structural chunker driven by a small per-language
+spec:
+
+- Symbol headers (functions, classes, structs, SQL objects, ...) are found
+  with regular expressions, only at the top level of the current scope
+- Block extents follow the language's structure: braces (JavaScript,
+  TypeScript, Go, Java, C, Rust, ...), indentation (Ruby) or terminating
+  semicolons (SQL)
+- Oversized classes are split into their members; anything else too large,
+  code between symbols, and files with no recognised symbols fall back to
+  fixed token windows with overlap
+
+Each language registers its chunker by file extension; CodebaseIndexer
+looks the chunker up per file and feeds every chunk through the same
+batched embedding pipeline. Chunks carry the same fields as Python chunks
+plus ``language`` and ``symbol_kind``.
+
+Example:
+    >>> from rag.language_chunkers import get_chunker
+    >>>
+    >>> chunker = get_chunker("web/src/api.ts")
+    >>> for chunk in chunker.chunk_file("web/src/api.ts"):
+    ...     print(chunk["chunk_type"], chunk["name"], chunk["start_line"])
+"""
+
+import os
+import re
+import uuid
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from rag.code_parser import CodeParser
+from rag.chunker import CodeChunker
+
+logger = logging.getLogger(__name__)
+
+
+WINDOW_TOKENS = 256  # Tokens per fallback window
+WINDOW_OVERLAP = 32  # Tokens repeated at the start of the next window
+MAX_CHUNK_TOKENS = 512  # Symbols larger than this are split
+
+# Symbol kind -> chunk_type (kinds not listed become "class")
+FUNCTION_KINDS = {"function", "method", "procedure", "trigger"}
+
+# Words that look like a call/definition header but are control flow
+_KEYWORDS = {
+    "if", "for", "while", "switch", "catch", "return", "new", "else", "do",
+    "try", "synchronized", "using", "lock", "foreach", "sizeof", "when",
+}
+
+_TOKEN = re.compile(r"\S+")
+_WORD = re.compile(r"\w")
+_STRING = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|`(?:\\.|[^`\\])*`')
+_INDENT = re.compile(r"^[ \t]*")
+
+
+@dataclass
+class LanguageSpec:
+    """How to find symbols and block extents in one language."""
+    name: str
+    extensions: Tuple[str, ...]
+    symbols: List[Tuple[str, Pattern]]  # (symbol kind, pattern with a 'name' group)
+    blocks: str = "brace"  # "brace", "indent" or "statement"
+    line_comment: str = "//"
+    block_comments: bool = True  # Supports /* ... */
+    block_end: Optional[Pattern] = None  # Indent languages: closing line (e.g. Ruby "end")
+
+
+@dataclass
+class _Block:
+    """Symbol found in a file (0-based, end exclusive)."""
+    kind: str
+    name: str
+    start: int  # First line, including leading comments and annotations
+    header: int  # Line the symbol header is on
+    body_start: int  # First line after the one opening the body
+    end: int
+
+
+def _symbols(*pairs: Tuple[str, str], flags: int = 0) -> List[Tuple[str, Pattern]]:
+    """Compile (kind, regex) pairs."""
+    return [(kind, re.compile(pattern, flags)) for kind, pattern in pairs]
+
+
+_JS_SYMBOLS = _symbols(
+    ("class", r"^\s*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(?P<name>\w+)"),
+    ("interface", r"^\s*(?:export\s+)?(?:declare\s+)?interface\s+(?P<name>\w+)"),
+    ("enum", r"^\s*(?:export\s+)?(?:declare\s+)?(?:const\s+)?enum\s+(?P<name>\w+)"),
+    ("type", r"^\s*(?:export\s+)?(?:declare\s+)?type\s+(?P<name>\w+)\s*(?:<[^=]*>)?\s*="),
+    ("function", r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(?P<name>\w+)"),
+    ("function", r"^\s*(?:export\s+)?(?:const|let|var)\s+(?P<name>\w+)\s*(?::[^=]+)?=\s*"
+                 r"(?:async\s+)?(?:function\b|(?:\([^)]*\)|\w+)\s*(?::\s*[^=]+)?=>)"),
+    ("method", r"^\s*(?:(?:public|private|protected|static|readonly|async|override|abstract|get|set)\s+)*"
+               r"(?P<name>\w+)\s*(?:<[^>]*>)?\s*\([^;]*\)\s*(?::\s*[^{;]+)?\{\s*$"),
+)
+
+LANGUAGES: List[LanguageSpec] = [
+    LanguageSpec("javascript", (".js", ".jsx", ".mjs", ".cjs"), _JS_SYMBOLS),
+    LanguageSpec("typescript", (".ts", ".tsx", ".mts", ".cts"), _JS_SYMBOLS),
+    LanguageSpec("go", (".go",), _symbols(
+        ("method", r"^func\s+\([^)]*\)\s*(?P<name>\w+)"),
+        ("function", r"^func\s+(?P<name>\w+)"),
+        ("struct", r"^type\s+(?P<name>\w+)\s+struct\b"),
+        ("interface", r"^type\s+(?P<name>\w+)\s+interface\b"),
+        ("type", r"^type\s+(?P<name>\w+)\b"),
+    )),
+    LanguageSpec("java", (".java",), _symbols(
+        ("class", r"^\s*(?:@\w+\s+)*(?:(?:public|private|protected|static|final|abstract|sealed|non-sealed)\s+)*"
+                  r"(?:class|interface|enum|record|@interface)\s+(?P<name>\w+)"),
+        ("method", r"^\s*(?:(?:public|private|protected|static|final|abstract|synchronized|native|default)\s+)*"
+                   r"(?:<[^>]+>\s+)?[\w<>\[\],.?]+\s+(?P<name>\w+)\s*\([^;]*$"),
+    )),
+    LanguageSpec("csharp", (".cs",), _symbols(
+        ("class", r"^\s*(?:(?:public|private|protected|internal|static|sealed|abstract|partial|readonly)\s+)*"
+                  r"(?:class|interface|struct|enum|record)\s+(?P<name>\w+)"),
+        ("method", r"^\s*(?:(?:public|private|protected|internal|static|virtual|override|abstract|async|sealed|new)\s+)*"
+                   r"[\w<>\[\],.?]+\s+(?P<name>\w+)\s*(?:<[^>]*>)?\s*\([^;]*$"),
+    )),
+    LanguageSpec("kotlin", (".kt", ".kts"), _symbols(
+        ("class", r"^\s*(?:(?:public|private|internal|protected|open|abstract|sealed|data|enum|inner)\s+)*"
+                  r"(?:class|interface|object)\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:(?:public|private|internal|protected|override|suspend|inline|open)\s+)*"
+                     r"fun\s+(?:<[^>]*>\s*)?(?:[\w.]+\.)?(?P<name>\w+)"),
+    )),
+    LanguageSpec("swift", (".swift",), _symbols(
+        ("class", r"^\s*(?:(?:public|private|internal|fileprivate|open|final)\s+)*"
+                  r"(?:class|struct|enum|protocol|extension|actor)\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:(?:public|private|internal|fileprivate|open|static|override|@\w+)\s+)*func\s+(?P<name>\w+)"),
+    )),
+    LanguageSpec("scala", (".scala",), _symbols(
+        ("class", r"^\s*(?:(?:case|abstract|sealed|final|private|protected|implicit)\s+)*"
+                  r"(?:class|trait|object)\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:(?:override|private|protected|final|implicit)\s+)*def\s+(?P<name>\w+)"),
+    )),
+    LanguageSpec("rust", (".rs",), _symbols(
+        ("function", r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:const\s+)?(?:async\s+)?(?:unsafe\s+)?"
+                     r"(?:extern\s+\"[^\"]+\"\s+)?fn\s+(?P<name>\w+)"),
+        ("impl", r"^\s*impl(?:<[^>]*>)?\s+(?P<name>[\w:<>]+(?:\s+for\s+[\w:<>]+)?)"),
+        ("struct", r"^\s*(?:pub(?:\([^)]*\))?\s+)?(?:struct|enum|union|trait|mod)\s+(?P<name>\w+)"),
+        ("macro", r"^\s*macro_rules!\s*(?P<name>\w+)"),
+    )),
+    LanguageSpec("c", (".c", ".h"), _symbols(
+        ("struct", r"^\s*(?:typedef\s+)?(?:struct|enum|union)\s+(?P<name>\w+)\s*\{?\s*$"),
+        ("function", r"^(?!\s*#)[\w\*\s]+?[\s\*](?P<name>\w+)\s*\([^;]*$"),
+    )),
+    LanguageSpec("cpp", (".cpp", ".cc", ".cxx", ".hpp", ".hh", ".hxx"), _symbols(
+        ("namespace", r"^\s*namespace\s+(?P<name>[\w:]+)"),
+        ("class", r"^\s*(?:template\s*<[^>]*>\s*)?(?:class|struct|enum(?:\s+class)?|union)\s+(?P<name>\w+)[^;]*$"),
+        ("function", r"^(?!\s*#)[\w\*&:<>,\s~]+?[\s\*&](?P<name>[\w:~]+)\s*\([^;]*$"),
+    )),
+    LanguageSpec("php", (".php",), _symbols(
+        ("class", r"^\s*(?:(?:abstract|final|readonly)\s+)*(?:class|interface|trait|enum)\s+(?P<name>\w+)"),
+        ("function", r"^\s*(?:(?:public|private|protected|static|abstract|final)\s+)*function\s+&?(?P<name>\w+)"),
+    ), line_comment="//"),
+    LanguageSpec("shell", (".sh", ".bash", ".zsh"), _symbols(
+        ("function", r"^\s*function\s+(?P<name>[\w-]+)"),
+        ("function", r"^\s*(?P<name>[\w-]+)\s*\(\)\s*\{?"),
+    ), line_comment="#", block_comments=False),
+    LanguageSpec("ruby", (".rb", ".rake"), _symbols(
+        ("class", r"^\s*(?:class|module)\s+(?P<name>[\w:]+)"),
+        ("method", r"^\s*def\s+(?:self\.)?(?P<name>\w+[?!=]?)"),
+    ), blocks="indent", line_comment="#", block_comments=False, block_end=re.compile(r"^\s*end\b")),
+    LanguageSpec("sql", (".sql",), _symbols(
+        ("function", r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:FUNCTION|PROCEDURE)\s+(?P<name>[\w.\"]+)"),
+        ("trigger", r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:CONSTRAINT\s+)?TRIGGER\s+(?P<name>[\w.\"]+)"),
+        ("table", r"^\s*CREATE\s+(?:(?:GLOBAL|LOCAL)\s+)?(?:TEMP(?:ORARY)?\s+|UNLOGGED\s+)?TABLE\s+"
+                  r"(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w.\"]+)"),
+        ("view", r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?(?:MATERIALIZED\s+)?VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w.\"]+)"),
+        ("index", r"^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w.\"]+)"),
+        ("type", r"^\s*CREATE\s+(?:TYPE|DOMAIN|SEQUENCE|SCHEMA)\s+(?:IF\s+NOT\s+EXISTS\s+)?(?P<name>[\w.\"]+)"),
+        ("table", r"^\s*ALTER\s+TABLE\s+(?:ONLY\s+)?(?:IF\s+EXISTS\s+)?(?P<name>[\w.\"]+)"),
+    flags=re.IGNORECASE), blocks="statement", line_comment="--"),
+]
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count (whitespace-separated words)."""
+    return len(_TOKEN.findall(text))
+
+
+class LanguageChunker(ABC):
+    """Turns a source file into chunk dictionaries for the index."""
+
+    language: str = ""
+    extensions: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def chunk_file(self, filepath: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Chunk a file.
+
+        Args:
+            filepath: Absolute path to the source file
+
+        Returns:
+            List of chunk dictionaries, or None if the file can't be parsed
+        """
+
+
+class PythonChunker(LanguageChunker):
+    """AST-based chunking for Python (CodeParser + CodeChunker)."""
+
+    language = "python"
+    extensions = (".py",)
+
+    def __init__(self):
+        self.parser = CodeParser()
+        self.chunker = CodeChunker()
+
+    def chunk_file(self, filepath: str) -> Optional[List[Dict[str, Any]]]:
+        parsed_data = self.parser.parse_file(filepath)
+        if parsed_data is None:
+            return None
+        chunks = self.chunker.create_chunks(parsed_data, filepath)
+        for chunk in chunks:
+            chunk["language"] = self.language
+            chunk["symbol_kind"] = chunk["chunk_type"]
+        return chunks
+
+
+class StructuralChunker(LanguageChunker):
+    """Generic brace/indent/statement-aware chunker for one language."""
+
+    def __init__(self, spec: LanguageSpec):
+        """
+        Initialize chunker.
+
+        Args:
+            spec: Language description
+        """
+        self.spec = spec
+        self.language = spec.name
+        self.extensions = spec.extensions
+
+    def chunk_file(self, filepath: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+                source = f.read()
+        except OSError as e:
+            logger.warning(f"Cannot read {filepath}: {e}")
+            return None
+        return self.chunk_source(source, filepath)
+
+    def chunk_source(self, source: str, filepath: str) -> List[Dict[str, Any]]:
+        """
+        Chunk source text.
+
+        Args:
+            source: File contents
+            filepath: Path recorded in chunk metadata
+
+        Returns:
+            List of chunk dictionaries in file order
+        """
+        lines = source.splitlines()
+        clean = self._strip_strings_and_comments(lines)
+        module = Path(filepath).stem
+        chunks: List[Dict[str, Any]] = []
+
+        pos = 0
+        for block in self._find_blocks(lines, clean, 0, len(lines)):
+            chunks.extend(self._windows(lines, pos, block.start, filepath, module, "module"))
+            chunks.extend(self._block_chunks(block, lines, clean, filepath, None))
+            pos = block.end
+        chunks.extend(self._windows(lines, pos, len(lines), filepath, module, "module"))
+        return chunks
+
+    # -- Scanning -----------------------------------------------------------
+
+    def _strip_strings_and_comments(self, lines: List[str]) -> List[str]:
+        """Blank out string literals and comments so they don't count as structure."""
+        clean = []
+        in_comment = False
+        in_dollar = False  # SQL $$ ... $$ bodies
+        for line in lines:
+            text = line
+            if self.spec.block_comments:
+                if in_comment:
+                    end = text.find("*/")
+                    if end == -1:
+                        clean.append("")
+                        continue
+                    text = text[end + 2:]
+                    in_comment = False
+            text = _STRING.sub('""', text)
+            if self.spec.block_comments:
+                text = re.sub(r"/\*.*?\*/", " ", text)
+                start = text.find("/*")
+                if start != -1:
+                    text = text[:start]
+                    in_comment = True
+            comment = text.find(self.spec.line_comment)
+            if comment != -1:
+                text = text[:comment]
+            if self.spec.blocks == "statement":
+                # Semicolons inside dollar-quoted bodies don't end the statement
+                parts = text.split("$$")
+                kept = [p for i, p in enumerate(parts) if (i % 2 == 0) != in_dollar]
+                if len(parts) % 2 == 0:
+                    in_dollar = not in_dollar
+                text = " ".join(kept)
+            clean.append(text)
+        return clean
+
+    def _match_header(self, line: str) -> Optional[Tuple[str, str]]:
+        """Return (kind, name) if the line starts a symbol."""
+        for kind, pattern in self.spec.symbols:
+            match = pattern.match(line)
+            if match and match.group("name") not in _KEYWORDS:
+                return kind, match.group("name")
+        return None
+
+    @staticmethod
+    def _indent(line: str) -> int:
+        return len(_INDENT.match(line).group(0).expandtabs(4))
+
+    def _leading_start(self, lines: List[str], header: int, lo: int) -> int:
+        """Extend a symbol upwards over its doc comments and annotations."""
+        start = header
+        while start > lo:
+            prev = lines[start - 1].strip()
+            if prev and (
+                prev.startswith((self.spec.line_comment, "/*", "*", "@", "#[", "[")) or prev.endswith("*/")
+            ):
+                start -= 1
+            else:
+                break
+        return start
+
+    def _find_blocks(self, lines: List[str], clean: List[str], lo: int, hi: int) -> List[_Block]:
+        """Find symbols at the top level of lines[lo:hi]."""
+        blocks = []
+        depth = 0  # brace depth of non-symbol code
+        in_statement = False
+        base_indent = None
+
+        i = lo
+        while i < hi:
+            line = lines[i]
+            code = clean[i]
+            if not code.strip():
+                i += 1
+                continue
+
+            if base_indent is None:
+                base_indent = self._indent(line)
+
+            at_top = (
+                depth == 0 if self.spec.blocks == "brace"
+                else not in_statement if self.spec.blocks == "statement"
+                else self._indent(line) <= base_indent
+            )
+            header = self._match_header(line) if at_top else None
+
+            if header is None:
+                if self.spec.blocks == "brace":
+                    depth = max(0, depth + code.count("{") - code.count("}"))
+                elif self.spec.blocks == "statement":
+                    in_statement = not code.rstrip().endswith(";")
+                i += 1
+                continue
+
+            kind, name = header
+            end, body_start = self._block_end(lines, clean, i, hi)
+            start = max(self._leading_start(lines, i, lo), blocks[-1].end if blocks else lo)
+            blocks.append(_Block(kind, name, start, i, body_start, end))
+            i = end
+
+        return blocks
+
+    def _block_end(self, lines: List[str], clean: List[str], header: int, hi: int) -> Tuple[int, int]:
+        """Find where a symbol ends. Returns (end, body_start), end exclusive."""
+        if self.spec.blocks == "statement":
+            for j in range(header, hi):
+                if ";" in clean[j]:
+                    return j + 1, header + 1
+            return hi, header + 1
+
+        if self.spec.blocks == "indent":
+            base = self._indent(lines[header])
+            last = header
+            for j in range(header + 1, hi):
+                if not lines[j].strip():
+                    continue
+                if self._indent(lines[j]) <= base:
+                    if self.spec.block_end and self.spec.block_end.match(lines[j]) and self._indent(lines[j]) == base:
+                        last = j
+                    break
+                last = j
+            return last + 1, header + 1
+
+        depth = 0
+        opened = False
+        body_start = header + 1
+        for j in range(header, hi):
+            code = clean[j]
+            if j > header and not opened and self._match_header(lines[j]):
+                return j, j  # Declaration without a body (e.g. a type alias)
+            opens, closes = code.count("{"), code.count("}")
+            if opens and not opened:
+                opened = True
+                body_start = j + 1
+            depth += opens - closes
+            if opened and depth <= 0:
+                return j + 1, body_start
+            if not opened and (code.rstrip().endswith(";") or j - header >= 5):
+                return j + 1, j + 1
+        return hi, body_start
+
+    # -- Chunk construction -------------------------------------------------
+
+    def _block_chunks(
+        self,
+        block: _Block,
+        lines: List[str],
+        clean: List[str],
+        filepath: str,
+        parent: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Chunks for one symbol: whole, split into members, or windowed."""
+        name = f"{parent}.{block.name}" if parent else block.name
+        chunk_type = "function" if block.kind in FUNCTION_KINDS else "class"
+        text = "\n".join(lines[block.start:block.end])
+
+        if count_tokens(text) <= MAX_CHUNK_TOKENS:
+            return [self._chunk(lines, block.start, block.end, filepath, name, chunk_type,
+                                block.kind, block.header, parent)]
+
+        # Large container: one chunk per member, windows for the rest
+        if chunk_type == "class" and block.body_start < block.end:
+            members = self._find_blocks(lines, clean, block.body_start, block.end)
+            if members:
+                chunks = []
+                pos = block.start
+                for member in members:
+                    chunks.extend(self._windows(lines, pos, member.start, filepath, name, chunk_type,
+                                                block.kind, block.header if pos == block.start else None, parent))
+                    chunks.extend(self._block_chunks(member, lines, clean, filepath, name))
+                    pos = member.end
+                chunks.extend(self._windows(lines, pos, block.end, filepath, name, chunk_type, block.kind, None, parent))
+                return chunks
+
+        return self._windows(lines, block.start, block.end, filepath, name, chunk_type,
+                             block.kind, block.header, parent)
+
+    def _windows(
+        self,
+        lines: List[str],
+        lo: int,
+        hi: int,
+        filepath: str,
+        name: str,
+        chunk_type: str,
+        kind: str = "module",
+        header: Optional[int] = None,
+        parent: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Fixed token windows with overlap over lines[lo:hi] (ranges without code skipped)."""
+        if not any(_WORD.search(line) for line in lines[lo:hi]):
+            return []  # Blank lines or lone closing braces
+
+        counts = [count_tokens(line) for line in lines[lo:hi]]
+        if sum(counts) <= MAX_CHUNK_TOKENS:
+            return [self._chunk(lines, lo, hi, filepath, name, chunk_type, kind, header, parent)]
+
+        chunks = []
+        start = lo
+        while start < hi:
+            end = start
+            tokens = 0
+            while end < hi and (tokens < WINDOW_TOKENS or end == start):
+                tokens += counts[end - lo]
+                end += 1
+
+            if any(_WORD.search(line) for line in lines[start:end]):
+                chunks.append(self._chunk(lines, start, end, filepath, name, chunk_type, kind,
+                                          header if start == lo else None, parent))
+            if end >= hi:
+                break
+
+            # Step back over the overlap, always moving forward
+            back = end
+            overlap = 0
+            while back > start + 1 and overlap < WINDOW_OVERLAP:
+                back -= 1
+                overlap += counts[back - lo]
+            start = max(back, start + 1)
+        return chunks
+
+    def _chunk(
+        self,
+        lines: List[str],
+        start: int,
+        end: int,
+        filepath: str,
+        name: str,
+        chunk_type: str,
+        kind: str,
+        header: Optional[int],
+        parent: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a chunk dictionary for lines[start:end]."""
+        # Trim blank lines at the edges so line ranges point at code
+        while start < end - 1 and not lines[start].strip():
+            start += 1
+        while end > start + 1 and not lines[end - 1].strip():
+            end -= 1
+
+        docstring = ""
+        if header is not None and header > start:
+            comment_lines = [
+                re.sub(r"^\s*(?:/\*\*?|\*/|\*|///?|#|--)\s?", "", l).rstrip(" */")
+                for l in lines[start:header] if not l.strip().startswith(("@", "#["))
+            ]
+            docstring = "\n".join(l for l in comment_lines if l).strip()
+
+        chunk = {
+            "chunk_id": str(uuid.uuid4()),
+            "file_path": filepath,
+            "chunk_type": chunk_type,
+            "name": name,
+            "start_line": start + 1,
+            "end_line": end,
+            "code": "\n".join(lines[start:end]),
+            "docstring": docstring,
+            "language": self.language,
+            "symbol_kind": kind,
+        }
+        if header is not None and chunk_type == "function":
+            chunk["signature"] = lines[header].strip().rstrip("{").strip()
+        if parent:
+            chunk["parent"] = parent
+        return chunk
+
+
+# Extension -> chunker
+CHUNKERS: Dict[str, LanguageChunker] = {}
+
+
+def register_chunker(chunker: LanguageChunker) -> LanguageChunker:
+    """
+    Register a chunker for its file extensions (replacing earlier ones).
+
+    Args:
+        chunker: Chunker instance
+
+    Returns:
+        The chunker
+    """
+    for ext in chunker.extensions:
+        CHUNKERS[ext.lower()] = chunker
+    return chunker
+
+
+def get_chunker(filepath: str) -> Optional[LanguageChunker]:
+    """
+    Get the chunker for a source file.
+
+    Args:
+        filepath: Source file path
+
+    Returns:
+        Registered chunker, or None if the language isn't supported
+    """
+    return CHUNKERS.get(os.path.splitext(str(filepath))[1].lower())
+
+
+register_chunker(PythonChunker())
+for _spec in LANGUAGES:
+    register_chunker(StructuralChunker(_spec))
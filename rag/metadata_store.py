@@ -4,6 +4,8 @@ from typing import Dict, List, Any, Optional
 import json
 from pathlib import Path
 
+from optimization.resource_monitor import get_resource_monitor, estimate_size
+
 
 class MetadataStore:
     """JSON-based storage for code chunk metadata.
@@ -40,6 +42,8 @@ class MetadataStore:
         self.filepath = filepath
         self.metadata: Dict[str, dict] = {}
 
+        get_resource_monitor().register_component("metadata_store", self.estimate_memory)
+
         # Try to load existing metadata
         if Path(filepath).exists():
             try:
@@ -170,6 +174,19 @@ class MetadataStore:
         with open(self.filepath, "r", encoding="utf-8") as f:
             self.metadata = json.load(f)
 
+    def estimate_memory(self) -> int:
+        """Estimate memory held by the metadata dict.
+
+        Returns:
+            Estimated size in bytes (sampled for large stores)
+
+        Example:
+            >>> store = MetadataStore()
+            >>> store.estimate_memory() > 0
+            True
+        """
+        return estimate_size(self.metadata)
+
     def size(self) -> int:
         """Get number of chunks in the store.
 
@@ -0,0 +1,310 @@
+"""Second-stage reranking for code search results.
+
+Vector search ranks chunks by embedding distance alone, which often puts
+a chunk that merely talks about the same topic above the one that defines
+the identifier the user asked for. ``Reranker`` rescores an over-fetched
+candidate list and keeps the best few:
+
+- With a cross-encoder model configured (and sentence-transformers
+  installed), (query, chunk) pairs are scored in batches by the model
+- Otherwise a cheap lexical/structural scorer combines the vector
+  similarity with identifier overlap, chunk type and same-file proximity
+
+Scores are cached per (query, chunk id), so repeated or refined searches
+only score chunks they haven't seen.
+
+Example:
+    >>> from rag.reranker import Reranker
+    >>>
+    >>> reranker = Reranker()
+    >>> candidates = indexer.search(query, top_k=40)
+    >>> for metadata, distance, score in reranker.rerank(query, candidates, top_k=8):
+    ...     print(metadata["name"], score)
+"""
+
+import hashlib
+import importlib.util
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from optimization.resource_monitor import get_resource_monitor, estimate_model_bytes, estimate_size
+
+# The lexical scorer doesn't need sentence-transformers; import it only
+# when a cross-encoder is actually loaded.
+CROSS_ENCODER_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+
+# Words that carry no signal about which code the user wants
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "code", "do", "does",
+    "for", "from", "how", "i", "in", "is", "it", "me", "of", "on", "or", "show",
+    "that", "the", "this", "to", "what", "where", "which", "with", "work", "works",
+}
+
+# Query words hinting at the kind of chunk wanted
+TYPE_HINTS = {
+    "class": "class", "classes": "class", "object": "class",
+    "function": "function", "functions": "function", "method": "function",
+    "methods": "function", "def": "function",
+    "import": "imports", "imports": "imports", "dependency": "imports",
+    "dependencies": "imports",
+    "module": "module", "file": "module",
+}
+
+# Weights of the lexical scorer components (sum to 1.0)
+WEIGHTS = {
+    "vector": 0.40,
+    "name": 0.25,
+    "code": 0.20,
+    "type": 0.10,
+    "file": 0.05,
+}
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_CAMEL = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def split_identifiers(text: str) -> List[str]:
+    """
+    Split text into lowercase identifier parts.
+
+    ``parseConfigFile`` and ``parse_config_file`` both become
+    ``["parse", "config", "file"]``.
+
+    Args:
+        text: Query or code text
+
+    Returns:
+        List of identifier parts (may repeat)
+    """
+    parts = []
+    for word in _IDENTIFIER.findall(text):
+        for piece in word.split("_"):
+            parts.extend(p.lower() for p in _CAMEL.findall(piece))
+    return parts
+
+
+class Reranker:
+    """Rescores code search candidates and returns the best top_k.
+
+    Thread-safe: the score cache is guarded by a lock.
+
+    Attributes:
+        model_name: Cross-encoder model (None = lexical scoring only)
+        batch_size: Candidate pairs scored per model call
+        cache_size: Cached (query, chunk) scores kept
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        batch_size: int = 32,
+        cache_size: int = 4096
+    ):
+        """
+        Initialize reranker.
+
+        Args:
+            model_name: Cross-encoder model identifier; falls back to the
+                lexical scorer when None or when sentence-transformers is missing
+            batch_size: Candidate pairs scored per model call
+            cache_size: Cached (query, chunk) scores kept
+        """
+        self.model_name = model_name if CROSS_ENCODER_AVAILABLE else None
+        self.batch_size = max(1, batch_size)
+        self.cache_size = cache_size
+        self._model = None
+        self._cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.reranks = 0
+        self.scored = 0
+        self.cache_hits = 0
+
+        get_resource_monitor().register_component("reranker", self.estimate_memory)
+
+    @property
+    def model(self):
+        """Lazy-load the cross-encoder on first use."""
+        if self._model is None and self.model_name:
+            from sentence_transformers import CrossEncoder
+            self._model = CrossEncoder(self.model_name, device='cpu')
+        return self._model
+
+    @property
+    def method(self) -> str:
+        """Scoring method in use ("cross-encoder" or "lexical")."""
+        return "cross-encoder" if self.model_name else "lexical"
+
+    @staticmethod
+    def _chunk_id(metadata: Dict[str, Any]) -> str:
+        """Stable id for a chunk (chunks indexed before ids existed use location)."""
+        return metadata.get("chunk_id") or (
+            f"{metadata.get('file_path', '')}:{metadata.get('start_line', 0)}"
+            f"-{metadata.get('end_line', 0)}"
+        )
+
+    def rerank(
+        self,
+        query: str,
+        candidates: List[Tuple[Dict[str, Any], float]],
+        top_k: int
+    ) -> List[Tuple[Dict[str, Any], float, float]]:
+        """
+        Rescore candidates and keep the best.
+
+        Args:
+            query: Search query
+            candidates: (chunk_metadata, distance) tuples from vector search
+            top_k: Number of results to return
+
+        Returns:
+            (chunk_metadata, distance, score) tuples, best first
+        """
+        if not candidates:
+            return []
+
+        query_key = hashlib.sha1(query.strip().lower().encode("utf-8")).hexdigest()
+        keys = [(query_key, self._chunk_id(metadata)) for metadata, _ in candidates]
+
+        scores: List[Optional[float]] = []
+        with self.lock:
+            for key in keys:
+                score = self._cache.get(key)
+                if score is not None:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                scores.append(score)
+
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            if self.model_name:
+                fresh = self._score_cross_encoder(query, [candidates[i] for i in missing])
+            else:
+                fresh = self._score_lexical(query, candidates, missing)
+
+            with self.lock:
+                for i, score in zip(missing, fresh):
+                    scores[i] = score
+                    self._cache[keys[i]] = score
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                self.scored += len(missing)
+
+        with self.lock:
+            self.reranks += 1
+
+        ranked = sorted(
+            ((metadata, distance, score) for (metadata, distance), score in zip(candidates, scores)),
+            key=lambda item: (-item[2], item[1])
+        )
+        return ranked[:top_k]
+
+    def _score_cross_encoder(
+        self,
+        query: str,
+        candidates: List[Tuple[Dict[str, Any], float]]
+    ) -> List[float]:
+        """Score (query, chunk) pairs with the cross-encoder, batch_size at a time."""
+        pairs = [(query, self._chunk_text(metadata)) for metadata, _ in candidates]
+        scores: List[float] = []
+        for start in range(0, len(pairs), self.batch_size):
+            batch = self.model.predict(pairs[start:start + self.batch_size])
+            # Logits to 0-1 so scores are comparable with the lexical scorer
+            scores.extend(1.0 / (1.0 + math.exp(-float(s))) for s in batch)
+        return scores
+
+    @staticmethod
+    def _chunk_text(metadata: Dict[str, Any]) -> str:
+        """Text shown to the cross-encoder for a chunk."""
+        header = f"{metadata.get('chunk_type', '')} {metadata.get('name', '')} in {metadata.get('file_path', '')}"
+        return f"{header}\n{metadata.get('code', '')}"
+
+    def _score_lexical(
+        self,
+        query: str,
+        candidates: List[Tuple[Dict[str, Any], float]],
+        indexes: List[int]
+    ) -> List[float]:
+        """
+        Score candidates with the lexical/structural scorer.
+
+        All candidates are passed so same-file proximity can see the whole
+        list; only those at `indexes` are scored.
+        """
+        words = [w for w in split_identifiers(query) if w not in STOPWORDS]
+        terms = set(words)
+        wanted_types = {TYPE_HINTS[w] for w in re.findall(r"[a-z]+", query.lower()) if w in TYPE_HINTS}
+
+        # Files holding several candidates are more likely the right place
+        file_counts = Counter(metadata.get("file_path", "") for metadata, _ in candidates)
+        busiest = max(file_counts.values())
+
+        scores = []
+        for i in indexes:
+            metadata, distance = candidates[i]
+            vector = 1.0 / (1.0 + max(distance, 0.0))
+
+            name_parts = set(split_identifiers(metadata.get("name", "")))
+            name = len(terms & name_parts) / len(terms) if terms else 0.0
+
+            code_parts = set(split_identifiers(metadata.get("code", "")))
+            code = len(terms & code_parts) / len(terms) if terms else 0.0
+
+            chunk_type = metadata.get("chunk_type", "")
+            if wanted_types:
+                type_score = 1.0 if chunk_type in wanted_types else 0.0
+            else:
+                # Definitions answer most queries better than import blocks
+                type_score = 1.0 if chunk_type in ("function", "class") else 0.5
+
+            file_path = metadata.get("file_path", "")
+            file_parts = set(split_identifiers(file_path.rsplit("/", 1)[-1]))
+            file_score = 0.5 * (file_counts[file_path] - 1) / max(busiest - 1, 1)
+            if terms & file_parts:
+                file_score += 0.5
+
+            scores.append(
+                WEIGHTS["vector"] * vector
+                + WEIGHTS["name"] * name
+                + WEIGHTS["code"] * code
+                + WEIGHTS["type"] * type_score
+                + WEIGHTS["file"] * file_score
+            )
+        return scores
+
+    def clear_cache(self) -> None:
+        """Drop cached scores (e.g. after re-indexing)."""
+        with self.lock:
+            self._cache.clear()
+
+    def estimate_memory(self) -> int:
+        """
+        Estimate memory held by the cross-encoder weights and score cache.
+
+        Returns:
+            Estimated size in bytes
+        """
+        model_bytes = estimate_model_bytes(self._model.model) if self._model is not None else 0
+        return model_bytes + estimate_size(self._cache)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get reranker statistics.
+
+        Returns:
+            Dictionary with method, rerank/score counts and cache usage
+        """
+        with self.lock:
+            return {
+                "method": self.method,
+                "model": self.model_name,
+                "reranks": self.reranks,
+                "scored": self.scored,
+                "cache_hits": self.cache_hits,
+                "cached_scores": len(self._cache),
+            }
@@ -7,6 +7,8 @@ import pickle
 import os
 from pathlib import Path
 
+from optimization.resource_monitor import get_resource_monitor, estimate_size, faiss_index_bytes
+
 
 class VectorStore:
     """FAISS-based vector store for semantic similarity search.
@@ -41,6 +43,8 @@ class VectorStore:
         self.idx_to_chunk_id: Dict[int, str] = {}  # FAISS index -> chunk_id
         self.next_idx = 0  # Next available FAISS index
 
+        get_resource_monitor().register_component("vector_store", self.estimate_memory)
+
     def add(self, embedding: np.ndarray, chunk_id: str) -> None:
         """Add single embedding vector to the index.
 
@@ -148,8 +152,9 @@ class VectorStore:
                 f"Query embedding dimension {query_embedding.shape} doesn't match store dimension ({self.dimension},)"
             )
 
-        # Limit top_k to number of vectors in index
-        k = min(top_k, self.index.ntotal)
+        # Over-fetch by the number of removed vectors still in the index
+        removed = self.index.ntotal - len(self.idx_to_chunk_id)
+        k = min(top_k + removed, self.index.ntotal)
 
         # FAISS requires 2D array of shape (1, dimension)
         query_2d = query_embedding.reshape(1, -1)
@@ -167,7 +172,57 @@ class VectorStore:
             if chunk_id is not None:
                 results.append((chunk_id, distance))
 
-        return results
+        return results[:top_k]
+
+    def remove(self, chunk_ids: List[str]) -> int:
+        """Remove vectors so they no longer appear in search results.
+
+        IndexFlatL2 can't delete without renumbering, so removed vectors only
+        lose their id mapping and stay in the index (search skips them) until
+        they outnumber the live ones and the index is compacted.
+
+        Args:
+            chunk_ids: Chunk identifiers to remove (unknown ids are ignored)
+
+        Returns:
+            Number of vectors removed
+
+        Example:
+            >>> store = VectorStore()
+            >>> # ... add vectors ...
+            >>> store.remove(["chunk-1", "chunk-2"])
+            2
+        """
+        removed = 0
+        for chunk_id in chunk_ids:
+            faiss_idx = self.chunk_id_to_idx.pop(chunk_id, None)
+            if faiss_idx is not None:
+                del self.idx_to_chunk_id[faiss_idx]
+                removed += 1
+
+        if removed and self.index.ntotal - self.size() > self.size():
+            self.compact()
+        return removed
+
+    def compact(self) -> None:
+        """Rebuild the index without removed vectors.
+
+        Example:
+            >>> store = VectorStore()
+            >>> # ... add and remove vectors ...
+            >>> store.compact()
+            >>> store.index.ntotal == store.size()
+            True
+        """
+        live = sorted(self.idx_to_chunk_id.items())
+        index = faiss.IndexFlatL2(self.dimension)
+        if live:
+            index.add(np.vstack([self.index.reconstruct(faiss_idx) for faiss_idx, _ in live]))
+
+        self.index = index
+        self.chunk_id_to_idx = {chunk_id: i for i, (_, chunk_id) in enumerate(live)}
+        self.idx_to_chunk_id = {i: chunk_id for i, (_, chunk_id) in enumerate(live)}
+        self.next_idx = len(live)
 
     def save(self, path: str) -> None:
         """Save FAISS index and ID mappings to disk.
@@ -233,15 +288,30 @@ class VectorStore:
         self.next_idx = mappings["next_idx"]
         self.dimension = mappings["dimension"]
 
+    def estimate_memory(self) -> int:
+        """Estimate memory held by the index and its id mappings.
+
+        Returns:
+            Estimated size in bytes (vectors are ntotal * d * 4)
+
+        Example:
+            >>> store = VectorStore()
+            >>> store.estimate_memory() >= 0
+            True
+        """
+        return (faiss_index_bytes(self.index)
+                + estimate_size(self.chunk_id_to_idx)
+                + estimate_size(self.idx_to_chunk_id))
+
     def size(self) -> int:
         """Get number of vectors in the index.
 
         Returns:
-            Number of vectors stored
+            Number of vectors stored (excluding removed ones)
 
         Example:
             >>> store = VectorStore()
             >>> store.size()
             0
         """
-        return self.index.ntotal
+        return len(self.chunk_id_to_idx)
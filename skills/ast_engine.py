@@ -0,0 +1,395 @@
+"""Shared AST analysis engine for Meton's code skills.
+
+Code skills are often chained on the same source (review, then explain, then
+generate tests), and each used to parse it and walk the tree several times.
+The engine parses once, makes a single breadth-first pass that dispatches
+every node to the rule callbacks registered for its type, and caches the
+result by code hash so the next skill reuses the tree and the collected
+facts.
+
+Built-in rules collect what most skills need:
+- A node index by type (in ``ast.walk`` order), and each node's parent
+- Per-function facts: cyclomatic complexity, nesting depth, calls, raises
+- Module-wide decision points (for cyclomatic complexity)
+
+Skills can register their own rules; their results land in
+``analysis.facts[name]``.
+
+Example:
+    >>> from skills.ast_engine import analyze
+    >>>
+    >>> analysis = analyze("def add(a, b):\\n    return a + b")
+    >>> [f.node.name for f in analysis.functions.values()]
+    ['add']
+    >>> analysis.complexity
+    1
+"""
+
+import ast
+import hashlib
+import heapq
+import threading
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+# Control-flow blocks that add a nesting level
+NESTING_NODES = (ast.If, ast.For, ast.While, ast.With, ast.Try)
+
+# Nodes that add a decision point (BoolOp adds one per extra operand)
+DECISION_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler)
+
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+_NESTING_TYPES = frozenset(NESTING_NODES)
+_DECISION_TYPES = frozenset(DECISION_NODES)
+_FUNCTION_TYPES = frozenset(FUNCTION_NODES)
+
+
+class Scope(NamedTuple):
+    """Where a node sits in the tree, passed to every rule callback.
+
+    Attributes:
+        parent: Parent node (None for the module)
+        functions: Enclosing function nodes, innermost last
+        depth: Control-flow blocks (``NESTING_NODES``) above the node
+    """
+    parent: Optional[ast.AST]
+    functions: Tuple[ast.AST, ...]
+    depth: int
+
+
+@dataclass
+class FunctionFacts:
+    """Facts about one function, nested functions included.
+
+    Attributes:
+        node: FunctionDef or AsyncFunctionDef node
+        base_depth: Control-flow blocks above the function itself
+        complexity: Cyclomatic complexity
+        max_depth: Deepest control-flow nesting inside the function
+        calls: Call nodes in the function, in walk order
+        raises: Raise nodes in the function, in walk order
+        has_return: Whether the function contains a return statement
+        has_yield: Whether the function contains yield
+    """
+    node: ast.AST
+    base_depth: int = 0
+    complexity: int = 1
+    max_depth: int = 0
+    calls: List[ast.Call] = field(default_factory=list)
+    raises: List[ast.Raise] = field(default_factory=list)
+    has_return: bool = False
+    has_yield: bool = False
+
+
+class ASTAnalysis:
+    """One parsed piece of code and everything the engine collected about it.
+
+    Treat it as read-only: the tree and facts are shared by every skill that
+    analyzes the same code.
+
+    Attributes:
+        code_hash: SHA-256 of the source
+        tree: Parsed module (None if the code doesn't parse)
+        error: SyntaxError raised by the parser, if any
+        lines: Source lines
+        nodes: Nodes by exact type, in ``ast.walk`` order
+        positions: Walk positions of the nodes in ``nodes``
+        parents: Parent of every node
+        functions: FunctionFacts by function node, in walk order
+        decision_points: Decision points in the whole module
+        facts: Results of registered rules, by rule name
+    """
+
+    def __init__(self, code: str, code_hash: str):
+        self.code_hash = code_hash
+        self.lines = code.split('\n')
+        self.tree: Optional[ast.Module] = None
+        self.error: Optional[SyntaxError] = None
+        self.nodes: Dict[Type[ast.AST], List[ast.AST]] = defaultdict(list)
+        self.positions: Dict[Type[ast.AST], List[int]] = defaultdict(list)
+        self.parents: Dict[ast.AST, ast.AST] = {}
+        self.functions: Dict[ast.AST, FunctionFacts] = {}
+        self.decision_points = 0
+        self.facts: Dict[str, Any] = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether the code parsed."""
+        return self.tree is not None
+
+    @property
+    def complexity(self) -> int:
+        """Module cyclomatic complexity (decision points + 1)."""
+        return self.decision_points + 1
+
+    def of_type(self, *node_types: Type[ast.AST]) -> List[ast.AST]:
+        """Get nodes of the given exact types.
+
+        Args:
+            *node_types: AST node classes
+
+        Returns:
+            Matching nodes, in ``ast.walk`` order
+        """
+        if len(node_types) == 1:
+            return list(self.nodes.get(node_types[0], ()))
+        streams = [
+            zip(self.positions[node_type], self.nodes[node_type])
+            for node_type in node_types if node_type in self.nodes
+        ]
+        return [node for _, node in heapq.merge(*streams, key=lambda item: item[0])]
+
+    def parent(self, node: ast.AST) -> Optional[ast.AST]:
+        """Get a node's parent (None for the module)."""
+        return self.parents.get(node)
+
+    def ancestors(self, node: ast.AST) -> Iterator[ast.AST]:
+        """Iterate over a node's ancestors, innermost first."""
+        parent = self.parents.get(node)
+        while parent is not None:
+            yield parent
+            parent = self.parents.get(parent)
+
+    def top_level_functions(self) -> List[ast.FunctionDef]:
+        """Get FunctionDef nodes not nested inside another FunctionDef.
+
+        These are what an ``ast.NodeVisitor`` that doesn't descend into
+        functions would visit: module functions and methods.
+        """
+        return [
+            node for node in self.of_type(ast.FunctionDef)
+            if not any(isinstance(a, ast.FunctionDef) for a in self.ancestors(node))
+        ]
+
+
+RuleCallback = Callable[[ast.AST, Scope, ASTAnalysis], None]
+
+
+class ASTEngine:
+    """Parses code once, runs all rules in one pass and caches the analysis.
+
+    Example:
+        >>> engine = ASTEngine()
+        >>> engine.register("calls", [ast.Call], lambda node, scope, a: a.facts["calls"].append(node),
+        ...                 init=lambda a: a.facts.setdefault("calls", []))
+        >>> len(engine.analyze("f(g(1))").facts["calls"])
+        2
+    """
+
+    def __init__(self, cache_size: int = 64):
+        """Initialize the engine.
+
+        Args:
+            cache_size: Analyses kept, least recently used dropped first
+        """
+        self.cache_size = cache_size
+        self._rules: Dict[str, Tuple[Tuple[Type[ast.AST], ...], RuleCallback, Optional[Callable]]] = {}
+        self._dispatch: Dict[Type[ast.AST], List[RuleCallback]] = {}
+        self._cache: "OrderedDict[str, ASTAnalysis]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.generation = 0
+
+        self.parses = 0
+        self.walks = 0
+        self.hits = 0
+
+    # ========== Rules ==========
+
+    def register(
+        self,
+        name: str,
+        node_types: List[Type[ast.AST]],
+        callback: RuleCallback,
+        init: Optional[Callable[[ASTAnalysis], None]] = None
+    ) -> None:
+        """Register a rule run on every node of the given types.
+
+        Registering a name again replaces the rule. Cached analyses made
+        before the change are not reused.
+
+        Args:
+            name: Rule name (and usually its key in ``analysis.facts``)
+            node_types: Node classes the callback is called for
+            callback: Called as ``callback(node, scope, analysis)``
+            init: Called with the analysis before the pass, to set up facts
+        """
+        with self.lock:
+            self._rules[name] = (tuple(node_types), callback, init)
+            self._rebuild_dispatch()
+
+    def unregister(self, name: str) -> bool:
+        """Remove a rule.
+
+        Args:
+            name: Rule name
+
+        Returns:
+            True if the rule existed
+        """
+        with self.lock:
+            if self._rules.pop(name, None) is None:
+                return False
+            self._rebuild_dispatch()
+            return True
+
+    def _rebuild_dispatch(self) -> None:
+        """Rebuild the node type -> callbacks table (lock held)."""
+        dispatch: Dict[Type[ast.AST], List[RuleCallback]] = defaultdict(list)
+        for node_types, callback, _ in self._rules.values():
+            for node_type in node_types:
+                dispatch[node_type].append(callback)
+        self._dispatch = dict(dispatch)
+        self.generation += 1
+        self._cache.clear()
+
+    # ========== Analysis ==========
+
+    def analyze(self, code: str) -> ASTAnalysis:
+        """Get the analysis of some code, parsing and walking it on a miss.
+
+        Args:
+            code: Python source
+
+        Returns:
+            ASTAnalysis (check ``ok``/``error`` for syntax errors)
+        """
+        code_hash = hashlib.sha256(code.encode('utf-8', 'surrogatepass')).hexdigest()
+        with self.lock:
+            analysis = self._cache.get(code_hash)
+            if analysis is not None:
+                self._cache.move_to_end(code_hash)
+                self.hits += 1
+                return analysis
+            generation = self.generation
+            rules = list(self._rules.values())
+            dispatch = self._dispatch
+
+        # Parsed outside the lock: other skills keep going meanwhile
+        analysis = ASTAnalysis(code, code_hash)
+        try:
+            analysis.tree = ast.parse(code)
+        except SyntaxError as e:
+            analysis.error = e
+        self.parses += 1
+
+        if analysis.tree is not None:
+            for _, _, init in rules:
+                if init:
+                    init(analysis)
+            self._walk(analysis, dispatch)
+
+        with self.lock:
+            if generation == self.generation:
+                self._cache[code_hash] = analysis
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return analysis
+
+    def _walk(self, analysis: ASTAnalysis, dispatch: Dict[Type[ast.AST], List[RuleCallback]]) -> None:
+        """Visit every node once, breadth first like ``ast.walk``."""
+        self.walks += 1
+        nodes, positions = analysis.nodes, analysis.positions
+        parents, functions = analysis.parents, analysis.functions
+        AST = ast.AST
+        # Entries: (node, scope, FunctionFacts of the enclosing functions)
+        queue = deque([(analysis.tree, Scope(None, (), 0), ())])
+        position = 0
+
+        while queue:
+            node, scope, enclosing = queue.popleft()
+            node_type = type(node)
+            nodes[node_type].append(node)
+            positions[node_type].append(position)
+            position += 1
+
+            # Built-in facts
+            child_functions, child_depth, child_enclosing = scope.functions, scope.depth, enclosing
+            if node_type in _FUNCTION_TYPES:
+                facts = functions[node] = FunctionFacts(node, base_depth=scope.depth)
+                child_functions = scope.functions + (node,)
+                child_enclosing = enclosing + (facts,)
+            elif node_type in _NESTING_TYPES:
+                child_depth += 1
+                for facts in enclosing:
+                    facts.max_depth = max(facts.max_depth, child_depth - facts.base_depth)
+
+            if node_type in _DECISION_TYPES or node_type is ast.BoolOp:
+                points = 1 if node_type is not ast.BoolOp else len(node.values) - 1
+                analysis.decision_points += points
+                for facts in enclosing:
+                    facts.complexity += points
+            elif enclosing:
+                if node_type is ast.Call:
+                    for facts in enclosing:
+                        facts.calls.append(node)
+                elif node_type is ast.Raise:
+                    for facts in enclosing:
+                        facts.raises.append(node)
+                elif node_type is ast.Return:
+                    for facts in enclosing:
+                        facts.has_return = True
+                elif node_type is ast.Yield or node_type is ast.YieldFrom:
+                    for facts in enclosing:
+                        facts.has_yield = True
+
+            callbacks = dispatch.get(node_type)
+            if callbacks:
+                for callback in callbacks:
+                    callback(node, scope, analysis)
+
+            # Inlined ast.iter_child_nodes
+            child_scope = None
+            for name in node._fields:
+                value = getattr(node, name, None)
+                if isinstance(value, list):
+                    children = [item for item in value if isinstance(item, AST)]
+                elif isinstance(value, AST):
+                    children = (value,)
+                else:
+                    continue
+                for child in children:
+                    if child_scope is None:
+                        child_scope = Scope(node, child_functions, child_depth)
+                    parents[child] = node
+                    queue.append((child, child_scope, child_enclosing))
+
+    # ========== Cache ==========
+
+    def clear_cache(self) -> None:
+        """Drop all cached analyses."""
+        with self.lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and work counters.
+
+        Returns:
+            Cached analyses, registered rules, parses, walks and cache hits
+        """
+        with self.lock:
+            return {
+                "cached": len(self._cache),
+                "cache_size": self.cache_size,
+                "rules": sorted(self._rules),
+                "parses": self.parses,
+                "walks": self.walks,
+                "hits": self.hits
+            }
+
+
+# Shared by all code skills so chained skills reuse one analysis
+engine = ASTEngine()
+
+
+def analyze(code: str) -> ASTAnalysis:
+    """Analyze code with the shared engine.
+
+    Args:
+        code: Python source
+
+    Returns:
+        Cached or fresh ASTAnalysis
+    """
+    return engine.analyze(code)
@@ -0,0 +1,474 @@
+"""Batch mode for Meton's code skills.
+
+Runs a code skill (review, refactoring, documentation) over every Python
+file under a directory or matching a glob, instead of one ``code`` string per
+call:
+
+- Files are analyzed in a process pool; results are streamed per file as
+  they finish.
+- Results are cached by skill, options and file content hash, so re-running
+  after small edits only re-analyzes the files that changed.
+- Progress and throughput (files/s, lines/s) are tracked as results arrive.
+
+Example:
+    >>> from skills.batch import SkillBatchRunner
+    >>>
+    >>> runner = SkillBatchRunner("code_reviewer", cache_path="./cache/skill_batch.json")
+    >>> for file_result in runner.run("rag/"):
+    ...     print(file_result.path, file_result.result.get("score"))
+    >>> runner.summarize()["average_score"]
+"""
+
+import glob
+import hashlib
+import importlib
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from skills.base import BaseSkill, SkillError
+
+# Skills that take a single "code" string, with the defaults batch mode uses
+BATCH_SKILLS: Dict[str, Dict[str, Any]] = {
+    "code_reviewer": {},
+    "refactoring_engine": {},
+    "documentation_generator": {"doc_type": "docstring"},
+}
+
+# Short names accepted by the CLI
+SKILL_ALIASES = {
+    "review": "code_reviewer",
+    "refactor": "refactoring_engine",
+    "docs": "documentation_generator",
+}
+
+SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "env", "node_modules", ".tox",
+             ".mypy_cache", ".pytest_cache", "build", "dist", ".eggs"}
+
+
+class BatchError(SkillError):
+    """Batch run could not start."""
+    pass
+
+
+@dataclass
+class FileResult:
+    """One file's skill result.
+
+    Attributes:
+        path: File path
+        result: The skill's output dictionary
+        cached: Whether the result came from the cache
+        seconds: Time spent analyzing (0 for cached results)
+        lines: Lines in the file
+        error: Why the file couldn't be analyzed (unreadable, skill crash)
+    """
+    path: str
+    result: Dict[str, Any] = field(default_factory=dict)
+    cached: bool = False
+    seconds: float = 0.0
+    lines: int = 0
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the skill ran and reported success."""
+        return self.error is None and bool(self.result.get("success"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class BatchProgress:
+    """Progress and throughput of a batch run.
+
+    Attributes:
+        total: Files in the run
+        done: Files finished (analyzed, cached or failed)
+        cached: Files answered from the cache
+        failed: Files with errors or unsuccessful results
+        lines: Lines in finished files
+        started: Start time (time.time())
+        elapsed: Seconds since the start (final once the run ends)
+    """
+    total: int = 0
+    done: int = 0
+    cached: int = 0
+    failed: int = 0
+    lines: int = 0
+    started: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, with throughput."""
+        data = asdict(self)
+        data["files_per_second"] = round(self.files_per_second, 1)
+        data["lines_per_second"] = round(self.lines_per_second, 1)
+        return data
+
+
+def resolve_skill(name: str) -> str:
+    """Map a skill name or alias to a batch-capable skill.
+
+    Args:
+        name: Skill name or alias (review, refactor, docs)
+
+    Returns:
+        Skill name
+
+    Raises:
+        BatchError: If the skill can't run in batch mode
+    """
+    skill_name = SKILL_ALIASES.get(name, name)
+    if skill_name not in BATCH_SKILLS:
+        names = ", ".join(sorted(BATCH_SKILLS) + sorted(SKILL_ALIASES))
+        raise BatchError(f"Skill '{name}' doesn't support batch mode. Available: {names}")
+    return skill_name
+
+
+def find_files(target: str) -> List[Path]:
+    """Find the Python files a batch run covers.
+
+    Args:
+        target: Directory (searched recursively), glob pattern or file
+
+    Returns:
+        Sorted file paths
+
+    Raises:
+        BatchError: If nothing matches
+    """
+    path = Path(target).expanduser()
+    if any(c in target for c in "*?["):
+        files = [Path(p) for p in glob.glob(str(path), recursive=True)]
+        files = [p for p in files if p.is_file()]
+    elif path.is_dir():
+        files = []
+        for root, dirs, names in os.walk(path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.endswith(".egg-info")]
+            files.extend(Path(root) / name for name in names if name.endswith(".py"))
+    elif path.is_file():
+        files = [path]
+    else:
+        raise BatchError(f"Path not found: {target}")
+
+    if not files:
+        raise BatchError(f"No Python files found in {target}")
+    return sorted(files)
+
+
+def describe(file_result: FileResult) -> str:
+    """One-line description of a file result, for progress output.
+
+    Args:
+        file_result: Result to describe
+
+    Returns:
+        E.g. "score 85, 6 issues", "3 suggestions" or the error
+    """
+    if file_result.error:
+        return file_result.error
+    result = file_result.result
+    if not result.get("success"):
+        return result.get("error") or "failed"
+    if "score" in result:
+        return f"score {result['score']}, {len(result.get('issues', []))} issues"
+    if "refactoring_suggestions" in result:
+        return f"{len(result['refactoring_suggestions'])} suggestions"
+    if "doc_count" in result:
+        return f"{result['doc_count']} documented"
+    return "ok"
+
+
+# ========== Worker side ==========
+
+_worker_skills: Dict[str, BaseSkill] = {}
+
+
+def load_skill(skill_name: str) -> BaseSkill:
+    """Import and instantiate a Python skill by name (cached per process).
+
+    Args:
+        skill_name: Skill name, also its module name under skills/
+
+    Returns:
+        Skill instance
+    """
+    skill = _worker_skills.get(skill_name)
+    if skill is None:
+        module = importlib.import_module(f"skills.{skill_name}")
+        for attr in vars(module).values():
+            if (isinstance(attr, type) and issubclass(attr, BaseSkill)
+                    and attr is not BaseSkill and attr.name == skill_name):
+                skill = _worker_skills[skill_name] = attr()
+                break
+        else:
+            raise BatchError(f"No skill class named '{skill_name}' in skills/{skill_name}.py")
+    return skill
+
+
+def run_skill(skill_name: str, options: Dict[str, Any], code: str) -> Tuple[Dict[str, Any], float]:
+    """Run a skill on one file's code (in a worker process).
+
+    Args:
+        skill_name: Skill to run
+        options: Extra skill input besides "code"
+        code: File contents
+
+    Returns:
+        Tuple of (skill output, seconds taken)
+    """
+    start = time.perf_counter()
+    result = load_skill(skill_name).execute({**options, "code": code})
+    return result, time.perf_counter() - start
+
+
+# ========== Cache ==========
+
+class BatchCache:
+    """Skill results by cache key, persisted as JSON, least recently used dropped."""
+
+    def __init__(self, path: Optional[str], max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file (None keeps results in memory only)
+            max_entries: Results kept
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.dirty = False
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = OrderedDict(json.load(f))
+            except (OSError, ValueError):
+                self.entries = OrderedDict()  # Corrupt cache: start over
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed."""
+        if not self.path or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+
+# ========== Runner ==========
+
+class SkillBatchRunner:
+    """Runs one code skill over many files with a process pool and a result cache."""
+
+    def __init__(
+        self,
+        skill_name: str,
+        options: Optional[Dict[str, Any]] = None,
+        workers: int = 0,
+        cache_path: Optional[str] = None,
+        cache_size: int = 10000,
+        on_progress: Optional[Callable[[BatchProgress, FileResult], None]] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            skill_name: Skill name or alias
+            options: Extra skill input (e.g. {"doc_type": "api_docs"})
+            workers: Worker processes (0 = one per CPU, 1 = run in this process)
+            cache_path: JSON file for cached results (None = memory only)
+            cache_size: Cached results kept
+            on_progress: Called after every file with (progress, file_result)
+
+        Raises:
+            BatchError: If the skill can't run in batch mode
+        """
+        self.skill_name = resolve_skill(skill_name)
+        self.options = {**BATCH_SKILLS[self.skill_name], **(options or {})}
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = BatchCache(cache_path, cache_size)
+        self.on_progress = on_progress
+        self.progress = BatchProgress()
+        self.results: List[FileResult] = []
+
+        # Results depend on the skill's version and options as well as the code
+        version = getattr(load_skill(self.skill_name), "version", "")
+        options_key = json.dumps(self.options, sort_keys=True)
+        self._key_prefix = f"{self.skill_name}:{version}:{options_key}:"
+
+    def cache_key(self, code: str) -> str:
+        """Cache key of a file's contents for this skill and options."""
+        return hashlib.sha256((self._key_prefix + code).encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def run(self, target: str) -> Iterator[FileResult]:
+        """Run the skill over a directory, glob or file.
+
+        Cached files are yielded first, then analyzed files as they finish.
+        The cache is saved when the run ends (also if it's abandoned).
+
+        Args:
+            target: Directory, glob pattern or file
+
+        Yields:
+            FileResult per file
+
+        Raises:
+            BatchError: If no files match
+        """
+        files = find_files(target)
+        self.progress = BatchProgress(total=len(files), started=time.time())
+        self.results = []
+        pending: List[Tuple[str, str, str, int]] = []  # (path, key, code, lines)
+
+        try:
+            for path in files:
+                try:
+                    code = path.read_text(encoding='utf-8')
+                except (OSError, UnicodeDecodeError) as e:
+                    yield self._finish(FileResult(str(path), error=f"Unreadable: {e}"))
+                    continue
+
+                lines = code.count('\n') + 1
+                key = self.cache_key(code)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    yield self._finish(FileResult(str(path), cached, cached=True, lines=lines))
+                else:
+                    pending.append((str(path), key, code, lines))
+
+            yield from self._analyze(pending)
+        finally:
+            self.progress.elapsed = time.time() - self.progress.started
+            self.cache.save()
+
+    def _analyze(self, pending: List[Tuple[str, str, str, int]]) -> Iterator[FileResult]:
+        """Analyze uncached files, in worker processes when it pays off."""
+        if self.workers <= 1 or len(pending) <= 1:
+            for path, key, code, lines in pending:
+                yield self._finish(self._run_local(path, key, code, lines))
+            return
+
+        workers = min(self.workers, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(run_skill, self.skill_name, self.options, code): (path, key, lines)
+                for path, key, code, lines in pending
+            }
+            try:
+                for future in as_completed(futures):
+                    path, key, lines = futures[future]
+                    try:
+                        result, seconds = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        yield self._finish(FileResult(path, lines=lines, error=f"{type(e).__name__}: {e}"))
+                        continue
+                    self.cache.put(key, result)
+                    yield self._finish(FileResult(path, result, seconds=seconds, lines=lines))
+            finally:
+                for future in futures:
+                    future.cancel()  # Run abandoned: drop queued files
+
+    def _run_local(self, path: str, key: str, code: str, lines: int) -> FileResult:
+        """Analyze one file in this process."""
+        try:
+            result, seconds = run_skill(self.skill_name, self.options, code)
+        except Exception as e:
+            return FileResult(path, lines=lines, error=f"{type(e).__name__}: {e}")
+        self.cache.put(key, result)
+        return FileResult(path, result, seconds=seconds, lines=lines)
+
+    def _finish(self, file_result: FileResult) -> FileResult:
+        """Record a finished file and report progress."""
+        progress = self.progress
+        progress.done += 1
+        progress.lines += file_result.lines
+        progress.cached += file_result.cached
+        progress.failed += not file_result.success
+        progress.elapsed = time.time() - progress.started
+        self.results.append(file_result)
+        if self.on_progress:
+            self.on_progress(progress, file_result)
+        return file_result
+
+    def summarize(self, results: Optional[List[FileResult]] = None) -> Dict[str, Any]:
+        """Aggregate a run's results.
+
+        Args:
+            results: File results (default: the last run's)
+
+        Returns:
+            Progress/throughput plus skill-specific totals: issue counts and
+            scores for reviews, suggestion counts for refactoring, documented
+            items for documentation
+        """
+        results = self.results if results is None else results
+        ok = [r for r in results if r.success]
+        summary: Dict[str, Any] = {
+            "skill": self.skill_name,
+            "files": len(results),
+            "succeeded": len(ok),
+            "failed": [{"path": r.path, "error": r.error or r.result.get("error")}
+                       for r in results if not r.success],
+            "progress": self.progress.to_dict()
+        }
+
+        if self.skill_name == "code_reviewer":
+            by_severity: Dict[str, int] = {}
+            for r in ok:
+                for severity, count in r.result.get("summary", {}).get("by_severity", {}).items():
+                    by_severity[severity] = by_severity.get(severity, 0) + count
+            scores = [r.result.get("score", 0) for r in ok]
+            summary["total_issues"] = sum(by_severity.values())
+            summary["by_severity"] = by_severity
+            summary["average_score"] = round(sum(scores) / len(scores), 1) if scores else None
+            worst = sorted(ok, key=lambda r: r.result.get("score", 0))[:5]
+            summary["lowest_scores"] = [(r.path, r.result.get("score")) for r in worst]
+
+        elif self.skill_name == "refactoring_engine":
+            by_type: Dict[str, int] = {}
+            for r in ok:
+                for suggestion in r.result.get("refactoring_suggestions", []):
+                    by_type[suggestion["type"]] = by_type.get(suggestion["type"], 0) + 1
+            summary["total_suggestions"] = sum(by_type.values())
+            summary["by_type"] = by_type
+
+        elif self.skill_name == "documentation_generator":
+            summary["documented_items"] = sum(r.result.get("doc_count", 0) for r in ok)
+
+        return summary
@@ -19,6 +19,7 @@ Example:
 
 import ast
 from typing import Dict, Any, List, Set, Optional
+from skills.ast_engine import ASTAnalysis, analyze
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -106,10 +107,10 @@ class CodeExplainerSkill(BaseSkill):
             code = input_data["code"]
             context = input_data.get("context", "")
 
-            # Parse code with AST
-            try:
-                tree = ast.parse(code)
-            except SyntaxError as e:
+            # Parse code with AST (shared with the other code skills)
+            analysis = analyze(code)
+            if analysis.error is not None:
+                e = analysis.error
                 return {
                     "success": False,
                     "error": f"Syntax error in code: {str(e)}",
@@ -121,11 +122,11 @@ class CodeExplainerSkill(BaseSkill):
                 }
 
             # Analyze code
-            analysis = self._analyze_code(tree, code, context)
+            result = self._analyze_code(analysis, code, context)
 
             return {
                 "success": True,
-                **analysis
+                **result
             }
 
         except SkillValidationError as e:
@@ -141,11 +142,11 @@ class CodeExplainerSkill(BaseSkill):
         except Exception as e:
             raise SkillExecutionError(f"Code explanation failed: {str(e)}")
 
-    def _analyze_code(self, tree: ast.AST, code: str, context: str) -> Dict[str, Any]:
-        """Analyze parsed AST and generate explanation.
+    def _analyze_code(self, analysis: ASTAnalysis, code: str, context: str) -> Dict[str, Any]:
+        """Analyze parsed code and generate explanation.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis of the code
             code: Original source code
             context: Additional context
 
@@ -153,13 +154,13 @@ class CodeExplainerSkill(BaseSkill):
             Dictionary with analysis results
         """
         # Extract code elements
-        functions = self._extract_functions(tree)
-        classes = self._extract_classes(tree)
-        imports = self._extract_imports(tree)
-        patterns = self._detect_patterns(tree)
+        functions = self._extract_functions(analysis)
+        classes = self._extract_classes(analysis)
+        imports = self._extract_imports(analysis)
+        patterns = self._detect_patterns(analysis)
 
         # Calculate complexity
-        complexity_score = self._calculate_complexity(tree)
+        complexity_score = self._calculate_complexity(analysis)
         complexity_level = self._assess_complexity(complexity_score)
 
         # Generate explanations
@@ -180,182 +181,125 @@ class CodeExplainerSkill(BaseSkill):
             "suggestions": suggestions
         }
 
-    def _extract_functions(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Extract function definitions from AST.
+    def _extract_functions(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
+        """Extract function definitions.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis
 
         Returns:
             List of function information dictionaries
         """
         functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_info = {
-                    "name": node.name,
-                    "args": [arg.arg for arg in node.args.args],
-                    "is_async": False,
-                    "has_decorators": len(node.decorator_list) > 0,
-                    "decorators": [self._get_decorator_name(dec) for dec in node.decorator_list],
-                    "returns": self._get_return_annotation(node),
-                    "docstring": ast.get_docstring(node)
-                }
-                functions.append(func_info)
-            elif isinstance(node, ast.AsyncFunctionDef):
-                func_info = {
-                    "name": node.name,
-                    "args": [arg.arg for arg in node.args.args],
-                    "is_async": True,
-                    "has_decorators": len(node.decorator_list) > 0,
-                    "decorators": [self._get_decorator_name(dec) for dec in node.decorator_list],
-                    "returns": self._get_return_annotation(node),
-                    "docstring": ast.get_docstring(node)
-                }
-                functions.append(func_info)
+        for node in analysis.functions:
+            func_info = {
+                "name": node.name,
+                "args": [arg.arg for arg in node.args.args],
+                "is_async": isinstance(node, ast.AsyncFunctionDef),
+                "has_decorators": len(node.decorator_list) > 0,
+                "decorators": [self._get_decorator_name(dec) for dec in node.decorator_list],
+                "returns": self._get_return_annotation(node),
+                "docstring": ast.get_docstring(node)
+            }
+            functions.append(func_info)
         return functions
 
-    def _extract_classes(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Extract class definitions from AST.
+    def _extract_classes(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
+        """Extract class definitions.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis
 
         Returns:
             List of class information dictionaries
         """
         classes = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                methods = []
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        methods.append({
-                            "name": item.name,
-                            "is_async": isinstance(item, ast.AsyncFunctionDef)
-                        })
-
-                class_info = {
-                    "name": node.name,
-                    "bases": [self._get_name(base) for base in node.bases],
-                    "methods": methods,
-                    "has_decorators": len(node.decorator_list) > 0,
-                    "docstring": ast.get_docstring(node)
-                }
-                classes.append(class_info)
+        for node in analysis.of_type(ast.ClassDef):
+            methods = []
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    methods.append({
+                        "name": item.name,
+                        "is_async": isinstance(item, ast.AsyncFunctionDef)
+                    })
+
+            class_info = {
+                "name": node.name,
+                "bases": [self._get_name(base) for base in node.bases],
+                "methods": methods,
+                "has_decorators": len(node.decorator_list) > 0,
+                "docstring": ast.get_docstring(node)
+            }
+            classes.append(class_info)
         return classes
 
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements from AST.
+    def _extract_imports(self, analysis: ASTAnalysis) -> List[str]:
+        """Extract import statements.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis
 
         Returns:
             List of imported module names
         """
         imports = []
-        for node in ast.walk(tree):
+        for node in analysis.of_type(ast.Import, ast.ImportFrom):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
+            else:
                 module = node.module or ""
                 for alias in node.names:
                     imports.append(f"{module}.{alias.name}" if module else alias.name)
         return imports
 
-    def _detect_patterns(self, tree: ast.AST) -> Dict[str, bool]:
+    def _detect_patterns(self, analysis: ASTAnalysis) -> Dict[str, bool]:
         """Detect common code patterns.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis
 
         Returns:
             Dictionary of detected patterns
         """
-        patterns = {
-            "has_loops": False,
-            "has_recursion": False,
-            "has_async": False,
-            "has_list_comprehension": False,
-            "has_generator": False,
-            "has_context_manager": False,
-            "has_exception_handling": False,
-            "has_lambda": False
-        }
-
-        function_names = set()
-
-        for node in ast.walk(tree):
-            # Detect loops
-            if isinstance(node, (ast.For, ast.While)):
-                patterns["has_loops"] = True
-
-            # Collect function names for recursion detection
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                function_names.add(node.name)
+        def has(*node_types) -> bool:
+            return any(node_type in analysis.nodes for node_type in node_types)
 
-            # Detect async
-            if isinstance(node, (ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith)):
-                patterns["has_async"] = True
-
-            # Detect comprehensions
-            if isinstance(node, (ast.ListComp, ast.SetComp, ast.DictComp)):
-                patterns["has_list_comprehension"] = True
-
-            # Detect generators
-            if isinstance(node, ast.GeneratorExp) or \
-               (isinstance(node, ast.FunctionDef) and any(isinstance(n, ast.Yield) for n in ast.walk(node))):
-                patterns["has_generator"] = True
-
-            # Detect context managers
-            if isinstance(node, (ast.With, ast.AsyncWith)):
-                patterns["has_context_manager"] = True
-
-            # Detect exception handling
-            if isinstance(node, (ast.Try, ast.ExceptHandler, ast.Raise)):
-                patterns["has_exception_handling"] = True
-
-            # Detect lambdas
-            if isinstance(node, ast.Lambda):
-                patterns["has_lambda"] = True
-
-        # Detect recursion by checking if function calls itself
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id in function_names:
-                    patterns["has_recursion"] = True
-                    break
+        function_names = {node.name for node in analysis.functions}
+        generator_functions = any(
+            facts.has_yield for node, facts in analysis.functions.items()
+            if isinstance(node, ast.FunctionDef)
+        )
 
-        return patterns
+        return {
+            "has_loops": has(ast.For, ast.While),
+            # A function that calls itself
+            "has_recursion": any(
+                isinstance(node.func, ast.Name) and node.func.id in function_names
+                for node in analysis.of_type(ast.Call)
+            ),
+            "has_async": has(ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith),
+            "has_list_comprehension": has(ast.ListComp, ast.SetComp, ast.DictComp),
+            "has_generator": has(ast.GeneratorExp) or generator_functions,
+            "has_context_manager": has(ast.With, ast.AsyncWith),
+            "has_exception_handling": has(ast.Try, ast.ExceptHandler, ast.Raise),
+            "has_lambda": has(ast.Lambda)
+        }
 
-    def _calculate_complexity(self, tree: ast.AST) -> int:
+    def _calculate_complexity(self, analysis: ASTAnalysis) -> int:
         """Calculate cyclomatic complexity.
 
         Cyclomatic complexity = number of decision points + 1
         Decision points: if, for, while, except, and, or, etc.
+        Each function adds 1 as well.
 
         Args:
-            tree: Parsed AST
+            analysis: Shared AST analysis
 
         Returns:
             Complexity score
         """
-        complexity = 1  # Base complexity
-
-        for node in ast.walk(tree):
-            # Decision points
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                # and/or operators
-                complexity += len(node.values) - 1
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                # Each function adds 1 to complexity
-                complexity += 1
-
-        return complexity
+        return analysis.complexity + len(analysis.functions)
 
     def _assess_complexity(self, score: int) -> str:
         """Assess complexity level based on score.
@@ -19,7 +19,8 @@ Example:
 import ast
 import re
 from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from skills.ast_engine import ASTAnalysis, Scope, analyze, engine
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -193,11 +194,10 @@ class CodeReviewerSkill(BaseSkill):
         """
         issues = []
 
-        # Parse code
-        try:
-            tree = ast.parse(code)
-            lines = code.split('\n')
-        except SyntaxError as e:
+        # Parse and walk once; the analysis is shared with other code skills
+        analysis = analyze(code)
+        if analysis.error is not None:
+            e = analysis.error
             return [ReviewIssue(
                 severity="CRITICAL",
                 category="syntax",
@@ -207,28 +207,33 @@ class CodeReviewerSkill(BaseSkill):
 
         # Run requested checks
         if "best_practices" in checks:
-            issues.extend(self._check_best_practices(tree, code, lines))
+            issues.extend(self._check_best_practices(analysis))
 
         if "security" in checks:
-            issues.extend(self._check_security(tree, code, lines))
+            issues.extend(self._check_security(analysis))
 
         if "style" in checks:
-            issues.extend(self._check_style(tree, code, lines))
+            issues.extend(self._check_style(analysis))
 
         return issues
 
-    def _check_best_practices(
-        self,
-        tree: ast.AST,
-        code: str,
-        lines: List[str]
-    ) -> List[ReviewIssue]:
+    def _findings(self, analysis: ASTAnalysis, *kinds: str) -> List[Tuple[str, ast.AST, Any]]:
+        """Get the review rules' findings of the given kinds, in walk order.
+
+        Args:
+            analysis: Code analysis
+            *kinds: Finding kinds
+
+        Returns:
+            List of (kind, node, detail) tuples
+        """
+        return [finding for finding in analysis.facts[REVIEW_FACTS] if finding[0] in kinds]
+
+    def _check_best_practices(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check for best practice violations.
 
         Args:
-            tree: AST tree
-            code: Source code
-            lines: Code lines
+            analysis: Code analysis
 
         Returns:
             List of issues found
@@ -236,201 +241,173 @@ class CodeReviewerSkill(BaseSkill):
         issues = []
 
         # Check function-specific issues
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Function complexity
-                func_complexity = self._calculate_function_complexity(node)
-                if func_complexity > self.COMPLEXITY_THRESHOLD:
+        for node in analysis.of_type(ast.FunctionDef):
+            # Function complexity
+            func_complexity = analysis.functions[node].complexity
+            if func_complexity > self.COMPLEXITY_THRESHOLD:
+                issues.append(ReviewIssue(
+                    severity="MEDIUM",
+                    category="best_practices",
+                    message=f"Function '{node.name}' has high cyclomatic complexity: {func_complexity} (threshold: {self.COMPLEXITY_THRESHOLD})",
+                    line_number=node.lineno,
+                    suggestion="Consider breaking this function into smaller functions"
+                ))
+
+            # Function length
+            if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
+                func_length = node.end_lineno - node.lineno + 1
+                if func_length > self.FUNCTION_LENGTH_THRESHOLD:
                     issues.append(ReviewIssue(
-                        severity="MEDIUM",
+                        severity="LOW",
                         category="best_practices",
-                        message=f"Function '{node.name}' has high cyclomatic complexity: {func_complexity} (threshold: {self.COMPLEXITY_THRESHOLD})",
+                        message=f"Function '{node.name}' is too long: {func_length} lines (threshold: {self.FUNCTION_LENGTH_THRESHOLD})",
                         line_number=node.lineno,
-                        suggestion="Consider breaking this function into smaller functions"
+                        suggestion="Break this function into smaller, focused functions"
                     ))
 
-                # Function length
-                if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
-                    func_length = node.end_lineno - node.lineno + 1
-                    if func_length > self.FUNCTION_LENGTH_THRESHOLD:
-                        issues.append(ReviewIssue(
-                            severity="LOW",
-                            category="best_practices",
-                            message=f"Function '{node.name}' is too long: {func_length} lines (threshold: {self.FUNCTION_LENGTH_THRESHOLD})",
-                            line_number=node.lineno,
-                            suggestion="Break this function into smaller, focused functions"
-                        ))
+            # Too many parameters
+            args = node.args
+            total_args = len(args.args) + len(args.kwonlyargs)
+            if args.vararg:
+                total_args += 1
+            if args.kwarg:
+                total_args += 1
 
-                # Too many parameters
-                args = node.args
-                total_args = len(args.args) + len(args.kwonlyargs)
-                if args.vararg:
-                    total_args += 1
-                if args.kwarg:
-                    total_args += 1
+            if total_args > self.MAX_PARAMETERS:
+                issues.append(ReviewIssue(
+                    severity="LOW",
+                    category="best_practices",
+                    message=f"Function '{node.name}' has too many parameters: {total_args} (max: {self.MAX_PARAMETERS})",
+                    line_number=node.lineno,
+                    suggestion="Consider using a configuration object or reducing parameters"
+                ))
 
-                if total_args > self.MAX_PARAMETERS:
-                    issues.append(ReviewIssue(
-                        severity="LOW",
-                        category="best_practices",
-                        message=f"Function '{node.name}' has too many parameters: {total_args} (max: {self.MAX_PARAMETERS})",
-                        line_number=node.lineno,
-                        suggestion="Consider using a configuration object or reducing parameters"
-                    ))
+            # Non-descriptive names
+            if self._is_non_descriptive_name(node.name):
+                issues.append(ReviewIssue(
+                    severity="LOW",
+                    category="best_practices",
+                    message=f"Function '{node.name}' has non-descriptive name",
+                    line_number=node.lineno,
+                    suggestion="Use descriptive names that explain the function's purpose"
+                ))
 
-                # Non-descriptive names
-                if self._is_non_descriptive_name(node.name):
+            # Missing docstrings on public functions
+            if not node.name.startswith('_'):
+                docstring = ast.get_docstring(node)
+                if not docstring:
                     issues.append(ReviewIssue(
-                        severity="LOW",
+                        severity="INFO",
                         category="best_practices",
-                        message=f"Function '{node.name}' has non-descriptive name",
+                        message=f"Public function '{node.name}' missing docstring",
                         line_number=node.lineno,
-                        suggestion="Use descriptive names that explain the function's purpose"
+                        suggestion="Add a docstring explaining what the function does"
                     ))
 
-                # Missing docstrings on public functions
-                if not node.name.startswith('_'):
-                    docstring = ast.get_docstring(node)
-                    if not docstring:
-                        issues.append(ReviewIssue(
-                            severity="INFO",
-                            category="best_practices",
-                            message=f"Public function '{node.name}' missing docstring",
-                            line_number=node.lineno,
-                            suggestion="Add a docstring explaining what the function does"
-                        ))
-
         # Check nesting depth
-        nesting_issues = self._check_nesting_depth(tree)
+        nesting_issues = self._check_nesting_depth(analysis)
         issues.extend(nesting_issues)
 
         # Check for non-descriptive variable names
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                if self._is_non_descriptive_name(node.id):
-                    issues.append(ReviewIssue(
-                        severity="LOW",
-                        category="best_practices",
-                        message=f"Variable '{node.id}' has non-descriptive name",
-                        line_number=node.lineno if hasattr(node, 'lineno') else None,
-                        suggestion="Use descriptive variable names"
-                    ))
+        for _, node, _ in self._findings(analysis, "stored_name"):
+            if self._is_non_descriptive_name(node.id):
+                issues.append(ReviewIssue(
+                    severity="LOW",
+                    category="best_practices",
+                    message=f"Variable '{node.id}' has non-descriptive name",
+                    line_number=node.lineno if hasattr(node, 'lineno') else None,
+                    suggestion="Use descriptive variable names"
+                ))
 
         return issues
 
-    def _check_security(
-        self,
-        tree: ast.AST,
-        code: str,
-        lines: List[str]
-    ) -> List[ReviewIssue]:
+    def _check_security(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check for security issues.
 
         Args:
-            tree: AST tree
-            code: Source code
-            lines: Code lines
+            analysis: Code analysis
 
         Returns:
             List of issues found
         """
         issues = []
 
-        for node in ast.walk(tree):
-            # Check for dangerous functions (eval, exec, compile)
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
+        findings = self._findings(
+            analysis, "dangerous_call", "shell_call", "shell_true", "pickle_loads", "sql_concat"
+        )
+        for kind, node, detail in findings:
+            line_number = node.lineno if hasattr(node, 'lineno') else None
 
-                    if func_name in self.DANGEROUS_FUNCS:
-                        issues.append(ReviewIssue(
-                            severity="CRITICAL",
-                            category="security",
-                            message=f"Dangerous function '{func_name}()' detected",
-                            line_number=node.lineno if hasattr(node, 'lineno') else None,
-                            suggestion=f"Avoid using {func_name}() as it can execute arbitrary code"
-                        ))
+            # Dangerous functions (eval, exec, compile)
+            if kind == "dangerous_call":
+                issues.append(ReviewIssue(
+                    severity="CRITICAL",
+                    category="security",
+                    message=f"Dangerous function '{detail}()' detected",
+                    line_number=line_number,
+                    suggestion=f"Avoid using {detail}() as it can execute arbitrary code"
+                ))
 
-                # Check for os.system() or subprocess with shell=True
-                if isinstance(node.func, ast.Attribute):
-                    if node.func.attr in self.SHELL_FUNCS:
-                        issues.append(ReviewIssue(
-                            severity="HIGH",
-                            category="security",
-                            message=f"Shell command execution detected: {node.func.attr}()",
-                            line_number=node.lineno if hasattr(node, 'lineno') else None,
-                            suggestion="Use subprocess with shell=False and proper argument passing"
-                        ))
+            # os.system() and friends
+            elif kind == "shell_call":
+                issues.append(ReviewIssue(
+                    severity="HIGH",
+                    category="security",
+                    message=f"Shell command execution detected: {detail}()",
+                    line_number=line_number,
+                    suggestion="Use subprocess with shell=False and proper argument passing"
+                ))
 
-                    # Check for subprocess.call/run with shell=True
-                    if node.func.attr in ["call", "run", "Popen"]:
-                        for keyword in node.keywords:
-                            if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant):
-                                if keyword.value.value is True:
-                                    issues.append(ReviewIssue(
-                                        severity="HIGH",
-                                        category="security",
-                                        message="subprocess called with shell=True",
-                                        line_number=node.lineno if hasattr(node, 'lineno') else None,
-                                        suggestion="Use shell=False and pass arguments as a list"
-                                    ))
-
-                    # Check for pickle.loads
-                    if node.func.attr == "loads":
-                        if isinstance(node.func.value, ast.Name) and node.func.value.id == "pickle":
-                            issues.append(ReviewIssue(
-                                severity="MEDIUM",
-                                category="security",
-                                message="pickle.loads() can execute arbitrary code",
-                                line_number=node.lineno if hasattr(node, 'lineno') else None,
-                                suggestion="Only unpickle data from trusted sources or use safer formats like JSON"
-                            ))
+            # subprocess.call/run with shell=True
+            elif kind == "shell_true":
+                issues.append(ReviewIssue(
+                    severity="HIGH",
+                    category="security",
+                    message="subprocess called with shell=True",
+                    line_number=line_number,
+                    suggestion="Use shell=False and pass arguments as a list"
+                ))
 
-            # Check for SQL injection patterns (string concatenation with SQL keywords)
-            if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mod)):
-                if isinstance(node.left, ast.Constant) and isinstance(node.left.value, str):
-                    sql_keywords = ["SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE"]
-                    if any(keyword in node.left.value.upper() for keyword in sql_keywords):
-                        issues.append(ReviewIssue(
-                            severity="HIGH",
-                            category="security",
-                            message="Potential SQL injection: string concatenation with SQL query",
-                            line_number=node.lineno if hasattr(node, 'lineno') else None,
-                            suggestion="Use parameterized queries or ORM instead of string concatenation"
-                        ))
+            elif kind == "pickle_loads":
+                issues.append(ReviewIssue(
+                    severity="MEDIUM",
+                    category="security",
+                    message="pickle.loads() can execute arbitrary code",
+                    line_number=line_number,
+                    suggestion="Only unpickle data from trusted sources or use safer formats like JSON"
+                ))
+
+            # SQL injection patterns (string concatenation with SQL keywords)
+            elif kind == "sql_concat":
+                issues.append(ReviewIssue(
+                    severity="HIGH",
+                    category="security",
+                    message="Potential SQL injection: string concatenation with SQL query",
+                    line_number=line_number,
+                    suggestion="Use parameterized queries or ORM instead of string concatenation"
+                ))
 
         # Check for hardcoded secrets
-        secret_issues = self._check_hardcoded_secrets(tree)
+        secret_issues = self._check_hardcoded_secrets(analysis)
         issues.extend(secret_issues)
 
         # Check for open() with user input (potential path traversal)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name) and node.func.id == "open":
-                    # Check if first argument is a variable or user input
-                    if node.args and isinstance(node.args[0], ast.Name):
-                        issues.append(ReviewIssue(
-                            severity="MEDIUM",
-                            category="security",
-                            message="File path from variable: validate to prevent path traversal",
-                            line_number=node.lineno if hasattr(node, 'lineno') else None,
-                            suggestion="Validate and sanitize file paths before use"
-                        ))
+        for _, node, _ in self._findings(analysis, "open_variable"):
+            issues.append(ReviewIssue(
+                severity="MEDIUM",
+                category="security",
+                message="File path from variable: validate to prevent path traversal",
+                line_number=node.lineno if hasattr(node, 'lineno') else None,
+                suggestion="Validate and sanitize file paths before use"
+            ))
 
         return issues
 
-    def _check_style(
-        self,
-        tree: ast.AST,
-        code: str,
-        lines: List[str]
-    ) -> List[ReviewIssue]:
+    def _check_style(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check for style violations.
 
         Args:
-            tree: AST tree
-            code: Source code
-            lines: Code lines
+            analysis: Code analysis
 
         Returns:
             List of issues found
@@ -438,7 +415,7 @@ class CodeReviewerSkill(BaseSkill):
         issues = []
 
         # Check naming conventions
-        for node in ast.walk(tree):
+        for kind, node, _ in self._findings(analysis, "definition", "constant"):
             # Function/method names should be snake_case
             if isinstance(node, ast.FunctionDef):
                 if not self._is_snake_case(node.name) and not node.name.startswith('__'):
@@ -466,7 +443,7 @@ class CodeReviewerSkill(BaseSkill):
                         ))
 
             # Class names should be PascalCase
-            if isinstance(node, ast.ClassDef):
+            elif isinstance(node, ast.ClassDef):
                 if not self._is_pascal_case(node.name):
                     issues.append(ReviewIssue(
                         severity="LOW",
@@ -477,32 +454,30 @@ class CodeReviewerSkill(BaseSkill):
                     ))
 
             # Constants should be UPPER_CASE
-            if isinstance(node, ast.Assign):
+            elif kind == "constant":
                 for target in node.targets:
                     if isinstance(target, ast.Name):
-                        # Check if it looks like a constant (module-level, immutable value)
-                        if isinstance(node.value, ast.Constant):
-                            if not self._is_upper_case(target.id) and not target.id.startswith('_'):
-                                # Only flag if it's likely a constant (all caps or has numbers)
-                                if target.id.isupper() or any(c.isdigit() for c in target.id):
-                                    continue
-                                if len(target.id) > 2 and target.id == target.id.upper():
-                                    continue
-
-                                issues.append(ReviewIssue(
-                                    severity="INFO",
-                                    category="style",
-                                    message=f"Constant '{target.id}' should use UPPER_CASE",
-                                    line_number=node.lineno if hasattr(node, 'lineno') else None,
-                                    suggestion=f"Consider renaming to '{target.id.upper()}' if this is a constant"
-                                ))
+                        if not self._is_upper_case(target.id) and not target.id.startswith('_'):
+                            # Only flag if it's likely a constant (all caps or has numbers)
+                            if target.id.isupper() or any(c.isdigit() for c in target.id):
+                                continue
+                            if len(target.id) > 2 and target.id == target.id.upper():
+                                continue
+
+                            issues.append(ReviewIssue(
+                                severity="INFO",
+                                category="style",
+                                message=f"Constant '{target.id}' should use UPPER_CASE",
+                                line_number=node.lineno if hasattr(node, 'lineno') else None,
+                                suggestion=f"Consider renaming to '{target.id.upper()}' if this is a constant"
+                            ))
 
         # Check imports
-        import_issues = self._check_imports(tree)
+        import_issues = self._check_imports(analysis)
         issues.extend(import_issues)
 
         # Check for multiple statements on one line
-        for i, line in enumerate(lines, 1):
+        for i, line in enumerate(analysis.lines, 1):
             # Count semicolons (indicator of multiple statements)
             if ';' in line and not line.strip().startswith('#'):
                 issues.append(ReviewIssue(
@@ -515,76 +490,54 @@ class CodeReviewerSkill(BaseSkill):
 
         return issues
 
-    def _check_hardcoded_secrets(self, tree: ast.AST) -> List[ReviewIssue]:
+    def _check_hardcoded_secrets(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check for hardcoded secrets and passwords.
 
         Args:
-            tree: AST tree
+            analysis: Code analysis
 
         Returns:
             List of issues found
         """
         issues = []
 
-        for node in ast.walk(tree):
-            # Check assignments like: password = "secret123"
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        var_name = target.id.lower()
-
-                        # Check if variable name suggests a secret
-                        if any(keyword in var_name for keyword in self.SECRET_KEYWORDS):
-                            # Check if assigned a string literal
-                            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                                # Ignore empty strings or placeholder values
-                                if node.value.value and node.value.value not in ["", "TODO", "FIXME"]:
-                                    issues.append(ReviewIssue(
-                                        severity="HIGH",
-                                        category="security",
-                                        message=f"Hardcoded secret in variable '{target.id}'",
-                                        line_number=node.lineno if hasattr(node, 'lineno') else None,
-                                        suggestion="Use environment variables or a secrets management system"
-                                    ))
+        # Assignments like: password = "secret123"
+        for _, node, name in self._findings(analysis, "secret"):
+            issues.append(ReviewIssue(
+                severity="HIGH",
+                category="security",
+                message=f"Hardcoded secret in variable '{name}'",
+                line_number=node.lineno if hasattr(node, 'lineno') else None,
+                suggestion="Use environment variables or a secrets management system"
+            ))
 
         return issues
 
-    def _check_imports(self, tree: ast.AST) -> List[ReviewIssue]:
+    def _check_imports(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check import statements for issues.
 
         Args:
-            tree: AST tree
+            analysis: Code analysis
 
         Returns:
             List of issues found
         """
         issues = []
         imported_names = set()
-        used_names = set()
 
-        for node in ast.walk(tree):
-            # Check for wildcard imports
-            if isinstance(node, ast.ImportFrom):
-                for alias in node.names:
-                    if alias.name == '*':
-                        issues.append(ReviewIssue(
-                            severity="MEDIUM",
-                            category="style",
-                            message=f"Wildcard import: from {node.module} import *",
-                            line_number=node.lineno if hasattr(node, 'lineno') else None,
-                            suggestion="Import specific names instead of using wildcard"
-                        ))
-                    else:
-                        imported_names.add(alias.asname if alias.asname else alias.name)
-
-            # Track imported names from regular imports
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imported_names.add(alias.asname if alias.asname else alias.name)
+        for kind, node, name in self._findings(analysis, "wildcard_import", "imported_name"):
+            if kind == "wildcard_import":
+                issues.append(ReviewIssue(
+                    severity="MEDIUM",
+                    category="style",
+                    message=f"Wildcard import: from {node.module} import *",
+                    line_number=node.lineno if hasattr(node, 'lineno') else None,
+                    suggestion="Import specific names instead of using wildcard"
+                ))
+            else:
+                imported_names.add(name)
 
-            # Track used names
-            if isinstance(node, ast.Name):
-                used_names.add(node.id)
+        used_names = {node.id for node in analysis.of_type(ast.Name)}
 
         # Check for unused imports (simple heuristic)
         unused = imported_names - used_names
@@ -600,84 +553,40 @@ class CodeReviewerSkill(BaseSkill):
 
         return issues
 
-    def _check_nesting_depth(self, tree: ast.AST) -> List[ReviewIssue]:
+    def _check_nesting_depth(self, analysis: ASTAnalysis) -> List[ReviewIssue]:
         """Check for excessive nesting depth.
 
         Args:
-            tree: AST tree
+            analysis: Code analysis
 
         Returns:
             List of issues found
         """
         issues = []
 
-        def get_depth(node, current_depth=0):
-            """Recursively calculate nesting depth."""
-            max_depth = current_depth
-
-            for child in ast.iter_child_nodes(node):
-                if isinstance(child, (ast.If, ast.For, ast.While, ast.With, ast.Try)):
-                    child_depth = get_depth(child, current_depth + 1)
-                    max_depth = max(max_depth, child_depth)
-                else:
-                    child_depth = get_depth(child, current_depth)
-                    max_depth = max(max_depth, child_depth)
-
-            return max_depth
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                depth = get_depth(node)
-                if depth > self.MAX_NESTED_DEPTH:
-                    issues.append(ReviewIssue(
-                        severity="MEDIUM",
-                        category="best_practices",
-                        message=f"Function '{node.name}' has excessive nesting: {depth} levels (max: {self.MAX_NESTED_DEPTH})",
-                        line_number=node.lineno,
-                        suggestion="Reduce nesting using early returns or extracting functions"
-                    ))
+        for node in analysis.of_type(ast.FunctionDef):
+            depth = analysis.functions[node].max_depth
+            if depth > self.MAX_NESTED_DEPTH:
+                issues.append(ReviewIssue(
+                    severity="MEDIUM",
+                    category="best_practices",
+                    message=f"Function '{node.name}' has excessive nesting: {depth} levels (max: {self.MAX_NESTED_DEPTH})",
+                    line_number=node.lineno,
+                    suggestion="Reduce nesting using early returns or extracting functions"
+                ))
 
         return issues
 
-    def _calculate_complexity(self, tree: ast.AST) -> int:
+    def _calculate_complexity(self, analysis: ASTAnalysis) -> int:
         """Calculate cyclomatic complexity.
 
         Args:
-            tree: AST tree
-
-        Returns:
-            Complexity score
-        """
-        complexity = 1  # Base complexity
-
-        for node in ast.walk(tree):
-            # Decision points increase complexity
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-
-        return complexity
-
-    def _calculate_function_complexity(self, func_node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity for a specific function.
-
-        Args:
-            func_node: Function AST node
+            analysis: Code analysis
 
         Returns:
             Complexity score
         """
-        complexity = 1  # Base complexity
-
-        for node in ast.walk(func_node):
-            # Decision points increase complexity
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-
-        return complexity
+        return analysis.complexity
 
     def _is_non_descriptive_name(self, name: str) -> bool:
         """Check if a name is non-descriptive.
@@ -754,3 +663,98 @@ class CodeReviewerSkill(BaseSkill):
             score -= self.SEVERITY_SCORES.get(issue.severity, 0)
 
         return max(0, score)  # Ensure non-negative
+
+
+# ========== Review rules ==========
+#
+# Run by the shared AST engine in its single pass. They record thresholdless
+# findings as (kind, node, detail); the skill turns them into issues.
+
+REVIEW_FACTS = "code_reviewer"
+SQL_KEYWORDS = ["SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE"]
+
+
+def _init_findings(analysis: ASTAnalysis) -> None:
+    analysis.facts.setdefault(REVIEW_FACTS, [])
+
+
+def _review_call(node: ast.Call, scope: Scope, analysis: ASTAnalysis) -> None:
+    """Dangerous functions, shell commands, pickle.loads and open(variable)."""
+    findings = analysis.facts[REVIEW_FACTS]
+    func = node.func
+
+    if isinstance(func, ast.Name):
+        if func.id in CodeReviewerSkill.DANGEROUS_FUNCS:
+            findings.append(("dangerous_call", node, func.id))
+        if func.id == "open" and node.args and isinstance(node.args[0], ast.Name):
+            findings.append(("open_variable", node, None))
+
+    elif isinstance(func, ast.Attribute):
+        if func.attr in CodeReviewerSkill.SHELL_FUNCS:
+            findings.append(("shell_call", node, func.attr))
+
+        if func.attr in ["call", "run", "Popen"]:
+            for keyword in node.keywords:
+                if keyword.arg == "shell" and isinstance(keyword.value, ast.Constant):
+                    if keyword.value.value is True:
+                        findings.append(("shell_true", node, None))
+
+        if func.attr == "loads":
+            if isinstance(func.value, ast.Name) and func.value.id == "pickle":
+                findings.append(("pickle_loads", node, None))
+
+
+def _review_binop(node: ast.BinOp, scope: Scope, analysis: ASTAnalysis) -> None:
+    """SQL built by concatenating or %-formatting a string literal."""
+    if isinstance(node.op, (ast.Add, ast.Mod)):
+        if isinstance(node.left, ast.Constant) and isinstance(node.left.value, str):
+            if any(keyword in node.left.value.upper() for keyword in SQL_KEYWORDS):
+                analysis.facts[REVIEW_FACTS].append(("sql_concat", node, None))
+
+
+def _review_assign(node: ast.Assign, scope: Scope, analysis: ASTAnalysis) -> None:
+    """Constant assignments and hardcoded secrets."""
+    findings = analysis.facts[REVIEW_FACTS]
+    if not isinstance(node.value, ast.Constant):
+        return
+    findings.append(("constant", node, None))
+
+    value = node.value.value
+    if isinstance(value, str) and value and value not in ["TODO", "FIXME"]:
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                var_name = target.id.lower()
+                if any(keyword in var_name for keyword in CodeReviewerSkill.SECRET_KEYWORDS):
+                    findings.append(("secret", node, target.id))
+
+
+def _review_definition(node: ast.AST, scope: Scope, analysis: ASTAnalysis) -> None:
+    """Function and class definitions, for naming checks."""
+    analysis.facts[REVIEW_FACTS].append(("definition", node, None))
+
+
+def _review_import(node: ast.AST, scope: Scope, analysis: ASTAnalysis) -> None:
+    """Wildcard imports and imported names."""
+    findings = analysis.facts[REVIEW_FACTS]
+    for alias in node.names:
+        if alias.name == '*':
+            findings.append(("wildcard_import", node, None))
+        else:
+            findings.append(("imported_name", node, alias.asname if alias.asname else alias.name))
+
+
+def _review_name(node: ast.Name, scope: Scope, analysis: ASTAnalysis) -> None:
+    """Assigned variable names."""
+    if isinstance(node.ctx, ast.Store):
+        analysis.facts[REVIEW_FACTS].append(("stored_name", node, None))
+
+
+for _name, _types, _callback in [
+    ("calls", [ast.Call], _review_call),
+    ("binops", [ast.BinOp], _review_binop),
+    ("assignments", [ast.Assign], _review_assign),
+    ("definitions", [ast.FunctionDef, ast.ClassDef], _review_definition),
+    ("imports", [ast.Import, ast.ImportFrom], _review_import),
+    ("names", [ast.Name], _review_name),
+]:
+    engine.register(f"{REVIEW_FACTS}.{_name}", _types, _callback, init=_init_findings)
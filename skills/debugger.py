@@ -21,6 +21,7 @@ Example:
 import ast
 import re
 from typing import Dict, Any, List, Optional, Tuple
+from skills.ast_engine import ASTAnalysis, analyze
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -180,11 +181,7 @@ class DebuggerAssistantSkill(BaseSkill):
         Returns:
             SyntaxError if found, None otherwise
         """
-        try:
-            ast.parse(code)
-            return None
-        except SyntaxError as e:
-            return e
+        return analyze(code).error
 
     def _analyze_syntax_error(
         self,
@@ -286,21 +283,23 @@ class DebuggerAssistantSkill(BaseSkill):
         suggestions = []
 
         try:
-            tree = ast.parse(code)
+            analysis = analyze(code)
+            if analysis.error is not None:
+                raise analysis.error
 
             # Check for common logic issues
             # 1. Unreachable code
-            unreachable = self._find_unreachable_code(tree)
+            unreachable = self._find_unreachable_code(analysis)
             if unreachable:
                 issues.append("Potentially unreachable code detected")
 
             # 2. Unused variables
-            unused = self._find_unused_variables(tree)
+            unused = self._find_unused_variables(analysis)
             if unused:
                 issues.append(f"Unused variables: {', '.join(unused)}")
 
             # 3. Missing return statements
-            missing_returns = self._find_missing_returns(tree)
+            missing_returns = self._find_missing_returns(analysis)
             if missing_returns:
                 issues.append("Functions may be missing return statements")
 
@@ -765,90 +764,65 @@ class DebuggerAssistantSkill(BaseSkill):
 
         return location
 
-    def _find_unreachable_code(self, tree: ast.AST) -> bool:
+    def _find_unreachable_code(self, analysis: ASTAnalysis) -> bool:
         """Find potentially unreachable code.
 
         Args:
-            tree: AST tree
+            analysis: Shared AST analysis
 
         Returns:
             True if unreachable code found
         """
-        class UnreachableVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.has_unreachable = False
-
-            def check_block(self, stmts):
-                """Check a block of statements for unreachable code."""
-                for i, stmt in enumerate(stmts):
-                    if isinstance(stmt, ast.Return) and i < len(stmts) - 1:
-                        self.has_unreachable = True
-                    elif isinstance(stmt, (ast.If, ast.For, ast.While, ast.With)):
-                        # Recursively check nested blocks
-                        if hasattr(stmt, 'body'):
-                            self.check_block(stmt.body)
-                        if hasattr(stmt, 'orelse'):
-                            self.check_block(stmt.orelse)
-
-            def visit_FunctionDef(self, node):
-                self.check_block(node.body)
-                # Don't visit nested functions
-                # self.generic_visit(node)
-
-        visitor = UnreachableVisitor()
-        visitor.visit(tree)
-        return visitor.has_unreachable
-
-    def _find_unused_variables(self, tree: ast.AST) -> List[str]:
+        def check_block(stmts) -> bool:
+            """Check a block of statements for unreachable code."""
+            for i, stmt in enumerate(stmts):
+                if isinstance(stmt, ast.Return) and i < len(stmts) - 1:
+                    return True
+                elif isinstance(stmt, (ast.If, ast.For, ast.While, ast.With)):
+                    # Recursively check nested blocks
+                    if check_block(stmt.body) or check_block(getattr(stmt, 'orelse', [])):
+                        return True
+            return False
+
+        # Nested functions are checked as part of their outer function
+        return any(check_block(node.body) for node in analysis.top_level_functions())
+
+    def _find_unused_variables(self, analysis: ASTAnalysis) -> List[str]:
         """Find potentially unused variables.
 
         Args:
-            tree: AST tree
+            analysis: Shared AST analysis
 
         Returns:
             List of unused variable names
         """
-        class VariableVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.assigned = set()
-                self.used = set()
-
-            def visit_Name(self, node):
-                if isinstance(node.ctx, ast.Store):
-                    self.assigned.add(node.id)
-                elif isinstance(node.ctx, ast.Load):
-                    self.used.add(node.id)
-                self.generic_visit(node)
-
-        visitor = VariableVisitor()
-        visitor.visit(tree)
-        unused = visitor.assigned - visitor.used
+        assigned = set()
+        used = set()
+
+        for node in analysis.of_type(ast.Name):
+            if isinstance(node.ctx, ast.Store):
+                assigned.add(node.id)
+            elif isinstance(node.ctx, ast.Load):
+                used.add(node.id)
+
+        unused = assigned - used
         return sorted(list(unused))[:5]  # Return max 5
 
-    def _find_missing_returns(self, tree: ast.AST) -> bool:
+    def _find_missing_returns(self, analysis: ASTAnalysis) -> bool:
         """Check if functions are missing return statements.
 
         Args:
-            tree: AST tree
+            analysis: Shared AST analysis
 
         Returns:
             True if functions missing returns found
         """
-        class ReturnVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.has_missing = False
-
-            def visit_FunctionDef(self, node):
-                # Check if function has no return and more than just pass
-                has_return = any(isinstance(stmt, ast.Return) for stmt in ast.walk(node))
-                has_real_body = len(node.body) > 1 or (
-                    len(node.body) == 1 and not isinstance(node.body[0], ast.Pass)
-                )
-                if has_real_body and not has_return and node.name != "__init__":
-                    self.has_missing = True
-                # Don't visit nested functions
-                # self.generic_visit(node)
-
-        visitor = ReturnVisitor()
-        visitor.visit(tree)
-        return visitor.has_missing
+        for node in analysis.top_level_functions():
+            # Check if function has no return and more than just pass
+            has_return = analysis.functions[node].has_return
+            has_real_body = len(node.body) > 1 or (
+                len(node.body) == 1 and not isinstance(node.body[0], ast.Pass)
+            )
+            if has_real_body and not has_return and node.name != "__init__":
+                return True
+        return False
@@ -21,6 +21,7 @@ import ast
 import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
+from skills.ast_engine import FunctionFacts, analyze
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -158,25 +159,26 @@ class DocumentationGeneratorSkill(BaseSkill):
         Returns:
             Dictionary with success, documentation, and doc_count
         """
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
+        analysis = analyze(code)
+        if analysis.error is not None:
             return {
                 "success": False,
                 "documentation": "",
-                "error": f"Syntax error in code: {str(e)}"
+                "error": f"Syntax error in code: {str(analysis.error)}"
             }
 
         docstrings = []
         doc_count = 0
 
-        for node in ast.walk(tree):
+        for node in analysis.of_type(ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef):
             if isinstance(node, ast.FunctionDef):
-                docstring = self._create_function_docstring(node, style)
+                docstring = self._create_function_docstring(node, style, facts=analysis.functions[node])
                 docstrings.append(f"# Function: {node.name}\n{docstring}")
                 doc_count += 1
             elif isinstance(node, ast.AsyncFunctionDef):
-                docstring = self._create_function_docstring(node, style, is_async=True)
+                docstring = self._create_function_docstring(
+                    node, style, is_async=True, facts=analysis.functions[node]
+                )
                 docstrings.append(f"# Async Function: {node.name}\n{docstring}")
                 doc_count += 1
             elif isinstance(node, ast.ClassDef):
@@ -202,7 +204,8 @@ class DocumentationGeneratorSkill(BaseSkill):
         self,
         node: ast.FunctionDef,
         style: str,
-        is_async: bool = False
+        is_async: bool = False,
+        facts: Optional[FunctionFacts] = None
     ) -> str:
         """Create docstring for a function.
 
@@ -210,6 +213,7 @@ class DocumentationGeneratorSkill(BaseSkill):
             node: AST FunctionDef node
             style: Docstring style
             is_async: Whether function is async
+            facts: The function's facts from the shared analysis, if available
 
         Returns:
             Formatted docstring
@@ -218,7 +222,7 @@ class DocumentationGeneratorSkill(BaseSkill):
         func_name = node.name
         args = self._extract_arguments(node)
         returns = self._extract_return_type(node)
-        raises = self._extract_raises(node)
+        raises = self._extract_raises(node, facts.raises if facts else None)
 
         # Get brief description
         brief = self._generate_brief_description(func_name, is_async)
@@ -373,24 +377,31 @@ class DocumentationGeneratorSkill(BaseSkill):
             return ast.unparse(node.returns)
         return None
 
-    def _extract_raises(self, node: ast.FunctionDef) -> List[str]:
+    def _extract_raises(
+        self,
+        node: ast.FunctionDef,
+        raise_nodes: Optional[List[ast.Raise]] = None
+    ) -> List[str]:
         """Extract exceptions that function might raise.
 
         Args:
             node: AST FunctionDef node
+            raise_nodes: The function's raise statements, if already collected
 
         Returns:
             List of exception names
         """
+        if raise_nodes is None:
+            raise_nodes = [child for child in ast.walk(node) if isinstance(child, ast.Raise)]
+
         raises = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Raise):
-                if child.exc:
-                    if isinstance(child.exc, ast.Call):
-                        if isinstance(child.exc.func, ast.Name):
-                            raises.append(child.exc.func.id)
-                    elif isinstance(child.exc, ast.Name):
-                        raises.append(child.exc.id)
+        for child in raise_nodes:
+            if child.exc:
+                if isinstance(child.exc, ast.Call):
+                    if isinstance(child.exc.func, ast.Name):
+                        raises.append(child.exc.func.id)
+                elif isinstance(child.exc, ast.Name):
+                    raises.append(child.exc.id)
         return list(set(raises))  # Remove duplicates
 
     def _generate_brief_description(self, func_name: str, is_async: bool = False) -> str:
@@ -665,25 +676,24 @@ class DocumentationGeneratorSkill(BaseSkill):
                 "error": "No code provided and module_path not found"
             }
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
+        analysis = analyze(code)
+        if analysis.error is not None:
             return {
                 "success": False,
                 "documentation": "",
-                "error": f"Syntax error in code: {str(e)}"
+                "error": f"Syntax error in code: {str(analysis.error)}"
             }
 
         api_docs = []
         doc_count = 0
 
         # Extract module docstring
-        module_doc = ast.get_docstring(tree)
+        module_doc = ast.get_docstring(analysis.tree)
         if module_doc:
             api_docs.append(f"# Module Documentation\n\n{module_doc}\n")
 
         # Extract classes
-        classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+        classes = [node for node in analysis.tree.body if isinstance(node, ast.ClassDef)]
         if classes:
             api_docs.append("## Classes\n")
             for cls in classes:
@@ -710,7 +720,7 @@ class DocumentationGeneratorSkill(BaseSkill):
                     doc_count += 1
 
         # Extract functions
-        functions = [node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        functions = [node for node in analysis.tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
         public_functions = [f for f in functions if not f.name.startswith('_')]
 
         if public_functions:
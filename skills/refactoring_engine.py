@@ -20,6 +20,7 @@ Example:
 import ast
 import re
 from typing import Dict, Any, List, Set, Optional, Tuple
+from skills.ast_engine import ASTAnalysis, analyze
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -161,31 +162,9 @@ class RefactoringEngineSkill(BaseSkill):
         """
         suggestions = []
 
-        try:
-            tree = ast.parse(code)
-            lines = code.split('\n')
-
-            # Different analysis based on focus
-            if focus in ["all", "readability"]:
-                suggestions.extend(self._detect_long_functions(tree, lines))
-                suggestions.extend(self._detect_naming_issues(tree))
-                suggestions.extend(self._detect_nested_conditionals(tree, code))
-                suggestions.extend(self._detect_list_comprehension_opportunities(tree, code))
-
-            if focus in ["all", "performance"]:
-                suggestions.extend(self._detect_inefficient_loops(tree, code))
-
-            if focus in ["all", "best_practices"]:
-                suggestions.extend(self._detect_magic_numbers(tree, code))
-                suggestions.extend(self._detect_missing_context_managers(tree, code))
-                suggestions.extend(self._detect_dead_code(tree))
-                suggestions.extend(self._detect_missing_type_hints(tree, code))
-
-            # Sort by severity
-            severity_order = {"major": 0, "moderate": 1, "minor": 2}
-            suggestions.sort(key=lambda x: severity_order.get(x["severity"], 3))
-
-        except SyntaxError:
+        # Parsed and walked once, shared with the other code skills
+        analysis = analyze(code)
+        if analysis.error is not None:
             # Can't analyze code with syntax errors
             suggestions.append({
                 "type": "fix_syntax",
@@ -196,61 +175,73 @@ class RefactoringEngineSkill(BaseSkill):
                 "reason": "Code must be syntactically valid for refactoring",
                 "impact": "readability"
             })
+            return suggestions
+
+        # Different analysis based on focus
+        if focus in ["all", "readability"]:
+            suggestions.extend(self._detect_long_functions(analysis))
+            suggestions.extend(self._detect_naming_issues(analysis))
+            suggestions.extend(self._detect_nested_conditionals(analysis))
+            suggestions.extend(self._detect_list_comprehension_opportunities(analysis))
+
+        if focus in ["all", "performance"]:
+            suggestions.extend(self._detect_inefficient_loops(analysis))
+
+        if focus in ["all", "best_practices"]:
+            suggestions.extend(self._detect_magic_numbers(analysis))
+            suggestions.extend(self._detect_missing_context_managers(analysis))
+            suggestions.extend(self._detect_dead_code(analysis))
+            suggestions.extend(self._detect_missing_type_hints(analysis))
+
+        # Sort by severity
+        severity_order = {"major": 0, "moderate": 1, "minor": 2}
+        suggestions.sort(key=lambda x: severity_order.get(x["severity"], 3))
 
         return suggestions
 
-    def _detect_long_functions(
-        self,
-        tree: ast.AST,
-        lines: List[str]
-    ) -> List[Dict[str, Any]]:
+    def _in_source_order(self, nodes: List[ast.AST]) -> List[ast.AST]:
+        """Sort nodes by position, the order a depth-first visit finds them."""
+        return sorted(nodes, key=lambda node: (node.lineno, node.col_offset))
+
+    def _detect_long_functions(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect functions that are too long.
 
         Args:
-            tree: AST tree
-            lines: Source code lines
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
+        lines = analysis.lines
+
+        for node in self._in_source_order(analysis.of_type(ast.FunctionDef)):
+            # Calculate function length
+            if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
+                func_length = node.end_lineno - node.lineno + 1
+
+                if func_length > self.LONG_FUNCTION_LINES:
+                    # Get function code
+                    func_lines = lines[node.lineno - 1:node.end_lineno]
+                    original = '\n'.join(func_lines)
+
+                    suggestions.append({
+                        "type": "extract_function",
+                        "severity": "moderate",
+                        "description": f"Function '{node.name}' is {func_length} lines long (>{self.LONG_FUNCTION_LINES})",
+                        "original_code": original,
+                        "refactored_code": f"# Consider breaking '{node.name}' into smaller functions",
+                        "reason": "Long functions are harder to understand and maintain",
+                        "impact": "readability"
+                    })
+
+        return suggestions
 
-        class FunctionVisitor(ast.NodeVisitor):
-            def __init__(self, outer_self):
-                self.outer_self = outer_self
-                self.suggestions = []
-
-            def visit_FunctionDef(self, node):
-                # Calculate function length
-                if hasattr(node, 'end_lineno') and hasattr(node, 'lineno'):
-                    func_length = node.end_lineno - node.lineno + 1
-
-                    if func_length > self.outer_self.LONG_FUNCTION_LINES:
-                        # Get function code
-                        func_lines = lines[node.lineno - 1:node.end_lineno]
-                        original = '\n'.join(func_lines)
-
-                        self.suggestions.append({
-                            "type": "extract_function",
-                            "severity": "moderate",
-                            "description": f"Function '{node.name}' is {func_length} lines long (>{self.outer_self.LONG_FUNCTION_LINES})",
-                            "original_code": original,
-                            "refactored_code": f"# Consider breaking '{node.name}' into smaller functions",
-                            "reason": "Long functions are harder to understand and maintain",
-                            "impact": "readability"
-                        })
-
-                self.generic_visit(node)
-
-        visitor = FunctionVisitor(self)
-        visitor.visit(tree)
-        return visitor.suggestions
-
-    def _detect_naming_issues(self, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _detect_naming_issues(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect poor variable/function names.
 
         Args:
-            tree: AST tree
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
@@ -258,28 +249,21 @@ class RefactoringEngineSkill(BaseSkill):
         suggestions = []
         poor_names = set()
 
-        class NameVisitor(ast.NodeVisitor):
-            def visit_Name(self, node):
-                if isinstance(node.ctx, ast.Store):
-                    name = node.id
-                    # Check for single letter names (except common ones)
-                    if len(name) == 1 and name not in ['i', 'j', 'k', 'x', 'y', 'z', '_']:
-                        poor_names.add(name)
-                    # Check for unclear abbreviations
-                    elif len(name) <= 3 and name not in ['df', 'np', 'pd', 'os', 'sys']:
-                        if not name.isupper():  # Allow constants
-                            poor_names.add(name)
-                self.generic_visit(node)
-
-            def visit_FunctionDef(self, node):
-                name = node.name
+        # In source order, like a depth-first visit
+        for node in self._in_source_order(analysis.of_type(ast.Name, ast.FunctionDef)):
+            if isinstance(node, ast.FunctionDef):
                 # Check for single letter function names
-                if len(name) == 1:
-                    poor_names.add(f"function '{name}'")
-                self.generic_visit(node)
-
-        visitor = NameVisitor()
-        visitor.visit(tree)
+                if len(node.name) == 1:
+                    poor_names.add(f"function '{node.name}'")
+            elif isinstance(node.ctx, ast.Store):
+                name = node.id
+                # Check for single letter names (except common ones)
+                if len(name) == 1 and name not in ['i', 'j', 'k', 'x', 'y', 'z', '_']:
+                    poor_names.add(name)
+                # Check for unclear abbreviations
+                elif len(name) <= 3 and name not in ['df', 'np', 'pd', 'os', 'sys']:
+                    if not name.isupper():  # Allow constants
+                        poor_names.add(name)
 
         for name in list(poor_names)[:5]:  # Limit to 5 suggestions
             suggestions.append({
@@ -294,45 +278,28 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_nested_conditionals(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_nested_conditionals(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect deeply nested if statements.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
 
-        class NestedIfVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.depth = 0
-                self.max_depth = 0
-                self.deep_ifs = []
-
-            def visit_If(self, node):
-                self.depth += 1
-                if self.depth > MAX_NESTED_DEPTH:
-                    self.deep_ifs.append(node)
-                self.max_depth = max(self.max_depth, self.depth)
-                self.generic_visit(node)
-                self.depth -= 1
-
-        MAX_NESTED_DEPTH = self.MAX_NESTED_DEPTH
-        visitor = NestedIfVisitor()
-        visitor.visit(tree)
-
-        if visitor.deep_ifs:
+        # An if's depth is 1 + the number of enclosing ifs
+        deep_ifs = [
+            node for node in analysis.of_type(ast.If)
+            if 1 + sum(isinstance(a, ast.If) for a in analysis.ancestors(node)) > self.MAX_NESTED_DEPTH
+        ]
+
+        if deep_ifs:
             suggestions.append({
                 "type": "simplify",
                 "severity": "moderate",
-                "description": f"Found {len(visitor.deep_ifs)} deeply nested if statement(s) (depth > {MAX_NESTED_DEPTH})",
+                "description": f"Found {len(deep_ifs)} deeply nested if statement(s) (depth > {self.MAX_NESTED_DEPTH})",
                 "original_code": "if cond1:\n    if cond2:\n        if cond3:\n            ...",
                 "refactored_code": "# Use early returns or combine conditions:\nif not cond1:\n    return\nif not cond2:\n    return\nif cond3:\n    ...",
                 "reason": "Deep nesting makes code harder to follow",
@@ -341,40 +308,27 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_list_comprehension_opportunities(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_list_comprehension_opportunities(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect loops that could be list comprehensions.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
+        opportunities = []
 
-        class LoopVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.opportunities = []
-
-            def visit_For(self, node):
-                # Check if it's a simple append loop
-                if len(node.body) == 1 and isinstance(node.body[0], ast.Expr):
-                    expr = node.body[0].value
-                    if isinstance(expr, ast.Call) and isinstance(expr.func, ast.Attribute):
-                        if expr.func.attr == 'append':
-                            self.opportunities.append(node)
-
-                self.generic_visit(node)
+        for node in analysis.of_type(ast.For):
+            # Check if it's a simple append loop
+            if len(node.body) == 1 and isinstance(node.body[0], ast.Expr):
+                expr = node.body[0].value
+                if isinstance(expr, ast.Call) and isinstance(expr.func, ast.Attribute):
+                    if expr.func.attr == 'append':
+                        opportunities.append(node)
 
-        visitor = LoopVisitor()
-        visitor.visit(tree)
-
-        for opportunity in visitor.opportunities[:3]:  # Limit to 3
+        for opportunity in opportunities[:3]:  # Limit to 3
             suggestions.append({
                 "type": "simplify",
                 "severity": "minor",
@@ -387,41 +341,28 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_inefficient_loops(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_inefficient_loops(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect inefficient loop patterns.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
-
-        class LoopVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.range_len_loops = []
-
-            def visit_For(self, node):
-                # Check for range(len(x)) pattern
-                if isinstance(node.iter, ast.Call):
-                    if isinstance(node.iter.func, ast.Name) and node.iter.func.id == 'range':
-                        if len(node.iter.args) == 1 and isinstance(node.iter.args[0], ast.Call):
-                            inner = node.iter.args[0]
-                            if isinstance(inner.func, ast.Name) and inner.func.id == 'len':
-                                self.range_len_loops.append(node)
-
-                self.generic_visit(node)
-
-        visitor = LoopVisitor()
-        visitor.visit(tree)
-
-        for loop in visitor.range_len_loops[:3]:  # Limit to 3
+        range_len_loops = []
+
+        for node in analysis.of_type(ast.For):
+            # Check for range(len(x)) pattern
+            if isinstance(node.iter, ast.Call):
+                if isinstance(node.iter.func, ast.Name) and node.iter.func.id == 'range':
+                    if len(node.iter.args) == 1 and isinstance(node.iter.args[0], ast.Call):
+                        inner = node.iter.args[0]
+                        if isinstance(inner.func, ast.Name) and inner.func.id == 'len':
+                            range_len_loops.append(node)
+
+        for loop in range_len_loops[:3]:  # Limit to 3
             suggestions.append({
                 "type": "optimize",
                 "severity": "minor",
@@ -434,16 +375,11 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_magic_numbers(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_magic_numbers(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect magic numbers that should be constants.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
@@ -451,27 +387,12 @@ class RefactoringEngineSkill(BaseSkill):
         suggestions = []
         magic_numbers = []
 
-        class NumberVisitor(ast.NodeVisitor):
-            def visit_Num(self, node):
-                # Python 3.7 and earlier
-                if hasattr(node, 'n'):
-                    value = node.n
-                    # Ignore common values
-                    if value not in [0, 1, -1, 2, 10, 100]:
-                        magic_numbers.append(value)
-                self.generic_visit(node)
-
-            def visit_Constant(self, node):
-                # Python 3.8+
-                if isinstance(node.value, (int, float)):
-                    value = node.value
-                    # Ignore common values
-                    if value not in [0, 1, -1, 2, 10, 100]:
-                        magic_numbers.append(value)
-                self.generic_visit(node)
-
-        visitor = NumberVisitor()
-        visitor.visit(tree)
+        for node in self._in_source_order(analysis.of_type(ast.Constant)):
+            if isinstance(node.value, (int, float)):
+                value = node.value
+                # Ignore common values
+                if value not in [0, 1, -1, 2, 10, 100]:
+                    magic_numbers.append(value)
 
         if magic_numbers:
             unique_numbers = list(set(magic_numbers))[:3]  # Limit to 3
@@ -488,47 +409,28 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_missing_context_managers(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_missing_context_managers(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect file operations without context managers.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
 
-        class FileVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.open_calls = []
-                self.in_with = False
-
-            def visit_With(self, node):
-                old_in_with = self.in_with
-                self.in_with = True
-                self.generic_visit(node)
-                self.in_with = old_in_with
-
-            def visit_Call(self, node):
-                if isinstance(node.func, ast.Name) and node.func.id == 'open':
-                    if not self.in_with:
-                        self.open_calls.append(node)
-                self.generic_visit(node)
-
-        visitor = FileVisitor()
-        visitor.visit(tree)
+        open_calls = [
+            node for node in analysis.of_type(ast.Call)
+            if isinstance(node.func, ast.Name) and node.func.id == 'open'
+            and not any(isinstance(a, ast.With) for a in analysis.ancestors(node))
+        ]
 
-        if visitor.open_calls:
+        if open_calls:
             suggestions.append({
                 "type": "use_context_manager",
                 "severity": "moderate",
-                "description": f"Found {len(visitor.open_calls)} file open() call(s) without context manager",
+                "description": f"Found {len(open_calls)} file open() call(s) without context manager",
                 "original_code": "f = open('file.txt')\ndata = f.read()\nf.close()",
                 "refactored_code": "with open('file.txt') as f:\n    data = f.read()",
                 "reason": "Context managers ensure files are properly closed",
@@ -537,45 +439,38 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_dead_code(self, tree: ast.AST) -> List[Dict[str, Any]]:
+    def _detect_dead_code(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect dead/unreachable code.
 
         Args:
-            tree: AST tree
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
         """
         suggestions = []
-
-        class DeadCodeVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.unreachable = []
-                self.unused_vars = []
-
-            def check_block(self, stmts, context=""):
-                """Check a block of statements for unreachable code."""
-                for i, stmt in enumerate(stmts):
-                    if isinstance(stmt, ast.Return) and i < len(stmts) - 1:
-                        self.unreachable.append(context)
-                        break
-                    # Recurse into nested blocks
-                    if isinstance(stmt, ast.If):
-                        self.check_block(stmt.body, context)
-                        self.check_block(stmt.orelse, context)
-                    elif isinstance(stmt, (ast.For, ast.While)):
-                        self.check_block(stmt.body, context)
-                        self.check_block(stmt.orelse, context)
-
-            def visit_FunctionDef(self, node):
-                self.check_block(node.body, node.name)
-                # Don't visit nested functions with generic_visit
-
-        visitor = DeadCodeVisitor()
-        visitor.visit(tree)
-
-        if visitor.unreachable:
-            for func_name in list(set(visitor.unreachable))[:3]:  # Limit to 3, unique
+        unreachable = []
+
+        def check_block(stmts, context=""):
+            """Check a block of statements for unreachable code."""
+            for i, stmt in enumerate(stmts):
+                if isinstance(stmt, ast.Return) and i < len(stmts) - 1:
+                    unreachable.append(context)
+                    break
+                # Recurse into nested blocks
+                if isinstance(stmt, ast.If):
+                    check_block(stmt.body, context)
+                    check_block(stmt.orelse, context)
+                elif isinstance(stmt, (ast.For, ast.While)):
+                    check_block(stmt.body, context)
+                    check_block(stmt.orelse, context)
+
+        # Nested functions are covered by their outer function's blocks
+        for node in analysis.top_level_functions():
+            check_block(node.body, node.name)
+
+        if unreachable:
+            for func_name in list(set(unreachable))[:3]:  # Limit to 3, unique
                 suggestions.append({
                     "type": "remove_dead_code",
                     "severity": "minor",
@@ -588,16 +483,11 @@ class RefactoringEngineSkill(BaseSkill):
 
         return suggestions
 
-    def _detect_missing_type_hints(
-        self,
-        tree: ast.AST,
-        code: str
-    ) -> List[Dict[str, Any]]:
+    def _detect_missing_type_hints(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
         """Detect functions missing type hints.
 
         Args:
-            tree: AST tree
-            code: Source code
+            analysis: Shared AST analysis
 
         Returns:
             List of suggestions
@@ -605,24 +495,14 @@ class RefactoringEngineSkill(BaseSkill):
         suggestions = []
         functions_without_hints = []
 
-        class TypeHintVisitor(ast.NodeVisitor):
-            def visit_FunctionDef(self, node):
-                # Check if function has type hints
-                has_hints = False
-                if node.returns is not None:
-                    has_hints = True
-                for arg in node.args.args:
-                    if arg.annotation is not None:
-                        has_hints = True
-                        break
-
-                if not has_hints and not node.name.startswith('_'):
-                    functions_without_hints.append(node.name)
-
-                self.generic_visit(node)
+        for node in analysis.of_type(ast.FunctionDef):
+            # Check if function has type hints
+            has_hints = node.returns is not None or any(
+                arg.annotation is not None for arg in node.args.args
+            )
 
-        visitor = TypeHintVisitor()
-        visitor.visit(tree)
+            if not has_hints and not node.name.startswith('_'):
+                functions_without_hints.append(node.name)
 
         if functions_without_hints:
             count = len(functions_without_hints)
@@ -688,21 +568,11 @@ class RefactoringEngineSkill(BaseSkill):
         Returns:
             Complexity score
         """
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
+        analysis = analyze(code)
+        if analysis.error is not None:
             return 0
 
-        complexity = 1  # Base complexity
-
-        for node in ast.walk(tree):
-            # Decision points increase complexity
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-
-        return complexity
+        return analysis.complexity
 
     def _calculate_improvement_score(
         self,
@@ -99,7 +99,7 @@ class SkillManager:
             return
 
         # Files to skip
-        skip_files = {"__init__.py", "base.py", "skill_manager.py", "markdown_skill.py"}
+        skip_files = {"__init__.py", "base.py", "skill_manager.py", "markdown_skill.py", "ast_engine.py", "batch.py"}
 
         for file_path in self.skills_dir.glob("*.py"):
             filename = file_path.name
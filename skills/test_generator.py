@@ -14,6 +14,7 @@ Automatically generates unit tests for Python code with support for:
 import ast
 import re
 from typing import Dict, List, Any, Optional, Tuple
+from skills.ast_engine import ASTAnalysis, analyze
 from skills.base import BaseSkill, SkillValidationError, SkillExecutionError
 
 
@@ -117,19 +118,18 @@ class TestGeneratorSkill(BaseSkill):
         self._imports_needed = set()
         self._test_code_lines = []
 
-        try:
-            # Parse the code
-            tree = ast.parse(code)
-        except SyntaxError as e:
+        # Parse the code (shared with the other code skills)
+        analysis = analyze(code)
+        if analysis.error is not None:
             return {
                 "success": False,
-                "error": f"Syntax error in code: {str(e)}"
+                "error": f"Syntax error in code: {str(analysis.error)}"
             }
 
         # Analyze code structure
-        functions = self._extract_functions(tree)
-        classes = self._extract_classes(tree)
-        imports = self._extract_imports(tree)
+        functions = self._extract_functions(analysis)
+        classes = self._extract_classes(analysis)
+        imports = self._extract_imports(analysis)
 
         # Add framework-specific imports
         if framework == "pytest":
@@ -163,101 +163,93 @@ class TestGeneratorSkill(BaseSkill):
             "notes": notes
         }
 
-    def _extract_functions(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Extract function information from AST."""
+    def _extract_functions(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
+        """Extract function information from the shared analysis."""
         functions = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                # Skip nested functions (methods will be handled in classes)
-                if not any(isinstance(parent, ast.ClassDef)
-                          for parent in ast.walk(tree)
-                          if hasattr(parent, 'body') and node in parent.body):
-
-                    func_info = {
-                        "name": node.name,
-                        "args": [arg.arg for arg in node.args.args],
-                        "defaults": len(node.args.defaults),
-                        "returns": ast.unparse(node.returns) if node.returns else None,
-                        "is_async": isinstance(node, ast.AsyncFunctionDef),
-                        "docstring": ast.get_docstring(node),
-                        "decorators": [ast.unparse(d) for d in node.decorator_list],
-                        "raises": self._extract_exceptions(node),
-                        "calls": self._extract_calls(node)
-                    }
-                    functions.append(func_info)
+        for node, facts in analysis.functions.items():
+            # Skip methods (they are handled with their classes)
+            if not isinstance(analysis.parent(node), ast.ClassDef):
+                func_info = {
+                    "name": node.name,
+                    "args": [arg.arg for arg in node.args.args],
+                    "defaults": len(node.args.defaults),
+                    "returns": ast.unparse(node.returns) if node.returns else None,
+                    "is_async": isinstance(node, ast.AsyncFunctionDef),
+                    "docstring": ast.get_docstring(node),
+                    "decorators": [ast.unparse(d) for d in node.decorator_list],
+                    "raises": self._extract_exceptions(facts.raises),
+                    "calls": self._extract_calls(facts.calls)
+                }
+                functions.append(func_info)
 
         return functions
 
-    def _extract_classes(self, tree: ast.AST) -> List[Dict[str, Any]]:
-        """Extract class information from AST."""
+    def _extract_classes(self, analysis: ASTAnalysis) -> List[Dict[str, Any]]:
+        """Extract class information from the shared analysis."""
         classes = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                methods = []
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_info = {
-                            "name": item.name,
-                            "args": [arg.arg for arg in item.args.args],
-                            "is_async": isinstance(item, ast.AsyncFunctionDef),
-                            "decorators": [ast.unparse(d) for d in item.decorator_list],
-                            "raises": self._extract_exceptions(item)
-                        }
-                        methods.append(method_info)
-
-                class_info = {
-                    "name": node.name,
-                    "bases": [ast.unparse(base) for base in node.bases],
-                    "methods": methods,
-                    "docstring": ast.get_docstring(node)
-                }
-                classes.append(class_info)
+        for node in analysis.of_type(ast.ClassDef):
+            methods = []
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    method_info = {
+                        "name": item.name,
+                        "args": [arg.arg for arg in item.args.args],
+                        "is_async": isinstance(item, ast.AsyncFunctionDef),
+                        "decorators": [ast.unparse(d) for d in item.decorator_list],
+                        "raises": self._extract_exceptions(analysis.functions[item].raises)
+                    }
+                    methods.append(method_info)
+
+            class_info = {
+                "name": node.name,
+                "bases": [ast.unparse(base) for base in node.bases],
+                "methods": methods,
+                "docstring": ast.get_docstring(node)
+            }
+            classes.append(class_info)
 
         return classes
 
-    def _extract_imports(self, tree: ast.AST) -> List[str]:
-        """Extract import statements from AST."""
+    def _extract_imports(self, analysis: ASTAnalysis) -> List[str]:
+        """Extract imported modules from the shared analysis."""
         imports = []
 
-        for node in ast.walk(tree):
+        for node in analysis.of_type(ast.Import, ast.ImportFrom):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    imports.append(node.module)
+            elif node.module:
+                imports.append(node.module)
 
         return imports
 
-    def _extract_exceptions(self, node: ast.FunctionDef) -> List[str]:
-        """Extract exceptions that might be raised in a function."""
+    def _extract_exceptions(self, raises: List[ast.Raise]) -> List[str]:
+        """Extract exception names from a function's raise statements."""
         exceptions = []
 
-        for child in ast.walk(node):
-            if isinstance(child, ast.Raise):
-                if child.exc:
-                    if isinstance(child.exc, ast.Call):
-                        if isinstance(child.exc.func, ast.Name):
-                            exceptions.append(child.exc.func.id)
-                    elif isinstance(child.exc, ast.Name):
-                        exceptions.append(child.exc.id)
+        for child in raises:
+            if child.exc:
+                if isinstance(child.exc, ast.Call):
+                    if isinstance(child.exc.func, ast.Name):
+                        exceptions.append(child.exc.func.id)
+                elif isinstance(child.exc, ast.Name):
+                    exceptions.append(child.exc.id)
 
         return exceptions
 
-    def _extract_calls(self, node: ast.FunctionDef) -> List[str]:
-        """Extract function calls to detect dependencies."""
-        calls = []
+    def _extract_calls(self, calls: List[ast.Call]) -> List[str]:
+        """Extract called names from a function's calls to detect dependencies."""
+        names = []
 
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name):
-                    calls.append(child.func.id)
-                elif isinstance(child.func, ast.Attribute):
-                    calls.append(ast.unparse(child.func))
+        for child in calls:
+            if isinstance(child.func, ast.Name):
+                names.append(child.func.id)
+            elif isinstance(child.func, ast.Attribute):
+                names.append(ast.unparse(child.func))
 
-        return calls
+        return names
 
     def _generate_function_tests(
         self,
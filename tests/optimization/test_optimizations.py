@@ -6,15 +6,20 @@ Tests for all optimization components:
 - Performance Profiler
 - Cache Manager
 - Query Optimizer
-- Resource Monitor
+- Resource Monitor (process and component accounting)
 - Benchmarks
+- Lazy component loading
+- Learned latency model
 
 Minimum 15 tests required for Task 49.
 """
 
+import json
 import sys
 import time
 import shutil
+import subprocess
+import threading
 from pathlib import Path
 
 # Add parent directory to path
@@ -23,8 +28,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from optimization.profiler import PerformanceProfiler, TimingContext, timed
 from optimization.cache_manager import CacheManager, EmbeddingCache, QueryCache
 from optimization.query_optimizer import QueryOptimizer
-from optimization.resource_monitor import ResourceMonitor
+from optimization.query_router import QueryRouter, ROUTE_FAST_PATH, ROUTE_FULL
+from optimization.resource_monitor import ResourceMonitor, estimate_size
 from optimization.benchmarks import BenchmarkSuite
+from optimization.lazy_loader import LazyComponent, LazyRegistry
+from optimization.tool_prefetch import ToolPrefetcher, canonical_input, extract_identifiers
+from optimization.latency_model import LatencyModel
 
 
 # =============================================================================
@@ -440,16 +449,646 @@ def test_optimization_integration():
     print("   ✅ Optimization integration works")
 
 
+# =============================================================================
+# QUERY ROUTER TESTS (3 tests)
+# =============================================================================
+
+def test_router_fast_path():
+    """Test 19: Conversational and general-knowledge queries take the fast path."""
+    print("\n📝 Test 19: Router fast path")
+
+    router = QueryRouter()
+
+    assert router.route("Hello there!").route == ROUTE_FAST_PATH
+    assert router.route("thanks, that helped").route == ROUTE_FAST_PATH
+    assert router.route("Good morning").is_fast_path
+    for query in ["What is a decorator in Python?", "what is recursion?", "define polymorphism",
+                  "What's the difference between TCP and UDP?"]:
+        assert router.route(query).is_fast_path, query
+
+    # Short questions about the project need tools, even without a file name
+    for query in ["Where is the retry logic implemented?", "where is authenticate_user defined",
+                  "Summarize the README", "How many tests are there?", "show me the latest changes",
+                  "Why does login fail?", "calculate fib(30)", "what is this?", "What is the retry logic?"]:
+        assert router.route(query).route == ROUTE_FULL, query
+
+    # Project-related and tool-heavy queries need the full loop
+    assert router.route("Read the file core/agent.py").route == ROUTE_FULL
+    assert router.route("Find the main function in the codebase").route == ROUTE_FULL
+    assert router.route("Hello, can you list files in the repo?").route == ROUTE_FULL
+
+    # Disabled fast path always uses the full loop
+    router = QueryRouter(fast_path_enabled=False)
+    assert router.route("Hello").route == ROUTE_FULL
+
+    print("   ✅ Router fast path works")
+
+
+def test_fast_path_prompt():
+    """Test 19b: The fast-path prompt has the current message once, after the history."""
+    print("\n📝 Test 19b: Fast path prompt")
+
+    from core.agent import MetonAgent
+    from core.config import ConfigLoader
+
+    class Conversation:
+        def __init__(self):
+            self.messages = []
+
+        def add_user_message(self, content):
+            self.messages.append({"role": "user", "content": content})
+
+        def add_assistant_message(self, content, metadata=None):
+            self.messages.append({"role": "assistant", "content": content})
+
+        def get_messages(self, limit=None):
+            return self.messages[-limit:] if limit else list(self.messages)
+
+    class Models:
+        current_model = "quick"
+
+        def __init__(self):
+            self.prompts = []
+
+        def resolve_alias(self, name):
+            return name
+
+        def get_llm(self, name):
+            return self
+
+        def invoke(self, prompt):
+            self.prompts.append(prompt)
+            return "Hi!"
+
+    config = ConfigLoader()
+    config.config.optimization.query_optimization.latency_model = False
+    conversation = Conversation()
+    conversation.add_user_message("What is a closure?")
+    conversation.add_assistant_message("A function with captured variables.")
+    models = Models()
+    agent = MetonAgent(config, models, conversation, [], enable_memory=False)
+
+    conversation.add_user_message("thanks, that helped")
+    result = agent._run_fast_path("thanks, that helped", agent.router.route("thanks, that helped"), time.time())
+    assert result["output"] == "Hi!"
+
+    prompt = models.prompts[0]
+    assert prompt.count("thanks, that helped") == 1, "Current message sent twice"
+    assert prompt.index("What is a closure?") < prompt.index("User: thanks, that helped")
+
+    print("   ✅ Fast path prompt has the message once")
+
+
+def test_router_tool_selection():
+    """Test 20: Router narrows tool descriptions for tool-heavy queries."""
+    print("\n📝 Test 20: Router tool selection")
+
+    router = QueryRouter()
+    available = ["file_operations", "code_executor", "codebase_search", "symbol_lookup"]
+
+    decision = router.route("Find the authentication function in the code", available)
+    assert decision.route == ROUTE_FULL
+    assert "codebase_search" in decision.tools, "Should select codebase_search"
+    assert "code_executor" not in decision.tools, "Should drop unrelated tools"
+    assert all(t in available for t in decision.tools), "Should only select registered tools"
+
+    # No overlap with registered tools keeps the full prompt
+    decision = router.route("Find the authentication function in the code", ["custom_tool"])
+    assert decision.tools == [], "Should fall back to all tools"
+
+    print("   ✅ Router tool selection works")
+
+
+def test_router_latency_stats():
+    """Test 21: Router tracks per-route latency and savings."""
+    print("\n📝 Test 21: Router latency stats")
+
+    router = QueryRouter()
+    assert router.estimate_savings(0.5) is None, "No full-loop history yet"
+
+    router.record_latency(ROUTE_FULL, 10.0)
+    router.record_latency(ROUTE_FULL, 20.0)
+    router.record_latency(ROUTE_FAST_PATH, 1.0)
+    router.record_fallback()
+
+    assert router.estimate_savings(1.0) == 14.0
+    stats = router.get_stats()
+    assert stats["full_count"] == 2
+    assert stats["fast_path_count"] == 1
+    assert stats["fast_path_avg_time"] == 1.0
+    assert stats["estimated_time_saved"] == 14.0
+    assert stats["fallbacks"] == 1
+
+    print("   ✅ Router latency stats work")
+
+
+# =============================================================================
+# RESOURCE PROFILING TESTS (3 tests)
+# =============================================================================
+
+def test_resource_component_accounting():
+    """Test 22: Components register size estimators held weakly."""
+    print("\n📝 Test 22: Component memory accounting")
+
+    class Store:
+        def __init__(self, items):
+            self.data = {f"chunk_{i}": {"code": "x" * 200, "line": i} for i in range(items)}
+
+        def estimate_memory(self):
+            return estimate_size(self.data)
+
+    monitor = ResourceMonitor()
+    small, large = Store(10), Store(5000)
+    assert monitor.register_component("store", small.estimate_memory) == "store"
+    assert monitor.register_component("store", large.estimate_memory) == "store#2"
+
+    usage = monitor.get_component_usage()
+    assert list(usage) == ["store#2", "store"], "Largest component first"
+    assert usage["store#2"] > 5000 * 200, "Should count nested strings"
+
+    del large
+    assert list(monitor.get_component_usage()) == ["store"], "Collected components drop out"
+    monitor.unregister_component("store")
+    assert monitor.get_component_usage() == {}
+
+    print("   ✅ Component memory accounting works")
+
+
+def test_resource_process_profile():
+    """Test 23: Process RSS and per-thread CPU time are reported."""
+    print("\n📝 Test 23: Process resource profile")
+
+    monitor = ResourceMonitor()
+    monitor.register_component("fixed", lambda: 3 * 1024 * 1024)
+
+    worker = threading.Thread(target=lambda: sum(range(200000)), name="busy-worker")
+    worker.start()
+    process = monitor.get_process_usage()
+    worker.join()
+
+    assert process["rss_mb"] > 0, "Should report process RSS"
+    assert process["num_threads"] >= 1
+    assert any(t["name"] == "MainThread" for t in process["threads"]), "Should name threads"
+
+    profile = monitor.get_profile()
+    assert profile["components"] == {"fixed": 3.0}
+    assert profile["unaccounted_mb"] < profile["process"]["rss_mb"]
+
+    metric = monitor.sample()
+    assert metric["components"] == {"fixed": 3.0}
+    assert metric["process_rss_mb"] > 0
+
+    print("   ✅ Process resource profile works")
+
+
+def test_resource_growth_alerts():
+    """Test 24: Steady component growth raises one leak alert per window."""
+    print("\n📝 Test 24: Memory growth alerts")
+
+    sizes = {"leaky": 0, "spiky": 0}
+    monitor = ResourceMonitor(alert_cpu_threshold=101, alert_memory_threshold=101,
+                              alert_growth_mb=10, growth_window=5)
+    for name in sizes:
+        monitor.register_component(name, lambda name=name: sizes[name])
+
+    for step in range(8):
+        sizes["leaky"] += 4 * 1024 * 1024  # Grows every sample
+        sizes["spiky"] = (50 if step == 3 else 0) * 1024 * 1024  # One-off allocation
+        monitor.sample()
+
+    alerts = [a for a in monitor.get_alerts() if a["type"] == "growth"]
+    assert [a["component"] for a in alerts] == ["leaky"], "Only steady growth alerts, once"
+    assert alerts[0]["value"] == 16.0
+
+    growth = monitor.get_growth()
+    assert growth["leaky"]["growth_mb"] == 16.0
+    assert "process" in growth
+
+    print("   ✅ Memory growth alerts work")
+
+
+# =============================================================================
+# LAZY LOADING TESTS (3 tests)
+# =============================================================================
+
+def test_lazy_component_builds_once():
+    """Test 25: Lazy components build on first use, once, across threads."""
+    print("\n📝 Test 25: Lazy component")
+
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"ready": True}
+
+    component = LazyComponent("store", factory)
+    assert not component.is_loaded, "Nothing built at registration"
+
+    threads = [threading.Thread(target=component.get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1, "Factory should run once"
+    assert component.copy() == {"ready": True}, "Attributes forward to the component"
+    assert component.load_seconds >= 0.05
+
+    failing = LazyComponent("memory", lambda: 1 / 0)
+    assert not failing, "Failed components are falsy"
+    assert "division by zero" in failing.load_error
+
+    print("   ✅ Lazy component works")
+
+
+def test_lazy_registry_prewarm():
+    """Test 26: Registry prewarms components in the background and reports stats."""
+    print("\n📝 Test 26: Lazy registry prewarm")
+
+    registry = LazyRegistry()
+    registry.register("index", lambda: "index")
+    registry.register("on_demand", lambda: "model", prewarm=False)
+
+    thread = registry.prewarm()
+    thread.join(timeout=5)
+
+    assert registry.is_loaded("index"), "Prewarmed in the background"
+    assert not registry.is_loaded("on_demand"), "Not marked for prewarm"
+    assert registry.get("on_demand") == "model"
+
+    assert registry.mark_prompt_ready() > 0
+    stats = registry.get_stats()
+    assert stats["loaded"] == stats["registered"] == 2
+    assert stats["time_to_prompt"] is not None
+
+    print("   ✅ Lazy registry prewarm works")
+
+
+def test_lazy_package_imports():
+    """Test 27: Importing the agent doesn't import sentence-transformers or FAISS."""
+    print("\n📝 Test 27: Lazy package imports")
+
+    root = Path(__file__).parent.parent.parent
+    code = (
+        "import sys; import core.agent, memory, agent, optimization; "
+        "from memory import LongTermMemory; "
+        "print(sorted(m for m in ('sentence_transformers', 'faiss', 'torch') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=root,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]", "Heavy modules imported eagerly"
+
+    print("   ✅ Lazy package imports work")
+
+
 # =============================================================================
 # TEST RUNNER
 # =============================================================================
 
+# =============================================================================
+# TOOL PREFETCH TESTS (3 tests)
+# =============================================================================
+
+class SlowTool:
+    """Read-only tool stand-in that records its inputs."""
+
+    def __init__(self, name, delay=0.05):
+        self.name = name
+        self.delay = delay
+        self.inputs = []
+
+    def _run(self, tool_input):
+        time.sleep(self.delay)
+        self.inputs.append(json.loads(tool_input))
+        return f"{self.name} result for {tool_input}"
+
+
+def test_prefetch_predictions():
+    """Test 22: Prefetcher predicts codebase searches and symbol lookups."""
+    print("\n📝 Test 22: Prefetch predictions")
+
+    assert extract_identifiers("Why does `Config.load` call parse_args() and CodebaseIndexer?") == \
+        ["load", "parse_args", "CodebaseIndexer"]
+    assert extract_identifiers("what is the meaning of life") == []
+
+    tools = {name: SlowTool(name) for name in ("codebase_search", "symbol_lookup", "file_operations")}
+    prefetcher = ToolPrefetcher(tools, max_symbols=2)
+
+    calls = prefetcher.predict("Find the function that calls build_index and SkillManager")
+    assert calls[0] == ("codebase_search", json.dumps({"query": "Find the function that calls build_index and SkillManager"}))
+    assert [json.loads(i)["symbol"] for t, i in calls[1:]] == ["build_index", "SkillManager"]
+
+    # "general" queries only get the optimizer's default tools: no search
+    assert prefetcher.predict("hmm, interesting thought") == []
+
+    # Equivalent inputs share a cache key
+    assert canonical_input("symbol_lookup", '{"symbol": "X", "type": "all"}') == \
+        canonical_input("symbol_lookup", '{ "symbol":"X" }')
+
+    print("   ✅ Prefetch predictions work")
+
+
+def test_prefetch_run_hits_and_waste():
+    """Test 23: Prefetched results answer tool calls; unused ones count as waste."""
+    print("\n📝 Test 23: Prefetch hits and waste")
+
+    tools = {name: SlowTool(name, delay=0.1) for name in ("codebase_search", "symbol_lookup")}
+    prefetcher = ToolPrefetcher(tools, max_workers=3)
+
+    start = time.time()
+    run = prefetcher.start("Find where `load_config` and `parse_args` are defined in the code")
+    assert len(run.entries) == 3
+    time.sleep(0.15)  # The "first LLM call"
+
+    result, hit = run.execute(tools["symbol_lookup"], '{"symbol": "load_config", "scope": "all"}')
+    assert hit and "load_config" in result
+    assert time.time() - start < 0.2, "Prefetched result should be ready"
+
+    # Not predicted: runs for real and counts as a miss
+    result, hit = run.execute(tools["codebase_search"], '{"query": "config loading"}')
+    assert not hit and len(tools["codebase_search"].inputs) == 2
+
+    stats = run.finish()
+    assert stats == {"prefetched": 3, "hits": 1, "misses": 1, "wasted": 2,
+                     "saved_seconds": stats["saved_seconds"]}
+    assert stats["saved_seconds"] > 0.05
+
+    totals = prefetcher.get_stats()
+    assert totals["runs"] == 1 and totals["hit_rate"] == 1 / 3 and totals["coverage"] == 0.5
+    assert totals["tools"]["symbol_lookup"]["wasted"] == 1
+    assert totals["wasted_seconds"] >= 0.2
+    prefetcher.shutdown()
+
+    print("   ✅ Prefetch hits and waste tracked")
+
+
+def test_agent_uses_prefetch():
+    """Test 24: The agent's tool execution checks the prefetch cache first."""
+    print("\n📝 Test 24: Agent tool execution with prefetch")
+
+    from core.agent import MetonAgent
+    from core.config import ConfigLoader
+
+    class Conversation:
+        def __init__(self):
+            self.tool_messages = []
+
+        def add_tool_message(self, content, tool_name=None, action=None):
+            self.tool_messages.append(tool_name)
+
+    config = ConfigLoader()
+    config.config.optimization.query_optimization.speculative_prefetch = True
+    search = SlowTool("codebase_search", delay=0.1)
+    agent = MetonAgent(config, object(), Conversation(), [search], enable_routing=False, enable_memory=False)
+    assert agent.prefetcher is not None
+
+    query = "Find the authentication function in the code"
+    agent._prefetch = agent.prefetcher.start(query)
+    state = {"messages": [query], "thoughts": [], "iteration": 1, "finished": False, "final_answer": None,
+             "tool_calls": [{"tool_name": "codebase_search", "input": json.dumps({"query": query}), "output": None}]}
+
+    state = agent._tool_execution_node(state)
+    assert state["tool_calls"][0]["output"].startswith("codebase_search result")
+    assert len(search.inputs) == 1, "Prefetched call shouldn't run twice"
+    assert agent.conversation.tool_messages == ["codebase_search"]
+
+    assert agent._finish_prefetch()["hits"] == 1 and agent._prefetch is None
+    assert agent.prefetcher.get_stats()["hit_rate"] == 1.0
+
+    print("   ✅ Agent uses prefetched results")
+
+
+# =============================================================================
+# LATENCY MODEL TESTS (5 tests)
+# =============================================================================
+
+def train(model, tool, seconds, query, count=200):
+    """Feed a tool alternating +/-20% around a typical latency."""
+    for i in range(count):
+        model.observe_tool(tool, seconds * (1.2 if i % 2 else 0.8), query)
+
+
+def test_latency_model_learns_and_tracks_error():
+    """Test 25: Latency model learns per-query latency and tracks its error."""
+    print("\n📝 Test 25: Latency model")
+
+    model = LatencyModel(optimizer=QueryOptimizer())
+    cold = model.predict_tool("web_search", "what is rust")
+    assert cold["source"] == "prior" and cold["p50"] == QueryOptimizer.TOOL_TIME_ESTIMATES["web_search"]
+
+    quick, slow = "what is python", "find the class that loads `settings.py` in the code"
+    for _ in range(150):
+        model.observe_tool("web_search", 1.6, quick)
+        model.observe_tool("web_search", 2.4, quick)
+        model.observe_tool("web_search", 4.8, slow)
+        model.observe_tool("web_search", 7.2, slow)
+
+    quick_prediction = model.predict_tool("web_search", "what is a tuple")
+    slow_prediction = model.predict_tool("web_search", "find the function that parses `config.yaml` in the code")
+    assert quick_prediction["source"] == "model" and quick_prediction["samples"] == 600
+    assert 1.4 < quick_prediction["p50"] < 2.8 and quick_prediction["p90"] >= quick_prediction["p50"]
+    assert 4.0 < slow_prediction["p50"] < 8.0, "Query features should separate slow calls"
+
+    errors = model.get_error_stats()
+    assert errors["predictions"] == 600 - model.min_samples
+    assert errors["recent_mae"] < errors["mae"], "Error should fall as the model learns"
+    assert 0.6 < errors["keys"]["web_search"]["p90_coverage"] <= 1.0
+
+    # Round trip through the JSON file
+    tmp_dir = Path("./test_latency_model")
+    try:
+        model.path = tmp_dir / "model.json"
+        assert model.save()
+        loaded = LatencyModel(optimizer=QueryOptimizer(), path=str(model.path))
+        assert loaded.predict_tool("web_search", "what is a tuple") == quick_prediction
+        assert loaded.get_error_stats()["predictions"] == errors["predictions"]
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print("   ✅ Latency model learns and tracks error")
+
+
+def test_latency_driven_timeouts_and_estimates():
+    """Test 26: Learned latencies feed tool timeouts, estimates and route ETAs."""
+    print("\n📝 Test 26: Latency-driven timeouts and estimates")
+
+    from agent.parallel_executor import ParallelToolExecutor
+
+    optimizer = QueryOptimizer()
+    model = LatencyModel(optimizer=optimizer)
+    config = {"parallel_execution": {"timeout_per_tool": 30, "timeout_multiplier": 3.0, "min_timeout": 2}}
+    executor = ParallelToolExecutor({"web_search": lambda args: "ok"}, config, latency_model=model)
+
+    assert executor.get_timeout("web_search") == 30, "No data: configured timeout"
+    train(model, "web_search", 2.0, "python asyncio")
+    assert 6.0 < executor.get_timeout("web_search", {"query": "python asyncio"}) < 12.0
+    train(model, "web_search", 60.0, "python asyncio")
+    assert executor.get_timeout("web_search", {"query": "python asyncio"}) == 30, "Capped at timeout_per_tool"
+
+    samples = model.predict_tool("web_search")["samples"]
+    executor.execute_parallel([{"tool": "web_search", "args": {"query": "python asyncio"}}])
+    assert model.predict_tool("web_search")["samples"] == samples + 1, "Executions feed the model"
+    executor.shutdown()
+
+    # Optimizer estimates switch from constants to learned latency
+    query = "how does the cache eviction work in our project"
+    heuristic = optimizer.estimate_execution_time(query, ["web_search"])
+    optimizer.latency_model = model
+    assert optimizer.estimate_execution_time(query, ["web_search"]) == heuristic, "Prior until trained"
+    for _ in range(20):
+        model.observe_query(query, 12.0)
+    assert 8.0 < optimizer.estimate_execution_time(query, ["web_search"]) < 16.0
+
+    # Routes get ETAs once learned; savings use the query's predicted full-loop time
+    router = QueryRouter(optimizer=optimizer, latency_model=model)
+    decision = router.route("hello there")
+    assert decision.is_fast_path and decision.eta is None
+    for _ in range(20):
+        router.record_latency(ROUTE_FAST_PATH, 1.0, "hello there")
+    decision = router.route("hello there")
+    assert 0.5 < decision.eta < 2.0 and decision.eta_p90 >= decision.eta
+    assert router.route(query).eta > 8.0
+    assert 7.0 < router.estimate_savings(1.0, query) < 15.0
+    assert "latency_prediction" in router.get_stats()
+
+    print("   ✅ Timeouts, estimates and ETAs use learned latency")
+
+
+def test_analytics_latency_prediction():
+    """Test 27: PerformanceAnalytics fits the latency model on recorded metrics."""
+    print("\n📝 Test 27: Analytics latency prediction")
+
+    from agent.performance_analytics import PerformanceAnalytics
+
+    tmp_dir = Path("./test_latency_analytics")
+    try:
+        analytics = PerformanceAnalytics(storage_path=str(tmp_dir))
+        assert "estimated_time_p90" not in analytics.predict_performance("find the parser")
+
+        for i in range(30):
+            analytics.record_query(
+                query=f"find the parser function number {i}", query_type="medium",
+                response_time=8.0 if i % 2 else 12.0, tool_calls=["codebase_search"],
+                tool_times={"codebase_search": 1.5 if i % 2 else 2.5}
+            )
+
+        prediction = analytics.predict_performance("find the parser function")
+        assert 6.0 < prediction["estimated_time"] < 14.0
+        assert prediction["estimated_time_p90"] >= prediction["estimated_time"]
+        assert 1.0 < prediction["estimated_tool_times"]["codebase_search"] < 3.0
+
+        model = analytics.get_latency_model()
+        assert model.fit_metrics(analytics.metrics) == 0, "Metrics are fit once"
+        assert model.get_error_stats()["predictions"] > 0
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print("   ✅ Analytics predictions use the latency model")
+
+
+def test_timeout_backs_off_adaptive_timeouts():
+    """Test 28: A timed-out call restores the configured timeout until the p90 covers again."""
+    print("\n📝 Test 28: Timeouts back off adaptive timeouts")
+
+    from agent.parallel_executor import ParallelToolExecutor
+
+    release = threading.Event()
+
+    def stuck_search(args):
+        release.wait(10)
+        return "late"
+
+    model = LatencyModel(optimizer=QueryOptimizer())
+    config = {"parallel_execution": {"timeout_per_tool": 30, "timeout_multiplier": 3.0, "min_timeout": 0.1}}
+    executor = ParallelToolExecutor({"web_search": stuck_search}, config, latency_model=model)
+    args = {"query": "python asyncio"}
+
+    train(model, "web_search", 0.05, "python asyncio", count=50)
+    fast_timeout = executor.get_timeout("web_search", args)
+    assert fast_timeout < 1.0, "Trained on fast calls"
+
+    try:
+        results = executor._execute_independent_batch([{"tool": "web_search", "args": args}])
+    finally:
+        release.set()
+        executor.shutdown()
+
+    assert results["web_search"]["error"] == f"Timeout after {fast_timeout:g}s"
+    assert model.predict_tool("web_search")["samples"] == 51, "The timed-out call is observed"
+    assert model.recent_errors[-1]["actual"] >= fast_timeout and not model.recent_errors[-1]["covered"]
+    assert executor.get_timeout("web_search", args) == 30, "Configured timeout after a timeout"
+    assert model.get_stats()["models"]["web_search"]["recovering"]
+
+    # Adaptive again once the p90 covers the tool's calls
+    train(model, "web_search", 0.05, "python asyncio", count=model.min_samples + 1)
+    assert executor.get_timeout("web_search", args) < 30
+    assert not model.get_stats()["models"]["web_search"]["recovering"]
+
+    # The default (global) model follows query_optimization.latency_model
+    disabled = ParallelToolExecutor({}, {
+        "parallel_execution": {"timeout_per_tool": 30},
+        "optimization": {"query_optimization": {"latency_model": False}}
+    })
+    assert disabled.latency_model is None and disabled.get_timeout("web_search") == 30
+    disabled.shutdown()
+
+    print("   ✅ Timed-out calls restore the configured timeout")
+
+
+def test_latency_model_concurrent_saves():
+    """Test 29: Saves and error stats are safe while other threads observe."""
+    print("\n📝 Test 29: Concurrent latency model saves")
+
+    tmp_dir = Path("./test_latency_concurrent")
+    model = LatencyModel(optimizer=QueryOptimizer(), min_samples=1, path=str(tmp_dir / "model.json"))
+    stop = threading.Event()
+    failures = []
+
+    def observe(worker):
+        i = 0
+        while not stop.is_set():
+            # New keys grow the errors dict while savers serialize it
+            model.observe_tool(f"tool_{worker}_{i % 50}", 0.1 + i % 7, "python asyncio")
+            i += 1
+
+    def save():
+        try:
+            for _ in range(30):
+                assert model.save()
+                model.get_error_stats()
+        except Exception as e:
+            failures.append(e)
+
+    try:
+        observers = [threading.Thread(target=observe, args=(n,)) for n in range(2)]
+        savers = [threading.Thread(target=save) for _ in range(3)]
+        for thread in observers + savers:
+            thread.start()
+        for thread in savers:
+            thread.join()
+        stop.set()
+        for thread in observers:
+            thread.join()
+
+        assert not failures, f"Concurrent save failed: {failures[0]!r}"
+        assert [p.name for p in tmp_dir.iterdir()] == ["model.json"], "No temp files left behind"
+        loaded = LatencyModel(optimizer=QueryOptimizer(), path=str(tmp_dir / "model.json"))
+        assert loaded.get_stats()["models"]
+    finally:
+        stop.set()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    print("   ✅ Concurrent saves are consistent")
+
+
 def run_all_tests():
     """Run all optimization tests."""
     print("=" * 80)
     print("OPTIMIZATION TESTS")
     print("=" * 80)
-    print(f"Running {18} comprehensive tests...")
+    print(f"Running {36} comprehensive tests...")
 
     tests = [
         # Profiler tests (5)
@@ -481,6 +1120,34 @@ def run_all_tests():
 
         # Integration test (1)
         test_optimization_integration,
+
+        # Router tests (4)
+        test_router_fast_path,
+        test_fast_path_prompt,
+        test_router_tool_selection,
+        test_router_latency_stats,
+
+        # Resource profiling tests (3)
+        test_resource_component_accounting,
+        test_resource_process_profile,
+        test_resource_growth_alerts,
+
+        # Lazy loading tests (3)
+        test_lazy_component_builds_once,
+        test_lazy_registry_prewarm,
+        test_lazy_package_imports,
+
+        # Tool prefetch tests (3)
+        test_prefetch_predictions,
+        test_prefetch_run_hits_and_waste,
+        test_agent_uses_prefetch,
+
+        # Latency model tests (5)
+        test_latency_model_learns_and_tracks_error,
+        test_latency_driven_timeouts_and_estimates,
+        test_analytics_latency_prediction,
+        test_timeout_backs_off_adaptive_timeouts,
+        test_latency_model_concurrent_saves,
     ]
 
     passed = 0
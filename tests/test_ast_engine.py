@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared AST analysis engine.
+
+Tests cover:
+- One parse and one tree walk shared by chained code skills
+- Node index in ast.walk order, parents and per-function facts
+- Registered rules dispatched by node type; re-registration invalidating the cache
+- Syntax errors and LRU eviction
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.ast_engine import ASTEngine, engine
+from skills.code_explainer import CodeExplainerSkill
+from skills.code_reviewer import CodeReviewerSkill
+from skills.debugger import DebuggerAssistantSkill
+from skills.documentation_generator import DocumentationGeneratorSkill
+from skills.refactoring_engine import RefactoringEngineSkill
+from skills.test_generator import TestGeneratorSkill as GeneratorSkill
+
+SAMPLE = '''
+import os
+
+
+class Store:
+    def load(self, path):
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line and not line.startswith("#"):
+                        yield line
+
+
+def check(value):
+    def inner(x):
+        if x > 3 or x < -3:
+            raise ValueError("range")
+        return x
+    try:
+        return inner(value)
+    except ValueError:
+        raise
+'''
+
+
+def test_chained_skills_share_one_walk():
+    """Test six skills on the same code parse and walk it once."""
+    engine.clear_cache()
+    parses, walks = engine.parses, engine.walks
+
+    assert CodeReviewerSkill().execute({"code": SAMPLE})["success"]
+    assert CodeExplainerSkill().execute({"code": SAMPLE})["success"]
+    assert DebuggerAssistantSkill().execute({"code": SAMPLE})["success"]
+    assert DocumentationGeneratorSkill().execute({"doc_type": "docstring", "code": SAMPLE})["success"]
+    assert RefactoringEngineSkill().execute({"code": SAMPLE})["success"]
+    assert GeneratorSkill().execute({"code": SAMPLE})["success"]
+
+    assert (engine.parses - parses, engine.walks - walks) == (1, 1)
+    assert engine.get_stats()["cached"] == 1
+
+
+def test_large_file_reviewed_in_one_walk():
+    """Test reviewing a 5k-line file walks the tree once."""
+    code = "\n".join(
+        f"def handler_{i}(value):\n    if value > {i}:\n        return value\n    return {i}\n"
+        for i in range(1000)
+    )
+    assert len(code.split("\n")) >= 5000
+    engine.clear_cache()
+    walks = engine.walks
+
+    result = CodeReviewerSkill().execute({"code": code})
+    assert result["success"] and result["summary"]["by_category"]["style"] == 1000  # Type hints
+    assert engine.walks - walks == 1
+
+
+def test_node_index_and_function_facts():
+    """Test the index matches ast.walk and functions get their facts."""
+    analysis = ASTEngine().analyze(SAMPLE)
+    walked = list(ast.walk(ast.parse(SAMPLE)))
+
+    def lines(nodes):
+        return [(type(n).__name__, n.lineno) for n in nodes]
+
+    assert lines(analysis.of_type(ast.If)) == lines(n for n in walked if isinstance(n, ast.If))
+    mixed = analysis.of_type(ast.Import, ast.FunctionDef, ast.ClassDef)
+    assert lines(mixed) == lines(n for n in walked if isinstance(n, (ast.Import, ast.FunctionDef, ast.ClassDef)))
+
+    facts = {node.name: f for node, f in analysis.functions.items()}
+    assert facts["load"].max_depth == 4 and facts["load"].has_yield
+    assert facts["load"].complexity == 5  # if, for, if, and
+    assert facts["check"].max_depth == 1
+    assert facts["check"].complexity == 4 and facts["inner"].complexity == 3
+    assert [r.lineno for r in facts["check"].raises] == [17, 22]  # Includes the nested function
+    assert len(facts["check"].calls) == 2 and facts["inner"].has_return
+    assert analysis.complexity == 8  # Seven decision points
+
+    method = next(n for n in analysis.functions if n.name == "load")
+    assert isinstance(analysis.parent(method), ast.ClassDef)
+    assert [n.name for n in analysis.top_level_functions()] == ["check", "load"]
+
+
+def test_registered_rules():
+    """Test rules get dispatched per node type with scope, and can be replaced."""
+    test_engine = ASTEngine()
+    seen = []
+    test_engine.register(
+        "calls", [ast.Call],
+        lambda node, scope, analysis: analysis.facts["calls"].append((node.func.id, scope.depth,
+                                                                      len(scope.functions))),
+        init=lambda analysis: analysis.facts.setdefault("calls", [])
+    )
+    test_engine.register("names", [ast.Name, ast.arg], lambda node, scope, analysis: seen.append(node))
+
+    code = "def f(a):\n    if a:\n        g(a)\nh()"
+    analysis = test_engine.analyze(code)
+    assert analysis.facts["calls"] == [("h", 0, 0), ("g", 1, 1)]
+    assert len(seen) == 5  # arg a, Names h, a, g, a
+
+    # Cached until the rules change
+    assert test_engine.analyze(code) is analysis and test_engine.hits == 1
+    assert test_engine.unregister("names") and not test_engine.unregister("names")
+    assert test_engine.analyze(code) is not analysis
+    assert test_engine.get_stats()["rules"] == ["calls"]
+
+
+def test_syntax_errors_and_eviction():
+    """Test syntax errors are cached like analyses and old entries are dropped."""
+    test_engine = ASTEngine(cache_size=2)
+
+    broken = test_engine.analyze("def f(:\n")
+    assert not broken.ok and broken.error.lineno == 1
+    assert test_engine.analyze("def f(:\n") is broken and test_engine.parses == 1
+
+    test_engine.analyze("a = 1")
+    test_engine.analyze("b = 2")  # Evicts the broken code
+    test_engine.analyze("def f(:\n")
+    stats = test_engine.get_stats()
+    assert stats["parses"] == 4 and stats["cached"] == 2
+    assert stats["walks"] == 2  # Broken code isn't walked
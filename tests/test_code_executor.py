@@ -9,6 +9,7 @@ Tests all CodeExecutorTool functionality including:
 - Multi-line code execution
 - Output capture (stdout/stderr)
 - Execution time tracking
+- Sandbox worker pool (reuse, recycling, limits, isolation between runs)
 """
 
 import sys
@@ -21,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.config import Config
 from tools.code_executor import CodeExecutorTool, ImportValidator
+from tools.sandbox_pool import SandboxError, SandboxPool, SandboxTimeoutError
 from utils.logger import setup_logger
 from utils.formatting import *
 
@@ -44,6 +46,7 @@ def test_tool_initialization():
         console.print(f"  Max output length: {info['max_output_length']} chars")
         console.print(f"  Allowed imports: {len(info['allowed_imports'])} modules")
         console.print(f"  Blocked imports: {len(info['blocked_imports'])} modules")
+        assert info["sandbox_pool"] is None, "Pool should start on first execution"
 
         return tool
 
@@ -348,6 +351,127 @@ def test_missing_code_parameter(tool: CodeExecutorTool):
         return False
 
 
+def test_sandbox_pool_reuse():
+    """Test warm workers are reused, recycled and report latency stats."""
+    print_section("Test 11: Sandbox Pool Reuse")
+
+    pool = SandboxPool(size=1, max_runs=3, preload=["math"])
+    try:
+        results = [pool.execute(f"print({i} * 2)", timeout=5) for i in range(4)]
+        console.print(f"Outputs: {[r['stdout'].strip() for r in results]}")
+
+        assert [r["stdout"].strip() for r in results] == ["0", "2", "4", "6"]
+        assert all(r["returncode"] == 0 for r in results)
+
+        # Globals don't leak between runs in the same worker
+        pool.execute("leaked = 1", timeout=5)
+        assert "NameError" in pool.execute("print(leaked)", timeout=5)["stderr"]
+
+        stats = pool.get_stats()
+        console.print(f"Stats: {stats}")
+        assert stats["executions"] == 6
+        assert stats["recycled"] == 2  # Worker replaced after every 3 runs
+        assert stats["p50_ms"] > 0
+
+        print_success("✓ Workers reused and recycled")
+        return True
+
+    finally:
+        pool.shutdown()
+
+
+def test_sandbox_pool_isolation():
+    """Test module and sys state changed by one run don't reach the next."""
+    print_section("Test 13: Sandbox Pool Isolation")
+
+    pool = SandboxPool(size=1, max_runs=50, preload=["math"])
+    try:
+        pool.execute("import math, sys\nmath.pi = 3\nsys.setrecursionlimit(50)\n"
+                     "import builtins\nbuiltins.len = None", timeout=5)
+        result = pool.execute("import math, sys\nprint(math.pi, sys.getrecursionlimit(), len('ab'))",
+                              timeout=5)
+        console.print(f"Next run sees: {result['stdout'].strip()}")
+        assert result["returncode"] == 0, result["stderr"]
+        pi, limit, length = result["stdout"].split()
+        assert pi == "3.141592653589793" and int(limit) > 50 and length == "2"
+        assert pool.get_stats()["recycled"] == 0, "Same worker, no recycling needed"
+
+        # Same through the tool
+        tool = CodeExecutorTool(Config())
+        try:
+            tool._run(json.dumps({"code": "import math\nmath.pi = 3"}))
+            result = json.loads(tool._run(json.dumps({"code": "import math\nprint(math.pi)"})))
+            assert result["output"] == "3.141592653589793", result
+        finally:
+            tool.close()
+
+        print_success("✓ State doesn't leak between runs")
+        return True
+
+    finally:
+        pool.shutdown()
+
+
+def test_sandbox_pool_limits():
+    """Test timeouts and memory limits replace the worker."""
+    print_section("Test 12: Sandbox Pool Limits")
+
+    pool = SandboxPool(size=1, max_runs=50, memory_limit_mb=256)
+    try:
+        try:
+            pool.execute("while True:\n    pass", timeout=1)
+            assert False, "Infinite loop should time out"
+        except SandboxTimeoutError:
+            console.print("Infinite loop timed out")
+
+        result = pool.execute("data = bytearray(1024 ** 3)", timeout=5)
+        console.print(f"Oversized allocation: {result['stderr'].strip().splitlines()[-1]}")
+        assert result["returncode"] == 1 and "MemoryError" in result["stderr"]
+
+        # Pool keeps serving after both failures
+        assert pool.execute("print('ok')", timeout=5)["stdout"] == "ok\n"
+        stats = pool.get_stats()
+        assert stats["timeouts"] == 1 and stats["recycled"] == 2
+
+        print_success("✓ Limits enforced and workers replaced")
+        return True
+
+    finally:
+        pool.shutdown()
+
+
+def test_sandbox_pool_dead_worker():
+    """Test a dead worker is replaced, and SandboxError is raised when it can't be."""
+    print_section("Test 14: Sandbox Pool Dead Worker")
+
+    pool = SandboxPool(size=1, max_runs=50)
+    try:
+        # Replaced transparently
+        pool._workers[0].kill()
+        assert pool.execute("print('ok')", timeout=5)["stdout"] == "ok\n"
+
+        # Replacement fails: the documented error, not queue.Empty
+        pool._workers[0].kill()
+
+        def failing_spawn():
+            raise SandboxError("spawn failed")
+        pool._spawn = failing_spawn
+
+        start = time.time()
+        try:
+            pool.execute("print('ok')", timeout=0.5)
+            assert False, "No live worker should be available"
+        except SandboxError as e:
+            console.print(f"Raised: {e}")
+        assert time.time() - start < 2
+
+        print_success("✓ Dead workers replaced or reported")
+        return True
+
+    finally:
+        pool.shutdown()
+
+
 def main():
     """Run all tests."""
     print_header("🧪 Code Executor Tool Test Suite")
@@ -430,6 +554,34 @@ def main():
         tests_failed += 1
     console.print()
 
+    # Test 11: Sandbox pool reuse
+    if test_sandbox_pool_reuse():
+        tests_passed += 1
+    else:
+        tests_failed += 1
+    console.print()
+
+    # Test 12: Sandbox pool limits
+    if test_sandbox_pool_limits():
+        tests_passed += 1
+    else:
+        tests_failed += 1
+    console.print()
+
+    # Test 13: Sandbox pool isolation
+    if test_sandbox_pool_isolation():
+        tests_passed += 1
+    else:
+        tests_failed += 1
+    console.print()
+
+    # Test 14: Sandbox pool dead worker
+    if test_sandbox_pool_dead_worker():
+        tests_passed += 1
+    else:
+        tests_failed += 1
+    console.print()
+
     # Summary
     print_header("📊 Test Summary")
     console.print(f"✅ Tests passed: [green]{tests_passed}[/green]")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for the conversation full-text search index.
+
+Tests cover:
+- Indexing and ranked search with snippets
+- Role, source, session and date filters
+- Session replacement and deletion
+- Backfilling from session files (sync)
+- Incremental feeding from ConversationManager
+"""
+
+import sys
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.conversation_index import ConversationSearchIndex, SNIPPET_START, SNIPPET_END
+from core.conversation import ConversationManager
+
+
+class DictConfig:
+    """Minimal config exposing the dotted-key get() used by ConversationManager."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def create_test_index():
+    """Create search index with temporary storage."""
+    temp_dir = tempfile.mkdtemp()
+    return ConversationSearchIndex(str(Path(temp_dir) / "search_index.db")), Path(temp_dir)
+
+
+def sample_messages():
+    """Messages spanning two days and two roles."""
+    return [
+        {"role": "user", "content": "How do I configure the vector store?", "timestamp": "2026-03-01T09:00:00"},
+        {"role": "assistant", "content": "Set rag.vector_store in config.yaml", "timestamp": "2026-03-01T09:00:05"},
+        {"role": "user", "content": "The parser crashes on decorators", "timestamp": "2026-03-02T14:30:00"},
+    ]
+
+
+def test_search_ranked_with_snippets():
+    """Test basic search returns highlighted snippets."""
+    index, temp_dir = create_test_index()
+    try:
+        index.add_messages("cli", "session-a", sample_messages())
+        index.add_messages("cli", "session-b", [{"role": "user", "content": "unrelated", "timestamp": "2026-03-03"}])
+
+        hits = index.search("parser")
+        assert len(hits) == 1
+        assert hits[0].session_id == "session-a"
+        assert f"{SNIPPET_START}parser{SNIPPET_END}" in hits[0].snippet
+
+        # Query syntax characters are treated as plain words
+        assert index.search('vector "store') != []
+        assert index.search("***") == []
+    finally:
+        index.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_search_filters():
+    """Test role, source, session and date filters."""
+    index, temp_dir = create_test_index()
+    try:
+        index.add_messages("cli", "session-a", sample_messages())
+        index.add_messages("web", "session-w", [
+            {"role": "user", "content": "vector store on the web", "timestamp": "2026-03-05T10:00:00"}
+        ])
+
+        assert len(index.search("vector")) == 3
+        assert {h.role for h in index.search("vector", role="user")} == {"user"}
+        assert [h.source for h in index.search("vector", source="web")] == ["web"]
+        assert len(index.search("vector", session_id="session-a")) == 2
+        assert len(index.search("vector", since="2026-03-02")) == 1
+        # A bare date bound includes the whole day
+        assert len(index.search("vector", until="2026-03-01")) == 2
+    finally:
+        index.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_replace_and_delete_session():
+    """Test replacing and removing indexed sessions."""
+    index, temp_dir = create_test_index()
+    try:
+        index.add_messages("cli", "session-a", sample_messages())
+        index.add_messages("cli", "session-a", [{"role": "user", "content": "fresh start"}], replace=True)
+
+        assert index.search("parser") == []
+        assert len(index.search("fresh")) == 1
+
+        index.delete_session("cli", "session-a")
+        assert index.get_stats()["messages"] == 0
+    finally:
+        index.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_sync_files():
+    """Test backfilling from session files on disk."""
+    index, temp_dir = create_test_index()
+    try:
+        session_file = temp_dir / "session_1.json"
+        session_file.write_text(json.dumps({"id": "s1", "messages": sample_messages()}))
+
+        def reader(path):
+            data = json.loads(path.read_text())
+            return data["id"], data["messages"]
+
+        assert index.sync_files("cli", [session_file], reader) == 1
+        assert len(index.search("decorators")) == 1
+
+        # Unchanged files are skipped
+        assert index.sync_files("cli", [session_file], reader) == 0
+
+        # Removed files drop their session
+        session_file.unlink()
+        index.sync_files("cli", [], reader)
+        assert index.search("decorators") == []
+    finally:
+        index.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_conversation_manager_feeds_index():
+    """Test ConversationManager indexes messages as it persists them."""
+    temp_dir = tempfile.mkdtemp()
+    config = DictConfig({
+        "conversation.save_path": temp_dir,
+        "conversation.auto_save": True,
+        "conversation.flush_interval": 0.05,
+    })
+    try:
+        manager = ConversationManager(config)
+        manager.add_message("user", "explain the embedding cache")
+        manager.flush()
+
+        hits = manager.search_saved("embedding")
+        assert len(hits) == 1
+        assert hits[0]["session_id"] == manager.session_id
+
+        manager.clear()
+        manager.add_message("user", "something else")
+        manager.close()
+        assert manager.search_saved("embedding") == []
+
+        # A second manager finds the compacted session
+        other = ConversationManager(config)
+        assert other.search_saved("something")[0]["session_id"] == manager.session_id
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental conversation persistence.
+
+Tests cover:
+- Batched writes to the append-only session log
+- Compaction into a snapshot on close
+- Loading snapshots and session logs
+- Session index listing and lookup
+"""
+
+import sys
+import json
+import time
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.conversation import ConversationManager, SessionIndex
+
+
+class DictConfig:
+    """Minimal config exposing the dotted-key get() used by ConversationManager."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def create_test_manager(flush_interval=0.05):
+    """Create conversation manager with temporary storage."""
+    temp_dir = tempfile.mkdtemp()
+    config = DictConfig({
+        "conversation.save_path": temp_dir,
+        "conversation.auto_save": True,
+        "conversation.flush_interval": flush_interval,
+    })
+    return ConversationManager(config), config, Path(temp_dir)
+
+
+def session_logs(save_dir):
+    """Session logs in a save directory."""
+    return sorted(save_dir.glob("session_*.jsonl"))
+
+
+def test_messages_batched_into_log():
+    """Test that a burst of messages lands in a single session log."""
+    manager, _, save_dir = create_test_manager()
+    try:
+        for i in range(5):
+            manager.add_message("user", f"message {i}")
+        manager.flush()
+
+        logs = session_logs(save_dir)
+        assert len(logs) == 1
+
+        records = [json.loads(line) for line in logs[0].read_text().splitlines()]
+        assert records[0]["type"] == "session"
+        assert [r["content"] for r in records[1:]] == [f"message {i}" for i in range(5)]
+
+        # Later messages are appended, not rewritten
+        manager.add_message("assistant", "reply")
+        manager.flush()
+        assert len(logs[0].read_text().splitlines()) == 7
+    finally:
+        manager.close()
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+
+def test_close_compacts_log():
+    """Test that close() replaces the log with a snapshot."""
+    manager, config, save_dir = create_test_manager()
+    try:
+        manager.add_message("user", "hello")
+        manager.add_message("assistant", "hi")
+        snapshot = manager.close()
+
+        assert snapshot is not None and snapshot.suffix == ".json"
+        assert session_logs(save_dir) == []
+
+        restored = ConversationManager(config)
+        restored.load(snapshot)
+        assert restored.session_id == manager.session_id
+        assert [m.content for m in restored.messages] == ["hello", "hi"]
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+
+def test_load_session_log():
+    """Test recovering a session from an uncompacted log."""
+    manager, config, save_dir = create_test_manager()
+    try:
+        manager.add_message("user", "before clear")
+        manager.flush()
+        manager.clear()
+        manager.add_message("user", "after clear")
+        log_path = manager.flush()
+
+        restored = ConversationManager(config)
+        restored.load(log_path)
+        assert [m.content for m in restored.messages] == ["after clear"]
+
+        # Continuing the restored session appends to the same log
+        restored.add_message("assistant", "continued")
+        assert restored.flush() == log_path
+    finally:
+        manager.close()
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+
+def test_session_index():
+    """Test listing and finding sessions through the index."""
+    manager, config, save_dir = create_test_manager()
+    try:
+        manager.add_message("user", "first session")
+        first = manager.close()
+
+        other = ConversationManager(config)
+        other.add_message("user", "second session")
+        other.flush()
+
+        saved = manager.list_saved_conversations()
+        assert set(saved) == {first, other._log_path}
+        assert manager.find_saved_conversation(manager.session_id) == first
+
+        # A missing index is rebuilt from the session files
+        (save_dir / SessionIndex.FILENAME).unlink()
+        assert set(manager.list_saved_conversations()) == set(saved)
+
+        other.close()
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+
+def test_clear_without_messages_writes_nothing():
+    """Test that clearing an unsaved session creates no log."""
+    manager, _, save_dir = create_test_manager()
+    try:
+        manager.clear()
+        time.sleep(0.1)
+        assert session_logs(save_dir) == []
+        assert manager.close() is None
+    finally:
+        shutil.rmtree(save_dir, ignore_errors=True)
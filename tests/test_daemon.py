@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Tests for the background daemon and its thin client.
+
+Tests cover:
+- Ping/status over the Unix socket
+- Socket permissions set at bind time
+- Query results with streamed tool events
+- Serialized queries and conversation reset
+- Stale socket cleanup and refusing a second daemon
+- Thin client imports (no config or model imports)
+"""
+
+import os
+import sys
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.daemon import DaemonClient, DaemonError, DaemonNotRunningError, MetonDaemon
+from hooks import HookContext, HookManager, HookType
+
+
+class FakeConversation:
+    """Records clears."""
+
+    def __init__(self):
+        self.clears = 0
+
+    def clear(self):
+        self.clears += 1
+
+
+class FakeAgent:
+    """Runs a fake tool through the hook manager and echoes the query."""
+
+    def __init__(self, hook_manager, delay=0.0):
+        self.hook_manager = hook_manager
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    def run(self, query):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            self.hook_manager.execute(HookContext(HookType.PRE_TOOL, name="codebase_search"), "codebase_search")
+            time.sleep(self.delay)
+            self.hook_manager.execute(
+                HookContext(HookType.POST_TOOL, name="codebase_search", duration_seconds=0.5),
+                "codebase_search"
+            )
+            if query == "fail":
+                raise RuntimeError("model unavailable")
+            return {"success": True, "output": f"answer: {query}", "iterations": 1,
+                    "tool_calls": [{"tool": "codebase_search"}]}
+        finally:
+            self.running -= 1
+
+
+class FakeSearchTool:
+    """Counts index reloads."""
+
+    def __init__(self):
+        self.reloads = 0
+
+    def reload_index(self):
+        self.reloads += 1
+        return True
+
+
+class FakeCLI:
+    """Minimal stand-in for an initialized MetonCLI."""
+
+    def __init__(self, delay=0.0):
+        self.hook_manager = HookManager()
+        self.agent = FakeAgent(self.hook_manager, delay)
+        self.conversation = FakeConversation()
+        self.codebase_search_tool = FakeSearchTool()
+
+
+@pytest.fixture
+def socket_dir():
+    path = Path(tempfile.mkdtemp(prefix="meton"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def start_daemon(socket_dir, delay=0.0):
+    """Start a daemon with a fake CLI on a temporary socket."""
+    cli = FakeCLI(delay)
+    daemon = MetonDaemon(cli, socket_path=str(socket_dir / "d.sock"))
+    daemon.start()
+    return daemon, cli, DaemonClient(str(daemon.socket_path), timeout=10)
+
+
+def test_ping_status_and_reload(socket_dir):
+    """Test the daemon answers control requests."""
+    daemon, cli, client = start_daemon(socket_dir)
+    try:
+        assert client.is_running()
+        assert oct(daemon.socket_path.stat().st_mode & 0o777) == "0o600"
+
+        status = client.status()
+        assert status["queries_served"] == 0 and status["busy"] is False
+        assert status["socket"] == str(daemon.socket_path)
+
+        assert client.reload() is True
+        assert cli.codebase_search_tool.reloads == 1
+    finally:
+        daemon.stop()
+
+    assert not daemon.socket_path.exists()
+    assert not client.is_running()
+    with pytest.raises(DaemonNotRunningError):
+        client.query("hello")
+
+
+def test_socket_private_from_bind(socket_dir, monkeypatch):
+    """Test the socket is owner-only as soon as it's bound, whatever the umask."""
+    from core import daemon as daemon_module
+
+    modes = []
+    original_bind = daemon_module._UnixServer.server_bind
+
+    def recording_bind(server):
+        original_bind(server)
+        modes.append(Path(server.server_address).stat().st_mode & 0o777)
+
+    monkeypatch.setattr(daemon_module._UnixServer, "server_bind", recording_bind)
+    old_umask = os.umask(0o022)
+    try:
+        daemon, _, client = start_daemon(socket_dir)
+        try:
+            assert modes == [0o600]
+            assert os.umask(0o022) == 0o022  # Restored after bind
+            assert client.is_running()
+        finally:
+            daemon.stop()
+    finally:
+        os.umask(old_umask)
+
+
+def test_query_streams_tool_events(socket_dir):
+    """Test queries stream tool events before the result."""
+    daemon, cli, client = start_daemon(socket_dir)
+    try:
+        events = []
+        result = client.query("where is config loaded?", on_event=events.append)
+
+        assert result["success"] and result["output"] == "answer: where is config loaded?"
+        assert result["tool_calls"] == 1
+        assert [e["event"] for e in events] == ["started", "tool_start", "tool_end"]
+        assert events[2] == {"event": "tool_end", "name": "codebase_search",
+                             "success": True, "duration": 0.5}
+        assert cli.conversation.clears == 1
+
+        client.query("follow up", reset=False)
+        assert cli.conversation.clears == 1
+
+        with pytest.raises(DaemonError, match="model unavailable"):
+            client.query("fail")
+        with pytest.raises(DaemonError, match="empty"):
+            client.query("   ")
+        assert client.status()["queries_served"] == 3
+    finally:
+        daemon.stop()
+
+    # Stream hooks are removed with the daemon
+    assert not cli.hook_manager.list_hooks(HookType.PRE_TOOL)
+
+
+def test_queries_are_serialized(socket_dir):
+    """Test concurrent clients queue instead of running the agent in parallel."""
+    daemon, cli, client = start_daemon(socket_dir, delay=0.2)
+    try:
+        events, results = [], []
+
+        def ask(query):
+            results.append(client.query(query, on_event=events.append))
+
+        threads = [threading.Thread(target=ask, args=(f"q{i}",)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert len(results) == 3 and all(r["success"] for r in results)
+        assert cli.agent.max_running == 1
+        assert any(e["event"] == "queued" for e in events)
+    finally:
+        daemon.stop()
+
+
+def test_stale_socket_and_second_daemon(socket_dir):
+    """Test stale sockets are replaced but a live daemon isn't."""
+    stale = socket_dir / "d.sock"
+    stale.touch()
+
+    daemon, _, client = start_daemon(socket_dir)
+    try:
+        assert client.is_running()
+        with pytest.raises(DaemonError, match="already running"):
+            MetonDaemon(FakeCLI(), socket_path=str(stale)).start()
+        client.shutdown()
+        daemon.wait()
+    finally:
+        daemon.stop()
+    assert not stale.exists()
+
+
+def test_thin_client_imports():
+    """Test meton.py imports nothing heavy before deciding to use the daemon."""
+    root = Path(__file__).parent.parent
+    code = (
+        "import sys; import meton; "
+        "print(sorted(m for m in ('pydantic', 'langchain_core', 'core.config', 'yaml') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=root,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
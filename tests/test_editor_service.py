@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Tests for the editor completion/hover service.
+
+Tests cover:
+- One model call per completion, fences stripped, LRU cache
+- Newer requests superseding (and closing) older model streams
+- Hovers answered from the symbol index without the model
+- Latency percentiles and the /complete, /hover and /status endpoints
+- The model is verified once, not per request
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.editor import EditorService, EditorServiceError, percentile
+
+
+class FakeModel:
+    """Streams canned replies and records prompts and closed streams."""
+
+    def __init__(self, reply="return a + b"):
+        self.reply = reply
+        self.prompts = []
+        self.closed = 0
+        self.gate = None  # Event the stream waits on after its first chunk
+        self.started = threading.Event()
+
+    def __call__(self, prompt, max_tokens, stop):
+        self.prompts.append(prompt)
+        return self._stream()
+
+    def _stream(self):
+        try:
+            chunks = self.reply if isinstance(self.reply, list) else [self.reply]
+            for i, chunk in enumerate(chunks):
+                yield chunk
+                if i == 0 and self.gate:
+                    self.started.set()
+                    self.gate.wait(5)
+        finally:
+            self.closed += 1
+
+
+def test_completion_and_cache():
+    """Test completions make one model call and repeat requests hit the cache."""
+    model = FakeModel(["```python\n", "return a + b\n", "```"])
+    service = EditorService(model, cache_size=2)
+
+    result = service.complete("def add(a, b):\n    ", language="python", file_hash="h1")
+    assert result["items"] == ["return a + b"]
+    assert not result["cached"] and not result["cancelled"]
+    assert "<CURSOR>" in model.prompts[0] and len(model.prompts) == 1
+
+    assert service.complete("def add(a, b):\n    ", language="python", file_hash="h1")["cached"]
+    assert not service.complete("def add(a, b):\n    ", language="python", file_hash="h2")["cached"]
+    service.complete("x = ", language="python", file_hash="h3")  # Evicts the oldest entry
+    assert not service.complete("def add(a, b):\n    ", language="python", file_hash="h1")["cached"]
+    assert len(model.prompts) == 4
+
+    stats = service.get_stats()
+    assert stats["complete"]["requests"] == 5 and stats["complete"]["cache_hits"] == 1
+    assert stats["cache_entries"] == 2
+
+
+def test_newer_request_cancels_older():
+    """Test a newer request from the same client stops the older model stream."""
+    model = FakeModel(["first ", "chunk"])
+    model.gate = threading.Event()
+    service = EditorService(model)
+    results = {}
+
+    thread = threading.Thread(target=lambda: results.setdefault("old", service.complete("a", client_id="c1")))
+    thread.start()
+    assert model.started.wait(5)
+
+    model.gate.set()
+    model.gate = None
+    results["new"] = service.complete("ab", client_id="c1")
+    thread.join(5)
+
+    assert results["old"]["cancelled"] and results["old"]["items"] == []
+    assert results["new"]["items"] == ["first chunk"] and not results["new"]["cancelled"]
+    assert model.closed == 2
+    assert service.get_stats()["complete"]["cancelled"] == 1
+
+    # Other clients don't cancel each other
+    assert not service.complete("zzz", client_id="c2")["cancelled"]
+
+
+def test_hover_symbols_and_model():
+    """Test known definitions skip the model and unknown words ask it."""
+    model = FakeModel("Sums two numbers.")
+    definitions = {"add": [{"name": "add", "signature": "def add(a, b)", "docstring": "Add numbers.",
+                            "file": "calc.py", "line": 3}]}
+    service = EditorService(model, symbol_lookup=lambda word: definitions.get(word, []))
+
+    hover = service.hover("add", line="total = add(1, 2)", language="python")
+    assert hover["source"] == "symbols" and model.prompts == []
+    assert "def add(a, b)" in hover["contents"] and "calc.py:3" in hover["contents"]
+
+    hover = service.hover("total", line="total = add(1, 2)", language="python")
+    assert hover["source"] == "model" and hover["contents"] == "Sums two numbers."
+    assert service.hover("total", line="total = add(1, 2)", language="python")["cached"]
+    assert service.hover("add", use_symbols=False)["source"] == "model"
+
+    stats = service.get_stats()["hover"]
+    assert stats["requests"] == 4 and stats["symbol_hits"] == 1
+    assert stats["p50_ms"] is not None and stats["p95_ms"] >= stats["p50_ms"]
+
+
+def test_model_errors_and_percentiles():
+    """Test model failures raise and percentiles use nearest rank."""
+    def failing(prompt, max_tokens, stop):
+        raise ConnectionError("ollama down")
+
+    service = EditorService(failing)
+    with pytest.raises(EditorServiceError, match="ollama down"):
+        service.complete("x")
+    assert service.get_stats()["complete"]["errors"] == 1
+
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50 and percentile(samples, 95) == 95
+    assert percentile([7.0], 95) == 7.0 and percentile([], 50) is None
+
+
+def test_endpoints():
+    """Test /complete, /hover and /status without starting the agent."""
+    from fastapi.testclient import TestClient
+    import api.server as server
+
+    client = TestClient(server.app)
+    server.editor = None
+    assert client.post("/complete", json={"prefix": "x"}).status_code == 503
+
+    server.editor = EditorService(FakeModel("pass"))
+    try:
+        response = client.post("/complete", json={"prefix": "def f():\n    ", "language": "python"})
+        assert response.status_code == 200 and response.json()["items"] == ["pass"]
+        response = client.post("/hover", json={"word": "f", "line": "f()"})
+        assert response.json()["source"] == "model"
+
+        editor_stats = client.get("/status").json()["editor"]
+        assert editor_stats["complete"]["requests"] == 1
+        assert editor_stats["complete"]["p95_ms"] is not None
+
+        server.editor = EditorService(lambda *args: iter(()).throw(RuntimeError("boom")))
+        assert client.post("/complete", json={"prefix": "x"}).status_code == 502
+    finally:
+        server.editor = None
+
+
+def test_model_verified_once(monkeypatch):
+    """Test the service checks the model at startup, not on every request."""
+    import core.models
+    from types import SimpleNamespace
+    import api.server as server
+
+    calls = {"list": 0, "generate": []}
+
+    def fake_list():
+        calls["list"] += 1
+        return SimpleNamespace(models=[SimpleNamespace(model="quick-model:7b")])
+
+    def fake_generate(model, prompt, options, stream=False):
+        calls["generate"].append((model, options["num_predict"]))
+        return iter([{"response": "pass"}])
+
+    monkeypatch.setattr(core.models.ollama, "list", fake_list)
+    monkeypatch.setattr(core.models.ollama, "generate", fake_generate)
+    # The stub config has no model settings to merge
+    monkeypatch.setattr(core.models.ModelManager, "_get_model_options", lambda self, options=None: dict(options or {}))
+
+    loader = SimpleNamespace(
+        config=SimpleNamespace(editor=SimpleNamespace(
+            model="quick", hover_symbols=False, cache_size=8,
+            completion_max_tokens=16, hover_max_tokens=32
+        )),
+        get=lambda key: {"models.primary": "big-model", "models.quick": "quick-model:7b"}.get(key)
+    )
+
+    editor = server.create_editor_service(loader)
+    startup_lists = calls["list"]
+    for i in range(3):
+        assert editor.complete(f"def f{i}():\n    ", language="python")["items"] == ["pass"]
+
+    assert calls["list"] == startup_lists, "No ollama.list() per request"
+    assert calls["generate"] == [("quick-model:7b", 16)] * 3
+
+    # A missing model fails at startup instead of on every request
+    loader.config.editor.model = "missing-model"
+    with pytest.raises(core.models.ModelNotFoundError):
+        server.create_editor_service(loader)
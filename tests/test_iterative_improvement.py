@@ -10,25 +10,32 @@ Tests the iterative improvement capabilities including:
 - Improvement tracking
 - Statistics calculation
 - Error handling
+- Combined reflect + improve generations and the time budget
 - Edge cases
 """
 
+import json
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agent.iterative_improvement import IterativeImprovementLoop, IterationRecord, ImprovementSession
+from agent.iterative_improvement import (
+    IterativeImprovementLoop, IterationRecord, ImprovementSession, QualityBudget
+)
+from core.models import ModelManager
 
 
 def create_mock_dependencies():
     """Create mock dependencies for testing."""
     # Mock ModelManager
-    mock_model_manager = Mock()
+    mock_model_manager = Mock(spec=ModelManager)
     mock_llm = Mock()
-    mock_model_manager.get_model = Mock(return_value=mock_llm)
+    mock_model_manager.get_llm = Mock(return_value=mock_llm)
+    mock_model_manager.resolve_alias = Mock(side_effect=lambda alias: f"{alias}-model")
 
     # Mock SelfReflectionModule
     mock_reflection = Mock()
@@ -141,8 +148,7 @@ def test_single_iteration_improvement():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM improvement
-    llm_response = Mock()
-    llm_response.content = "Improved response with more detail"
+    llm_response = "Improved response with more detail"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -181,8 +187,7 @@ def test_multi_iteration_improvement():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM improvement
-    llm_response = Mock()
-    llm_response.content = "Improved response"
+    llm_response = "Improved response"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -221,8 +226,7 @@ def test_max_iterations_reached():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM improvement
-    llm_response = Mock()
-    llm_response.content = "Slightly improved"
+    llm_response = "Slightly improved"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -257,8 +261,7 @@ def test_quality_threshold_reached():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM
-    llm_response = Mock()
-    llm_response.content = "Improved"
+    llm_response = "Improved"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -295,8 +298,7 @@ def test_convergence_detection():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM
-    llm_response = Mock()
-    llm_response.content = "Improved"
+    llm_response = "Improved"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -382,8 +384,7 @@ def test_quality_decline_reverts():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM
-    llm_response = Mock()
-    llm_response.content = "Improved (or not)"
+    llm_response = "Improved (or not)"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -418,8 +419,7 @@ def test_no_issues_stops_iteration():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM
-    llm_response = Mock()
-    llm_response.content = "Improved"
+    llm_response = "Improved"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -482,8 +482,7 @@ def test_improvement_tracking():
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
     # Mock LLM
-    llm_response = Mock()
-    llm_response.content = "Improved"
+    llm_response = "Improved"
     llm.invoke = Mock(return_value=llm_response)
 
     query = "Test query"
@@ -544,8 +543,7 @@ def test_get_improvement_stats_with_data():
         ]
         reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
-        llm_response = Mock()
-        llm_response.content = "Improved"
+        llm_response = "Improved"
         llm.invoke = Mock(return_value=llm_response)
 
         loop.iterate_until_satisfied("Query", "Response", {})
@@ -584,8 +582,7 @@ def test_sessions_by_iterations_distribution():
         {"quality_score": 0.88, "issues": [], "suggestions": [], "should_improve": False}
     ]
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
-    llm_response = Mock()
-    llm_response.content = "Improved"
+    llm_response = "Improved"
     llm.invoke = Mock(return_value=llm_response)
     loop.iterate_until_satisfied("Query2", "Good response", {})
 
@@ -731,8 +728,7 @@ def test_max_improvement_stat():
     ]
     reflection.reflect_on_response = Mock(side_effect=reflection_responses)
 
-    llm_response = Mock()
-    llm_response.content = "Much improved"
+    llm_response = "Much improved"
     llm.invoke = Mock(return_value=llm_response)
 
     loop.iterate_until_satisfied("Query", "Response", {})
@@ -746,6 +742,269 @@ def test_max_improvement_stat():
     print(f"  Max improvement: +{stats['max_improvement']:.2f}")
 
 
+def combined_output(score, issues, improved=""):
+    """Build a combined scoring + improvement LLM output."""
+    return json.dumps({
+        "quality_score": score,
+        "issues": issues,
+        "suggestions": ["fix"] if issues else [],
+        "improved_response": improved
+    })
+
+
+def test_combined_generation_saves_calls():
+    """Test scoring and improving in one generation halves the LLM calls."""
+    print("\n" + "=" * 70)
+    print("TEST: Combined Reflect + Improve")
+    print("=" * 70)
+
+    model_manager, llm, reflection, config = create_mock_dependencies()
+    loop = IterativeImprovementLoop(model_manager, reflection, config)
+
+    # Drafts with braces survive parsing
+    llm.invoke = Mock(side_effect=[
+        combined_output(0.55, ["incomplete_answer"], "def f():\n    return {'a': 1}"),
+        combined_output(0.70, ["missing_code"], "Draft 2"),
+        combined_output(0.80, ["too_verbose"], "Draft 3"),
+        combined_output(0.90, [], "Unused draft"),
+    ])
+    reflection.reflect_on_response = Mock()
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    assert result["iterations"] == 3 and result["final_response"] == "Draft 3"
+    assert result["final_score"] == 0.90
+    assert result["improvement_path"][1]["quality_score"] == 0.70
+    # 4 combined calls (the last one only scores), vs 1 + 2 * 3 separate calls
+    assert llm.invoke.call_count == 4 and not reflection.reflect_on_response.called
+    model_manager.resolve_alias.assert_called_with("primary")
+    model_manager.get_llm.assert_called_with("primary-model")
+
+    stages = result["stages"]
+    assert stages["combined"]["calls"] == 4 and stages["combined"]["tokens"] > 0
+    assert set(stages) == {"combined"} and not result["budget_exhausted"]
+
+    print("✓ Combined generation used")
+    print(f"  Stages: {stages}")
+
+
+def test_combined_falls_back_to_separate_calls():
+    """Test unparseable combined output switches to reflect/improve calls."""
+    print("\n" + "=" * 70)
+    print("TEST: Combined Fallback")
+    print("=" * 70)
+
+    model_manager, llm, reflection, config = create_mock_dependencies()
+    loop = IterativeImprovementLoop(model_manager, reflection, config)
+
+    reflection.reflect_on_response = Mock(side_effect=[
+        {"quality_score": 0.60, "issues": ["unclear_explanation"], "suggestions": ["clarify"]},
+        {"quality_score": 0.90, "issues": [], "suggestions": []},
+    ])
+    plain = "Plain improved response"
+    llm.invoke = Mock(return_value=plain)
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    assert result["final_response"] == "Plain improved response"
+    assert result["final_score"] == 0.90
+    assert set(result["stages"]) == {"combined", "reflect", "improve"}
+    assert result["stages"]["combined"]["calls"] == 1  # Not retried after the failure
+    # Scoring stays on the loop's model after the fallback
+    for call in reflection.reflect_on_response.call_args_list:
+        assert call.kwargs["model"] == "primary"
+
+    print("✓ Fell back to separate calls")
+
+
+def test_one_scorer_per_session():
+    """Test every step of a session is scored by the same prompt and model."""
+    print("\n" + "=" * 70)
+    print("TEST: One Scorer Per Session")
+    print("=" * 70)
+
+    # Combined: the last step is scored by the combined generation too
+    model_manager, llm, reflection, config = create_mock_dependencies()
+    config["max_iterations"] = 2
+    loop = IterativeImprovementLoop(model_manager, reflection, config)
+    llm.invoke = Mock(side_effect=[
+        combined_output(0.50, ["incomplete_answer"], "Draft 1"),
+        combined_output(0.60, ["missing_code"], "Draft 2"),
+        combined_output(0.55, ["too_verbose"], "Unused draft"),
+    ])
+    reflection.reflect_on_response = Mock()
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    scorers = [step["scorer"] for step in result["improvement_path"]]
+    assert scorers == ["combined:primary", "combined:primary"]
+    # The decline at the last step was judged by the same scorer and reverted
+    assert result["final_response"] == "Draft 1" and result["final_score"] == 0.60
+    assert not reflection.reflect_on_response.called
+
+    # Separate calls: every step uses the reflection module's own model
+    model_manager, llm, reflection, config = create_mock_dependencies()
+    config.update({"max_iterations": 2, "combined": False})
+    loop = IterativeImprovementLoop(model_manager, reflection, config)
+    scores = iter([0.5, 0.6, 0.7])
+    reflection.reflect_on_response = Mock(side_effect=lambda *args, **kwargs: {
+        "quality_score": next(scores), "issues": ["issue"], "suggestions": []
+    })
+    plain = "Improved"
+    llm.invoke = Mock(return_value=plain)
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    scorers = [step["scorer"] for step in result["improvement_path"]]
+    assert scorers == ["reflect", "reflect", "reflect"]
+    assert all(call.kwargs["model"] is None for call in reflection.reflect_on_response.call_args_list)
+
+    print("✓ One scorer per session")
+
+
+class StubLLM:
+    """OllamaLLM stand-in: invoke() returns text."""
+
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+
+    def invoke(self, prompt):
+        return self.outputs.pop(0)
+
+
+class StubModelManager:
+    """ModelManager stand-in with only the methods ModelManager has."""
+
+    def __init__(self, llm):
+        self.llm = llm
+        self.requested = []
+
+    def resolve_alias(self, alias):
+        return {"primary": "big-model", "quick": "small-model"}.get(alias, alias)
+
+    def get_llm(self, model_name=None):
+        self.requested.append(model_name)
+        return self.llm
+
+
+def test_model_manager_interface():
+    """Test the loop works with ModelManager's get_llm()/resolve_alias() and text output."""
+    print("\n" + "=" * 70)
+    print("TEST: ModelManager Interface")
+    print("=" * 70)
+
+    from agent.self_reflection import SelfReflectionModule
+
+    llm = StubLLM([
+        combined_output(0.50, ["incomplete_answer"], "Draft 1"),
+        combined_output(0.90, [], ""),
+    ])
+    model_manager = StubModelManager(llm)
+    reflection = SelfReflectionModule(model_manager, {})
+    loop = IterativeImprovementLoop(model_manager, reflection, {"max_iterations": 2})
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    assert result["final_response"] == "Draft 1" and result["final_score"] == 0.90
+    assert [step["scorer"] for step in result["improvement_path"]] == ["combined:primary"] * 2
+    assert model_manager.requested == ["big-model", "big-model"]
+    assert result["stages"]["combined"]["tokens"] > 0
+
+    # Reflection and its improvement use the same interface
+    llm.outputs = ['{"quality_score": 0.6, "issues": ["too_verbose"], "suggestions": []}', " Shorter "]
+    scored = reflection.reflect_on_response("Test query", "Response", {})
+    assert scored["quality_score"] == 0.6 and model_manager.requested[-1] == "small-model"
+    assert reflection.improve_response("Test query", "Response", scored) == "Shorter"
+
+    print("✓ get_llm() with resolved aliases and text output")
+
+
+def test_session_recorded_in_analytics():
+    """Test a finished session is recorded in analytics with its stages."""
+    print("\n" + "=" * 70)
+    print("TEST: Session Recorded in Analytics")
+    print("=" * 70)
+
+    import shutil
+    import tempfile
+    from agent.performance_analytics import PerformanceAnalytics
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        analytics = PerformanceAnalytics(storage_path=temp_dir)
+        model_manager, llm, reflection, config = create_mock_dependencies()
+        loop = IterativeImprovementLoop(model_manager, reflection, config, analytics=analytics)
+        llm.invoke = Mock(side_effect=[
+            combined_output(0.50, ["incomplete_answer"], "Draft 1"),
+            combined_output(0.90, [], ""),
+        ])
+
+        context = {"tool_calls": [{"tool": "codebase_search"}], "query_type": "medium"}
+        result = loop.iterate_until_satisfied("Test query", "Initial", context)
+
+        metric = analytics.metrics[-1]
+        assert metric.query == "Test query" and metric.query_type == "medium"
+        assert metric.tool_calls == ["codebase_search"] and metric.iterations == 1
+        assert metric.reflection_score == 0.90 and metric.stages == result["stages"]
+        assert analytics.get_dashboard()["stages"]["combined"]["calls"] == 2
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    print("✓ Stages recorded")
+
+
+def test_time_budget_stops_loop():
+    """Test the loop stops before a step that would overrun the time budget."""
+    print("\n" + "=" * 70)
+    print("TEST: Time Budget")
+    print("=" * 70)
+
+    model_manager, llm, reflection, config = create_mock_dependencies()
+    config.update({"time_budget": 0.22, "combined": False})
+    loop = IterativeImprovementLoop(model_manager, reflection, config)
+    scores = iter([0.5, 0.6, 0.7])
+
+    def slow_reflect(query, response, context, model=None):
+        time.sleep(0.05)
+        return {"quality_score": next(scores), "issues": ["issue"], "suggestions": []}
+    reflection.reflect_on_response = Mock(side_effect=slow_reflect)
+
+    def slow_improve(prompt):
+        time.sleep(0.05)
+        message = "Improved"
+        return message
+    llm.invoke = Mock(side_effect=slow_improve)
+
+    result = loop.iterate_until_satisfied("Test query", "Initial", {})
+
+    # Reflect + improve + reflect = 0.15s: another improve + reflect would end at 0.25s
+    assert result["budget_exhausted"] and result["iterations"] == 1
+    assert result["elapsed"] < 0.25
+    assert loop.improvement_history[-1].budget_exhausted
+
+    print("✓ Budget stopped the loop")
+    print(f"  Elapsed: {result['elapsed']:.2f}s")
+
+
+def test_quality_budget_accounting():
+    """Test QualityBudget sums stages and estimates the next step."""
+    print("\n" + "=" * 70)
+    print("TEST: QualityBudget")
+    print("=" * 70)
+
+    budget = QualityBudget(time_budget=10.0)
+    budget.record("reflect", 1.0, 200)
+    budget.record("reflect", 3.0, 300)
+    budget.record("improve", 2.0, 900)
+
+    assert budget.to_dict()["reflect"] == {"calls": 2, "seconds": 4.0, "tokens": 500}
+    assert not budget.exhausted(4)  # ~0s elapsed + 4 calls * 2s = 8s
+    assert budget.exhausted(6)  # 12s > 10s
+    assert not QualityBudget(0).exhausted(1000)  # Unlimited
+
+    print("✓ Budget accounting correct")
+
+
 def run_all_tests():
     """Run all tests and report results."""
     print("\n" + "=" * 80)
@@ -775,6 +1034,13 @@ def run_all_tests():
         ("String Representation", test_repr),
         ("Error Handling", test_error_handling_in_improvement),
         ("Max Improvement Stat", test_max_improvement_stat),
+        ("Combined Reflect + Improve", test_combined_generation_saves_calls),
+        ("Combined Fallback", test_combined_falls_back_to_separate_calls),
+        ("One Scorer Per Session", test_one_scorer_per_session),
+        ("ModelManager Interface", test_model_manager_interface),
+        ("Session in Analytics", test_session_recorded_in_analytics),
+        ("Time Budget", test_time_budget_stops_loop),
+        ("QualityBudget", test_quality_budget_accounting),
     ]
 
     passed = 0
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Tests for the queue-based logging backend.
+
+Tests cover:
+- Records written by the background listener, not the caller
+- JSON-lines format with per-query correlation ids
+- DEBUG sampling and rate limiting
+- Records propagated from child loggers
+- Synchronous fallback and once-per-process log cleanup
+"""
+
+import json
+import logging
+import sys
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.logger import flush_logs, get_log_backend, get_query_id, query_context, setup_logger
+
+
+@pytest.fixture
+def log_dir():
+    path = Path(tempfile.mkdtemp(prefix="meton_logs"))
+    yield path
+    get_log_backend().configure(0.0, 1.0)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def read_lines(log_dir, name):
+    flush_logs()
+    [log_file] = list(log_dir.glob(f"{name}_*.log"))
+    return log_file.read_text().splitlines()
+
+
+def make_logger(log_dir, name, **config):
+    settings = {"log_dir": str(log_dir), "level": "DEBUG", "console_output": False, "format": "json"}
+    settings.update(config)
+    return setup_logger(name=name, config=settings)
+
+
+def test_json_lines_with_query_ids(log_dir):
+    """Test records are written off-thread as JSON with the active query id."""
+    logger = make_logger(log_dir, "meton_test_json")
+
+    logger.info("before")
+    with query_context() as query_id:
+        logger.warning("inside")
+        with query_context():
+            assert get_query_id() == query_id  # Nested work keeps the id
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+    assert get_query_id() is None
+
+    entries = [json.loads(line) for line in read_lines(log_dir, "meton_test_json")]
+    assert [e["message"] for e in entries] == ["before", "inside", "failed"]
+    assert entries[0]["query_id"] is None
+    assert entries[1]["query_id"] == entries[2]["query_id"] == query_id
+    assert entries[1]["level"] == "WARNING" and entries[1]["func"] == "test_json_lines_with_query_ids"
+    assert "ValueError: boom" in entries[2]["exception"]
+    assert all(e["thread"] == threading.current_thread().name for e in entries)
+    assert get_log_backend().get_stats()["running"]
+
+
+def test_text_format_tags_queries(log_dir):
+    """Test the text format carries the query tag and no Rich markup."""
+    logger = make_logger(log_dir, "meton_test_text", format="text")
+    with query_context("abc123"):
+        logger.info("tagged")
+    logger.info("plain")
+
+    tagged, plain = read_lines(log_dir, "meton_test_text")
+    assert tagged.endswith("- [q:abc123] tagged")
+    assert plain.endswith("- plain") and "[green]" not in plain
+
+
+def test_debug_rate_limit_and_sampling(log_dir):
+    """Test hot-path DEBUG records are limited while other levels pass."""
+    logger = make_logger(log_dir, "meton_test_rate", debug_rate_limit=5)
+    suppressed = get_log_backend().get_stats()["debug_suppressed"]
+    for i in range(100):
+        logger.debug(f"step {i}")
+    logger.error("still logged")
+
+    messages = [json.loads(line)["message"] for line in read_lines(log_dir, "meton_test_rate")]
+    assert 5 <= len(messages) - 1 <= 7
+    assert messages[-1] == "still logged"
+    assert get_log_backend().get_stats()["debug_suppressed"] - suppressed >= 93
+
+    sampled = make_logger(log_dir, "meton_test_sample", debug_rate_limit=0, debug_sample_rate=0.25)
+    for i in range(20):
+        sampled.debug(f"step {i}")
+    messages = [json.loads(line)["message"] for line in read_lines(log_dir, "meton_test_sample")]
+    assert messages == [f"step {i}" for i in range(0, 20, 4)]
+
+
+def test_child_logger_records_propagate(log_dir):
+    """Test records from child loggers reach the parent MetonLogger's file."""
+    make_logger(log_dir, "meton_test_parent")
+    logging.getLogger("meton_test_parent.hooks").warning("from child")
+    logging.getLogger("meton_test_parent.hooks.loader").error("from grandchild")
+
+    entries = [json.loads(line) for line in read_lines(log_dir, "meton_test_parent")]
+    assert [(e["logger"], e["message"]) for e in entries] == [
+        ("meton_test_parent.hooks", "from child"),
+        ("meton_test_parent.hooks.loader", "from grandchild"),
+    ]
+
+    # A child with its own MetonLogger keeps its records (propagate is off)
+    make_logger(log_dir, "meton_test_parent.skills")
+    logging.getLogger("meton_test_parent.skills").info("own file")
+    assert [json.loads(line)["message"] for line in read_lines(log_dir, "meton_test_parent.skills")] == ["own file"]
+    assert len(read_lines(log_dir, "meton_test_parent")) == 2
+
+
+def test_pooled_tools_keep_query_id(log_dir):
+    """Test records logged from pool threads carry the submitting query's id."""
+    from agent.parallel_executor import ParallelToolExecutor
+    from optimization.tool_prefetch import ToolPrefetcher
+
+    logger = make_logger(log_dir, "meton_test_pool")
+
+    class LoggingTool:
+        name = "logging_tool"
+
+        def __call__(self, args):
+            logger.info(f"parallel {args['n']}")
+            return "ok"
+
+        def _run(self, tool_input):
+            logger.info("prefetch")
+            return "ok"
+
+    tool = LoggingTool()
+    executor = ParallelToolExecutor({"logging_tool": tool}, {"parallel_execution": {"adaptive_timeouts": False}})
+    prefetcher = ToolPrefetcher({"logging_tool": tool})
+    try:
+        with query_context() as query_id:
+            executor._execute_independent_batch([
+                {"tool": "logging_tool", "args": {"n": 1}},
+                {"tool": "logging_tool", "args": {"n": 2}},
+            ])
+            prefetcher._submit(tool, "{}").result()
+        # A later query on the same pool threads gets its own id
+        with query_context() as other_id:
+            executor._execute_independent_batch([{"tool": "logging_tool", "args": {"n": 3}}])
+    finally:
+        executor.shutdown()
+        prefetcher.shutdown()
+
+    entries = {json.loads(line)["message"]: json.loads(line) for line in read_lines(log_dir, "meton_test_pool")}
+    assert set(entries) == {"parallel 1", "parallel 2", "prefetch", "parallel 3"}
+    assert entries["parallel 1"]["query_id"] == entries["parallel 2"]["query_id"] == query_id
+    assert entries["prefetch"]["query_id"] == query_id
+    assert entries["parallel 3"]["query_id"] == other_id != query_id
+    assert entries["prefetch"]["thread"] != threading.current_thread().name
+
+
+def test_sync_mode_and_cleanup(log_dir):
+    """Test the synchronous fallback and that old logs are pruned once per process."""
+    for day in range(3):
+        (log_dir / f"meton_test_sync_2020010{day}.log").write_text("old\n")
+
+    logger = make_logger(log_dir, "meton_test_sync", async_logging=False, max_log_files=1)
+    assert len(list(log_dir.glob("meton_test_sync_*.log"))) == 1
+    logger.info("direct")
+    assert logger.logger.handlers[0].__class__.__name__ == "FileHandler"
+
+    # A second logger with the same name doesn't glob and sort again
+    (log_dir / "meton_test_sync_20200109.log").write_text("old\n")
+    make_logger(log_dir, "meton_test_sync", async_logging=False, max_log_files=1)
+    assert len(list(log_dir.glob("meton_test_sync_*.log"))) == 2
@@ -557,6 +557,104 @@ def test_trend_direction_improving():
     cleanup_test_analytics(temp_dir)
 
 
+def test_snapshot_memoized_by_version():
+    """Test the snapshot is rebuilt only after metrics change."""
+    analytics, temp_dir = create_test_analytics()
+
+    analytics.record_query("Q1", "simple", 1.0, ["tool1"], {"tool1": 15.0})
+    snapshot = analytics.get_snapshot()
+    assert analytics.get_snapshot() is snapshot
+    assert analytics.snapshot_builds == 1
+    assert snapshot["version"] == analytics.version
+    assert snapshot["dashboard"] == analytics.get_dashboard()
+    assert snapshot["bottlenecks"] == analytics.get_bottlenecks()
+    json.dumps(snapshot)
+
+    version = analytics.version
+    analytics.record_query("Q2", "complex", 2.0, ["tool2"], {"tool2": 0.5})
+    assert analytics.version == version + 1
+
+    # Within the refresh interval the old snapshot is still served
+    assert analytics.get_snapshot(min_interval=60) is snapshot
+    updated = analytics.get_snapshot()
+    assert updated is not snapshot and analytics.snapshot_builds == 2
+    assert updated["dashboard"]["overview"]["total_queries"] == 2
+
+    cleanup_test_analytics(temp_dir)
+
+
+def test_snapshot_sees_other_writers():
+    """Test a snapshot picks up metrics saved by another instance."""
+    analytics, temp_dir = create_test_analytics()
+    assert analytics.get_snapshot()["dashboard"]["overview"]["total_queries"] == 0
+
+    writer = PerformanceAnalytics(storage_path=temp_dir)
+    writer.record_query("Q1", "simple", 1.0, ["tool1"], {"tool1": 0.5})
+
+    snapshot = analytics.get_snapshot()
+    assert snapshot["dashboard"]["overview"]["total_queries"] == 1
+    assert analytics.get_snapshot() is snapshot
+
+    cleanup_test_analytics(temp_dir)
+
+
+def test_visualizations_share_snapshot():
+    """Test one chart refresh computes the analytics once."""
+    from web.visualizations import MetonVisualizations
+
+    analytics, temp_dir = create_test_analytics()
+    for i in range(3):
+        analytics.record_query(f"Q{i}", "simple", 1.0 + i, ["tool1"], {"tool1": 0.5})
+
+    calls = []
+    get_dashboard = analytics.get_dashboard
+    analytics.get_dashboard = lambda: calls.append(1) or get_dashboard()
+
+    charts = MetonVisualizations(analytics)
+    charts.create_performance_chart()
+    charts.create_tool_usage_chart()
+    charts.create_success_rate_gauge()
+    charts.create_reflection_scores_chart()
+    charts.create_bottleneck_table()
+    summary = charts.create_metrics_summary()
+    charts.create_query_types_chart()
+    charts.create_tool_performance_table()
+
+    assert len(calls) == 1
+    assert summary["total_queries"] == 3
+
+    cleanup_test_analytics(temp_dir)
+
+
+def test_quality_stages():
+    """Test per-stage time and tokens are aggregated and exported."""
+    analytics, temp_dir = create_test_analytics()
+
+    analytics.record_query("Q1", "complex", 20.0, [], {}, reflection_score=0.9, stages={
+        "combined": {"calls": 2, "seconds": 12.0, "tokens": 3000},
+        "reflect": {"calls": 1, "seconds": 1.5, "tokens": 600}
+    })
+    analytics.record_query("Q2", "complex", 8.0, [], {}, stages={
+        "reflect": {"calls": 1, "seconds": 0.5, "tokens": 400}
+    })
+    analytics.record_query("Q3", "simple", 1.0, [], {})
+
+    stages = analytics.get_dashboard()["stages"]
+    assert stages["combined"]["avg_seconds_per_call"] == 6.0
+    assert stages["reflect"] == {
+        "queries": 2, "calls": 2, "seconds": 2.0, "tokens": 1000,
+        "avg_seconds_per_call": 1.0, "avg_tokens_per_query": 500.0
+    }
+
+    # Persisted and exported
+    reloaded = PerformanceAnalytics(storage_path=temp_dir)
+    assert reloaded.metrics[0].stages["combined"]["tokens"] == 3000
+    with open(analytics.export_metrics(format="csv"), 'r') as f:
+        assert "stages" in f.readline()
+
+    cleanup_test_analytics(temp_dir)
+
+
 def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -591,6 +689,10 @@ def run_all_tests():
         test_tool_performance_min_max,
         test_trend_direction_degrading,
         test_trend_direction_improving,
+        test_snapshot_memoized_by_version,
+        test_snapshot_sees_other_writers,
+        test_visualizations_share_snapshot,
+        test_quality_stages,
     ]
 
     print(f"Running {len(tests)} tests...\n")
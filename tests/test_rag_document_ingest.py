@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests for document ingestion into the RAG index.
+
+Tests cover:
+- Section readers (text, Markdown, reStructuredText)
+- Overlapping text chunks with line ranges
+- Batched embedding into VectorStore/MetadataStore
+- Skipping unchanged documents and replacing changed ones
+- Streaming large documents
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag import document_ingest
+from rag.document_ingest import (
+    DocumentIngester, DocumentSection, MarkdownReader, RstReader, TextChunker, get_reader
+)
+from rag.vector_store import VectorStore
+from rag.metadata_store import MetadataStore
+
+
+class HashEmbedder:
+    """Deterministic embedder recording batch sizes (no model download)."""
+
+    def __init__(self, dimension=16):
+        self.dimension = dimension
+        self.batches = []
+
+    def get_dimension(self):
+        return self.dimension
+
+    def encode_batch(self, texts):
+        self.batches.append(len(texts))
+        rows = [np.random.default_rng(abs(hash(t)) % (2 ** 32)).random(self.dimension) for t in texts]
+        return np.array(rows, dtype=np.float32)
+
+
+def create_ingester(batch_size=64, chunk_size=300, overlap=50):
+    """Create an ingester over empty stores in a temporary directory."""
+    temp_dir = Path(tempfile.mkdtemp())
+    embedder = HashEmbedder()
+    ingester = DocumentIngester(
+        embedder,
+        VectorStore(dimension=embedder.dimension),
+        MetadataStore(str(temp_dir / "metadata.json")),
+        chunk_size=chunk_size,
+        overlap=overlap,
+        batch_size=batch_size
+    )
+    return ingester, temp_dir
+
+
+def test_markdown_sections():
+    """Test Markdown splits at headings but not inside code fences."""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "guide.md"
+        path.write_text("Intro text\n# Setup\nInstall it.\n```\n# not a heading\n```\n## Usage\nRun it.\n")
+        sections = list(MarkdownReader().read_sections(path))
+
+        assert [s.title for s in sections] == ["guide.md", "Setup", "Usage"]
+        assert (sections[1].start_line, sections[1].end_line) == (2, 6)
+        assert "# not a heading" in sections[1].text
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_rst_sections():
+    """Test reStructuredText titles start sections at the title line."""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        path = temp_dir / "api.rst"
+        path.write_text("Overview\n========\nText.\n\nMethods\n-------\nMore.\n")
+        sections = list(RstReader().read_sections(path))
+
+        assert [s.title for s in sections] == ["Overview", "Methods"]
+        assert sections[1].start_line == 5
+        assert sections[1].text.startswith("Methods\n-------")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_chunker_overlap_and_lines():
+    """Test chunks overlap, prefer sentence breaks and track lines."""
+    text = "".join(f"Sentence number {i} is here.\n" for i in range(1, 41))
+    section = DocumentSection(text, "doc", 10, 49)
+    chunks = list(TextChunker(chunk_size=200, overlap=60).chunk(section))
+
+    assert len(chunks) > 1
+    assert all(c.text.endswith(".") for c in chunks)
+    assert chunks[0].start_line == 10
+    assert chunks[-1].end_line == 49
+    # Consecutive chunks share text
+    assert chunks[1].start_line <= chunks[0].end_line
+
+
+def test_ingest_file_batches():
+    """Test chunks are embedded in batches and stored with metadata."""
+    ingester, temp_dir = create_ingester(batch_size=4)
+    try:
+        path = temp_dir / "book.txt"
+        path.write_text("\n\n".join(f"Paragraph {i}. " + "word " * 40 for i in range(20)))
+
+        created = ingester.ingest_file(str(path))
+        assert created > 4
+        assert max(ingester.embedder.batches) == 4
+        assert ingester.vector_store.size() == created
+
+        chunks = ingester.metadata_store.search_by_field("chunk_type", "document")
+        assert len(chunks) == created
+        assert chunks[0]["language"] == "text"
+        assert chunks[0]["file_path"] == str(path.resolve())
+        assert chunks[0]["start_line"] == 1
+
+        stats = ingester.get_stats()
+        assert stats["bytes_read"] == path.stat().st_size
+        assert stats["chunks_per_sec"] > 0
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_reingest_skips_or_replaces():
+    """Test unchanged documents are skipped and changed ones replaced."""
+    ingester, temp_dir = create_ingester()
+    try:
+        path = temp_dir / "notes.md"
+        path.write_text("# One\nfirst version\n")
+        ingester.ingest_file(str(path))
+        assert ingester.ingest_file(str(path)) == 0
+        assert ingester.stats["files_skipped"] == 1
+
+        path.write_text("# One\nsecond version\n")
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 5))
+        ingester.ingest_file(str(path))
+
+        chunks = ingester.metadata_store.search_by_field("chunk_type", "document")
+        assert [c["code"] for c in chunks] == ["# One\nsecond version"]
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_ingest_directory_and_large_document():
+    """Test directory ingestion streams large files in bounded sections."""
+    ingester, temp_dir = create_ingester(chunk_size=1000, overlap=100)
+    original = document_ingest.SECTION_CHARS
+    try:
+        document_ingest.SECTION_CHARS = 2048
+        (temp_dir / "big.txt").write_text("".join(f"Line {i} of a long book.\n\n" for i in range(5000)))
+        (temp_dir / "settings.yaml").write_text("debug: true\n")
+        (temp_dir / "module.py").write_text("def ignored(): pass\n")
+        (temp_dir / "schema.sql").write_text("CREATE TABLE users (id INTEGER);\n")
+
+        sizes = [len(s.text) for s in get_reader(temp_dir / "big.txt").read_sections(temp_dir / "big.txt")]
+        assert max(sizes) < 2 * 2048 + 100
+
+        stats = ingester.ingest_directory(str(temp_dir))
+        assert stats["files_processed"] == 2  # Code with a language chunker is left to CodebaseIndexer
+        languages = {c["language"] for c in ingester.metadata_store.get_all().values()}
+        assert languages == {"text", "yaml"}
+    finally:
+        document_ingest.SECTION_CHARS = original
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tests for live index updates.
+
+Tests cover:
+- VectorStore removal and compaction
+- CodebaseIndexer.reindex_file re-embedding only changed chunks
+- Polling watcher picking up edits, new files and deletions
+- Coalescing repeated events and falling back to a rescan when full
+- SymbolLookupTool.update_files replacing one file's symbols
+"""
+
+import sys
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.config import ConfigLoader
+from rag.code_parser import CodeParser
+from rag.file_watcher import FileWatcherError, IndexWatcher
+from rag.indexer import CodebaseIndexer
+from rag.metadata_store import MetadataStore
+from rag.vector_store import VectorStore
+from tools.symbol_lookup import SymbolLookupTool
+
+
+class HashEmbedder:
+    """Deterministic embedder counting embedded texts (no model download)."""
+
+    def __init__(self, dimension=16):
+        self.dimension = dimension
+        self.embedded = 0
+
+    def get_dimension(self):
+        return self.dimension
+
+    def encode(self, text):
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts):
+        self.embedded += len(texts)
+        rows = [np.random.default_rng(abs(hash(t)) % (2 ** 32)).random(self.dimension) for t in texts]
+        return np.array(rows, dtype=np.float32)
+
+
+class FakeSymbolTool:
+    """Records update_files calls."""
+
+    def __init__(self):
+        self.updates = []
+
+    def update_files(self, paths):
+        self.updates.append(sorted(paths))
+        return len(paths)
+
+
+TWO_FUNCTIONS = "def alpha():\n    return 1\n\n\ndef beta():\n    return 2\n"
+
+
+@pytest.fixture
+def project():
+    path = Path(tempfile.mkdtemp(prefix="meton_watch"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def make_indexer(project):
+    """Index the project with a hash embedder."""
+    embedder = HashEmbedder()
+    indexer = CodebaseIndexer(embedder, VectorStore(dimension=16),
+                              MetadataStore(str(project / "metadata.json")), batch_size=8)
+    indexer.index_directory(str(project))
+    return indexer, embedder
+
+
+def names(indexer, filepath):
+    return sorted(chunk["name"] for chunk in indexer.file_chunks(str(filepath)))
+
+
+def test_vector_store_remove_and_compact():
+    """Test removed vectors leave search results and are compacted away."""
+    store = VectorStore(dimension=4)
+    vectors = np.eye(4, dtype=np.float32)
+    store.add_batch(vectors, ["a", "b", "c", "d"])
+
+    assert store.remove(["a", "missing"]) == 1
+    assert store.size() == 3 and store.index.ntotal == 4
+    results = store.search(vectors[0], top_k=3)
+    assert [chunk_id for chunk_id, _ in results] != [] and "a" not in dict(results)
+    assert len(results) == 3
+
+    # Once removed vectors outnumber live ones the index is rebuilt
+    store.remove(["b", "c"])
+    assert store.index.ntotal == store.size() == 1
+    assert store.search(vectors[3], top_k=5)[0][0] == "d"
+
+    store.add(vectors[0], "e")
+    assert {chunk_id for chunk_id, _ in store.search(vectors[0], top_k=5)} == {"d", "e"}
+
+
+def test_reindex_file_reuses_unchanged_chunks(project):
+    """Test only edited chunks are re-embedded and removed ones disappear."""
+    source = project / "mod.py"
+    source.write_text(TWO_FUNCTIONS)
+    indexer, embedder = make_indexer(project)
+    before = {c["name"]: c["chunk_id"] for c in indexer.file_chunks(str(source))}
+    embedded = embedder.embedded
+
+    # Add imports and gamma, change beta; alpha only shifts down two lines
+    source.write_text("import os\n\n" + TWO_FUNCTIONS.replace("return 2", "return 3") + "\n\ndef gamma():\n    pass\n")
+    result = indexer.reindex_file(str(source))
+
+    after = {c["name"]: c for c in indexer.file_chunks(str(source))}
+    assert sorted(after) == ["alpha", "beta", "gamma", "mod_imports"]
+    assert after["alpha"]["chunk_id"] == before["alpha"]
+    assert after["alpha"]["start_line"] == 3
+    assert after["beta"]["chunk_id"] != before["beta"]
+    assert result == {"embedded": 3, "reused": 1, "removed": 1}
+    assert embedder.embedded - embedded == 3
+    assert indexer.get_stats()["total_chunks"] == indexer.metadata_store.size() == 4
+
+    assert indexer.search("beta", top_k=10)
+    assert indexer.remove_file(str(source)) == 4
+    assert indexer.search("beta", top_k=10) == []
+
+
+def test_watcher_polls_edits_and_deletions(project):
+    """Test edited, new and deleted files reach the indexes without a rebuild."""
+    source = project / "mod.py"
+    source.write_text(TWO_FUNCTIONS)
+    (project / "node_modules").mkdir()
+    indexer, _ = make_indexer(project)
+    symbols = FakeSymbolTool()
+
+    watcher = IndexWatcher(str(project), indexer_provider=lambda: indexer, symbol_tool=symbols,
+                           debounce=0.05, poll_interval=0.05, backend="poll")
+    watcher.start()
+    try:
+        time.sleep(0.1)
+        source.write_text(TWO_FUNCTIONS + "\n\ndef delta():\n    pass\n")
+        (project / "extra.go").write_text("package main\n\nfunc Extra() {}\n")
+        (project / "node_modules" / "dep.py").write_text("def dep():\n    pass\n")
+
+        deadline = time.time() + 10
+        while watcher.get_stats()["files_updated"] < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        assert watcher.wait_idle()
+
+        assert "delta" in names(indexer, source)
+        assert names(indexer, project / "extra.go") == ["Extra", "extra"]
+        assert not indexer.file_chunks(str(project / "node_modules" / "dep.py"))
+
+        source.unlink()
+        deadline = time.time() + 10
+        while watcher.get_stats()["files_removed"] < 1 and time.time() < deadline:
+            time.sleep(0.05)
+        assert watcher.wait_idle()
+        assert not indexer.file_chunks(str(source))
+
+        stats = watcher.get_stats()
+        assert stats["backend"] == "poll" and stats["running"]
+        assert stats["chunks_reused"] >= 2 and stats["last_latency"] is not None
+        assert [str(source)] in symbols.updates
+    finally:
+        watcher.stop()
+    assert not watcher.is_running
+
+
+def test_watcher_coalesces_and_rescans_when_full(project):
+    """Test repeated events coalesce and overflow falls back to one rescan."""
+    files = []
+    for i in range(3):
+        files.append(project / f"m{i}.py")
+        files[-1].write_text(f"def f{i}():\n    return {i}\n")
+    indexer, _ = make_indexer(project)
+
+    watcher = IndexWatcher(str(project), indexer_provider=lambda: indexer,
+                           debounce=0.2, max_queue=1, backend="poll", poll_interval=60)
+    watcher.start()
+    try:
+        files[0].write_text("def renamed():\n    return 0\n")
+        files[2].write_text("def other():\n    return 2\n")
+        assert watcher.notify(str(files[0]))
+        assert watcher.notify(str(files[0]))  # Coalesced
+        assert not watcher.notify(str(files[2]))  # Queue full
+        assert not watcher.notify(str(project / "notes.unknown"))  # Not indexable
+        assert watcher.wait_idle()
+
+        stats = watcher.get_stats()
+        assert stats["dropped"] == 1 and stats["rescans"] == 1
+        assert names(indexer, files[0]) == ["renamed"]
+        assert names(indexer, files[2]) == ["other"]
+        assert names(indexer, files[1]) == ["f1"]
+        assert stats["files_updated"] == 2
+    finally:
+        watcher.stop()
+
+
+def test_watcher_saves_and_rejects_bad_config(project):
+    """Test updates are saved on stop and invalid setups raise."""
+    source = project / "mod.py"
+    source.write_text(TWO_FUNCTIONS)
+    indexer, _ = make_indexer(project)
+    index_path = project / "index" / "faiss.index"
+
+    watcher = IndexWatcher(str(project), indexer_provider=lambda: indexer, debounce=0.0,
+                           backend="poll", save_path=str(index_path), save_interval=3600)
+    watcher.start()
+    source.write_text(TWO_FUNCTIONS + "\n\ndef delta():\n    pass\n")
+    watcher.notify(str(source))
+    assert watcher.wait_idle()
+    assert not index_path.exists()  # Within the save interval
+    watcher.stop()
+    assert index_path.exists() and watcher.get_stats()["saves"] == 1
+
+    with pytest.raises(FileWatcherError):
+        IndexWatcher(str(source))
+    with pytest.raises(FileWatcherError):
+        IndexWatcher(str(project), backend="fsevents")
+
+
+def test_symbol_tool_update_files(project):
+    """Test update_files swaps one file's symbols and skips the periodic rebuild."""
+    tool = SymbolLookupTool(ConfigLoader("config.yaml"))
+    object.__setattr__(tool, '_project_root', project)
+    object.__setattr__(tool, '_parser', CodeParser())
+
+    source = project / "mod.py"
+    source.write_text(TWO_FUNCTIONS)
+    (project / "other.py").write_text("class Other:\n    pass\n")
+    assert tool.update_files([str(source)]) == 0  # Not built yet
+    assert tool._build_index_if_needed()
+
+    source.write_text("def alpha():\n    return 1\n")
+    assert tool.update_files([str(source), "/elsewhere/x.py", str(project / "README.md")]) == 1
+    assert sorted(s["name"] for s in tool._symbol_index) == ["Other", "alpha"]
+
+    tool.set_live_updates(True)
+    object.__setattr__(tool, '_index_timestamp', time.time() - 3600)
+    index = tool._symbol_index
+    assert tool._build_index_if_needed() and tool._symbol_index is index
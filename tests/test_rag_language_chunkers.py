@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for multi-language code chunking.
+
+Tests cover:
+- Brace languages (TypeScript, Go, Java) with doc comments
+- Statement (SQL) and indentation (Ruby) languages
+- Splitting large classes into members
+- Token-window fallback with overlap
+- CodebaseIndexer indexing mixed-language directories in shared batches
+"""
+
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag import language_chunkers
+from rag.language_chunkers import get_chunker
+from rag.indexer import CodebaseIndexer
+from rag.vector_store import VectorStore
+from rag.metadata_store import MetadataStore
+
+
+TYPESCRIPT = '''import { fetchJson } from "./http";
+
+/** Load a user by id. */
+export async function getUser(id: string): Promise<User> {
+  return fetchJson(`/users/${id}`);
+}
+
+export interface User {
+  id: string;
+}
+
+export const add = (a: number, b: number): number => {
+  return a + b;
+};
+'''
+
+GO = '''package server
+
+// Server handles requests.
+type Server struct {
+	addr string
+}
+
+func (s *Server) Start() error {
+	fmt.Println("{ not a brace }")
+	return nil
+}
+'''
+
+SQL = '''CREATE TABLE users (
+  id INTEGER PRIMARY KEY
+);
+
+CREATE OR REPLACE FUNCTION one() RETURNS int AS $$
+BEGIN
+  RETURN 1;
+END;
+$$ LANGUAGE plpgsql;
+'''
+
+RUBY = '''class Invoice
+  def total
+    1
+  end
+end
+'''
+
+JAVA = '''public class Service {
+    private int count = 0;
+
+    public String describe() {
+        return "Service with " + count + " runs and some words to pad the body out";
+    }
+
+    public void run(int n) {
+        for (int i = 0; i < n; i++) {
+            count += i;
+        }
+    }
+}
+'''
+
+
+class HashEmbedder:
+    """Deterministic embedder recording batch sizes (no model download)."""
+
+    def __init__(self, dimension=16):
+        self.dimension = dimension
+        self.batches = []
+
+    def get_dimension(self):
+        return self.dimension
+
+    def encode_batch(self, texts):
+        self.batches.append(len(texts))
+        rows = [np.random.default_rng(abs(hash(t)) % (2 ** 32)).random(self.dimension) for t in texts]
+        return np.array(rows, dtype=np.float32)
+
+
+def chunk(filename, source):
+    """Chunk source text as if it came from `filename`."""
+    return get_chunker(filename).chunk_source(source, filename)
+
+
+def summary(chunks):
+    """(chunk_type, name, start_line, end_line) for each chunk."""
+    return [(c["chunk_type"], c["name"], c["start_line"], c["end_line"]) for c in chunks]
+
+
+def test_typescript_symbols():
+    """Test TypeScript functions, interfaces and arrow functions."""
+    chunks = chunk("api.ts", TYPESCRIPT)
+    assert summary(chunks) == [
+        ("module", "api", 1, 1),
+        ("function", "getUser", 3, 6),
+        ("class", "User", 8, 10),
+        ("function", "add", 12, 14),
+    ]
+    assert chunks[1]["docstring"] == "Load a user by id."
+    assert chunks[1]["language"] == "typescript"
+    assert chunks[2]["symbol_kind"] == "interface"
+
+
+def test_go_braces_in_strings():
+    """Test braces inside string literals don't end blocks."""
+    chunks = chunk("server.go", GO)
+    assert summary(chunks)[1:] == [("class", "Server", 3, 6), ("function", "Start", 8, 11)]
+    assert chunks[1]["docstring"] == "Server handles requests."
+    assert chunks[2]["signature"] == "func (s *Server) Start() error"
+
+
+def test_sql_and_ruby():
+    """Test statement (SQL) and indentation (Ruby) block styles."""
+    sql = chunk("schema.sql", SQL)
+    assert summary(sql) == [("class", "users", 1, 3), ("function", "one", 5, 9)]
+    assert sql[0]["symbol_kind"] == "table"
+
+    ruby = chunk("invoice.rb", RUBY)
+    assert summary(ruby) == [("class", "Invoice", 1, 5)]
+
+
+def test_large_class_split_into_members():
+    """Test classes over MAX_CHUNK_TOKENS become one chunk per member."""
+    original = language_chunkers.MAX_CHUNK_TOKENS
+    try:
+        language_chunkers.MAX_CHUNK_TOKENS = 30
+        chunks = chunk("Service.java", JAVA)
+        names = [c["name"] for c in chunks]
+        assert "Service.describe" in names and "Service.run" in names
+        member = chunks[names.index("Service.run")]
+        assert (member["start_line"], member["end_line"]) == (8, 12)
+        assert member["parent"] == "Service"
+    finally:
+        language_chunkers.MAX_CHUNK_TOKENS = original
+
+
+def test_window_fallback_overlap():
+    """Test files without recognised symbols are split into overlapping windows."""
+    original = (language_chunkers.MAX_CHUNK_TOKENS, language_chunkers.WINDOW_TOKENS,
+                language_chunkers.WINDOW_OVERLAP)
+    try:
+        language_chunkers.MAX_CHUNK_TOKENS = 40
+        language_chunkers.WINDOW_TOKENS = 20
+        language_chunkers.WINDOW_OVERLAP = 5
+        source = "\n".join(f"x{i} := value plus more" for i in range(30))
+        chunks = chunk("consts.go", source)
+
+        assert len(chunks) > 1
+        assert chunks[0]["start_line"] == 1 and chunks[-1]["end_line"] == 30
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current["start_line"] <= previous["end_line"]  # Overlap
+            assert current["start_line"] > previous["start_line"]  # Progress
+    finally:
+        (language_chunkers.MAX_CHUNK_TOKENS, language_chunkers.WINDOW_TOKENS,
+         language_chunkers.WINDOW_OVERLAP) = original
+
+
+def test_indexer_mixed_languages():
+    """Test CodebaseIndexer indexes every supported language in shared batches."""
+    temp_dir = Path(tempfile.mkdtemp())
+    try:
+        (temp_dir / "api.ts").write_text(TYPESCRIPT)
+        (temp_dir / "server.go").write_text(GO)
+        (temp_dir / "schema.sql").write_text(SQL)
+        (temp_dir / "tool.py").write_text("def helper():\n    return 1\n")
+        (temp_dir / "notes.unknown").write_text("ignored")
+        os.makedirs(temp_dir / "node_modules")
+        (temp_dir / "node_modules" / "dep.js").write_text("function dep() {}\n")
+
+        embedder = HashEmbedder()
+        metadata_store = MetadataStore(str(temp_dir / "metadata.json"))
+        indexer = CodebaseIndexer(embedder, VectorStore(dimension=16), metadata_store, batch_size=8)
+
+        stats = indexer.index_directory(str(temp_dir))
+        assert stats["files_processed"] == 4
+        assert stats["languages"] == {"typescript": 1, "go": 1, "sql": 1, "python": 1}
+        assert indexer.get_stats()["total_chunks"] == stats["chunks_created"] == 10
+        assert embedder.batches == [8, 2]  # Batches span files
+
+        go_chunks = metadata_store.search_by_field("language", "go")
+        assert {c["name"] for c in go_chunks} == {"server", "Server", "Start"}
+
+        with pytest.raises(ValueError):
+            indexer.index_file(str(temp_dir / "notes.unknown"))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
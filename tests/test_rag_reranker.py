@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for second-stage reranking of code search results.
+
+Tests cover:
+- Identifier splitting
+- Lexical/structural scoring order
+- Score caching per (query, chunk)
+- Over-fetching and reranking in CodebaseSearchTool
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag.reranker import Reranker, split_identifiers
+from tools.codebase_search import CodebaseSearchTool
+from core.config import Config
+
+
+def make_chunk(chunk_id, name, code, chunk_type="function", file_path="app/service.py"):
+    """Build chunk metadata shaped like the indexer's."""
+    return {
+        "chunk_id": chunk_id,
+        "file_path": file_path,
+        "chunk_type": chunk_type,
+        "name": name,
+        "start_line": 1,
+        "end_line": 10,
+        "code": code,
+    }
+
+
+def sample_candidates():
+    """Candidates as vector search returns them (closest first)."""
+    return [
+        (make_chunk("c1", "imports", "import hashlib\nimport os", chunk_type="imports"), 0.5),
+        (make_chunk("c2", "send_email", "def send_email(user): ...", file_path="app/mail.py"), 0.6),
+        (make_chunk("c3", "hash_password", "def hash_password(password): return hashlib.sha256(password)"), 0.9),
+    ]
+
+
+class FakeIndexer:
+    """Indexer stand-in returning fixed candidates and recording top_k."""
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.requested = []
+
+    def get_stats(self):
+        return {"total_chunks": len(self.candidates)}
+
+    def search(self, query, top_k=10):
+        self.requested.append(top_k)
+        return self.candidates[:top_k]
+
+
+def test_split_identifiers():
+    """Test camelCase and snake_case are split into parts."""
+    assert split_identifiers("parseConfigFile") == ["parse", "config", "file"]
+    assert split_identifiers("parse_config_file()") == ["parse", "config", "file"]
+    assert split_identifiers("HTTPServer") == ["http", "server"]
+
+
+def test_lexical_rerank_prefers_identifier_match():
+    """Test a chunk defining the queried identifier moves to the top."""
+    reranker = Reranker()
+    ranked = reranker.rerank("how is the password hashed in hash_password", sample_candidates(), top_k=2)
+
+    assert len(ranked) == 2
+    assert ranked[0][0]["chunk_id"] == "c3"
+    assert ranked[0][2] > ranked[1][2]
+
+
+def test_chunk_type_hint():
+    """Test query words naming a chunk type favour that type."""
+    candidates = [
+        (make_chunk("f", "Session", "def session(): ..."), 0.5),
+        (make_chunk("c", "Session", "class Session: ...", chunk_type="class"), 0.5),
+    ]
+    ranked = Reranker().rerank("session class", candidates, top_k=1)
+    assert ranked[0][0]["chunk_id"] == "c"
+
+
+def test_score_cache():
+    """Test repeated queries reuse cached scores."""
+    reranker = Reranker()
+    first = reranker.rerank("hash password", sample_candidates(), top_k=3)
+    second = reranker.rerank("Hash Password ", sample_candidates(), top_k=3)
+
+    assert [c[0]["chunk_id"] for c in first] == [c[0]["chunk_id"] for c in second]
+    stats = reranker.get_stats()
+    assert stats["scored"] == 3
+    assert stats["cache_hits"] == 3
+
+    reranker.clear_cache()
+    assert reranker.get_stats()["cached_scores"] == 0
+
+
+def test_tool_overfetches_and_reranks():
+    """Test CodebaseSearchTool fetches top_k * multiplier and returns top_k."""
+    config = Config()
+    config.config.rag.enabled = True
+    search_config = config.config.tools.codebase_search
+    search_config.enabled = True
+    search_config.top_k = 1
+    search_config.similarity_threshold = 0.0
+    search_config.rerank = "always"
+    search_config.rerank_multiplier = 3
+
+    tool = CodebaseSearchTool(config)
+    indexer = FakeIndexer(sample_candidates())
+    object.__setattr__(tool, '_indexer', indexer)
+
+    result = json.loads(tool._run(json.dumps({"query": "hash_password function"})))
+    assert result["success"]
+    assert indexer.requested == [3]
+    assert result["count"] == 1
+    assert result["results"][0]["name"] == "hash_password"
+    assert "rerank_score" in result["results"][0]
+
+    # Without reranking, only top_k is fetched and vector order is kept
+    object.__setattr__(tool, '_rerank_mode', "never")
+    result = json.loads(tool._run(json.dumps({"query": "hash_password function"})))
+    assert indexer.requested[-1] == 1
+    assert result["results"][0]["name"] == "imports"
+    assert "rerank_score" not in result["results"][0]
@@ -19,15 +19,17 @@ from unittest.mock import Mock, MagicMock
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agent.self_reflection import SelfReflectionModule, ReflectionRecord
+from agent.self_reflection import SelfReflectionModule, ReflectionRecord, count_tokens
+from core.models import ModelManager
 
 
 def create_mock_dependencies():
     """Create mock dependencies for testing."""
     # Mock ModelManager
-    mock_model_manager = Mock()
+    mock_model_manager = Mock(spec=ModelManager)
     mock_llm = Mock()
-    mock_model_manager.get_model = Mock(return_value=mock_llm)
+    mock_model_manager.get_llm = Mock(return_value=mock_llm)
+    mock_model_manager.resolve_alias = Mock(side_effect=lambda alias: f"{alias}-model")
 
     # Mock config
     mock_config = {
@@ -212,8 +214,7 @@ def test_reflect_on_response_good_quality():
     reflection = SelfReflectionModule(model_manager, config)
 
     # Mock LLM response with high quality score
-    mock_response = Mock()
-    mock_response.content = """
+    mock_response = """
     {
         "quality_score": 0.9,
         "issues": [],
@@ -247,8 +248,7 @@ def test_reflect_on_response_poor_quality():
     reflection = SelfReflectionModule(model_manager, config)
 
     # Mock LLM response with low quality score
-    mock_response = Mock()
-    mock_response.content = """
+    mock_response = """
     {
         "quality_score": 0.5,
         "issues": ["incomplete_answer", "unclear_explanation"],
@@ -283,8 +283,7 @@ def test_reflect_with_critical_issues():
     reflection = SelfReflectionModule(model_manager, config)
 
     # Mock LLM response with critical issue
-    mock_response = Mock()
-    mock_response.content = """
+    mock_response = """
     {
         "quality_score": 0.75,
         "issues": ["incorrect_info"],
@@ -308,6 +307,37 @@ def test_reflect_with_critical_issues():
     print(f"  Critical issue: incorrect_info")
 
 
+def test_reflect_uses_quick_model_and_counts_tokens():
+    """Test scoring runs on the configured model and reports token usage."""
+    print("\n" + "=" * 70)
+    print("TEST: Reflection Model and Tokens")
+    print("=" * 70)
+
+    model_manager, mock_llm, config = create_mock_dependencies()
+    reflection = SelfReflectionModule(model_manager, config)
+
+    mock_response = '{"quality_score": 0.8, "issues": [], "suggestions": []}'
+    mock_llm.invoke = Mock(return_value=mock_response)
+
+    result = reflection.reflect_on_response("Test query", "Response", {})
+
+    model_manager.resolve_alias.assert_called_once_with("quick")
+    model_manager.get_llm.assert_called_once_with("quick-model")
+    assert result["quality_score"] == 0.8 and result["tokens"] > 0
+
+    # OllamaLLM returns text: estimated at ~4 chars per token
+    assert count_tokens(mock_response, "x" * 400) == (400 + len(mock_response)) // 4
+
+    # Chat messages report their counts
+    message = Mock()
+    message.usage_metadata = None
+    message.response_metadata = {"prompt_eval_count": 420, "eval_count": 35}
+    assert count_tokens(message, "x" * 400) == 455
+
+    print("✓ Quick model used")
+    print(f"  Tokens: {result['tokens']}")
+
+
 def test_improve_response():
     """Test response improvement."""
     print("\n" + "=" * 70)
@@ -318,8 +348,7 @@ def test_improve_response():
     reflection = SelfReflectionModule(model_manager, config)
 
     # Mock LLM improvement response
-    mock_response = Mock()
-    mock_response.content = "This is the improved response with all issues addressed."
+    mock_response = "This is the improved response with all issues addressed."
     mock_llm.invoke = Mock(return_value=mock_response)
 
     query = "Test query"
@@ -770,6 +799,7 @@ def run_all_tests():
         ("Reflect - Good Quality", test_reflect_on_response_good_quality),
         ("Reflect - Poor Quality", test_reflect_on_response_poor_quality),
         ("Reflect - Critical Issues", test_reflect_with_critical_issues),
+        ("Reflection Model and Tokens", test_reflect_uses_quick_model_and_counts_tokens),
         ("Improve Response", test_improve_response),
         ("Parse Pure JSON", test_parse_reflection_output_pure_json),
         ("Parse Markdown JSON", test_parse_reflection_output_with_markdown),
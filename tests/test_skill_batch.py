@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for batch mode of the code skills.
+
+Tests cover:
+- Finding files under a directory or glob
+- Running a skill in a process pool and streaming per-file results
+- Cached results by content hash: only edited files re-analyzed
+- Progress, throughput and aggregated totals
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.batch import BatchError, SkillBatchRunner, describe, find_files, resolve_skill
+
+
+def make_tree(root: Path, count: int = 4) -> None:
+    """Write a small package with `count` modules plus files batch mode skips."""
+    package = root / "pkg"
+    package.mkdir()
+    for i in range(count):
+        (package / f"mod_{i}.py").write_text(
+            f"import os\n\n\ndef load_{i}(path):\n    x = eval(path)\n    return x + {i}\n"
+        )
+    (package / "notes.txt").write_text("not python")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "cached.py").write_text("x = 1\n")
+
+
+def test_find_files(tmp_path):
+    """Test directories are searched recursively and globs are expanded."""
+    make_tree(tmp_path)
+
+    assert [p.name for p in find_files(str(tmp_path))] == [f"mod_{i}.py" for i in range(4)]
+    assert len(find_files(str(tmp_path / "pkg" / "mod_[01].py"))) == 2
+    assert len(find_files(str(tmp_path / "pkg" / "mod_0.py"))) == 1
+
+    with pytest.raises(BatchError):
+        find_files(str(tmp_path / "missing"))
+    with pytest.raises(BatchError):
+        find_files(str(tmp_path / "pkg" / "*.rs"))
+
+
+def test_resolve_skill():
+    """Test aliases map to skills and other skills are rejected."""
+    assert resolve_skill("review") == "code_reviewer"
+    assert resolve_skill("refactoring_engine") == "refactoring_engine"
+    with pytest.raises(BatchError):
+        resolve_skill("git_assistant")
+
+
+def test_process_pool_streams_results(tmp_path):
+    """Test files are analyzed in worker processes and reported as they finish."""
+    make_tree(tmp_path)
+    seen = []
+    runner = SkillBatchRunner("review", workers=2,
+                              on_progress=lambda progress, result: seen.append(progress.done))
+
+    results = list(runner.run(str(tmp_path)))
+
+    assert len(results) == 4 and seen == [1, 2, 3, 4]
+    assert all(r.success and not r.cached for r in results)
+    assert all(any(i["category"] == "security" for i in r.result["issues"]) for r in results)  # eval
+    assert describe(results[0]).startswith("score ")
+
+    progress = runner.progress
+    assert (progress.done, progress.cached, progress.failed, progress.lines) == (4, 0, 0, 28)
+    assert progress.elapsed > 0 and progress.files_per_second > 0
+
+
+def test_cached_rerun_only_analyzes_edits(tmp_path):
+    """Test a re-run answers unchanged files from the cache file."""
+    make_tree(tmp_path)
+    cache_path = str(tmp_path / "cache" / "batch.json")
+
+    first = list(SkillBatchRunner("refactor", workers=1, cache_path=cache_path).run(str(tmp_path)))
+    assert not any(r.cached for r in first)
+
+    (tmp_path / "pkg" / "mod_2.py").write_text("def changed():\n    return 1\n")
+    runner = SkillBatchRunner("refactor", workers=1, cache_path=cache_path)
+    second = {Path(r.path).name: r for r in runner.run(str(tmp_path))}
+
+    assert [name for name, r in second.items() if not r.cached] == ["mod_2.py"]
+    assert second["mod_0.py"].result == first[0].result
+    assert runner.progress.cached == 3
+
+    # Different options are cached separately
+    docs = SkillBatchRunner("docs", options={"doc_type": "readme"}, workers=1, cache_path=cache_path)
+    assert not any(r.cached for r in docs.run(str(tmp_path)))
+
+
+def test_summarize_and_failures(tmp_path):
+    """Test review totals add up and unreadable files are reported, not raised."""
+    make_tree(tmp_path, count=2)
+    (tmp_path / "pkg" / "broken.py").write_bytes(b"x = '\xff'\n")
+    runner = SkillBatchRunner("code_reviewer", workers=1)
+
+    results = list(runner.run(str(tmp_path)))
+    summary = runner.summarize()
+
+    assert summary["files"] == 3 and summary["succeeded"] == 2
+    assert [Path(f["path"]).name for f in summary["failed"]] == ["broken.py"]
+    assert summary["total_issues"] == sum(len(r.result["issues"]) for r in results if r.success)
+    assert summary["average_score"] == results[1].result["score"]  # Identical modules
+    assert describe(results[0]).startswith("Unreadable")
+    assert summary["progress"]["failed"] == 1
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for sub-agent pooling and concurrent delegation.
+
+Tests cover:
+- Reusing pooled instances per (definition, tool set, model)
+- Instances built with the sub-agent's model, role prompt and no memory
+- spawn_many running delegations concurrently under a cap, in order
+- Bounded result history and failed runs leaving the pool
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.subagent import SubAgent
+from agents.subagent_spawner import AgentPool, SubAgentSpawner, SubAgentSpawnError
+from core.config import ConfigLoader
+
+
+class FakeTool:
+    def __init__(self, name):
+        self.name = name
+        self.description = f"{name} tool"
+
+
+class FakeModelManager:
+    current_model = "primary-model"
+
+
+class FakeConversation:
+    def __init__(self):
+        self.clears = 0
+
+    def clear(self):
+        self.clears += 1
+
+
+class FakeAgent:
+    """Stands in for MetonAgent; tracks concurrent runs."""
+
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, model_name, delay=0.0):
+        self.model_name = model_name
+        self.conversation = FakeConversation()
+        self.delay = delay
+        self.runs = []
+
+    def run(self, task):
+        with FakeAgent.lock:
+            FakeAgent.running += 1
+            FakeAgent.max_running = max(FakeAgent.max_running, FakeAgent.running)
+        try:
+            time.sleep(self.delay)
+            self.runs.append(task)
+            if task == "crash":
+                raise RuntimeError("graph exploded")
+            if task == "fail":
+                return {"output": "Agent execution failed: no model", "success": False, "error": "no model"}
+            return {"output": f"done: {task}", "iterations": 2, "tool_calls": [], "success": True}
+        finally:
+            with FakeAgent.lock:
+                FakeAgent.running -= 1
+
+
+def make_spawner(delay=0.0, **subagents):
+    config = ConfigLoader("config.yaml")
+    for key, value in subagents.items():
+        setattr(config.config.subagents, key, value)
+    spawner = SubAgentSpawner(config, FakeModelManager(), [FakeTool("file_operations"), FakeTool("web_search")])
+    built = []
+
+    def create(agent, tools, model_name):
+        built.append((agent.name, [t.name for t in tools], model_name))
+        return FakeAgent(model_name, delay)
+
+    spawner._create_agent_instance = create
+    FakeAgent.running = FakeAgent.max_running = 0
+    return spawner, built
+
+
+def make_agent(name="helper", model="inherit", tools=None, prompt="Help."):
+    return SubAgent(name=name, description=f"{name} agent", system_prompt=prompt, tools=tools, model=model)
+
+
+def test_instances_are_pooled_per_definition():
+    """Test repeat delegations reuse one instance and reset its conversation."""
+    spawner, built = make_spawner()
+    helper = make_agent(tools=["file_operations"])
+
+    first = spawner.spawn(helper, "one")
+    second = spawner.spawn(helper, "two", context="ctx")
+    assert first.success and second.output == "done: Context:\nctx\n\nTask:\ntwo"
+    assert built == [("helper", ["file_operations"], "primary-model")]
+
+    # Different model or edited prompt get their own instances
+    spawner.spawn(make_agent(tools=["file_operations"], model="quick"), "three")
+    spawner.spawn(make_agent(tools=["file_operations"], prompt="Help more."), "four")
+    assert [b[2] for b in built] == ["primary-model", spawner.config.config.models.quick, "primary-model"]
+
+    stats = spawner.pool.get_stats()
+    assert (stats["created"], stats["reused"], stats["idle"]) == (3, 1, 3)
+    assert not spawner.active_agents
+
+
+def test_created_instance_uses_subagent_settings():
+    """Test real instances get the model, role prompt, no memory and no disk writes."""
+    config = ConfigLoader("config.yaml")
+    spawner = SubAgentSpawner(config, FakeModelManager(), [FakeTool("file_operations")])
+    instance = spawner._create_agent_instance(make_agent(prompt="Only review."), [], "small-model")
+
+    assert instance.model_name == "small-model"
+    assert instance.long_term_memory is None and instance.router is None
+    assert instance._get_system_prompt().startswith("# Sub-Agent: helper\n\nOnly review.\n\n---")
+    assert instance.conversation.auto_save is False
+    assert spawner._create_agent_instance(make_agent(), [], "m").logger is instance.logger
+
+
+def test_spawn_many_runs_concurrently_in_order():
+    """Test independent delegations overlap up to the cap and keep input order."""
+    spawner, built = make_spawner(delay=0.2, max_concurrent=2)
+    delegations = [{"agent": make_agent(), "task": f"t{i}"} for i in range(4)]
+
+    start = time.time()
+    results = spawner.spawn_many(delegations)
+    elapsed = time.time() - start
+
+    assert [r.output for r in results] == [f"done: t{i}" for i in range(4)]
+    assert FakeAgent.max_running == 2 and elapsed < 0.7
+    assert len(built) == 2  # One instance per concurrent slot, then reused
+
+    with pytest.raises(SubAgentSpawnError, match="not found"):
+        spawner.spawn_many([{"agent": "explorer", "task": "x"}, {"agent": "no-such-agent", "task": "y"}])
+    assert len(spawner.get_completed_results()) == 4  # Nothing ran
+
+
+def test_history_is_bounded_and_failures_leave_pool():
+    """Test old results are dropped and crashed instances aren't reused."""
+    spawner, built = make_spawner(history_size=3)
+    helper = make_agent()
+
+    ids = [spawner.spawn(helper, f"t{i}").agent_id for i in range(5)]
+    assert list(spawner.get_completed_results()) == ids[-3:]
+
+    crashed = spawner.spawn(helper, "crash")
+    assert not crashed.success and "graph exploded" in crashed.error
+    failed = spawner.spawn(helper, "fail")
+    assert not failed.success and failed.error == "no model"
+    assert len(built) == 2  # The crashed instance was replaced
+
+
+def test_agent_pool_evicts_least_recently_used():
+    """Test the pool keeps at most max_idle instances."""
+    pool = AgentPool(max_idle=2)
+    for key in ("a", "b", "c"):
+        pool.release((key,), object())
+    assert pool.get_stats()["idle"] == 2 and pool.evicted == 1
+
+    made = []
+    pool.acquire(("a",), lambda: made.append(1) or object())
+    pool.acquire(("c",), lambda: made.append(1) or object())
+    assert len(made) == 1 and pool.reused == 1
@@ -11,6 +11,7 @@ Tests cover:
 - File history
 - Branch operations
 - Search functionality
+- Semantic commit search
 - Error handling
 """
 
@@ -345,6 +346,218 @@ def test_determine_commit_type():
     assert commit_type == "docs"
 
 
+def make_repo(path):
+    """Create a small repository with three commits."""
+    from git import Repo, Actor
+
+    repo = Repo.init(path)
+    alice = Actor("Alice", "alice@example.com")
+    bob = Actor("Bob", "bob@example.com")
+
+    def commit(files, message, author, date):
+        for name, content in files.items():
+            file_path = Path(path) / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text(content)
+            repo.index.add([name])
+        repo.index.commit(message, author=author, committer=author,
+                          author_date=date, commit_date=date)
+
+    commit({"core/retry.py": "def retry():\n    pass\n"}, "Add retry helper", alice, "2024-01-10T12:00:00")
+    commit({"core/retry.py": "def retry(n=3):\n    for _ in range(n):\n        pass\n"},
+           "Make retry count configurable\n\nBackoff stays linear.", bob, "2024-03-05T12:00:00")
+    commit({"README.md": "# Demo\n"}, "Document the project", alice, "2024-06-01T12:00:00")
+    return repo
+
+
+def test_commit_index_search_and_incremental_update():
+    """Test the commit index answers filtered queries and updates incrementally."""
+    if not GIT_AVAILABLE:
+        print("⏭️  test_commit_index_search_and_incremental_update (GitPython not available)")
+        return
+
+    import shutil
+    import tempfile
+    from git import Actor
+
+    path = tempfile.mkdtemp(prefix="meton_git")
+    try:
+        repo = make_repo(path)
+        git_tool = GitTool(path)
+
+        index = git_tool.commit_index
+        assert index.get_stats()["commits"] == 3
+        assert (Path(repo.git_dir) / "meton" / "commit_index.json").exists()
+
+        assert [c["message"] for c in git_tool.search_commits(path="core")] == [
+            "Make retry count configurable", "Add retry helper"]
+        assert [c["author"] for c in git_tool.search_commits(author="alice@")] == ["Alice", "Alice"]
+        assert git_tool.search_commits(query="backoff")[0]["message"] == "Make retry count configurable"
+        assert [c["message"] for c in git_tool.search_commits(since="2024-02-01", until="2024-04-01")] == [
+            "Make retry count configurable"]
+        assert git_tool.find_related_commits("bob")[0]["author"] == "Bob"
+        assert "error" in git_tool.search_commits(since="not a date")[0]
+
+        analysis = git_tool.analyze_commit(repo.head.commit.parents[0].hexsha)
+        assert analysis["changed_files"] == ["core/retry.py"]
+        assert (analysis["insertions"], analysis["deletions"]) == (3, 2)
+
+        # New commits are appended without re-reading the old ones
+        (Path(path) / "core" / "retry.py").write_text("def retry(n=5):\n    pass\n")
+        repo.index.add(["core/retry.py"])
+        repo.index.commit("Raise default retries", author=Actor("Carol", "carol@example.com"))
+        assert GitTool(path).commit_index.update() == 0  # Loaded from disk and caught up on access
+        assert git_tool.commit_index.get_stats()["commits"] == 4
+        assert git_tool.get_file_history("core/retry.py", max_commits=1)[0]["message"] == "Raise default retries"
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_blame_range_and_cache():
+    """Test blame runs only on the requested range and is cached per blob."""
+    if not GIT_AVAILABLE:
+        print("⏭️  test_blame_range_and_cache (GitPython not available)")
+        return
+
+    import shutil
+    import tempfile
+
+    path = tempfile.mkdtemp(prefix="meton_git")
+    try:
+        make_repo(path)
+        git_tool = GitTool(path)
+        calls = []
+        original = git_tool._run_blame
+
+        def counting_blame(*args):
+            calls.append(args)
+            return original(*args)
+
+        git_tool._run_blame = counting_blame
+
+        blame = git_tool.get_blame("core/retry.py", 2, 3)
+        assert [(b["line"], b["author"]) for b in blame] == [(2, "Bob"), (3, "Bob")]
+        assert git_tool.get_blame("core/retry.py", 2, 3) == blame
+        assert len(calls) == 1
+
+        # A range past the end of the file falls back to blaming everything
+        assert [b["line"] for b in git_tool.get_blame("core/retry.py", 3, 99)] == [3]
+        assert "error" in git_tool.get_blame("missing.py")[0]
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class WordEmbedder:
+    """Bag-of-words embedder counting embedded texts (no model download)."""
+
+    model_name = "word-buckets"
+
+    def __init__(self, dimension=64):
+        self.dimension = dimension
+        self.embedded = 0
+
+    def get_dimension(self):
+        return self.dimension
+
+    def encode(self, text):
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts):
+        import re
+        import zlib
+        import numpy as np
+
+        self.embedded += len(texts)
+        rows = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in zip(rows, texts):
+            for word in re.findall(r"[a-z]+", text.lower()):
+                row[zlib.crc32(word.encode()) % self.dimension] += 1.0
+            row /= max(np.linalg.norm(row), 1.0)
+        return rows
+
+
+def test_semantic_commit_search():
+    """Test semantic search ranks by meaning, filters, and embeds incrementally."""
+    if not GIT_AVAILABLE:
+        print("⏭️  test_semantic_commit_search (GitPython not available)")
+        return
+
+    import shutil
+    import tempfile
+    from git import Actor
+    from rag.commit_search import parse_diff_summaries
+
+    path = tempfile.mkdtemp(prefix="meton_git")
+    try:
+        repo = make_repo(path)
+        embedder = WordEmbedder()
+        git_tool = GitTool(path, embedder=embedder)
+
+        results = git_tool.semantic_search_commits("configurable retry count", max_results=2)
+        assert results[0]["message"] == "Make retry count configurable"
+        assert results[0]["similarity"] >= results[1]["similarity"]
+        stats = git_tool.semantic_index.get_stats()
+        assert (stats["commits"], stats["documents"]) == (3, 6)  # A message and a file summary each
+
+        # Filters apply on top of similarity
+        assert [c["message"] for c in git_tool.semantic_search_commits("retry", path="README.md")] == [
+            "Document the project"]
+        assert [c["message"] for c in git_tool.semantic_search_commits(
+            "retry", path="core", until="2024-02-01")] == ["Add retry helper"]
+        assert git_tool.semantic_search_commits("retry", path="core")[0]["files"] == ["core/retry.py"]
+        assert "error" in git_tool.semantic_search_commits("")[0]
+
+        # Only the new commit is embedded, by a tool loading the saved vectors
+        (Path(path) / "core" / "retry.py").write_text("def retry(n=3, backoff=2.0):\n    pass\n")
+        repo.index.add(["core/retry.py"])
+        repo.index.commit("Switch to exponential backoff", author=Actor("Carol", "carol@example.com"))
+        embedded = embedder.embedded
+        other = GitTool(path, embedder=embedder)
+        assert other.semantic_index.get_stats()["commits"] == 4
+        assert embedder.embedded - embedded == 2
+
+        output = other.execute("semantic_search", query="exponential backoff", max_results=1)
+        assert "Switch to exponential backoff" in output and "files: core/retry.py" in output
+
+        # Hunk headers and changed lines end up in the file summaries
+        patch = repo.git.show("HEAD~2", "-U0", "--format=\x1e%H")
+        [(sha, files)] = list(parse_diff_summaries(patch))
+        assert sha == repo.commit("HEAD~2").hexsha
+        assert "def retry(n=3):" in files["core/retry.py"]["lines"]
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def test_absolute_paths_inside_repo():
+    """Test history, search, semantic search and blame accept absolute paths."""
+    if not GIT_AVAILABLE:
+        print("⏭️  test_absolute_paths_inside_repo (GitPython not available)")
+        return
+
+    import shutil
+    import tempfile
+
+    path = tempfile.mkdtemp(prefix="meton_git")
+    try:
+        make_repo(path)
+        git_tool = GitTool(path, embedder=WordEmbedder())
+        absolute = str(Path(path).resolve() / "core" / "retry.py")
+
+        assert [c["message"] for c in git_tool.get_file_history(absolute)] == [
+            "Make retry count configurable", "Add retry helper"]
+        assert git_tool.search_commits(path=str(Path(path) / "core")) == git_tool.search_commits(path="core")
+        assert git_tool.semantic_search_commits("retry", path=absolute)[0]["message"] in (
+            "Make retry count configurable", "Add retry helper")
+
+        blame = git_tool.get_blame(absolute, 1, 2)
+        assert [(b["line"], b["author"]) for b in blame] == [(1, "Bob"), (2, "Bob")]
+        assert git_tool.get_blame("core/retry.py", 1, 2) == blame
+
+        assert "outside the repository" in git_tool.get_file_history("/etc/hostname")[0]["error"]
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -368,6 +581,10 @@ def run_all_tests():
         test_format_status,
         test_format_history,
         test_determine_commit_type,
+        test_commit_index_search_and_incremental_update,
+        test_blame_range_and_cache,
+        test_semantic_commit_search,
+        test_absolute_paths_inside_repo,
     ]
 
     print(f"Running {len(tests)} tests...\n")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests for ranged file reads.
+
+Tests cover:
+- Line ranges, head and tail
+- Byte ranges
+- Line offset index caching and invalidation
+- Memory-mapped reads of large files
+- FileOperationsTool read parameters
+"""
+
+import sys
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tools import line_reader
+from tools.line_reader import LineReader
+from tools.file_ops import FileOperationsTool
+from core.config import Config
+
+
+def create_test_file(lines=100, trailing_newline=True):
+    """Create a numbered text file in a temporary directory."""
+    temp_dir = Path(tempfile.mkdtemp())
+    path = temp_dir / "numbers.txt"
+    content = "\n".join(f"line {i}" for i in range(1, lines + 1))
+    path.write_text(content + ("\n" if trailing_newline else ""))
+    return path, temp_dir
+
+
+def test_read_line_range():
+    """Test reading a range of lines."""
+    path, temp_dir = create_test_file()
+    try:
+        reader = LineReader()
+        chunk = reader.read_lines(path, 10, 12)
+
+        assert chunk.text == "line 10\nline 11\nline 12\n"
+        assert (chunk.start_line, chunk.end_line) == (10, 12)
+
+        # Range past the end is clipped
+        chunk = reader.read_lines(path, 99, 500)
+        assert chunk.text == "line 99\nline 100\n"
+        assert chunk.total_lines == 100
+
+        # Range starting past the end is empty
+        assert reader.read_lines(path, 101, 105).text == ""
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_head_stops_early():
+    """Test head only scans the start of the file."""
+    path, temp_dir = create_test_file(lines=100000)
+    try:
+        reader = LineReader()
+        chunk = reader.read_head(path, 3)
+
+        assert chunk.text == "line 1\nline 2\nline 3\n"
+        assert chunk.total_lines is None  # File not scanned to the end
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_read_tail():
+    """Test reading the last lines with and without a trailing newline."""
+    for trailing in (True, False):
+        path, temp_dir = create_test_file(trailing_newline=trailing)
+        try:
+            chunk = LineReader().read_tail(path, 2)
+            assert chunk.text.rstrip("\n") == "line 99\nline 100"
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_read_bytes():
+    """Test byte ranges, including negative offsets."""
+    path, temp_dir = create_test_file(lines=3)
+    try:
+        reader = LineReader()
+        assert reader.read_bytes(path, 0, 6).text == "line 1"
+        assert reader.read_bytes(path, -7, 7).text == "line 3\n"
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_index_cache_and_invalidation():
+    """Test line indexes are reused and rebuilt when the file changes."""
+    path, temp_dir = create_test_file()
+    try:
+        reader = LineReader()
+        reader.read_lines(path, 1, 10)
+        reader.read_lines(path, 50, 60)
+        stats = reader.get_stats()
+        assert stats["index_misses"] == 1
+        assert stats["index_hits"] == 1
+
+        path.write_text("changed\ncontent with more bytes\n")
+        chunk = reader.read_lines(path, 2, 2)
+        assert chunk.text == "content with more bytes\n"
+        assert reader.get_stats()["index_misses"] == 2
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_large_file_mmap():
+    """Test memory-mapped reads match buffered reads."""
+    path, temp_dir = create_test_file(lines=5000)
+    original = line_reader.MMAP_THRESHOLD
+    try:
+        line_reader.MMAP_THRESHOLD = 1024  # Force the mmap path
+        chunk = LineReader().read_lines(path, 4000, 4001)
+        assert chunk.text == "line 4000\nline 4001\n"
+    finally:
+        line_reader.MMAP_THRESHOLD = original
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_file_ops_ranged_read():
+    """Test FileOperationsTool read parameters and the line cap."""
+    path, temp_dir = create_test_file()
+    try:
+        config = Config()
+        config.config.tools.file_ops.allowed_paths = [str(temp_dir)]
+        config.config.tools.file_ops.max_read_lines = 20
+        tool = FileOperationsTool(config)
+
+        result = tool._run(json.dumps({"action": "read", "path": str(path), "start_line": 5, "end_line": 6}))
+        assert result.startswith("✓ Read lines 5-6 of 100")
+        assert result.endswith("line 5\nline 6\n")
+
+        result = tool._run(json.dumps({"action": "read", "path": str(path), "tail": 1}))
+        assert result.endswith("line 100\n")
+
+        # Unranged reads are capped at max_read_lines
+        result = tool._run(json.dumps({"action": "read", "path": str(path)}))
+        assert "Read lines 1-20" in result and "start_line 21" in result
+        assert result.endswith("line 20\n")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-session agent registry.
+
+Tests cover:
+- One agent per session, reused across requests
+- LRU eviction of idle agents (never of running ones)
+- Bounded concurrency across sessions, serialized requests within one
+- Queue wait and per-session latency statistics
+- Web UI sessions getting separate agents and histories
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from web.agent_registry import SessionAgentRegistry
+
+
+class FakeAgent:
+    """Stands in for MetonAgent; tracks concurrent runs."""
+
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def __init__(self, session_id, delay=0.0):
+        self.session_id = session_id
+        self.delay = delay
+        self.messages = []
+
+    def run(self, message):
+        with FakeAgent.lock:
+            FakeAgent.running += 1
+            FakeAgent.max_running = max(FakeAgent.max_running, FakeAgent.running)
+        try:
+            time.sleep(self.delay)
+            self.messages.append(message)
+            return {"output": f"{self.session_id}: {message}", "iterations": 1, "tool_calls": []}
+        finally:
+            with FakeAgent.lock:
+                FakeAgent.running -= 1
+
+
+def create_test_registry(delay=0.0, **kwargs):
+    """Create a registry building fake agents, recording builds and evictions."""
+    built, evicted = [], []
+    FakeAgent.running = FakeAgent.max_running = 0
+
+    def factory(session_id):
+        built.append(session_id)
+        return FakeAgent(session_id, delay)
+
+    registry = SessionAgentRegistry(
+        factory, on_evict=lambda session_id, agent: evicted.append(session_id), **kwargs
+    )
+    return registry, built, evicted
+
+
+def run_in_session(registry, session_id, message):
+    """Run one message on a session's agent."""
+    with registry.session(session_id) as agent:
+        return agent.run(message)
+
+
+def test_agent_per_session():
+    """Test each session gets its own agent, reused across requests."""
+    registry, built, evicted = create_test_registry()
+
+    run_in_session(registry, "a", "one")
+    run_in_session(registry, "b", "two")
+    run_in_session(registry, "a", "three")
+
+    assert built == ["a", "b"]
+    assert registry.get("a").messages == ["one", "three"]
+    assert registry.get("b").messages == ["two"]
+    assert registry.size() == 2
+
+
+def test_lru_eviction():
+    """Test the least recently used idle agent is evicted beyond max_agents."""
+    registry, built, evicted = create_test_registry(max_agents=2)
+
+    for session_id in ("a", "b", "a", "c"):
+        run_in_session(registry, session_id, "hi")
+
+    assert evicted == ["b"]
+    assert registry.get("b") is None and registry.get("a") is not None
+    assert registry.get_stats()["evicted"] == 1
+
+    # An evicted session gets a fresh agent
+    run_in_session(registry, "b", "back")
+    assert built == ["a", "b", "c", "b"]
+
+
+def test_running_agent_not_evicted():
+    """Test an agent in use survives eviction pressure."""
+    registry, built, evicted = create_test_registry(max_agents=1, max_concurrent=2)
+
+    with registry.session("a") as agent:
+        run_in_session(registry, "b", "hi")
+        assert registry.get("a") is agent  # Over the limit, but running
+    run_in_session(registry, "c", "hi")
+
+    assert "a" in evicted and registry.size() == 1
+
+
+def test_bounded_concurrency():
+    """Test runs across sessions are capped and queue wait is measured."""
+    registry, built, evicted = create_test_registry(delay=0.2, max_concurrent=2)
+
+    threads = [
+        threading.Thread(target=run_in_session, args=(registry, f"s{i}", "hi"))
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert FakeAgent.max_running == 2
+    stats = registry.get_stats()
+    assert stats["running"] == 0 and stats["waiting"] == 0
+    assert stats["wait_p95_ms"] >= 150  # Two requests waited for a slot
+
+
+def test_session_requests_serialized():
+    """Test two requests from one session never run at once."""
+    registry, built, evicted = create_test_registry(delay=0.1, max_concurrent=4)
+
+    threads = [
+        threading.Thread(target=run_in_session, args=(registry, "a", f"m{i}"))
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert FakeAgent.max_running == 1
+    assert built == ["a"] and len(registry.get("a").messages) == 3
+
+
+def test_session_stats_and_remove():
+    """Test per-session latency stats and removing a session."""
+    registry, built, evicted = create_test_registry(delay=0.05)
+
+    run_in_session(registry, "a", "one")
+    run_in_session(registry, "a", "two")
+
+    session = registry.get_stats("a")["session"]
+    assert session["requests"] == 2
+    assert session["avg_ms"] >= 40 and session["p95_ms"] >= session["avg_ms"] * 0.5
+    assert registry.get_stats("unknown")["session"]["requests"] == 0
+
+    assert registry.remove("a") and evicted == ["a"]
+    assert not registry.remove("a")
+    assert registry.get_stats("a")["session"]["requests"] == 0
+
+
+def test_web_ui_sessions_isolated():
+    """Test two browser sessions get separate agents and histories."""
+    import shutil
+    import tempfile
+    from web.app import MetonWebUI
+
+    temp_dir = tempfile.mkdtemp()
+    config_path = Path(temp_dir) / "config.yaml"
+    config_path.write_text(f"web_ui:\n  sessions:\n    storage_path: {temp_dir}/sessions\n")
+    ui = MetonWebUI(config_path=str(config_path))
+    ui.model_manager = object()  # Skip building the shared components
+    ui.agents.factory = lambda session_id: FakeAgent(session_id)
+
+    try:
+        first, second = ui.open_session(), ui.open_session()
+        ui.process_message("hello", [], first)
+        history, _ = ui.process_message("hi there", [], second)
+
+        assert history == [("hi there", f"{second}: hi there")]
+        assert ui.agents.get(first).messages == ["hello"]
+        assert [m.content for m in ui.histories[second]] == ["hi there", f"{second}: hi there"]
+        assert ui.conversation_history == []  # Default session untouched
+
+        saved = ui.session_manager.get_session(first).conversation_history
+        assert [m["content"] for m in saved] == ["hello", f"{first}: hello"]
+        assert "This session: 1 requests" in ui.format_status(first)
+
+        ui.close_session(first)
+        assert ui.agents.get(first) is None and first not in ui.histories
+    finally:
+        ui.cleanup()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_agent_per_session,
+        test_lru_eviction,
+        test_running_agent_not_evicted,
+        test_bounded_concurrency,
+        test_session_requests_serialized,
+        test_session_stats_and_remove,
+        test_web_ui_sessions_isolated,
+    ]
+
+    print(f"Running {len(tests)} tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{'='*60}")
+    print(f"Results: {passed} passed, {failed} failed out of {len(tests)} tests")
+
+    if failed == 0:
+        print("✅ All tests passed!")
+        return 0
+    else:
+        print(f"❌ {failed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(run_all_tests())
@@ -11,20 +11,24 @@ Tests cover:
 - Persistence (save/load)
 - Cleanup of expired sessions
 - Concurrent access
+- Conversation search indexing
 - Edge cases
 """
 
 import sys
+import json
 import tempfile
 import shutil
 import time
 from pathlib import Path
+from dataclasses import asdict
 from datetime import datetime, timedelta
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from web.session_manager import SessionManager, Session
+from core.conversation_index import ConversationSearchIndex
 
 
 def create_test_manager():
@@ -391,6 +395,163 @@ def test_list_sessions_sorted():
     cleanup_test_manager(manager, temp_dir)
 
 
+def test_session_search_index():
+    """Test that conversation history updates feed the search index."""
+    temp_dir = tempfile.mkdtemp()
+    index = ConversationSearchIndex(str(Path(temp_dir) / "search_index.db"))
+    manager = SessionManager(storage_path=temp_dir, search_index=index)
+
+    session_id = manager.create_session()
+    manager.update_session(session_id, conversation_history=[
+        {"role": "user", "content": "How does the reranker work?", "timestamp": "2026-03-01T10:00:00"}
+    ])
+
+    hits = index.search("reranker", source="web")
+    assert len(hits) == 1
+    assert hits[0].session_id == session_id
+
+    # A fresh index backfills from the session files
+    fresh = ConversationSearchIndex(str(Path(temp_dir) / "fresh_index.db"))
+    manager.search_index = fresh
+    assert manager.sync_search_index() == 1
+    assert len(fresh.search("reranker")) == 1
+
+    manager.delete_session(session_id)
+    assert fresh.search("reranker") == []
+
+    index.close()
+    fresh.close()
+    cleanup_test_manager(manager, temp_dir)
+
+
+def test_startup_reads_index_only():
+    """Test a new manager loads metadata from the index, bodies on first access."""
+    temp_dir = tempfile.mkdtemp()
+    manager1 = SessionManager(storage_path=temp_dir)
+    session_id = manager1.create_session()
+    manager1.update_session(session_id, conversation_history=[{"role": "user", "content": "Hi"}])
+
+    manager2 = SessionManager(storage_path=temp_dir)
+    assert manager2.sessions == {}
+    assert manager2.get_session_count() == 1
+    assert manager2.list_sessions()[0]["message_count"] == 1
+
+    assert manager2.get_session(session_id).conversation_history[0]["content"] == "Hi"
+    assert session_id in manager2.sessions
+
+    cleanup_test_manager(manager2, temp_dir)
+
+
+def test_history_appended_not_rewritten():
+    """Test new messages go to the history log, leaving the snapshot alone."""
+    manager, temp_dir = create_test_manager()
+    session_id = manager.create_session()
+    snapshot = Path(temp_dir) / f"session_{session_id}.json"
+    log = Path(temp_dir) / f"session_{session_id}.history.jsonl"
+    before = snapshot.read_text()
+
+    history = []
+    for i in range(3):
+        history = history + [{"role": "user", "content": f"m{i}"}]
+        manager.update_session(session_id, conversation_history=history)
+
+    assert snapshot.read_text() == before
+    assert len(log.read_text().splitlines()) == 4  # Header + 3 messages
+
+    # Clearing rewrites the snapshot and drops the log
+    manager.update_session(session_id, conversation_history=[])
+    assert not log.exists()
+    assert SessionManager(storage_path=temp_dir).get_session(session_id).conversation_history == []
+
+    cleanup_test_manager(manager, temp_dir)
+
+
+def test_stale_history_log_ignored():
+    """Test a log left over from an older snapshot isn't replayed."""
+    manager, temp_dir = create_test_manager()
+    session_id = manager.create_session()
+    manager.update_session(session_id, conversation_history=[{"role": "user", "content": "old"}])
+    log = Path(temp_dir) / f"session_{session_id}.history.jsonl"
+    leftover = log.read_text()
+
+    # Snapshot rewritten, but the process stopped before removing the log
+    manager.update_session(session_id, settings={"model": "x"})
+    log.write_text(leftover)
+
+    session = SessionManager(storage_path=temp_dir).get_session(session_id)
+    assert [m["content"] for m in session.conversation_history] == ["old"]
+    assert session.settings == {"model": "x"}
+
+    cleanup_test_manager(manager, temp_dir)
+
+
+def test_activity_updates_coalesced():
+    """Test get_session doesn't write files and activity is flushed to the index."""
+    temp_dir = tempfile.mkdtemp()
+    manager = SessionManager(storage_path=temp_dir, flush_interval=60)
+    session_id = manager.create_session()
+    index_file = Path(temp_dir) / "sessions_index.jsonl"
+    snapshot = Path(temp_dir) / f"session_{session_id}.json"
+    index_before, snapshot_before = index_file.read_text(), snapshot.read_text()
+
+    time.sleep(0.01)
+    for _ in range(5):
+        activity = manager.get_session(session_id).last_activity
+
+    assert index_file.read_text() == index_before
+    assert snapshot.read_text() == snapshot_before
+
+    assert manager.flush() == 1
+    assert len(index_file.read_text().splitlines()) == len(index_before.splitlines()) + 1
+    assert SessionManager(storage_path=temp_dir).list_sessions()[0]["last_activity"] == activity
+
+    manager.close()
+    cleanup_test_manager(manager, temp_dir)
+
+
+def test_index_built_from_existing_sessions():
+    """Test sessions saved without an index are indexed on first startup."""
+    temp_dir = tempfile.mkdtemp()
+    legacy = Session(
+        id="legacy", created_at="2026-01-01T10:00:00", last_activity="2026-01-01T11:00:00",
+        conversation_history=[{"role": "user", "content": "Old message"}]
+    )
+    with open(Path(temp_dir) / "session_legacy.json", "w") as f:
+        json.dump(asdict(legacy), f)
+
+    manager = SessionManager(storage_path=temp_dir)
+    assert manager.list_sessions()[0]["id"] == "legacy"
+    assert manager.get_session_stats()["total_messages"] == 1
+
+    manager.update_session("legacy", conversation_history=legacy.conversation_history + [
+        {"role": "assistant", "content": "New reply"}
+    ])
+    session = SessionManager(storage_path=temp_dir).get_session("legacy")
+    assert [m["content"] for m in session.conversation_history] == ["Old message", "New reply"]
+
+    cleanup_test_manager(manager, temp_dir)
+
+
+def test_close_stops_flush_timer():
+    """Test close() flushes pending activity and no timer fires afterwards."""
+    temp_dir = tempfile.mkdtemp()
+    manager = SessionManager(storage_path=temp_dir, flush_interval=0.2)
+    session_id = manager.create_session()
+    manager.get_session(session_id)
+    timer = manager._flush_timer
+    assert timer is not None
+
+    manager.close()
+    assert not timer.is_alive()
+    assert manager.list_sessions()[0]["id"] == session_id
+
+    # A timer outliving its storage directory has nothing to flush
+    manager.get_session(session_id)
+    shutil.rmtree(temp_dir)
+    assert manager.flush() == 0
+    manager.close()
+
+
 def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -415,6 +576,13 @@ def run_all_tests():
         test_session_dataclass,
         test_session_update_activity,
         test_list_sessions_sorted,
+        test_session_search_index,
+        test_startup_reads_index_only,
+        test_history_appended_not_rewritten,
+        test_stale_history_log_ignored,
+        test_activity_updates_coalesced,
+        test_index_built_from_existing_sessions,
+        test_close_stops_flush_timer,
     ]
 
     print(f"Running {len(tests)} tests...\n")
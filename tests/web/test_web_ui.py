@@ -496,6 +496,50 @@ def test_file_list_display_with_files():
     cleanup_test_ui(ui, temp_dir)
 
 
+def test_analytics_dashboard():
+    """Test the dashboard charts render from one analytics snapshot."""
+    temp_dir = tempfile.mkdtemp()
+    config_path = Path(temp_dir) / "config.yaml"
+    config_path.write_text(f"""
+analytics:
+  enabled: true
+  storage_path: {Path(temp_dir) / "analytics"}
+models:
+  primary: test-model
+""")
+    ui = MetonWebUI(config_path=str(config_path))
+
+    viz = ui.get_visualizations()
+    assert viz is not None and ui.get_visualizations() is viz
+    viz.analytics.record_query("Q1", "simple", 1.5, ["file_operations"], {"file_operations": 0.5})
+
+    performance, tool_usage, success, bottlenecks = ui.refresh_analytics()
+    assert performance is not None and tool_usage is not None and success is not None
+    assert bottlenecks is not None
+    assert viz.analytics.snapshot_builds == 1
+
+    cleanup_test_ui(ui, temp_dir)
+
+
+def test_analytics_dashboard_disabled():
+    """Test no charts are built when the dashboard is disabled."""
+    temp_dir = tempfile.mkdtemp()
+    config_path = Path(temp_dir) / "config.yaml"
+    config_path.write_text("""
+web_ui:
+  analytics:
+    enabled: false
+models:
+  primary: test-model
+""")
+    ui = MetonWebUI(config_path=str(config_path))
+
+    assert ui.get_visualizations() is None
+    assert ui.refresh_analytics() == (None, None, None, None)
+
+    cleanup_test_ui(ui, temp_dir)
+
+
 def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -525,6 +569,8 @@ def run_all_tests():
         test_rapid_messages,
         test_file_list_display_empty,
         test_file_list_display_with_files,
+        test_analytics_dashboard,
+        test_analytics_dashboard_disabled,
     ]
 
     print(f"Running {len(tests)} tests...\n")
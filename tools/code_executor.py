@@ -1,7 +1,9 @@
 """Code execution tools for Meton.
 
 This module provides safe Python code execution using subprocess isolation,
-AST-based import validation, and timeout protection.
+AST-based import validation, and timeout protection. Code runs in a pool of
+warm, resource-limited worker processes (see ``tools.sandbox_pool``) and is
+never written to disk.
 
 Example:
     >>> from core.config import Config
@@ -16,17 +18,17 @@ Example:
     >>> result = tool._run(input_json)
 """
 
-import os
 import ast
 import json
 import time
 import subprocess
-import tempfile
-from pathlib import Path
-from typing import List, Dict, Any, Set
+import threading
+from collections import deque
+from typing import List, Dict, Any, Optional, Set
 from pydantic import Field
 
 from tools.base import MetonBaseTool, ToolConfig, ToolError, ToolExecutionError, ToolValidationError
+from tools.sandbox_pool import SandboxPool, SandboxError, SandboxTimeoutError, latency_percentiles
 from utils.logger import setup_logger
 
 
@@ -51,6 +53,11 @@ class CodeExecutorConfig(ToolConfig):
     enabled: bool = True
     timeout: int = Field(default=5, ge=1)
     max_output_length: int = Field(default=10000, ge=100)
+    use_pool: bool = True
+    pool_size: int = Field(default=2, ge=1)
+    max_runs_per_worker: int = Field(default=50, ge=1)
+    memory_limit_mb: int = Field(default=512, ge=0)
+    preload_modules: List[str] = Field(default_factory=lambda: ["math", "json", "datetime", "collections", "re"])
 
 
 class ImportValidator:
@@ -160,10 +167,11 @@ class CodeExecutorTool(MetonBaseTool):
 
     Features:
     - Subprocess isolation for safety
+    - Warm worker pool with CPU/memory limits (no per-run interpreter startup)
     - AST-based import validation
     - Timeout protection
     - Output capture (stdout/stderr)
-    - Execution time tracking
+    - Execution time tracking and latency percentiles
 
     All code is validated before execution to prevent dangerous operations.
 
@@ -209,6 +217,7 @@ Blocked builtins: open, eval, exec, compile, __import__, etc.
         object.__setattr__(self, '_timeout', executor_config.timeout)
         object.__setattr__(self, '_max_output_length', executor_config.max_output_length)
         object.__setattr__(self, '_validator', ImportValidator())
+        object.__setattr__(self, '_latencies', deque(maxlen=SandboxPool.LATENCY_WINDOW))
 
         # Setup logger
         object.__setattr__(self, 'logger', setup_logger(
@@ -216,7 +225,39 @@ Blocked builtins: open, eval, exec, compile, __import__, etc.
             config=config.config.logging.model_dump()
         ))
 
-        self._log_execution("initialized", f"timeout={self._timeout}s")
+        # Warm workers are started on the first execution, not with the tool
+        object.__setattr__(self, '_executor_config', executor_config)
+        object.__setattr__(self, '_pool', None)
+        object.__setattr__(self, '_pool_wanted', executor_config.use_pool)
+        object.__setattr__(self, '_pool_lock', threading.Lock())
+
+        self._log_execution(
+            "initialized",
+            f"timeout={self._timeout}s, pool={executor_config.pool_size if executor_config.use_pool else 0}"
+        )
+
+    def _get_pool(self) -> Optional[SandboxPool]:
+        """Start the worker pool on first use.
+
+        Returns:
+            SandboxPool, or None if disabled or it failed to start (the
+            executor then uses a fresh interpreter per run)
+        """
+        with self._pool_lock:
+            if self._pool is None and self._pool_wanted:
+                config = self._executor_config
+                allowed = self._validator.get_allowed_imports()
+                try:
+                    object.__setattr__(self, '_pool', SandboxPool(
+                        size=config.pool_size,
+                        max_runs=config.max_runs_per_worker,
+                        memory_limit_mb=config.memory_limit_mb,
+                        preload=[m for m in config.preload_modules if m.split('.')[0] in allowed]
+                    ))
+                except SandboxError as e:
+                    object.__setattr__(self, '_pool_wanted', False)
+                    self._log_execution("pool_unavailable", str(e))
+            return self._pool
 
     def _run(self, input_str: str) -> str:
         """Execute Python code.
@@ -266,7 +307,7 @@ Blocked builtins: open, eval, exec, compile, __import__, etc.
             return self._handle_error(e, "executing code")
 
     def _execute_code(self, code: str) -> Dict[str, Any]:
-        """Execute code in subprocess.
+        """Execute code in a sandbox worker.
 
         Args:
             code: Python code to execute
@@ -275,67 +316,113 @@ Blocked builtins: open, eval, exec, compile, __import__, etc.
             Dict with success, output, error, and execution_time
         """
         start_time = time.time()
-
-        # Create temporary file for code
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_file = f.name
+        self._log_execution("executing", f"timeout={self._timeout}s")
 
         try:
-            # Execute in subprocess with timeout
-            self._log_execution("executing", f"timeout={self._timeout}s")
+            if self._get_pool() is not None:
+                returncode, stdout, stderr = self._execute_pooled(code)
+            else:
+                returncode, stdout, stderr = self._execute_subprocess(code)
+
+        except (SandboxTimeoutError, subprocess.TimeoutExpired):
+            execution_time = time.time() - start_time
+            self._log_execution("timeout", f"exceeded {self._timeout}s")
+
+            return {
+                "success": False,
+                "output": "",
+                "error": f"Code execution timed out after {self._timeout} seconds",
+                "execution_time": round(execution_time, 3)
+            }
+
+        except SandboxError as e:
+            execution_time = time.time() - start_time
+            self._log_execution("failed", str(e))
+
+            return {
+                "success": False,
+                "output": "",
+                "error": str(e),
+                "execution_time": round(execution_time, 3)
+            }
+
+        execution_time = time.time() - start_time
+        self._latencies.append(execution_time)
+
+        # Truncate output if too long
+        if len(stdout) > self._max_output_length:
+            stdout = stdout[:self._max_output_length] + "\n... (output truncated)"
+        if len(stderr) > self._max_output_length:
+            stderr = stderr[:self._max_output_length] + "\n... (output truncated)"
+
+        success = returncode == 0
+
+        self._log_execution(
+            "completed" if success else "failed",
+            f"time={execution_time:.3f}s, returncode={returncode}"
+        )
+
+        return {
+            "success": success,
+            "output": stdout.strip(),
+            "error": stderr.strip() if stderr else "",
+            "execution_time": round(execution_time, 3)
+        }
+
+    def _execute_pooled(self, code: str) -> tuple[int, str, str]:
+        """Run code in a warm pool worker.
 
-            process = subprocess.Popen(
-                ['python3', temp_file],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+        Args:
+            code: Python code to execute
 
-            try:
-                stdout, stderr = process.communicate(timeout=self._timeout)
-                execution_time = time.time() - start_time
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            SandboxTimeoutError: If execution timed out
+            SandboxError: If the worker failed
+        """
+        result = self._pool.execute(code, self._timeout, self._max_output_length)
+        return result["returncode"], result["stdout"], result["stderr"]
 
-                # Truncate output if too long
-                if len(stdout) > self._max_output_length:
-                    stdout = stdout[:self._max_output_length] + "\n... (output truncated)"
-                if len(stderr) > self._max_output_length:
-                    stderr = stderr[:self._max_output_length] + "\n... (output truncated)"
+    def _execute_subprocess(self, code: str) -> tuple[int, str, str]:
+        """Run code in a fresh interpreter (used when the pool is disabled).
 
-                success = process.returncode == 0
+        The code is piped to the interpreter's stdin rather than written
+        to a temporary file.
 
-                self._log_execution(
-                    "completed" if success else "failed",
-                    f"time={execution_time:.3f}s, returncode={process.returncode}"
-                )
+        Args:
+            code: Python code to execute
 
-                return {
-                    "success": success,
-                    "output": stdout.strip(),
-                    "error": stderr.strip() if stderr else "",
-                    "execution_time": round(execution_time, 3)
-                }
+        Returns:
+            Tuple of (returncode, stdout, stderr)
 
-            except subprocess.TimeoutExpired:
-                process.kill()
-                process.wait()
-                execution_time = time.time() - start_time
+        Raises:
+            subprocess.TimeoutExpired: If execution timed out
+        """
+        process = subprocess.Popen(
+            ['python3', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
 
-                self._log_execution("timeout", f"exceeded {self._timeout}s")
+        try:
+            stdout, stderr = process.communicate(input=code, timeout=self._timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
 
-                return {
-                    "success": False,
-                    "output": "",
-                    "error": f"Code execution timed out after {self._timeout} seconds",
-                    "execution_time": round(execution_time, 3)
-                }
+        return process.returncode, stdout, stderr
 
-        finally:
-            # Clean up temp file
-            try:
-                os.unlink(temp_file)
-            except Exception:
-                pass
+    def close(self) -> None:
+        """Stop the sandbox worker pool (if it was started)."""
+        with self._pool_lock:
+            object.__setattr__(self, '_pool_wanted', False)
+            if self._pool is not None:
+                self._pool.shutdown()
 
     def get_info(self) -> Dict[str, Any]:
         """Get tool information.
@@ -349,5 +436,19 @@ Blocked builtins: open, eval, exec, compile, __import__, etc.
             "max_output_length": self._max_output_length,
             "allowed_imports": sorted(list(self._validator.get_allowed_imports())),
             "blocked_imports": sorted(list(self._validator.get_blocked_imports())),
+            "execution_stats": self._get_execution_stats(),
+            "sandbox_pool": self._pool.get_stats() if self._pool is not None else None,
         })
         return base_info
+
+    def _get_execution_stats(self) -> Dict[str, Any]:
+        """Latency percentiles (ms) over recent completed executions.
+
+        Returns:
+            Dictionary with count, p50_ms, p95_ms, p99_ms and mean_ms
+        """
+        latencies = list(self._latencies)
+        stats: Dict[str, Any] = {"count": len(latencies)}
+        stats.update(latency_percentiles(latencies))
+        stats["mean_ms"] = round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0
+        return stats
@@ -18,6 +18,7 @@ Example:
 
 import json
 import os
+import threading
 from typing import Dict, Any, List, Optional
 from pydantic import Field
 
@@ -47,6 +48,9 @@ class CodebaseSearchConfig(ToolConfig):
     top_k: int = Field(default=5, ge=1, le=50)
     similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
     max_code_length: int = Field(default=500, ge=100, le=10000)
+    rerank: str = Field(default="auto", pattern="^(auto|always|never)$")
+    rerank_multiplier: int = Field(default=5, ge=1, le=20)
+    rerank_model: Optional[str] = None
 
 
 class CodebaseSearchTool(MetonBaseTool):
@@ -57,6 +61,7 @@ class CodebaseSearchTool(MetonBaseTool):
     - DISABLED BY DEFAULT - must be explicitly enabled after indexing
     - Configurable number of results (top_k)
     - Similarity threshold filtering
+    - Optional second-stage reranking of over-fetched candidates
     - Automatic code snippet truncation
     - Sorted results by relevance
 
@@ -91,6 +96,7 @@ Returns: JSON with search results:
             "name": "authenticate_user",
             "lines": "45-67",
             "similarity": 0.89,
+            "rerank_score": 0.74,  (only when results were reranked)
             "code_snippet": "def authenticate_user(username, password):\\n    ..."
         },
         ...
@@ -126,6 +132,9 @@ Note: This tool is DISABLED BY DEFAULT. You must:
         object.__setattr__(self, '_top_k', search_config.top_k)
         object.__setattr__(self, '_similarity_threshold', search_config.similarity_threshold)
         object.__setattr__(self, '_max_code_length', search_config.max_code_length)
+        object.__setattr__(self, '_rerank_mode', getattr(search_config, 'rerank', "auto"))
+        object.__setattr__(self, '_rerank_multiplier', getattr(search_config, 'rerank_multiplier', 5))
+        object.__setattr__(self, '_rerank_model', getattr(search_config, 'rerank_model', None))
 
         # Get RAG config
         rag_config = config.config.rag
@@ -140,8 +149,10 @@ Note: This tool is DISABLED BY DEFAULT. You must:
             config=config.config.logging.model_dump()
         ))
 
-        # Lazy-loaded indexer (only load when needed)
+        # Lazy-loaded indexer and reranker (only load when needed)
         object.__setattr__(self, '_indexer', None)
+        object.__setattr__(self, '_indexer_lock', threading.Lock())
+        object.__setattr__(self, '_reranker', None)
 
         self._log_execution(
             "initialized",
@@ -227,6 +238,18 @@ Note: This tool is DISABLED BY DEFAULT. You must:
         if self._indexer is not None:
             return self._indexer
 
+        # A query and the background prewarm may race to load the index
+        with self._indexer_lock:
+            if self._indexer is not None:
+                return self._indexer
+            return self._build_indexer()
+
+    def _build_indexer(self):
+        """Build the indexer and load the saved index.
+
+        Returns:
+            CodebaseIndexer instance or None if loading fails
+        """
         try:
             # Import here to avoid circular dependencies
             from rag.embeddings import EmbeddingModel
@@ -263,6 +286,37 @@ Note: This tool is DISABLED BY DEFAULT. You must:
             self._log_execution("indexer_load_error", str(e))
             return None
 
+    def _should_rerank(self, query: str) -> bool:
+        """Decide whether to rerank this query.
+
+        Args:
+            query: Search query
+
+        Returns:
+            True if candidates should be over-fetched and reranked
+        """
+        if self._rerank_mode == "always":
+            return True
+        if self._rerank_mode == "never":
+            return False
+
+        try:
+            from optimization.query_optimizer import get_optimizer
+            return get_optimizer().optimize_rag_search(query)["use_reranking"]
+        except Exception:
+            return False
+
+    def _get_reranker(self):
+        """Lazy-load the reranker when first needed.
+
+        Returns:
+            Reranker instance
+        """
+        if self._reranker is None:
+            from rag.reranker import Reranker
+            object.__setattr__(self, '_reranker', Reranker(model_name=self._rerank_model))
+        return self._reranker
+
     def _search(self, query: str) -> Dict[str, Any]:
         """Perform semantic code search.
 
@@ -294,23 +348,36 @@ Note: This tool is DISABLED BY DEFAULT. You must:
                     "error": "Index is empty. Index your codebase first."
                 }
 
-            self._log_execution("searching", f"query='{query}', top_k={self._top_k}")
+            rerank = self._should_rerank(query)
+            fetch_k = self._top_k * self._rerank_multiplier if rerank else self._top_k
+            self._log_execution(
+                "searching",
+                f"query='{query}', top_k={self._top_k}, rerank={rerank}, candidates={fetch_k}"
+            )
 
             # Perform search
-            raw_results = indexer.search(query, top_k=self._top_k)
+            raw_results = indexer.search(query, top_k=fetch_k)
+
+            # Convert distance to similarity score (lower distance = higher similarity)
+            # Using inverse formula: similarity = 1 / (1 + distance)
+            # This provides a more gradual decay than exponential.
+            # Filter by similarity threshold before reranking
+            candidates = [
+                (metadata, distance) for metadata, distance in raw_results
+                if 1.0 / (1.0 + distance) >= self._similarity_threshold
+            ]
+
+            # Second stage: rescore the over-fetched candidates, keep top_k
+            if rerank and candidates:
+                ranked = self._get_reranker().rerank(query, candidates, self._top_k)
+            else:
+                ranked = [(metadata, distance, None) for metadata, distance in candidates]
 
-            # Format and filter results
+            # Format results
             formatted_results = []
-            for metadata, distance in raw_results:
-                # Convert distance to similarity score (lower distance = higher similarity)
-                # Using inverse formula: similarity = 1 / (1 + distance)
-                # This provides a more gradual decay than exponential
+            for metadata, distance, rerank_score in ranked:
                 similarity = 1.0 / (1.0 + distance)
 
-                # Filter by similarity threshold
-                if similarity < self._similarity_threshold:
-                    continue
-
                 # Format code snippet (truncate if needed)
                 code = metadata.get("code", "")
                 if len(code) > self._max_code_length:
@@ -330,6 +397,8 @@ Note: This tool is DISABLED BY DEFAULT. You must:
                     "similarity": round(similarity, 4),
                     "code_snippet": code_snippet
                 })
+                if rerank_score is not None:
+                    formatted_results[-1]["rerank_score"] = round(rerank_score, 4)
 
             self._log_execution(
                 "completed",
@@ -387,6 +456,8 @@ Note: This tool is DISABLED BY DEFAULT. You must:
         """
         try:
             object.__setattr__(self, '_indexer', None)
+            if self._reranker is not None:
+                self._reranker.clear_cache()  # Chunk ids may now point at new code
             indexer = self._load_indexer()
             return indexer is not None
         except Exception as e:
@@ -418,6 +489,9 @@ Note: This tool is DISABLED BY DEFAULT. You must:
             "top_k": self._top_k,
             "similarity_threshold": self._similarity_threshold,
             "max_code_length": self._max_code_length,
+            "rerank": self._rerank_mode,
+            "rerank_multiplier": self._rerank_multiplier,
+            "reranker": self._reranker.get_stats() if self._reranker is not None else None,
             "index_exists": index_exists,
             "index_size": index_size,
             "index_path": self._index_path
@@ -24,9 +24,14 @@ from typing import List, Optional, Dict, Any
 from pydantic import Field
 
 from tools.base import MetonBaseTool, ToolConfig, ToolError, ToolExecutionError, ToolValidationError
+from tools.line_reader import LineReader, LineChunk
 from utils.logger import setup_logger
 
 
+# Read parameters selecting part of a file
+READ_RANGE_PARAMS = ("start_line", "end_line", "head", "tail", "offset", "length")
+
+
 # Custom Exceptions
 class FileOperationError(ToolError):
     """Base exception for file operation errors."""
@@ -48,13 +53,15 @@ class FileOpsConfig(ToolConfig):
     allowed_paths: List[str] = Field(default_factory=lambda: ["/media/development/projects/"])
     blocked_paths: List[str] = Field(default_factory=lambda: ["/etc/", "/sys/", "/proc/"])
     max_file_size_mb: int = 10
+    max_read_lines: int = 2000
+    line_index_cache_size: int = 32
 
 
 class FileOperationsTool(MetonBaseTool):
     """Tool for safe file system operations.
 
     Supports:
-    - Reading files (text only)
+    - Reading files (text only), whole or by line/byte range, head or tail
     - Writing files
     - Listing directory contents
     - Creating directories
@@ -79,6 +86,10 @@ Input format: JSON string with 'action' and parameters:
 
 Actions:
 - read: {"action": "read", "path": "/path/to/file"}
+  Optional ranges (use these for large files):
+    {"start_line": 100, "end_line": 150}  lines 100-150 (1-based, inclusive)
+    {"head": 50} / {"tail": 50}            first / last 50 lines
+    {"offset": 4096, "length": 2048}       byte range (negative offset counts from end)
 - write: {"action": "write", "path": "/path/to/file", "content": "text"}
 - list: {"action": "list", "path": "/path/to/directory"}
 - find: {"action": "find", "path": "/path/to/directory", "pattern": "*.py", "recursive": true}
@@ -101,6 +112,8 @@ Returns: Operation result or error message."""
         object.__setattr__(self, '_allowed_paths', [Path(p) for p in file_ops_config.allowed_paths])
         object.__setattr__(self, '_blocked_paths', [Path(p) for p in file_ops_config.blocked_paths])
         object.__setattr__(self, '_max_file_size', file_ops_config.max_file_size_mb * 1024 * 1024)
+        object.__setattr__(self, '_max_read_lines', file_ops_config.max_read_lines)
+        object.__setattr__(self, '_line_reader', LineReader(file_ops_config.line_index_cache_size))
 
         # Setup logger
         object.__setattr__(self, 'logger', setup_logger(
@@ -155,7 +168,7 @@ Returns: Operation result or error message."""
 
             # Route to appropriate method
             if action == "read":
-                return self._read_file(Path(path_str))
+                return self._read_file(Path(path_str), params)
             elif action == "write":
                 content = params.get("content", "")
                 return self._write_file(Path(path_str), content)
@@ -224,18 +237,28 @@ Returns: Operation result or error message."""
         except Exception as e:
             raise ValueError(f"Path validation failed: {e}")
 
-    def _read_file(self, path: Path) -> str:
-        """Read and return file contents.
+    def _read_file(self, path: Path, params: Optional[Dict[str, Any]] = None) -> str:
+        """Read file contents, whole or a range.
+
+        Whole-file reads return at most max_read_lines lines. Ranged reads
+        only touch the part of the file they return, so they also work on
+        files above the size limit.
 
         Args:
             path: Path to file
+            params: Optional range parameters (start_line/end_line, head,
+                tail, or offset/length)
 
         Returns:
             File contents or error message
 
         Example:
             >>> content = self._read_file(Path("/path/to/file.py"))
+            >>> page = self._read_file(Path("/path/to/big.log"), {"start_line": 500, "end_line": 600})
         """
+        params = params or {}
+        ranged = any(params.get(key) is not None for key in READ_RANGE_PARAMS)
+
         try:
             self._log_execution("read_file", f"path={path}")
 
@@ -249,36 +272,102 @@ Returns: Operation result or error message."""
             if not path.is_file():
                 return f"✗ Path is not a file: {path}"
 
-            # Check file size
+            # Check file size (ranged reads are bounded by the range instead)
             file_size = path.stat().st_size
-            if file_size > self._max_file_size:
+            if file_size > self._max_file_size and not ranged:
                 size_mb = file_size / (1024 * 1024)
                 limit_mb = self._max_file_size / (1024 * 1024)
                 raise FileSizeLimitError(
-                    f"✗ File is {size_mb:.1f}MB, exceeds limit of {limit_mb:.0f}MB"
+                    f"✗ File is {size_mb:.1f}MB, exceeds limit of {limit_mb:.0f}MB. "
+                    f"Use start_line/end_line, head, tail or offset/length to read part of it"
                 )
 
             # Try to read as text
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Count lines
-                line_count = content.count('\n') + 1
+                chunk = self._read_range(path, params)
+            except UnicodeDecodeError:
+                return f"✗ File {path} appears to be binary (not text)"
+            except (TypeError, ValueError) as e:
+                return f"✗ Invalid read range: {e}"
 
-                if self.logger:
-                    self.logger.info(f"Read {line_count} lines from {path}")
+            header = self._describe_chunk(path, chunk, params)
 
-                return f"✓ Read {line_count} lines from {path}\n\n{content}"
+            if self.logger:
+                self.logger.info(header[2:])
 
-            except UnicodeDecodeError:
-                return f"✗ File {path} appears to be binary (not text)"
+            return f"{header}\n\n{chunk.text}"
 
         except (PathNotAllowedError, FileSizeLimitError) as e:
             return str(e)
         except Exception as e:
             return self._handle_error(e, f"reading file {path}")
 
+    def _read_range(self, path: Path, params: Dict[str, Any]) -> LineChunk:
+        """Read the part of a file selected by read parameters.
+
+        Args:
+            path: Path to file
+            params: Read parameters
+
+        Returns:
+            LineChunk with the selected text
+
+        Raises:
+            UnicodeDecodeError: If the file is binary
+            ValueError: If the range is invalid
+        """
+        reader = self._line_reader
+        max_bytes = self._max_file_size
+
+        if params.get("offset") is not None or params.get("length") is not None:
+            length = int(params.get("length") or self._max_file_size)
+            return reader.read_bytes(path, int(params.get("offset") or 0), min(length, max_bytes))
+        if params.get("tail") is not None:
+            return reader.read_tail(path, min(int(params["tail"]), self._max_read_lines), max_bytes)
+        if params.get("head") is not None:
+            return reader.read_head(path, min(int(params["head"]), self._max_read_lines), max_bytes)
+
+        start = int(params.get("start_line") or 1)
+        end = params.get("end_line")
+        end = int(end) if end is not None else start + self._max_read_lines - 1
+        # Cap the page size so one call can't flood the prompt
+        end = min(end, start + self._max_read_lines - 1)
+        return reader.read_lines(path, start, end, max_bytes)
+
+    def _describe_chunk(self, path: Path, chunk: LineChunk, params: Dict[str, Any]) -> str:
+        """Build the status line for a read result.
+
+        Args:
+            path: Path that was read
+            chunk: Text that was read
+            params: Read parameters
+
+        Returns:
+            Status line (starting with ✓)
+        """
+        if chunk.start_line == 0 and chunk.end_line == 0 and params.get("tail") is None:
+            return f"✓ Read {len(chunk.text.encode('utf-8'))} bytes of {chunk.file_size} from {path}"
+
+        if chunk.end_line:
+            count = chunk.end_line - chunk.start_line + 1
+        else:
+            count = len(chunk.text.splitlines())
+        whole_file = chunk.start_line == 1 and chunk.total_lines == chunk.end_line
+
+        if whole_file:
+            header = f"✓ Read {chunk.total_lines} lines from {path}"
+        elif chunk.end_line == 0:
+            header = f"✓ Read last {count} lines from {path}"
+        else:
+            total = chunk.total_lines if chunk.total_lines is not None else "?"
+            header = f"✓ Read lines {chunk.start_line}-{chunk.end_line} of {total} from {path}"
+            if chunk.total_lines is None or chunk.end_line < chunk.total_lines:
+                header += f" (more lines follow; read from start_line {chunk.end_line + 1})"
+
+        if chunk.truncated:
+            header += " (output truncated)"
+        return header
+
     def _write_file(self, path: Path, content: str) -> str:
         """Write content to file.
 
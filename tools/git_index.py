@@ -0,0 +1,316 @@
+"""
+Commit Index - Persistent commit metadata for fast history queries.
+
+Reads the whole history once with a single ``git log --numstat`` call,
+stores sha, author, date, message and touched paths (with line counts) in
+``.git/meton/commit_index.json`` and afterwards only reads the commits
+added since the last indexed HEAD. Message, author, path and date queries
+then run in memory over the full history instead of re-walking commits
+through GitPython on every call.
+
+Example:
+    >>> from git import Repo
+    >>> from tools.git_index import CommitIndex
+    >>>
+    >>> index = CommitIndex(Repo("."))
+    >>> index.update()
+    >>> index.search(query="retry", path="core/", since="2024-01-01")
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+INDEX_VERSION = 1
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+# sha, parents, author, email, commit time, subject, body; --numstat lines follow
+LOG_FORMAT = f"{RECORD_SEP}%H{FIELD_SEP}%P{FIELD_SEP}%an{FIELD_SEP}%ae{FIELD_SEP}%ct{FIELD_SEP}%s{FIELD_SEP}%b{FIELD_SEP}"
+
+
+class CommitIndexError(Exception):
+    """Commit index cannot be built or read."""
+    pass
+
+
+def parse_date(value: Union[str, datetime, int, float, None]) -> Optional[float]:
+    """
+    Convert a date filter to a Unix timestamp.
+
+    Args:
+        value: ISO date/datetime string, datetime, timestamp or None
+
+    Returns:
+        Timestamp, or None if no value was given
+
+    Raises:
+        ValueError: If a string isn't an ISO date
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return datetime.fromisoformat(str(value)).timestamp()
+
+
+def parse_log(output: str) -> Iterator[Dict[str, Any]]:
+    """
+    Parse ``git log --numstat --format=LOG_FORMAT`` output.
+
+    Args:
+        output: Raw git log output
+
+    Yields:
+        Commit dictionaries (newest first, as git prints them)
+    """
+    for record in output.split(RECORD_SEP)[1:]:
+        fields = record.split(FIELD_SEP)
+        if len(fields) < 8:
+            continue
+        sha, parents, author, email, timestamp, subject, body, numstat = fields[:8]
+
+        files = []
+        for line in numstat.strip().splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            # Binary files show "-" instead of line counts
+            files.append([path, int(added) if added.isdigit() else 0, int(deleted) if deleted.isdigit() else 0])
+
+        yield {
+            "sha": sha,
+            "parents": parents.split(),
+            "author": author,
+            "email": email,
+            "date": int(timestamp),
+            "subject": subject,
+            "body": body.strip(),
+            "files": files
+        }
+
+
+class CommitIndex:
+    """
+    Commit metadata for a repository's HEAD history.
+
+    Commits are kept newest first. Updates are incremental while the old
+    HEAD is an ancestor of the new one; after a rebase or branch switch the
+    index is rebuilt.
+    """
+
+    def __init__(self, repo, index_path: Optional[str] = None):
+        """
+        Initialize the commit index.
+
+        Args:
+            repo: GitPython Repo
+            index_path: JSON file to persist to (default: .git/meton/commit_index.json)
+        """
+        self.repo = repo
+        self.index_path = Path(index_path) if index_path else Path(repo.git_dir) / "meton" / "commit_index.json"
+        self.head: Optional[str] = None
+        self.commits: List[Dict[str, Any]] = []
+        self._by_sha: Dict[str, int] = {}
+        self._by_path: Dict[str, List[int]] = {}
+        self.lock = threading.RLock()
+        self._load()
+
+    # ========== Persistence ==========
+
+    def _load(self) -> None:
+        """Load the persisted index if it exists and is current."""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return  # Rebuilt on next update
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.head = data.get("head")
+        self.commits = data.get("commits", [])
+        self._reindex()
+
+    def save(self) -> None:
+        """Write the index to disk (atomically)."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with self.lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "head": self.head, "commits": self.commits}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _reindex(self) -> None:
+        """Rebuild the sha and path lookup tables."""
+        self._by_sha = {commit["sha"]: i for i, commit in enumerate(self.commits)}
+        self._by_path = {}
+        for i, commit in enumerate(self.commits):
+            for path, _, _ in commit["files"]:
+                self._by_path.setdefault(path, []).append(i)
+
+    # ========== Updates ==========
+
+    def _current_head(self) -> Optional[str]:
+        """SHA of HEAD, or None for an empty repository."""
+        try:
+            return self.repo.head.commit.hexsha
+        except ValueError:
+            return None
+
+    def is_current(self) -> bool:
+        """Whether the index covers the current HEAD."""
+        return self.head == self._current_head()
+
+    def update(self) -> int:
+        """
+        Index commits added since the last indexed HEAD.
+
+        Returns:
+            Number of commits added
+
+        Raises:
+            CommitIndexError: If git log fails
+        """
+        with self.lock:
+            head = self._current_head()
+            if head == self.head:
+                return 0
+            if head is None:
+                self.head, self.commits = None, []
+                self._reindex()
+                return 0
+
+            incremental = bool(self.head) and self._is_ancestor(self.head, head)
+            revision = f"{self.head}..{head}" if incremental else head
+            try:
+                output = self.repo.git.log(revision, "--no-renames", "--numstat", f"--format={LOG_FORMAT}")
+            except Exception as e:
+                raise CommitIndexError(f"git log failed: {e}")
+
+            new_commits = list(parse_log(output))
+            self.commits = new_commits + self.commits if incremental else new_commits
+            self.head = head
+            self._reindex()
+
+        try:
+            self.save()
+        except OSError:
+            pass  # Read-only .git: keep the in-memory index
+        return len(new_commits)
+
+    def _is_ancestor(self, old: str, new: str) -> bool:
+        """Whether old is reachable from new (fast-forward)."""
+        try:
+            return self.repo.is_ancestor(old, new)
+        except Exception:
+            return False  # Old HEAD no longer exists (gc'd after a rebase)
+
+    # ========== Queries ==========
+
+    def get(self, sha: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an indexed commit by full or abbreviated SHA.
+
+        Args:
+            sha: Commit SHA (at least 4 characters)
+
+        Returns:
+            Commit dictionary or None
+        """
+        with self.lock:
+            if sha in self._by_sha:
+                return self.commits[self._by_sha[sha]]
+            if len(sha) >= 4:
+                for full_sha, i in self._by_sha.items():
+                    if full_sha.startswith(sha):
+                        return self.commits[i]
+        return None
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        author: Optional[str] = None,
+        path: Optional[str] = None,
+        since: Union[str, datetime, None] = None,
+        until: Union[str, datetime, None] = None,
+        max_results: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Find commits matching all given filters, newest first.
+
+        Args:
+            query: Case-insensitive substring of the message or author name
+            author: Case-insensitive substring of the author name or email
+            path: File path, or directory prefix, the commit touched
+            since: Only commits at or after this date (ISO string or datetime)
+            until: Only commits at or before this date
+            max_results: Maximum commits to return
+
+        Returns:
+            List of commit dictionaries
+        """
+        query = query.lower() if query else None
+        author = author.lower() if author else None
+        since_ts, until_ts = parse_date(since), parse_date(until)
+
+        with self.lock:
+            if path:
+                candidates = sorted(self._path_matches(path))
+            else:
+                candidates = range(len(self.commits))
+
+            results = []
+            for i in candidates:
+                commit = self.commits[i]
+                if since_ts is not None and commit["date"] < since_ts:
+                    continue
+                if until_ts is not None and commit["date"] > until_ts:
+                    continue
+                if author and author not in commit["author"].lower() and author not in commit["email"].lower():
+                    continue
+                if query and not (
+                    query in commit["subject"].lower()
+                    or query in commit["body"].lower()
+                    or query in commit["author"].lower()
+                ):
+                    continue
+                results.append(commit)
+                if len(results) >= max_results:
+                    break
+            return results
+
+    def _path_matches(self, path: str) -> set:
+        """Indices of commits touching a file or anything under a directory."""
+        path = path.strip("/")
+        if path in ("", "."):
+            return set(range(len(self.commits)))
+        if path in self._by_path:
+            return set(self._by_path[path])
+        prefix = path + "/"
+        matches = set()
+        for indexed_path, indices in self._by_path.items():
+            if indexed_path.startswith(prefix):
+                matches.update(indices)
+        return matches
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Indexed HEAD, commit and path counts and the index location
+        """
+        with self.lock:
+            return {
+                "head": self.head,
+                "commits": len(self.commits),
+                "paths": len(self._by_path),
+                "index_path": str(self.index_path)
+            }
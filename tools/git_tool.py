@@ -9,11 +9,14 @@ Provides git repository operations:
 - Commit message generation
 - Branch operations
 - File blame and history
+- Indexed commit search over the full history
+- Semantic commit search over embedded messages and diff summaries
 """
 
 import os
 import re
 import warnings
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -28,16 +31,22 @@ except ImportError:
     InvalidGitRepositoryError = Exception
     GitCommandError = Exception
 
+from tools.git_index import CommitIndex, CommitIndexError, LOG_FORMAT, parse_log
+
+BLAME_CACHE_SIZE = 128  # Cached (path, blob, range) blame results
+
 
 class GitTool:
     """Git integration for repository analysis and operations."""
 
-    def __init__(self, repo_path: str = "."):
+    def __init__(self, repo_path: str = ".", index_path: Optional[str] = None, embedder=None):
         """
         Initialize Git tool.
 
         Args:
             repo_path: Path to git repository
+            index_path: Commit index file (default: .git/meton/commit_index.json)
+            embedder: Embedding model for semantic search (default: EmbeddingModel, loaded on first use)
         """
         if not GIT_AVAILABLE:
             raise ImportError("GitPython not installed. Run: pip install GitPython")
@@ -45,6 +54,11 @@ class GitTool:
         self.repo_path = Path(repo_path).resolve()
         self.repo = self._initialize_repo()
         self.max_diff_size = 5000  # Max lines in diff
+        self.index_path = index_path
+        self._commit_index: Optional[CommitIndex] = None
+        self._embedder = embedder
+        self._semantic_index = None
+        self._blame_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
 
     def _initialize_repo(self) -> Optional[Repo]:
         """
@@ -61,10 +75,56 @@ class GitTool:
             warnings.warn(f"Failed to initialize git repository: {e}", UserWarning)
             return None
 
+    def _repo_relative(self, path: Optional[str]) -> Optional[str]:
+        """
+        Express a path relative to the repository root, as the index stores it.
+
+        Args:
+            path: Absolute path inside the repo, or a path relative to its root
+
+        Returns:
+            POSIX path relative to the root ("." for the root itself)
+
+        Raises:
+            ValueError: If an absolute path is outside the repository
+        """
+        if not path:
+            return path
+        root = Path(self.repo.working_tree_dir).resolve()
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                candidate = candidate.resolve().relative_to(root)
+            except ValueError:
+                raise ValueError(f"{path} is outside the repository ({root})") from None
+        return candidate.as_posix()
+
     def is_git_repo(self) -> bool:
         """Check if current directory is a git repository."""
         return self.repo is not None
 
+    @property
+    def commit_index(self) -> CommitIndex:
+        """Commit metadata index, brought up to date with HEAD on access."""
+        if self._commit_index is None:
+            self._commit_index = CommitIndex(self.repo, self.index_path)
+        self._commit_index.update()
+        return self._commit_index
+
+    @property
+    def semantic_index(self):
+        """Commit vector index, with commits new since the last use embedded on access."""
+        commit_index = self.commit_index
+        if self._semantic_index is None:
+            # Imported here: the embedding stack is heavy and most actions don't need it
+            from rag.commit_search import CommitSearchIndex
+            if self._embedder is None:
+                from rag.embeddings import EmbeddingModel
+                self._embedder = EmbeddingModel()
+            self._semantic_index = CommitSearchIndex(commit_index, self._embedder)
+        self._semantic_index.update()
+        return self._semantic_index
+
     def get_repo_status(self) -> Dict:
         """
         Get repository status.
@@ -87,20 +147,16 @@ class GitTool:
             modified = [item.a_path for item in self.repo.index.diff(None)]
             staged = [item.a_path for item in self.repo.index.diff("HEAD")]
 
-            # Get ahead/behind remote
+            # Get ahead/behind remote in one rev-list call
             ahead, behind = 0, 0
             try:
-                if self.repo.active_branch.tracking_branch():
-                    ahead_behind = self.repo.iter_commits(
-                        f'{self.repo.active_branch.tracking_branch()}...{current_branch}'
-                    )
-                    ahead = sum(1 for _ in ahead_behind)
-
-                    behind_iter = self.repo.iter_commits(
-                        f'{current_branch}...{self.repo.active_branch.tracking_branch()}'
+                tracking = self.repo.active_branch.tracking_branch()
+                if tracking:
+                    counts = self.repo.git.rev_list(
+                        "--left-right", "--count", f"{tracking}...{current_branch}"
                     )
-                    behind = sum(1 for _ in behind_iter)
-            except (AttributeError, GitCommandError):
+                    behind, ahead = (int(n) for n in counts.split())
+            except (AttributeError, TypeError, ValueError, GitCommandError):
                 pass
 
             return {
@@ -132,32 +188,20 @@ class GitTool:
         try:
             commit = self.repo.commit(commit_sha)
 
-            # Get changed files
-            changed_files = []
-            insertions = 0
-            deletions = 0
-
-            if commit.parents:
-                diffs = commit.parents[0].diff(commit)
-                changed_files = [diff.a_path or diff.b_path for diff in diffs]
-
-                # Count insertions/deletions
-                for diff in diffs:
-                    if diff.diff:
-                        diff_text = diff.diff.decode('utf-8', errors='ignore')
-                        insertions += diff_text.count('\n+')
-                        deletions += diff_text.count('\n-')
+            # Line counts come from the commit index (or one --numstat call),
+            # never from decoding full diffs
+            indexed = self._commit_index.get(commit.hexsha) if self._commit_index else None
+            if indexed is not None:
+                files = indexed["files"]
             else:
-                # Initial commit
-                changed_files = list(commit.stats.files.keys())
-                insertions = sum(
-                    commit.stats.files[f]['insertions']
-                    for f in commit.stats.files
-                )
-                deletions = sum(
-                    commit.stats.files[f]['deletions']
-                    for f in commit.stats.files
+                output = self.repo.git.show(
+                    commit.hexsha, "--no-renames", "--numstat", f"--format={LOG_FORMAT}"
                 )
+                files = next(parse_log(output))["files"]
+
+            changed_files = [path for path, _, _ in files]
+            insertions = sum(added for _, added, _ in files)
+            deletions = sum(deleted for _, _, deleted in files)
 
             return {
                 "sha": commit.hexsha,
@@ -294,22 +338,10 @@ class GitTool:
         if not self.repo:
             return [{"error": "Not a git repository"}]
 
-        try:
-            commits = list(self.repo.iter_commits(paths=file_path, max_count=max_commits))
-
-            history = []
-            for commit in commits:
-                history.append({
-                    "sha": commit.hexsha[:8],
-                    "author": commit.author.name,
-                    "date": datetime.fromtimestamp(commit.committed_date).strftime("%Y-%m-%d"),
-                    "message": commit.message.strip().split('\n')[0]  # First line only
-                })
-
-            return history
-
-        except Exception as e:
-            return [{"error": f"Failed to get file history: {str(e)}"}]
+        history = self.search_commits(path=file_path, max_results=max_commits)
+        if history and "error" in history[0]:
+            return [{"error": history[0]["error"].replace("search commits", "get file history")}]
+        return history
 
     def get_branch_info(self) -> Dict:
         """
@@ -377,7 +409,7 @@ class GitTool:
 
     def find_related_commits(self, query: str, max_results: int = 10) -> List[Dict]:
         """
-        Search commit history by message/author.
+        Search the full commit history by message/author.
 
         Args:
             query: Search query
@@ -386,32 +418,101 @@ class GitTool:
         Returns:
             List of matching commits
         """
+        return self.search_commits(query=query, max_results=max_results)
+
+    def search_commits(
+        self,
+        query: Optional[str] = None,
+        author: Optional[str] = None,
+        path: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        max_results: int = 10
+    ) -> List[Dict]:
+        """
+        Search the commit index by message, author, path and date.
+
+        Args:
+            query: Substring of the message or author name
+            author: Substring of the author name or email
+            path: File or directory the commit touched (relative to the repo root,
+                or absolute inside the repo)
+            since: ISO date; only commits on or after it
+            until: ISO date; only commits on or before it
+            max_results: Maximum results to return
+
+        Returns:
+            List of matching commits, newest first
+        """
         if not self.repo:
             return [{"error": "Not a git repository"}]
 
         try:
-            all_commits = list(self.repo.iter_commits(max_count=100))
-            query_lower = query.lower()
+            commits = self.commit_index.search(
+                query=query, author=author, path=self._repo_relative(path),
+                since=since, until=until, max_results=max_results
+            )
+            return [
+                {
+                    "sha": commit["sha"][:8],
+                    "author": commit["author"],
+                    "date": datetime.fromtimestamp(commit["date"]).strftime("%Y-%m-%d"),
+                    "message": commit["subject"]
+                }
+                for commit in commits
+            ]
 
-            matching = []
-            for commit in all_commits:
-                if (query_lower in commit.message.lower() or
-                    query_lower in commit.author.name.lower()):
+        except (CommitIndexError, ValueError) as e:
+            return [{"error": f"Failed to search commits: {str(e)}"}]
 
-                    matching.append({
-                        "sha": commit.hexsha[:8],
-                        "author": commit.author.name,
-                        "date": datetime.fromtimestamp(commit.committed_date).strftime("%Y-%m-%d"),
-                        "message": commit.message.strip().split('\n')[0]
-                    })
+    def semantic_search_commits(
+        self,
+        query: str,
+        path: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        max_results: int = 10
+    ) -> List[Dict]:
+        """
+        Find commits by meaning rather than exact words.
 
-                    if len(matching) >= max_results:
-                        break
+        Args:
+            query: Description of the change (e.g. "when did we change the retry logic")
+            path: File or directory the commit touched (relative to the repo root,
+                or absolute inside the repo)
+            since: ISO date; only commits on or after it
+            until: ISO date; only commits on or before it
+            max_results: Maximum results to return
 
-            return matching
+        Returns:
+            List of matching commits, most similar first
+        """
+        if not self.repo:
+            return [{"error": "Not a git repository"}]
+        if not query:
+            return [{"error": "Query is required"}]
 
-        except Exception as e:
+        try:
+            commits = self.semantic_index.search(
+                query, path=self._repo_relative(path), since=since, until=until, max_results=max_results
+            )
+            return [
+                {
+                    "sha": commit["sha"][:8],
+                    "author": commit["author"],
+                    "date": datetime.fromtimestamp(commit["date"]).strftime("%Y-%m-%d"),
+                    "message": commit["subject"],
+                    "similarity": round(commit["similarity"], 3),
+                    "files": commit["matched_files"]
+                }
+                for commit in commits
+            ]
+
+        except (CommitIndexError, ValueError) as e:
             return [{"error": f"Failed to search commits: {str(e)}"}]
+        except Exception as e:
+            # CommitSearchError, or the embedding model failing to load
+            return [{"error": f"Semantic search failed: {str(e)}"}]
 
     def get_blame(
         self,
@@ -422,8 +523,12 @@ class GitTool:
         """
         Git blame for file.
 
+        Only the requested range is blamed (``git blame -L``), and results
+        are cached per (path, blob SHA, range), so repeated questions about
+        an unchanged file don't run git again.
+
         Args:
-            file_path: Path to file
+            file_path: Path to file (relative to the repo root, or absolute inside the repo)
             line_start: Optional start line
             line_end: Optional end line
 
@@ -434,35 +539,69 @@ class GitTool:
             return [{"error": "Not a git repository"}]
 
         try:
-            # Get blame info
-            blame_list = self.repo.blame("HEAD", file_path)
+            file_path = self._repo_relative(file_path)
+            blob_sha = (self.repo.head.commit.tree / file_path).hexsha
+            key = (file_path, blob_sha, line_start, line_end)
+            if key in self._blame_cache:
+                self._blame_cache.move_to_end(key)
+                return self._blame_cache[key]
+
+            result = self._run_blame(file_path, line_start, line_end)
+
+            self._blame_cache[key] = result
+            if len(self._blame_cache) > BLAME_CACHE_SIZE:
+                self._blame_cache.popitem(last=False)
+            return result
 
-            result = []
-            current_line = 1
+        except Exception as e:
+            return [{"error": f"Failed to get blame: {str(e)}"}]
 
-            for commit, lines in blame_list:
-                for line in lines:
-                    # Check line range filter
-                    if line_start and current_line < line_start:
-                        current_line += 1
-                        continue
-                    if line_end and current_line > line_end:
-                        break
-
-                    result.append({
-                        "line": current_line,
-                        "author": commit.author.name,
-                        "commit": commit.hexsha[:8],
-                        "date": datetime.fromtimestamp(commit.committed_date).strftime("%Y-%m-%d"),
-                        "content": line.strip()
-                    })
+    def _run_blame(
+        self,
+        file_path: str,
+        line_start: Optional[int] = None,
+        line_end: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Run git blame on HEAD, restricted to the line range when given.
+
+        Returns:
+            List of blame information per line
+        """
+        blame_list = None
+        if line_start or line_end:
+            try:
+                blame_list = self.repo.blame("HEAD", file_path, L=f"{line_start or 1},{line_end or ''}")
+            except GitCommandError:
+                blame_list = None  # Range past the end of file: blame everything and filter
+
+        if blame_list is not None:
+            current_line = line_start or 1
+        else:
+            blame_list = self.repo.blame("HEAD", file_path)
+            current_line = 1
 
+        result = []
+        for commit, lines in blame_list:
+            for line in lines:
+                # Check line range filter
+                if line_start and current_line < line_start:
                     current_line += 1
+                    continue
+                if line_end and current_line > line_end:
+                    break
 
-            return result
+                result.append({
+                    "line": current_line,
+                    "author": commit.author.name,
+                    "commit": commit.hexsha[:8],
+                    "date": datetime.fromtimestamp(commit.committed_date).strftime("%Y-%m-%d"),
+                    "content": line.strip()
+                })
 
-        except Exception as e:
-            return [{"error": f"Failed to get blame: {str(e)}"}]
+                current_line += 1
+
+        return result
 
     def review_changes(self, file_path: Optional[str] = None) -> Dict:
         """
@@ -610,6 +749,21 @@ class GitTool:
                 file_path=kwargs.get("file_path"),
                 line_start=kwargs.get("line_start"),
                 line_end=kwargs.get("line_end")
+            )),
+            "search_commits": lambda: self._format_history(self.search_commits(
+                query=kwargs.get("query"),
+                author=kwargs.get("author"),
+                path=kwargs.get("file_path"),
+                since=kwargs.get("since"),
+                until=kwargs.get("until"),
+                max_results=kwargs.get("max_results", 10)
+            )),
+            "semantic_search": lambda: self._format_history(self.semantic_search_commits(
+                query=kwargs.get("query", ""),
+                path=kwargs.get("file_path"),
+                since=kwargs.get("since"),
+                until=kwargs.get("until"),
+                max_results=kwargs.get("max_results", 10)
             ))
         }
 
@@ -670,6 +824,8 @@ class GitTool:
         for commit in history:
             lines.append(f"  {commit['sha']} - {commit['date']} - {commit['author']}")
             lines.append(f"    {commit['message']}")
+            if commit.get("files"):
+                lines.append(f"    files: {', '.join(commit['files'])}")
 
         return '\n'.join(lines)
 
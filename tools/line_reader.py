@@ -0,0 +1,358 @@
+"""Bounded-memory ranged reads for text files.
+
+Reading a whole file to return a few lines costs O(file) time and memory
+on every call. This module reads only what a range needs:
+
+- Line ranges and ``head`` scan forward and stop once the range is covered
+- ``tail`` reads backwards from the end of the file in blocks
+- Byte ranges seek straight to the offset
+
+Line start offsets discovered while scanning are kept in a per-file
+``LineOffsetIndex`` (cached, invalidated when the file changes), so paging
+through a large file is O(range) after the first pass. Files above
+``MMAP_THRESHOLD`` are memory-mapped instead of read through a buffer.
+
+Example:
+    >>> from tools.line_reader import LineReader
+    >>>
+    >>> reader = LineReader()
+    >>> chunk = reader.read_lines(Path("big.log"), start=1000, end=1050)
+    >>> print(chunk.text, chunk.total_lines)
+"""
+
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+MMAP_THRESHOLD = 1024 * 1024  # Memory-map files larger than this
+SCAN_CHUNK = 64 * 1024  # Bytes scanned per step when extending an index
+TAIL_BLOCK = 64 * 1024  # Bytes read per step when scanning backwards
+
+
+@dataclass
+class LineChunk:
+    """Text read from a file range."""
+    text: str
+    start_line: int  # 1-based, first line returned (0 for byte reads)
+    end_line: int  # 1-based, last line returned (0 for byte reads)
+    total_lines: Optional[int]  # None if the file hasn't been scanned to the end
+    file_size: int
+    truncated: bool = False  # Output cut at max_bytes
+
+
+class LineOffsetIndex:
+    """Byte offsets of line starts in one file, extended on demand.
+
+    Only the part of the file needed so far is scanned; later requests
+    for lines further down continue from where the last scan stopped.
+    """
+
+    def __init__(self, path: Path, mtime_ns: int, size: int):
+        """
+        Initialize an empty index.
+
+        Args:
+            path: File the index describes
+            mtime_ns: File modification time when the index was created
+            size: File size when the index was created
+        """
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.offsets = array('Q', [0])  # offsets[i] = start of line i (0-based)
+        self.scanned = 0  # Bytes scanned so far
+        self.lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole file has been scanned."""
+        return self.scanned >= self.size
+
+    @property
+    def total_lines(self) -> Optional[int]:
+        """Number of lines, or None if the file isn't fully scanned."""
+        if not self.complete:
+            return None
+        if self.size == 0:
+            return 0
+        # A trailing newline doesn't start another line
+        return len(self.offsets) - 1 if self.offsets[-1] == self.size else len(self.offsets)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the index still describes the file."""
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+    def ensure_lines(self, buffer, line_count: int) -> None:
+        """
+        Scan until the start of line `line_count` (0-based) is known or EOF.
+
+        Args:
+            buffer: Open binary file or mmap of the file
+            line_count: Number of line starts needed
+        """
+        with self.lock:
+            while len(self.offsets) <= line_count and not self.complete:
+                end = min(self.scanned + SCAN_CHUNK, self.size)
+                if isinstance(buffer, mmap.mmap):
+                    data = buffer[self.scanned:end]
+                else:
+                    buffer.seek(self.scanned)
+                    data = buffer.read(end - self.scanned)
+
+                base = self.scanned
+                pos = data.find(b"\n")
+                while pos != -1:
+                    self.offsets.append(base + pos + 1)
+                    pos = data.find(b"\n", pos + 1)
+                self.scanned = end
+
+    def line_span(self, first: int, last: int) -> Tuple[int, int]:
+        """
+        Byte span covering lines first..last (0-based, inclusive).
+
+        Args:
+            first: First line
+            last: Last line (must be indexed, or the final line)
+
+        Returns:
+            Tuple of (start offset, end offset)
+        """
+        start = self.offsets[first]
+        end = self.offsets[last + 1] if last + 1 < len(self.offsets) else self.size
+        return start, end
+
+
+class LineReader:
+    """Ranged file reader with a shared LRU cache of line indexes.
+
+    Thread-safe: tools can be called from parallel tool execution.
+    """
+
+    def __init__(self, max_cached_files: int = 32):
+        """
+        Initialize reader.
+
+        Args:
+            max_cached_files: Line indexes kept before evicting the least recently used
+        """
+        self.max_cached_files = max_cached_files
+        self._indexes: "OrderedDict[str, LineOffsetIndex]" = OrderedDict()
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.index_hits = 0
+        self.index_misses = 0
+
+    def _get_index(self, path: Path, stat: os.stat_result) -> LineOffsetIndex:
+        """Get the cached index for a file, replacing it if the file changed."""
+        key = str(path.resolve())
+        with self.lock:
+            index = self._indexes.get(key)
+            if index is not None and index.matches(stat):
+                self._indexes.move_to_end(key)
+                self.index_hits += 1
+                return index
+
+            self.index_misses += 1
+            index = LineOffsetIndex(path, stat.st_mtime_ns, stat.st_size)
+            self._indexes[key] = index
+            while len(self._indexes) > self.max_cached_files:
+                self._indexes.popitem(last=False)
+            return index
+
+    def _open(self, path: Path, size: int):
+        """Open a file for reading, memory-mapped when large.
+
+        Returns:
+            Tuple of (file object, buffer to read from)
+        """
+        f = open(path, 'rb')
+        if size > MMAP_THRESHOLD:
+            try:
+                return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                pass  # e.g. special files - fall back to buffered reads
+        return f, f
+
+    @staticmethod
+    def _slice(buffer, start: int, end: int) -> bytes:
+        """Read bytes [start, end) from a file or mmap."""
+        if isinstance(buffer, mmap.mmap):
+            return buffer[start:end]
+        buffer.seek(start)
+        return buffer.read(end - start)
+
+    @staticmethod
+    def _decode(data: bytes, max_bytes: int) -> Tuple[str, bool]:
+        """Decode UTF-8, cutting at max_bytes. Raises UnicodeDecodeError for binary data."""
+        truncated = bool(max_bytes) and len(data) > max_bytes
+        if truncated:
+            data = data[:max_bytes]
+            return data.decode('utf-8', errors='ignore'), True
+        return data.decode('utf-8'), False
+
+    def read_lines(
+        self,
+        path: Path,
+        start: int = 1,
+        end: Optional[int] = None,
+        max_bytes: int = 0
+    ) -> LineChunk:
+        """
+        Read lines start..end (1-based, inclusive).
+
+        Args:
+            path: File to read
+            start: First line
+            end: Last line (None = to end of file)
+            max_bytes: Cap on bytes returned (0 = no cap)
+
+        Returns:
+            LineChunk with the requested lines
+
+        Raises:
+            UnicodeDecodeError: If the range isn't valid UTF-8 text
+            ValueError: If the range is invalid
+        """
+        if start < 1 or (end is not None and end < start):
+            raise ValueError(f"Invalid line range {start}-{end}")
+
+        stat = path.stat()
+        index = self._get_index(path, stat)
+        f, buffer = self._open(path, stat.st_size)
+        try:
+            # Need the start of the line after `end` to know where `end` stops
+            index.ensure_lines(buffer, end if end is not None else float('inf'))
+
+            last_known = len(index.offsets) - 1
+            if index.complete:
+                last_known = (index.total_lines or 0) - 1
+
+            first = start - 1
+            last = last_known if end is None else min(end - 1, last_known)
+            if first > last:
+                return LineChunk("", start, start - 1, index.total_lines, stat.st_size)
+
+            span_start, span_end = index.line_span(first, last)
+            text, truncated = self._decode(self._slice(buffer, span_start, span_end), max_bytes)
+        finally:
+            if buffer is not f:
+                buffer.close()
+            f.close()
+
+        return LineChunk(text, start, last + 1, index.total_lines, stat.st_size, truncated)
+
+    def read_head(self, path: Path, lines: int, max_bytes: int = 0) -> LineChunk:
+        """
+        Read the first lines of a file.
+
+        Args:
+            path: File to read
+            lines: Number of lines
+            max_bytes: Cap on bytes returned (0 = no cap)
+
+        Returns:
+            LineChunk with the first lines
+        """
+        return self.read_lines(path, 1, max(lines, 1), max_bytes)
+
+    def read_tail(self, path: Path, lines: int, max_bytes: int = 0) -> LineChunk:
+        """
+        Read the last lines of a file without scanning it from the start.
+
+        Args:
+            path: File to read
+            lines: Number of lines
+            max_bytes: Cap on bytes returned (0 = no cap)
+
+        Returns:
+            LineChunk with the last lines (line numbers known only if the
+            file is already fully indexed)
+        """
+        stat = path.stat()
+        size = stat.st_size
+        lines = max(lines, 1)
+
+        with open(path, 'rb') as f:
+            # Ignore a trailing newline, then find the `lines`-th newline from the end
+            end = size
+            if size:
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    end = size - 1
+
+            pos = end
+            found = 0
+            start = 0
+            while pos > 0 and found < lines:
+                block_start = max(0, pos - TAIL_BLOCK)
+                f.seek(block_start)
+                block = f.read(pos - block_start)
+                idx = len(block)
+                while found < lines:
+                    idx = block.rfind(b"\n", 0, idx)
+                    if idx == -1:
+                        break
+                    found += 1
+                    if found == lines:
+                        start = block_start + idx + 1
+                pos = block_start
+
+            f.seek(start)
+            data = f.read(size - start)
+
+        text, truncated = self._decode(data, max_bytes)
+
+        # Line numbers are only known if a full index is cached
+        with self.lock:
+            index = self._indexes.get(str(path.resolve()))
+        total = index.total_lines if index is not None and index.matches(stat) else None
+        returned = min(lines, total) if total is not None else lines
+        first = total - returned + 1 if total is not None else 0
+        return LineChunk(text, first, total or 0, total, size, truncated)
+
+    def read_bytes(self, path: Path, offset: int, length: int) -> LineChunk:
+        """
+        Read a byte range, decoding invalid UTF-8 at the edges leniently.
+
+        Args:
+            path: File to read
+            offset: Start offset (negative counts from the end)
+            length: Number of bytes
+
+        Returns:
+            LineChunk with the decoded bytes
+        """
+        size = path.stat().st_size
+        if offset < 0:
+            offset = max(0, size + offset)
+
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(max(length, 0))
+
+        if b"\0" in data:
+            raise UnicodeDecodeError('utf-8', data, 0, 1, "binary data")
+
+        return LineChunk(data.decode('utf-8', errors='replace'), 0, 0, None, size)
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cached file count and index hit/miss counts
+        """
+        with self.lock:
+            return {
+                "cached_files": len(self._indexes),
+                "max_cached_files": self.max_cached_files,
+                "index_hits": self.index_hits,
+                "index_misses": self.index_misses,
+            }
@@ -0,0 +1,399 @@
+"""Pool of warm sandbox processes for code execution.
+
+Starting a fresh interpreter per snippet costs more than most snippets
+take to run. This module keeps a few pre-started worker processes
+(``tools/sandbox_worker.py``) with common modules already imported and
+hands them code over a pipe - nothing is written to disk.
+
+Each snippet runs in a child forked from a warm worker, so module and
+interpreter state never carries over between snippets. Workers run under
+resource limits (address space via RLIMIT_AS, CPU time via RLIMIT_CPU per
+snippet) and are replaced after a fixed number of runs, on timeout, or
+when they crash. Each worker leads its own process group, so killing it
+also kills a snippet still running in its child.
+
+Example:
+    >>> from tools.sandbox_pool import SandboxPool
+    >>>
+    >>> pool = SandboxPool(size=2, preload=["math", "json"])
+    >>> result = pool.execute("print(2 + 2)", timeout=5)
+    >>> print(result["stdout"])  # "4\\n"
+    >>> pool.shutdown()
+"""
+
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from queue import Queue, Empty
+from typing import Any, Dict, List, Optional
+
+from tools.base import ToolError
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+WORKER_SCRIPT = Path(__file__).parent / "sandbox_worker.py"
+
+
+def latency_percentiles(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize latencies as percentiles.
+
+    Args:
+        latencies: Durations in seconds
+
+    Returns:
+        Dictionary with p50_ms, p95_ms and p99_ms (0.0 when empty)
+    """
+    ordered = sorted(latencies)
+    stats = {}
+    for label, pct in (("p50_ms", 50), ("p95_ms", 95), ("p99_ms", 99)):
+        if ordered:
+            index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+            stats[label] = round(ordered[index] * 1000, 2)
+        else:
+            stats[label] = 0.0
+    return stats
+
+
+# Custom Exceptions
+class SandboxError(ToolError):
+    """Sandbox worker failed or is unavailable."""
+    pass
+
+
+class SandboxTimeoutError(SandboxError):
+    """Code ran past its time limit (the worker was killed)."""
+    pass
+
+
+class SandboxWorker:
+    """Single warm interpreter process taking code over a pipe."""
+
+    def __init__(self, preload: List[str], memory_limit_mb: int = 0):
+        """
+        Start a worker process.
+
+        Args:
+            preload: Modules to import before accepting code
+            memory_limit_mb: Address space limit (0 = unlimited)
+
+        Raises:
+            SandboxError: If the process cannot be started
+        """
+        self.runs = 0
+        self.started_at = time.time()
+
+        read_fd, write_fd = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-I", str(WORKER_SCRIPT), str(write_fd), ",".join(preload)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                pass_fds=(write_fd,),
+                start_new_session=True,  # Own process group, shared with forked snippets
+                preexec_fn=self._limit_memory(memory_limit_mb) if RESOURCE_AVAILABLE else None
+            )
+        except OSError as e:
+            os.close(read_fd)
+            raise SandboxError(f"Failed to start sandbox worker: {e}") from e
+        finally:
+            os.close(write_fd)
+
+        self.response_fd = read_fd
+        self._buffer = b""
+
+    @staticmethod
+    def _limit_memory(memory_limit_mb: int):
+        """Build a preexec hook applying the address space limit in the child."""
+        def apply_limits():
+            if memory_limit_mb > 0:
+                limit = memory_limit_mb * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        return apply_limits
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running."""
+        return self.process.poll() is None
+
+    def run(self, code: str, timeout: float, max_output: int) -> Dict[str, Any]:
+        """
+        Execute code in this worker.
+
+        Args:
+            code: Python code
+            timeout: Wall-clock limit in seconds (also the CPU limit)
+            max_output: Maximum characters of stdout/stderr to keep
+
+        Returns:
+            Dict with returncode, stdout, stderr and recycle flag
+
+        Raises:
+            SandboxTimeoutError: If the code exceeded its time limit
+            SandboxError: If the worker died or the pipe broke
+        """
+        request = {"code": code, "cpu_seconds": timeout, "max_output": max_output}
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxError(f"Sandbox worker is not accepting code: {e}") from e
+
+        self.runs += 1
+        line = self._read_line(time.monotonic() + timeout)
+        result = json.loads(line)
+
+        # The snippet's child was killed; the worker itself is fine
+        killed_by = result.get("signal")
+        if killed_by is not None:
+            if killed_by == getattr(signal, "SIGXCPU", None):
+                raise SandboxTimeoutError("Sandbox code exceeded its CPU time limit")
+            raise SandboxError(f"Sandbox code was killed by signal {killed_by}")
+        return result
+
+    def _read_line(self, deadline: float) -> str:
+        """Read one response line, giving up at the deadline."""
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SandboxTimeoutError("Sandbox worker timed out")
+
+            ready, _, _ = select.select([self.response_fd], [], [], remaining)
+            if not ready:
+                continue
+
+            chunk = os.read(self.response_fd, 65536)
+            if not chunk:
+                # EOF: killed by RLIMIT_CPU (SIGXCPU) or crashed
+                self.process.wait()
+                if self.process.returncode == -getattr(signal, "SIGXCPU", 0):
+                    raise SandboxTimeoutError("Sandbox worker exceeded its CPU time limit")
+                raise SandboxError(
+                    f"Sandbox worker exited unexpectedly (code {self.process.returncode})"
+                )
+            self._buffer += chunk
+
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode("utf-8")
+
+    def kill(self) -> None:
+        """Stop the process, any snippet it forked, and release its pipes."""
+        if self.process.returncode is None:  # Not reaped yet, so the group ID is still ours
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except (OSError, AttributeError):
+                pass
+        try:
+            if self.alive:
+                self.process.kill()
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+
+        try:
+            self.process.stdin.close()
+        except Exception:
+            pass
+
+        try:
+            os.close(self.response_fd)
+        except OSError:
+            pass
+
+
+class SandboxPool:
+    """Fixed-size pool of warm sandbox workers.
+
+    Thread-safe: each execution checks a worker out of an idle queue,
+    so concurrent callers use separate processes.
+
+    Attributes:
+        size: Number of worker processes
+        max_runs: Executions before a worker is replaced
+        memory_limit_mb: Address space limit per worker
+        preload: Modules imported by each worker at startup
+    """
+
+    LATENCY_WINDOW = 1000  # Executions kept for percentile stats
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_runs: int = 50,
+        memory_limit_mb: int = 512,
+        preload: Optional[List[str]] = None
+    ):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            size: Number of worker processes
+            max_runs: Executions before a worker is replaced
+            memory_limit_mb: Address space limit per worker (0 = unlimited)
+            preload: Modules imported by each worker at startup
+
+        Raises:
+            SandboxError: If workers cannot be started
+        """
+        self.size = size
+        self.max_runs = max_runs
+        self.memory_limit_mb = memory_limit_mb
+        self.preload = list(preload or [])
+
+        self._idle: "Queue[SandboxWorker]" = Queue()
+        self._workers: List[SandboxWorker] = []
+        self._closed = False
+
+        # Statistics
+        self.lock = threading.Lock()
+        self.executions = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.recycled = 0
+        self._latencies: deque = deque(maxlen=self.LATENCY_WINDOW)  # (finished_at, seconds)
+
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+        # Don't leave worker processes behind if the pool is never shut down
+        self._finalizer = weakref.finalize(self, SandboxPool._kill_all, self._workers)
+
+    def _spawn(self) -> SandboxWorker:
+        """Start a worker and track it."""
+        worker = SandboxWorker(self.preload, self.memory_limit_mb)
+        with self.lock:
+            self._workers.append(worker)
+        return worker
+
+    def _retire(self, worker: SandboxWorker) -> None:
+        """Kill a worker and start its replacement."""
+        worker.kill()
+        with self.lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self.recycled += 1
+
+        if not self._closed:
+            try:
+                self._idle.put(self._spawn())
+            except SandboxError:
+                pass  # Pool shrinks; execute() reports when empty
+
+    def execute(self, code: str, timeout: float, max_output: int = 10000) -> Dict[str, Any]:
+        """
+        Execute code in a warm worker.
+
+        Args:
+            code: Python code
+            timeout: Time limit in seconds
+            max_output: Maximum characters of stdout/stderr to keep
+
+        Returns:
+            Dict with returncode, stdout and stderr
+
+        Raises:
+            SandboxTimeoutError: If the code exceeded its time limit
+            SandboxError: If no worker is available or the worker crashed
+        """
+        if self._closed:
+            raise SandboxError("Sandbox pool is shut down")
+
+        # Dead workers are replaced until a live one turns up or time runs out
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                worker = self._idle.get(timeout=max(0.0, deadline - time.monotonic()))
+            except Empty:
+                raise SandboxError(f"No sandbox worker became available within {timeout}s")
+            if worker.alive:
+                break
+            self._retire(worker)
+
+        start = time.perf_counter()
+        try:
+            result = worker.run(code, timeout, max_output)
+        except SandboxTimeoutError:
+            with self.lock:
+                self.timeouts += 1
+            self._retire(worker)
+            raise
+        except (SandboxError, ValueError) as e:
+            with self.lock:
+                self.crashes += 1
+            self._retire(worker)
+            raise SandboxError(str(e)) from e
+
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.executions += 1
+            self._latencies.append((time.time(), elapsed))
+
+        if result.pop("recycle", False) or worker.runs >= self.max_runs:
+            self._retire(worker)
+        else:
+            self._idle.put(worker)
+
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with counters, latency percentiles (ms) over the
+            last LATENCY_WINDOW executions and throughput
+        """
+        with self.lock:
+            latencies = [seconds for _, seconds in self._latencies]
+            finished = [t for t, _ in self._latencies]
+            stats = {
+                "size": self.size,
+                "idle": self._idle.qsize(),
+                "executions": self.executions,
+                "timeouts": self.timeouts,
+                "crashes": self.crashes,
+                "recycled": self.recycled,
+                "max_runs_per_worker": self.max_runs,
+                "memory_limit_mb": self.memory_limit_mb,
+                "preload": self.preload,
+            }
+
+        stats.update(latency_percentiles(latencies))
+
+        # Executions per second across the window, counting idle gaps
+        window = finished[-1] - finished[0] if len(finished) > 1 else 0.0
+        if window > 0:
+            stats["throughput_per_sec"] = round((len(finished) - 1) / window, 2)
+        elif latencies:
+            stats["throughput_per_sec"] = round(len(latencies) / sum(latencies), 2)
+        else:
+            stats["throughput_per_sec"] = 0.0
+
+        return stats
+
+    @staticmethod
+    def _kill_all(workers: List[SandboxWorker]) -> None:
+        """Kill every worker (finalizer - must not reference the pool)."""
+        for worker in list(workers):
+            worker.kill()
+        workers.clear()
+
+    def shutdown(self) -> None:
+        """Stop all workers. Safe to call more than once."""
+        self._closed = True
+        self._finalizer()
@@ -0,0 +1,158 @@
+"""Sandbox worker process for the code executor pool.
+
+Started by ``tools.sandbox_pool.SandboxPool`` as
+``python3 -I sandbox_worker.py <response_fd> <preload>``. The worker
+imports the preload modules once, then loops:
+
+1. Read one JSON request line from stdin: ``{"code": ..., "cpu_seconds": ...,
+   "max_output": ...}``
+2. Fork a child that executes the code in fresh globals with stdout/stderr
+   captured in memory, and sends its result back over a private pipe
+3. Write one JSON response line to the response pipe: ``{"returncode": ...,
+   "stdout": ..., "stderr": ..., "recycle": ...}``, or ``{"signal": ...}``
+   if the child was killed (e.g. SIGXCPU at its CPU limit)
+
+Each snippet runs in its own forked copy of the warm interpreter, so
+changes to ``sys.modules``, imported modules, builtins or ``sys`` settings
+die with the child and never reach the next snippet. Without ``os.fork``
+the code runs in the worker itself and the worker asks to be recycled.
+
+Responses go to a dedicated pipe rather than stdout, so output written
+straight to file descriptors by user code can't corrupt the protocol.
+The worker exits when stdin closes (pool shutdown or parent exit).
+
+This file only uses the standard library and never imports Meton modules:
+it runs in isolated mode (``-I``) without the project on ``sys.path``.
+"""
+
+import builtins
+import io
+import json
+import os
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+
+def _limit_cpu(seconds):
+    """Allow at most `seconds` more CPU time before SIGXCPU kills the worker."""
+    if not RESOURCE_AVAILABLE or not seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + int(seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _truncate(text, limit):
+    """Cap captured output so a chatty snippet can't flood the pipe."""
+    if limit and len(text) > limit:
+        return text[:limit] + "\n... (output truncated)"
+    return text
+
+
+def execute(code, max_output=0):
+    """Run code like ``python3 script.py`` would, capturing its output."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    recycle = False
+    namespace = {"__name__": "__main__", "__builtins__": builtins}
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            exec(compile(code, "<sandbox>", "exec"), namespace)
+        except SystemExit as e:
+            if e.code is None:
+                returncode = 0
+            elif isinstance(e.code, int):
+                returncode = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException as e:
+            # Drop this function's frame so the traceback starts at user code
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            returncode = 1
+            # Interpreter state may be unreliable after these
+            recycle = isinstance(e, (MemoryError, RecursionError, KeyboardInterrupt))
+
+    return {
+        "returncode": returncode,
+        "stdout": _truncate(stdout.getvalue(), max_output),
+        "stderr": _truncate(stderr.getvalue(), max_output),
+        "recycle": recycle,
+    }
+
+
+def run_isolated(request):
+    """Execute a request in a forked child; the worker's state stays untouched."""
+    if not hasattr(os, "fork"):
+        _limit_cpu(request.get("cpu_seconds"))
+        result = execute(request["code"], request.get("max_output", 0))
+        result["recycle"] = True  # Snippet ran in this interpreter
+        return result
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: the CPU limit counts from the fork, not the worker's lifetime
+        os.close(read_fd)
+        status = 0
+        try:
+            _limit_cpu(request.get("cpu_seconds"))
+            result = execute(request["code"], request.get("max_output", 0))
+            with os.fdopen(write_fd, "w", encoding="utf-8") as out:
+                out.write(json.dumps(result))
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "r", encoding="utf-8") as child_output:
+        data = child_output.read()  # Read before waiting: big outputs fill the pipe
+    _, status = os.waitpid(pid, 0)
+
+    if os.WIFSIGNALED(status):
+        return {"signal": os.WTERMSIG(status)}
+    try:
+        return json.loads(data)
+    except ValueError:
+        return {"returncode": 1, "stdout": "", "stderr": "Sandbox child exited without a result",
+                "recycle": False}
+
+
+def main():
+    response_fd = int(sys.argv[1])
+    preload = [m for m in sys.argv[2].split(",") if m] if len(sys.argv) > 2 else []
+
+    for module in preload:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+
+    # Requests arrive on stdin; user code gets an empty stdin instead
+    requests = sys.stdin
+    sys.stdin = io.StringIO()
+
+    with os.fdopen(response_fd, "w", encoding="utf-8") as responses:
+        for line in requests:
+            if not line.strip():
+                continue
+            result = run_isolated(json.loads(line))
+            responses.write(json.dumps(result) + "\n")
+            responses.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -135,6 +135,8 @@ Use this when you need to:
         # In-memory symbol index (built on first use)
         object.__setattr__(self, '_symbol_index', None)
         object.__setattr__(self, '_index_timestamp', None)
+        object.__setattr__(self, '_parser', None)
+        object.__setattr__(self, '_live_updates', False)  # Set while a file watcher keeps the index current
 
         # Get project root (where Meton is running from)
         object.__setattr__(self, '_project_root', Path.cwd())
@@ -317,79 +319,20 @@ Use this when you need to:
         current_time = time.time()
 
         if self._symbol_index is not None and self._index_timestamp is not None:
-            # Index exists and is less than 60 seconds old - use it
-            if current_time - self._index_timestamp < 60:
+            # A file watcher keeps the index current; otherwise rebuild after 60 seconds
+            if self._live_updates or current_time - self._index_timestamp < 60:
                 return True
 
         # Build new index
         self._log_execution("building_index", f"indexing {self._project_root}")
 
         try:
+            parser = self._get_parser()
             symbols = []
 
-            # Import CodeParser directly without triggering rag/__init__.py
-            import sys
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "code_parser",
-                Path(self._project_root) / "rag" / "code_parser.py"
-            )
-            code_parser_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(code_parser_module)
-            CodeParser = code_parser_module.CodeParser
-            parser = CodeParser()
-
             # Walk through Python files
             for py_file in self._find_python_files(self._project_root):
-                # Parse file
-                parsed_data = parser.parse_file(str(py_file))
-
-                if not parsed_data:
-                    continue
-
-                file_path = parsed_data['file_path']
-                relative_path = self._get_relative_path(file_path)
-
-                # Add functions
-                for func in parsed_data['functions']:
-                    symbols.append({
-                        'name': func['name'],
-                        'type': 'function',
-                        'file': relative_path,
-                        'file_path': file_path,
-                        'line': func['start_line'],
-                        'end_line': func['end_line'],
-                        'signature': func['signature'],
-                        'docstring': func['docstring']
-                    })
-
-                # Add classes and their methods
-                for cls in parsed_data['classes']:
-                    # Add class itself
-                    symbols.append({
-                        'name': cls['name'],
-                        'type': 'class',
-                        'file': relative_path,
-                        'file_path': file_path,
-                        'line': cls['start_line'],
-                        'end_line': cls['end_line'],
-                        'signature': f"class {cls['name']}({', '.join(cls['bases'])})" if cls['bases'] else f"class {cls['name']}",
-                        'docstring': cls['docstring']
-                    })
-
-                    # Add methods
-                    for method in cls['methods']:
-                        symbols.append({
-                            'name': method['name'],
-                            'type': 'method',
-                            'file': relative_path,
-                            'file_path': file_path,
-                            'line': method['start_line'],
-                            'end_line': method['end_line'],
-                            'signature': method['signature'],
-                            'docstring': method['docstring'],
-                            'class': cls['name']  # Track which class this method belongs to
-                        })
+                symbols.extend(self._parse_symbols(parser, str(py_file)))
 
             # Update index
             object.__setattr__(self, '_symbol_index', symbols)
@@ -402,6 +345,150 @@ Use this when you need to:
             self._log_execution("index_error", str(e))
             return False
 
+    def _get_parser(self):
+        """Get the code parser, loading it on first use.
+
+        Returns:
+            CodeParser instance
+        """
+        if self._parser is None:
+            # Import CodeParser directly without triggering rag/__init__.py
+            import importlib.util
+            spec = importlib.util.spec_from_file_location(
+                "code_parser",
+                Path(self._project_root) / "rag" / "code_parser.py"
+            )
+            code_parser_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(code_parser_module)
+            object.__setattr__(self, '_parser', code_parser_module.CodeParser())
+        return self._parser
+
+    def _parse_symbols(self, parser, path: str) -> List[Dict[str, Any]]:
+        """Parse one Python file into symbol entries.
+
+        Args:
+            parser: CodeParser instance
+            path: Path to the Python file
+
+        Returns:
+            List of symbol dictionaries (empty if the file doesn't parse)
+        """
+        parsed_data = parser.parse_file(path)
+
+        if not parsed_data:
+            return []
+
+        symbols = []
+        file_path = parsed_data['file_path']
+        relative_path = self._get_relative_path(file_path)
+
+        # Add functions
+        for func in parsed_data['functions']:
+            symbols.append({
+                'name': func['name'],
+                'type': 'function',
+                'file': relative_path,
+                'file_path': file_path,
+                'line': func['start_line'],
+                'end_line': func['end_line'],
+                'signature': func['signature'],
+                'docstring': func['docstring']
+            })
+
+        # Add classes and their methods
+        for cls in parsed_data['classes']:
+            # Add class itself
+            symbols.append({
+                'name': cls['name'],
+                'type': 'class',
+                'file': relative_path,
+                'file_path': file_path,
+                'line': cls['start_line'],
+                'end_line': cls['end_line'],
+                'signature': f"class {cls['name']}({', '.join(cls['bases'])})" if cls['bases'] else f"class {cls['name']}",
+                'docstring': cls['docstring']
+            })
+
+            # Add methods
+            for method in cls['methods']:
+                symbols.append({
+                    'name': method['name'],
+                    'type': 'method',
+                    'file': relative_path,
+                    'file_path': file_path,
+                    'line': method['start_line'],
+                    'end_line': method['end_line'],
+                    'signature': method['signature'],
+                    'docstring': method['docstring'],
+                    'class': cls['name']  # Track which class this method belongs to
+                })
+
+        return symbols
+
+    def update_files(self, paths: List[str]) -> int:
+        """Re-parse changed files and replace their symbols in the index.
+
+        Deleted files just lose their symbols. Files outside the project
+        root or that aren't Python are ignored. Does nothing until the
+        index has been built (the first lookup builds it from scratch).
+
+        Args:
+            paths: Changed or deleted file paths
+
+        Returns:
+            Number of files updated
+        """
+        if self._symbol_index is None:
+            return 0
+
+        root = os.path.abspath(self._project_root)
+        targets = {
+            os.path.abspath(path) for path in paths
+            if path.endswith('.py') and os.path.abspath(path).startswith(root + os.sep)
+        }
+        if not targets:
+            return 0
+
+        try:
+            parser = self._get_parser()
+            symbols = [s for s in self._symbol_index if os.path.abspath(s['file_path']) not in targets]
+            for path in sorted(targets):
+                if os.path.exists(path):
+                    symbols.extend(self._parse_symbols(parser, path))
+
+            # Swap in a new list so concurrent lookups see a consistent index
+            object.__setattr__(self, '_symbol_index', symbols)
+            self._log_execution("index_updated", f"{len(targets)} files")
+            return len(targets)
+        except Exception as e:
+            self._log_execution("update_error", str(e))
+            return 0
+
+    def find_definitions(self, name: str, max_results: int = 3) -> List[Dict[str, Any]]:
+        """Exact-name index entries, without reading code snippets.
+
+        Cheap enough for editor hovers; builds the index on first use.
+
+        Args:
+            name: Symbol name (case-sensitive)
+            max_results: Maximum entries to return
+
+        Returns:
+            Symbol dictionaries (name, type, file, line, signature, docstring)
+        """
+        if not name or not self._build_index_if_needed():
+            return []
+        matches = [s for s in self._symbol_index if s['name'] == name]
+        return matches[:max_results]
+
+    def set_live_updates(self, enabled: bool) -> None:
+        """Turn off (or back on) the periodic rebuild while a file watcher updates the index.
+
+        Args:
+            enabled: True while update_files() is fed file changes
+        """
+        object.__setattr__(self, '_live_updates', enabled)
+
     def _find_python_files(self, root: Path) -> List[Path]:
         """Find all Python files in the project.
 
@@ -1,14 +1,39 @@
-"""Logging setup for Meton with Rich integration."""
-
+"""Logging setup for Meton with Rich integration.
+
+Loggers don't write to their handlers directly: every MetonLogger puts
+records on one shared queue (``QueueHandler``) and a single background
+``QueueListener`` thread formats them and writes the log files and console,
+so logging I/O stays off the agent's hot path. Records are stamped with the
+current query's correlation id (see ``query_context``), files can be written
+as JSON lines, and DEBUG records are rate limited per logger.
+"""
+
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.logging import RichHandler
 
 
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d -%(query_tag)s %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Correlation id of the query being handled on this thread/task
+_query_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("meton_query_id", default=None)
+
+
 def _get_log_level(level_str: str) -> int:
     """Convert log level string to logging constant.
 
@@ -28,6 +53,267 @@ def _get_log_level(level_str: str) -> int:
     return levels.get(level_str.upper(), logging.INFO)
 
 
+def new_query_id() -> str:
+    """Generate a short correlation id for a query."""
+    return uuid.uuid4().hex[:12]
+
+
+def get_query_id() -> Optional[str]:
+    """Get the correlation id of the current query, if any."""
+    return _query_id.get()
+
+
+@contextmanager
+def query_context(query_id: Optional[str] = None) -> Iterator[str]:
+    """Tag log records emitted inside the block with a query correlation id.
+
+    Nested contexts without an explicit id keep the outer id, so work done
+    on behalf of a query (sub-agents, reflection, ...) shares its id. Thread
+    pools working for a query submit through ``contextvars.copy_context().run``
+    so their records keep it too.
+
+    Args:
+        query_id: Id to use (default: the current id, or a new one)
+
+    Yields:
+        The active query id
+
+    Example:
+        >>> with query_context() as qid:
+        ...     logger.info("Running query")  # File line carries [q:<qid>]
+    """
+    query_id = query_id or _query_id.get() or new_query_id()
+    token = _query_id.set(query_id)
+    try:
+        yield query_id
+    finally:
+        _query_id.reset(token)
+
+
+class _ContextFilter(logging.Filter):
+    """Stamps records with the query id and style on the emitting thread."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        query_id = _query_id.get()
+        record.query_id = query_id
+        record.query_tag = f" [q:{query_id}]" if query_id else ""
+        if not hasattr(record, "style"):
+            record.style = None
+        return True
+
+
+class _DebugRateLimiter(logging.Filter):
+    """Samples and rate limits DEBUG records per logger.
+
+    Higher levels always pass. With ``sample_rate`` r only every round(1/r)-th
+    DEBUG record is kept; ``rate_limit`` caps the kept ones per second with a
+    token bucket (burst of one second's worth).
+    """
+
+    def __init__(self, rate_limit: float = 0.0, sample_rate: float = 1.0):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.configure(rate_limit, sample_rate)
+        self.suppressed = 0
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # logger -> (tokens, last refill)
+        self._counters: Dict[str, int] = {}
+
+    def configure(self, rate_limit: float, sample_rate: float) -> None:
+        """Update limits (0 rate_limit = unlimited)."""
+        self.rate_limit = max(0.0, rate_limit)
+        self.sample_every = max(1, round(1 / sample_rate)) if sample_rate > 0 else 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+
+        with self.lock:
+            if self.sample_every != 1:
+                count = self._counters.get(record.name, 0)
+                self._counters[record.name] = count + 1
+                if not self.sample_every or count % self.sample_every:
+                    self.suppressed += 1
+                    return False
+
+            if self.rate_limit:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(record.name, (self.rate_limit, now))
+                tokens = min(self.rate_limit, tokens + (now - last) * self.rate_limit)
+                if tokens < 1:
+                    self._buckets[record.name] = (tokens, now)
+                    self.suppressed += 1
+                    return False
+                self._buckets[record.name] = (tokens - 1, now)
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records without formatting them on the caller's thread.
+
+    One handler per MetonLogger: records are tagged with the logger the
+    handler is attached to, so records propagated from child loggers
+    (``meton.hooks`` → ``meton``) reach that logger's files.
+    """
+
+    def __init__(self, queue_: "queue.SimpleQueue[logging.LogRecord]", route: str):
+        super().__init__(queue_)
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener lives in this process, so the record (args, exc_info)
+        # can travel as-is; formatting happens on the listener thread.
+        if hasattr(record, "meton_route"):
+            record = copy.copy(record)  # Also queued for another logger
+        record.meton_route = self.route
+        return record
+
+
+class _MarkupFormatter(logging.Formatter):
+    """Console formatter wrapping messages in their Rich style."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        style = getattr(record, "style", None)
+        return f"[{style}]{message}[/{style}]" if style else message
+
+
+class _TextFormatter(logging.Formatter):
+    """Detailed file format; tolerates records that skipped the context filter."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "query_tag"):
+            record.query_tag = ""
+        return super().format(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Example output:
+        {"ts": "2025-01-01T12:00:00.123", "level": "INFO", "logger": "meton",
+         "message": "Query done", "query_id": "3f2a9c1b7d4e", "func": "run", "line": 42}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "query_id": getattr(record, "query_id", None),
+            "func": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _Dispatcher(logging.Handler):
+    """Routes records on the listener thread to their logger's handlers."""
+
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, List[logging.Handler]] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self.routes.get(getattr(record, "meton_route", record.name), ()):
+            if record.levelno >= handler.level:
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - handle() routes
+        self.handle(record)
+
+
+class LogBackend:
+    """Process-wide queue and listener thread shared by all MetonLoggers."""
+
+    def __init__(self):
+        """Initialize the backend (the listener starts on first use)."""
+        self.queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.context_filter = _ContextFilter()
+        self.rate_limiter = _DebugRateLimiter()
+        self.queue_handlers: Dict[str, _QueueHandler] = {}  # Logger name -> its queue handler
+        self.dispatcher = _Dispatcher()
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.lock = threading.Lock()
+        self.cleaned: set = set()  # (log_dir, name) pairs already pruned this process
+
+    def configure(self, debug_rate_limit: float, debug_sample_rate: float) -> None:
+        """Update DEBUG sampling/rate limits for all loggers."""
+        self.rate_limiter.configure(debug_rate_limit, debug_sample_rate)
+
+    def attach(self, logger: logging.Logger, handlers: List[logging.Handler]) -> None:
+        """Route a logger's records through the queue to its handlers.
+
+        Args:
+            logger: Logger to attach the shared queue handler to
+            handlers: Handlers run on the listener thread for this logger
+        """
+        with self.lock:
+            for old in self.dispatcher.routes.get(logger.name, []):
+                old.close()
+            self.dispatcher.routes[logger.name] = handlers
+            queue_handler = self.queue_handlers.get(logger.name)
+            if queue_handler is None:
+                queue_handler = self.queue_handlers[logger.name] = _QueueHandler(self.queue, logger.name)
+                queue_handler.addFilter(self.context_filter)
+                queue_handler.addFilter(self.rate_limiter)
+            if self.listener is None:
+                self.listener = logging.handlers.QueueListener(self.queue, self.dispatcher)
+                self.listener.start()
+        if queue_handler not in logger.handlers:
+            logger.addHandler(queue_handler)
+
+    def flush(self) -> None:
+        """Block until all queued records are written (restarts the listener)."""
+        with self.lock:
+            if self.listener is not None:
+                self.listener.stop()  # Drains the queue
+                self.listener.start()
+            for handlers in self.dispatcher.routes.values():
+                for handler in handlers:
+                    handler.flush()
+
+    def shutdown(self) -> None:
+        """Drain the queue, stop the listener and close files."""
+        with self.lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+            for handlers in self.dispatcher.routes.values():
+                for handler in handlers:
+                    handler.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get backend statistics (queue depth, suppressed DEBUG records)."""
+        return {
+            "running": self.listener is not None,
+            "queued": self.queue.qsize(),
+            "loggers": len(self.dispatcher.routes),
+            "debug_suppressed": self.rate_limiter.suppressed,
+        }
+
+
+_backend = LogBackend()
+atexit.register(_backend.shutdown)
+
+
+def get_log_backend() -> LogBackend:
+    """Get the shared logging backend."""
+    return _backend
+
+
+def flush_logs() -> None:
+    """Write out everything queued so far."""
+    _backend.flush()
+
+
 class MetonLogger:
     """Custom logger for Meton with Rich-enhanced console output."""
 
@@ -38,7 +324,9 @@ class MetonLogger:
         level: int = logging.INFO,
         console_output: bool = True,
         use_rich: bool = True,
-        max_log_files: int = 30
+        max_log_files: int = 30,
+        async_logging: bool = True,
+        log_format: str = "text"
     ):
         """Initialize Meton logger with Rich integration.
 
@@ -49,6 +337,9 @@ class MetonLogger:
             console_output: Enable console output
             use_rich: Use Rich for colored console output
             max_log_files: Maximum number of daily log files to keep
+            async_logging: Write through the shared background listener
+                (False attaches the handlers to the logger directly)
+            log_format: File format, "text" or "json" (JSON lines)
 
         Example:
             >>> logger = MetonLogger()
@@ -63,6 +354,7 @@ class MetonLogger:
         self.use_rich = use_rich
         self.console = Console() if use_rich else None
         self.max_log_files = max_log_files
+        self.log_format = log_format
 
         # Create logger
         self.logger = logging.getLogger(name)
@@ -72,7 +364,8 @@ class MetonLogger:
         # Clear existing handlers
         self.logger.handlers.clear()
 
-        # Add handlers
+        # Build handlers
+        self.handlers: List[logging.Handler] = []
         if console_output:
             if use_rich:
                 self._add_rich_console_handler()
@@ -81,8 +374,19 @@ class MetonLogger:
 
         self._add_file_handler()
 
-        # Clean up old log files
-        self._cleanup_old_logs()
+        if async_logging:
+            _backend.attach(self.logger, self.handlers)
+        else:
+            self.logger.addFilter(_backend.context_filter)
+            self.logger.addFilter(_backend.rate_limiter)
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+
+        # Clean up old log files (once per process; loggers are created per tool instance)
+        key = (str(self.log_dir.resolve()), name)
+        if key not in _backend.cleaned:
+            _backend.cleaned.add(key)
+            self._cleanup_old_logs()
 
     def _cleanup_old_logs(self) -> None:
         """Remove old log files exceeding max_log_files limit."""
@@ -117,14 +421,14 @@ class MetonLogger:
         )
         rich_handler.setLevel(logging.INFO)
 
-        # Simple format for Rich console
-        console_format = logging.Formatter(
+        # Simple format for Rich console, styled per level
+        console_format = _MarkupFormatter(
             '%(message)s',
             datefmt='[%X]'
         )
         rich_handler.setFormatter(console_format)
 
-        self.logger.addHandler(rich_handler)
+        self.handlers.append(rich_handler)
 
     def _add_console_handler(self) -> None:
         """Add standard console handler with color formatting."""
@@ -138,7 +442,7 @@ class MetonLogger:
         )
         console_handler.setFormatter(console_format)
 
-        self.logger.addHandler(console_handler)
+        self.handlers.append(console_handler)
 
     def _add_file_handler(self) -> None:
         """Add file handler with detailed formatting."""
@@ -150,13 +454,13 @@ class MetonLogger:
         file_handler.setLevel(logging.DEBUG)
 
         # Detailed format for file
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        if self.log_format == "json":
+            file_format = JsonLinesFormatter()
+        else:
+            file_format = _TextFormatter(TEXT_FORMAT, datefmt=DATE_FORMAT)
         file_handler.setFormatter(file_format)
 
-        self.logger.addHandler(file_handler)
+        self.handlers.append(file_handler)
 
     def debug(self, message: str) -> None:
         """Log debug message (blue color).
@@ -164,10 +468,9 @@ class MetonLogger:
         Args:
             message: Debug message to log
         """
-        if self.use_rich:
-            self.logger.debug(f"[blue]{message}[/blue]")
-        else:
-            self.logger.debug(message)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return  # Skip building the record on the hot path
+        self.logger.debug(message, extra={"style": "blue" if self.use_rich else None}, stacklevel=2)
 
     def info(self, message: str) -> None:
         """Log info message (green color).
@@ -175,10 +478,7 @@ class MetonLogger:
         Args:
             message: Info message to log
         """
-        if self.use_rich:
-            self.logger.info(f"[green]{message}[/green]")
-        else:
-            self.logger.info(message)
+        self.logger.info(message, extra={"style": "green" if self.use_rich else None}, stacklevel=2)
 
     def warning(self, message: str) -> None:
         """Log warning message (yellow color).
@@ -186,10 +486,7 @@ class MetonLogger:
         Args:
             message: Warning message to log
         """
-        if self.use_rich:
-            self.logger.warning(f"[yellow]{message}[/yellow]")
-        else:
-            self.logger.warning(message)
+        self.logger.warning(message, extra={"style": "yellow" if self.use_rich else None}, stacklevel=2)
 
     def error(self, message: str) -> None:
         """Log error message (red color).
@@ -197,10 +494,7 @@ class MetonLogger:
         Args:
             message: Error message to log
         """
-        if self.use_rich:
-            self.logger.error(f"[red bold]{message}[/red bold]")
-        else:
-            self.logger.error(message)
+        self.logger.error(message, extra={"style": "red bold" if self.use_rich else None}, stacklevel=2)
 
     def critical(self, message: str) -> None:
         """Log critical message (red bold color).
@@ -208,10 +502,7 @@ class MetonLogger:
         Args:
             message: Critical message to log
         """
-        if self.use_rich:
-            self.logger.critical(f"[red bold underline]{message}[/red bold underline]")
-        else:
-            self.logger.critical(message)
+        self.logger.critical(message, extra={"style": "red bold underline" if self.use_rich else None}, stacklevel=2)
 
     def exception(self, message: str) -> None:
         """Log exception with traceback (red color).
@@ -219,10 +510,7 @@ class MetonLogger:
         Args:
             message: Exception message to log
         """
-        if self.use_rich:
-            self.logger.exception(f"[red bold]{message}[/red bold]")
-        else:
-            self.logger.exception(message)
+        self.logger.exception(message, extra={"style": "red bold" if self.use_rich else None}, stacklevel=2)
 
 
 def setup_logger(
@@ -232,7 +520,9 @@ def setup_logger(
     console_output: bool = True,
     use_rich: bool = True,
     max_log_files: int = 30,
-    config: Optional[dict] = None
+    config: Optional[dict] = None,
+    async_logging: bool = True,
+    log_format: str = "text"
 ) -> MetonLogger:
     """Set up and return a Meton logger with Rich integration.
 
@@ -244,6 +534,8 @@ def setup_logger(
         use_rich: Use Rich for colored console output
         max_log_files: Maximum number of daily log files to keep
         config: Optional logging config dict (from config.yaml logging section)
+        async_logging: Write through the shared background listener
+        log_format: File format, "text" or "json" (JSON lines)
 
     Returns:
         Configured MetonLogger instance
@@ -268,6 +560,12 @@ def setup_logger(
         console_output = config.get("console_output", console_output)
         use_rich = config.get("use_rich", use_rich)
         max_log_files = config.get("max_log_files", max_log_files)
+        async_logging = config.get("async_logging", async_logging)
+        log_format = config.get("format", log_format)
+        _backend.configure(
+            config.get("debug_rate_limit", 0.0),
+            config.get("debug_sample_rate", 1.0)
+        )
 
     return MetonLogger(
         name=name,
@@ -275,7 +573,9 @@ def setup_logger(
         level=level,
         console_output=console_output,
         use_rich=use_rich,
-        max_log_files=max_log_files
+        max_log_files=max_log_files,
+        async_logging=async_logging,
+        log_format=log_format
     )
 
 
@@ -1,4 +1,6 @@
 import * as vscode from 'vscode';
+import axios from 'axios';
+import { createHash } from 'crypto';
 import { MetonClient } from '../metonClient';
 
 export class MetonCompletionProvider implements vscode.CompletionItemProvider {
@@ -18,20 +20,30 @@ export class MetonCompletionProvider implements vscode.CompletionItemProvider {
             return [];
         }
 
-        try {
-            // Get code context (previous lines)
-            const contextLines = this.getContext(document, position, 10);
-            const language = document.languageId;
+        const controller = new AbortController();
+        const subscription = token.onCancellationRequested(() => controller.abort());
 
-            // Ask Meton for suggestions
-            const query = `Given this ${language} code context, suggest completions for: "${linePrefix}"\n\nContext:\n${contextLines}`;
-            const suggestions = await this.metonClient.sendQuery(query);
+        try {
+            // Send the code around the cursor; the server makes one quick-model call
+            const result = await this.metonClient.complete({
+                prefix: this.getContext(document, position, 30),
+                suffix: this.getSuffix(document, position, 10),
+                language: document.languageId,
+                file_path: document.uri.fsPath,
+                file_hash: hashDocument(document)
+            }, controller.signal);
 
-            // Parse suggestions into completion items
-            return this.parseCompletions(suggestions);
+            if (result.cancelled || token.isCancellationRequested) {
+                return [];
+            }
+            return this.toCompletionItems(result.items);
         } catch (error) {
-            console.error('Completion error:', error);
+            if (!axios.isCancel(error)) {
+                console.error('Completion error:', error);
+            }
             return [];
+        } finally {
+            subscription.dispose();
         }
     }
 
@@ -51,21 +63,22 @@ export class MetonCompletionProvider implements vscode.CompletionItemProvider {
         return document.getText(range);
     }
 
-    private parseCompletions(suggestions: string): vscode.CompletionItem[] {
-        const items: vscode.CompletionItem[] = [];
-
-        // Simple parsing - look for code blocks
-        const codeBlockRegex = /```(?:\w+)?\n(.*?)```/gs;
-        let match;
+    private getSuffix(document: vscode.TextDocument, position: vscode.Position, lines: number): string {
+        const endLine = Math.min(document.lineCount - 1, position.line + lines);
+        const range = new vscode.Range(position, document.lineAt(endLine).range.end);
+        return document.getText(range);
+    }
 
-        while ((match = codeBlockRegex.exec(suggestions)) !== null) {
-            const code = match[1].trim();
-            const item = new vscode.CompletionItem(code, vscode.CompletionItemKind.Snippet);
+    private toCompletionItems(completions: string[]): vscode.CompletionItem[] {
+        return completions.map(code => {
+            const item = new vscode.CompletionItem(code.split('\n')[0], vscode.CompletionItemKind.Snippet);
             item.detail = 'Meton suggestion';
-            item.insertText = new vscode.SnippetString(code);
-            items.push(item);
-        }
-
-        return items;
+            item.insertText = code;
+            return item;
+        });
     }
 }
+
+export function hashDocument(document: vscode.TextDocument): string {
+    return createHash('sha1').update(document.getText()).digest('hex');
+}
@@ -1,5 +1,6 @@
 import * as vscode from 'vscode';
 import { MetonClient } from '../metonClient';
+import { hashDocument } from './completions';
 
 export class MetonHoverProvider implements vscode.HoverProvider {
     constructor(private metonClient: MetonClient) {}
@@ -18,21 +19,32 @@ export class MetonHoverProvider implements vscode.HoverProvider {
         const word = document.getText(wordRange);
         const language = document.languageId;
 
+        const controller = new AbortController();
+        const subscription = token.onCancellationRequested(() => controller.abort());
+
         try {
-            // Get context
-            const lineText = document.lineAt(position.line).text;
+            // Known definitions come from the symbol index; anything else is one quick-model call
+            const result = await this.metonClient.hover({
+                word,
+                line: document.lineAt(position.line).text,
+                language,
+                file_path: document.uri.fsPath,
+                file_hash: hashDocument(document)
+            }, controller.signal);
 
-            // Ask Meton to explain
-            const query = `Briefly explain what "${word}" does in this ${language} context: ${lineText}`;
-            const explanation = await this.metonClient.sendQuery(query);
+            if (result.cancelled || !result.contents || token.isCancellationRequested) {
+                return undefined;
+            }
 
             const markdown = new vscode.MarkdownString();
-            markdown.appendMarkdown(`**Meton Explanation:**\n\n${explanation}`);
-            markdown.isTrusted = true;
+            const title = result.source === 'symbols' ? 'Definition' : 'Meton Explanation';
+            markdown.appendMarkdown(`**${title}:**\n\n${result.contents}`);
 
             return new vscode.Hover(markdown, wordRange);
         } catch (error) {
             return undefined;
+        } finally {
+            subscription.dispose();
         }
     }
 }
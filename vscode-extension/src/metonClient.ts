@@ -1,8 +1,41 @@
 import axios, { AxiosInstance } from 'axios';
 
+export interface CompletionRequest {
+    prefix: string;
+    suffix: string;
+    language: string;
+    file_path: string;
+    file_hash: string;
+}
+
+export interface CompletionResult {
+    items: string[];
+    cached: boolean;
+    cancelled: boolean;
+    latency_ms: number;
+}
+
+export interface HoverRequest {
+    word: string;
+    line: string;
+    language: string;
+    file_path: string;
+    file_hash: string;
+}
+
+export interface HoverResult {
+    contents: string;
+    source: 'symbols' | 'model';
+    cached: boolean;
+    cancelled: boolean;
+    latency_ms: number;
+}
+
 export class MetonClient {
     private client: AxiosInstance;
     private serverUrl: string;
+    // Newer completion/hover requests from this window supersede older ones on the server
+    private clientId = `vscode-${process.pid}-${Date.now()}`;
 
     constructor(serverUrl: string) {
         this.serverUrl = serverUrl;
@@ -49,6 +82,16 @@ export class MetonClient {
         return this.sendQuery(query);
     }
 
+    async complete(request: CompletionRequest, signal?: AbortSignal): Promise<CompletionResult> {
+        const response = await this.client.post('/complete', { client_id: this.clientId, ...request }, { signal, timeout: 10000 });
+        return response.data;
+    }
+
+    async hover(request: HoverRequest, signal?: AbortSignal): Promise<HoverResult> {
+        const response = await this.client.post('/hover', { client_id: this.clientId, ...request }, { signal, timeout: 10000 });
+        return response.data;
+    }
+
     async indexWorkspace(workspacePath: string): Promise<void> {
         await this.client.post('/index', { path: workspacePath });
     }
@@ -0,0 +1,284 @@
+"""
+Per-session agent registry for the Meton Web UI.
+
+Each browser session gets its own agent (and with it its own conversation),
+built on demand from shared read-only resources and kept in an LRU:
+
+- Requests from one session run one at a time on that session's agent;
+  requests from different sessions run concurrently, at most
+  ``max_concurrent`` at once; the others wait.
+- When more than ``max_agents`` agents exist, the least recently used idle
+  ones are evicted (``on_evict`` lets the owner flush their conversation).
+- Queue wait and per-session latency are tracked for the status panel.
+
+Example:
+    >>> registry = SessionAgentRegistry(build_agent, max_agents=8, max_concurrent=2)
+    >>> with registry.session("tab-1") as agent:
+    ...     result = agent.run("Explain rag/indexer.py")
+    >>> registry.get_stats("tab-1")["session"]["p95_ms"]
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+STATS_SESSIONS = 256  # Sessions whose latency stats are kept
+
+
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None without samples)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100.0 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+
+class SessionAgentRegistry:
+    """Agents keyed by session id, with LRU eviction and bounded concurrency."""
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any],
+        max_agents: int = 8,
+        max_concurrent: int = 2,
+        on_evict: Optional[Callable[[str, Any], None]] = None,
+        latency_window: int = 200
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            factory: Builds the agent for a session id
+            max_agents: Agents kept before idle ones are evicted
+            max_concurrent: Requests running at once across all sessions
+            on_evict: Called with (session_id, agent) when an agent is dropped
+            latency_window: Recent requests kept for percentiles
+        """
+        self.factory = factory
+        self.max_agents = max_agents
+        self.max_concurrent = max_concurrent
+        self.on_evict = on_evict
+        self.latency_window = latency_window
+
+        self._agents: "OrderedDict[str, Any]" = OrderedDict()
+        self._session_locks: Dict[str, threading.Lock] = {}
+        self._pending: Dict[str, int] = {}  # Requests holding or waiting for a session lock
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self.lock = threading.Lock()
+
+        self._waits = deque(maxlen=latency_window)
+        self._session_stats: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.running = 0
+        self.waiting = 0
+        self.created = 0
+        self.evicted = 0
+
+    # ========== Requests ==========
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator[Any]:
+        """
+        Run a request on a session's agent.
+
+        Waits for earlier requests of the same session and for a free slot,
+        then yields the agent (built on first use).
+
+        Args:
+            session_id: Session the request belongs to
+
+        Yields:
+            The session's agent
+        """
+        start = time.perf_counter()
+        with self.lock:
+            self.waiting += 1
+
+        # Session first: a queued follow-up of a busy session doesn't hold a slot
+        session_lock = self._lock_session(session_id)
+        self._slots.acquire()
+        wait = time.perf_counter() - start
+        with self.lock:
+            self.waiting -= 1
+            self.running += 1
+            self._waits.append(wait * 1000)
+
+        try:
+            agent = self._get_agent(session_id)
+            run_start = time.perf_counter()
+            yield agent
+            self._record(session_id, wait, time.perf_counter() - run_start)
+        finally:
+            self._slots.release()
+            with self.lock:
+                self.running -= 1
+            self._unlock_session(session_id, session_lock)
+            self._evict_idle()
+
+    def _lock_session(self, session_id: str) -> threading.Lock:
+        """Wait for and take a session's lock, marking the session busy."""
+        with self.lock:
+            session_lock = self._session_locks.setdefault(session_id, threading.Lock())
+            self._pending[session_id] = self._pending.get(session_id, 0) + 1
+        session_lock.acquire()
+        return session_lock
+
+    def _unlock_session(self, session_id: str, session_lock: threading.Lock) -> None:
+        """Release a session's lock; idle sessions drop it."""
+        session_lock.release()
+        with self.lock:
+            self._pending[session_id] -= 1
+            if not self._pending[session_id]:
+                del self._pending[session_id]
+                if session_id not in self._agents:
+                    self._session_locks.pop(session_id, None)
+
+    def _get_agent(self, session_id: str) -> Any:
+        """Get the session's agent, building it if needed (session lock held)."""
+        with self.lock:
+            agent = self._agents.get(session_id)
+            if agent is not None:
+                self._agents.move_to_end(session_id)
+                return agent
+
+        # Built outside the registry lock: other sessions keep running
+        agent = self.factory(session_id)
+        with self.lock:
+            self._agents[session_id] = agent
+            self.created += 1
+        return agent
+
+    def _evict_idle(self) -> None:
+        """Drop least recently used idle agents beyond max_agents."""
+        evicted = []
+        with self.lock:
+            excess = len(self._agents) - self.max_agents
+            for session_id in list(self._agents):
+                if excess <= 0:
+                    break
+                if session_id in self._pending:
+                    continue  # Running or queued
+                evicted.append((session_id, self._agents.pop(session_id)))
+                self._session_locks.pop(session_id, None)
+                self.evicted += 1
+                excess -= 1
+
+        for session_id, agent in evicted:
+            self._close(session_id, agent)
+
+    def _close(self, session_id: str, agent: Any) -> None:
+        """Hand a dropped agent to on_evict."""
+        if self.on_evict:
+            try:
+                self.on_evict(session_id, agent)
+            except Exception:
+                pass  # A failed flush mustn't break other sessions' requests
+
+    def _record(self, session_id: str, wait: float, latency: float) -> None:
+        """Record a finished request's queue wait and latency."""
+        with self.lock:
+            stats = self._session_stats.get(session_id)
+            if stats is None:
+                stats = {"requests": 0, "latencies": deque(maxlen=self.latency_window), "last_wait_ms": 0.0}
+                self._session_stats[session_id] = stats
+            self._session_stats.move_to_end(session_id)
+            while len(self._session_stats) > STATS_SESSIONS:
+                self._session_stats.popitem(last=False)
+
+            stats["requests"] += 1
+            stats["latencies"].append(latency * 1000)
+            stats["last_wait_ms"] = wait * 1000
+
+    # ========== Management ==========
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """
+        Get a session's agent without running a request.
+
+        Args:
+            session_id: Session id
+
+        Returns:
+            The agent, or None if the session has none
+        """
+        with self.lock:
+            return self._agents.get(session_id)
+
+    def remove(self, session_id: str) -> bool:
+        """
+        Drop a session's agent and stats (e.g. when the session is cleared).
+
+        Waits for the session's running request to finish first.
+
+        Args:
+            session_id: Session id
+
+        Returns:
+            True if the session had an agent
+        """
+        session_lock = self._lock_session(session_id)
+        try:
+            with self.lock:
+                agent = self._agents.pop(session_id, None)
+                self._session_stats.pop(session_id, None)
+            if agent is not None:
+                self._close(session_id, agent)
+        finally:
+            self._unlock_session(session_id, session_lock)
+        return agent is not None
+
+    def clear(self) -> None:
+        """Drop all idle agents."""
+        with self.lock:
+            idle = [session_id for session_id in self._agents if session_id not in self._pending]
+        for session_id in idle:
+            self.remove(session_id)
+
+    def size(self) -> int:
+        """Number of live agents."""
+        with self.lock:
+            return len(self._agents)
+
+    def get_stats(self, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get queue and agent statistics.
+
+        Args:
+            session_id: Also report this session's latency
+
+        Returns:
+            Agent counts, running/waiting requests, queue wait p50/p95 (ms)
+            and, with a session id, that session's request count and
+            latency avg/p95 (ms)
+        """
+        with self.lock:
+            waits = list(self._waits)
+            stats: Dict[str, Any] = {
+                "agents": len(self._agents),
+                "max_agents": self.max_agents,
+                "running": self.running,
+                "waiting": self.waiting,
+                "max_concurrent": self.max_concurrent,
+                "created": self.created,
+                "evicted": self.evicted,
+                "wait_p50_ms": _round(_percentile(waits, 50)),
+                "wait_p95_ms": _round(_percentile(waits, 95))
+            }
+
+            if session_id is not None:
+                session_stats = self._session_stats.get(session_id)
+                latencies = list(session_stats["latencies"]) if session_stats else []
+                stats["session"] = {
+                    "requests": session_stats["requests"] if session_stats else 0,
+                    "avg_ms": _round(sum(latencies) / len(latencies)) if latencies else None,
+                    "p95_ms": _round(_percentile(latencies, 95)),
+                    "last_wait_ms": _round(session_stats["last_wait_ms"]) if session_stats else None
+                }
+            return stats
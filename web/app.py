@@ -9,6 +9,13 @@ Provides a browser-based interface with:
 - Tool toggling
 - Conversation export
 - Performance metrics
+- Analytics dashboard (charts from the shared analytics snapshot)
+
+Every browser session gets its own agent and conversation
+(``web/agent_registry.py``); the model manager, tools, long-term memory and
+logger are built once and shared by all of them. Agent runs go through a
+bounded request queue, and the status panel shows queue wait and the
+session's latency.
 """
 
 import gradio as gr
@@ -16,6 +23,7 @@ import tempfile
 import shutil
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
@@ -26,10 +34,18 @@ from core.config import Config
 from core.models import ModelManager
 from core.conversation import ConversationManager
 from core.agent import MetonAgent
+from agent.performance_analytics import PerformanceAnalytics
+from utils.logger import setup_logger
 from tools.file_ops import FileOperationsTool
 from tools.code_executor import CodeExecutorTool
 from tools.web_search import WebSearchTool
 from tools.codebase_search import CodebaseSearchTool
+from web.agent_registry import SessionAgentRegistry
+from web.session_manager import SessionManager
+from web.visualizations import MetonVisualizations
+
+# Session used when no browser session is given (scripts, tests)
+DEFAULT_SESSION = "default"
 
 
 @dataclass
@@ -54,10 +70,13 @@ class MetonWebUI:
         self.config_path = config_path
         self.config = Config(config_path)
 
-        # Meton components (lazy-initialized)
+        web_config = self.config.config.web_ui
+
+        # Shared read-only components (lazy-initialized), used by every session's agent
         self.model_manager: Optional[ModelManager] = None
-        self.conversation: Optional[ConversationManager] = None
-        self.agent: Optional[MetonAgent] = None
+        self.long_term_memory = None
+        self.logger = None
+        self._init_lock = threading.Lock()
 
         # Tools
         self.file_tool: Optional[FileOperationsTool] = None
@@ -65,8 +84,18 @@ class MetonWebUI:
         self.web_tool: Optional[WebSearchTool] = None
         self.codebase_search_tool: Optional[CodebaseSearchTool] = None
 
+        # One agent (with its own conversation) per session
+        self.agents = SessionAgentRegistry(
+            self._create_session_agent,
+            max_agents=web_config.sessions.max_agents,
+            max_concurrent=web_config.max_concurrent,
+            on_evict=self._close_session_agent
+        )
+        self.session_manager: Optional[SessionManager] = None  # Opened for the first browser session
+        self.visualizations: Optional[MetonVisualizations] = None  # Built with the analytics tab
+
         # Session state
-        self.conversation_history = []
+        self.histories: Dict[str, List[ConversationMessage]] = {}
         self.uploaded_files = []
         self.temp_dir = tempfile.mkdtemp(prefix="meton_web_")
 
@@ -82,53 +111,138 @@ class MetonWebUI:
         # Status
         self.agent_status = "Not initialized"
 
+    @property
+    def conversation_history(self) -> List[ConversationMessage]:
+        """Conversation of the default session."""
+        return self.histories.setdefault(DEFAULT_SESSION, [])
+
+    @conversation_history.setter
+    def conversation_history(self, messages: List[ConversationMessage]) -> None:
+        self.histories[DEFAULT_SESSION] = messages
+
+    @property
+    def agent(self) -> Optional[MetonAgent]:
+        """Agent of the default session (None until it handled a message)."""
+        return self.agents.get(DEFAULT_SESSION)
+
     def initialize_agent(self) -> str:
         """
-        Initialize Meton agent.
+        Initialize the components shared by all sessions' agents.
 
         Returns:
             Status message
         """
-        try:
-            # Initialize Model Manager
-            self.model_manager = ModelManager(self.config)
+        with self._init_lock:
+            if self.model_manager is not None:
+                return "Agent initialized successfully"
+
+            try:
+                # Initialize Model Manager
+                model_manager = ModelManager(self.config)
+
+                # Initialize Tools
+                self.file_tool = FileOperationsTool(self.config)
+                self.code_tool = CodeExecutorTool(self.config)
+                self.web_tool = WebSearchTool(self.config)
+                self.codebase_search_tool = CodebaseSearchTool(self.config)
+
+                self.logger = setup_logger(
+                    name="meton_agent",
+                    config=self.config.config.logging.model_dump()
+                )
+                self.model_manager = model_manager
+
+                self.agent_status = "Ready"
+                return "Agent initialized successfully"
+
+            except Exception as e:
+                self.agent_status = f"Error: {str(e)}"
+                return f"Failed to initialize agent: {str(e)}"
+
+    def _create_session_agent(self, session_id: str) -> MetonAgent:
+        """
+        Build the agent for a session on the shared components.
 
-            # Initialize Conversation Manager
-            self.conversation = ConversationManager(self.config)
+        A session whose agent was evicted continues its saved conversation.
 
-            # Initialize Tools
-            self.file_tool = FileOperationsTool(self.config)
-            self.code_tool = CodeExecutorTool(self.config)
-            self.web_tool = WebSearchTool(self.config)
-            self.codebase_search_tool = CodebaseSearchTool(self.config)
+        Args:
+            session_id: Session ID
 
-            # Initialize Agent
-            self.agent = MetonAgent(
+        Returns:
+            MetonAgent with its own conversation
+        """
+        if session_id == DEFAULT_SESSION:
+            conversation = ConversationManager(self.config)
+        else:
+            conversation = ConversationManager(self.config, session_id=session_id)
+            saved = conversation.find_saved_conversation(session_id)
+            if saved:
+                conversation.load(saved)
+
+        # Serialized so the first agent's memory system is shared by all later ones
+        with self._init_lock:
+            agent = MetonAgent(
                 config=self.config,
                 model_manager=self.model_manager,
-                conversation=self.conversation,
+                conversation=conversation,
                 tools=[self.file_tool, self.code_tool, self.web_tool, self.codebase_search_tool],
-                verbose=False
+                verbose=False,
+                logger=self.logger,
+                long_term_memory=self.long_term_memory
             )
+            if self.long_term_memory is None:
+                self.long_term_memory = agent.long_term_memory
+        return agent
 
-            self.agent_status = "Ready"
-            return "Agent initialized successfully"
+    def _close_session_agent(self, session_id: str, agent: MetonAgent) -> None:
+        """Flush an evicted agent's conversation to disk."""
+        agent.conversation.close()
 
-        except Exception as e:
-            self.agent_status = f"Error: {str(e)}"
-            return f"Failed to initialize agent: {str(e)}"
+    def open_session(self) -> str:
+        """
+        Start a browser session tracked by the SessionManager.
+
+        Returns:
+            Session ID
+        """
+        with self._init_lock:
+            if self.session_manager is None:
+                sessions_config = self.config.config.web_ui.sessions
+                self.session_manager = SessionManager(
+                    storage_path=sessions_config.storage_path,
+                    flush_interval=sessions_config.flush_interval
+                )
+        return self.session_manager.create_session({"model": self.current_model})
+
+    def close_session(self, session_id: Optional[str]) -> None:
+        """
+        Release a browser session's agent when its tab goes away.
+
+        The session (and its saved conversation) stays on disk.
+
+        Args:
+            session_id: Session ID
+        """
+        if session_id:
+            self.agents.remove(session_id)
+            self.histories.pop(session_id, None)
 
     def process_message(
         self,
         message: str,
-        history: List[Tuple[str, str]]
+        history: List[Tuple[str, str]],
+        session_id: Optional[str] = None
     ) -> Tuple[List[Tuple[str, str]], str]:
         """
         Process user message and return updated history.
 
+        Runs on the session's own agent; waits while the session's previous
+        message or too many other sessions' messages are running.
+
         Args:
             message: User message
             history: Current conversation history (list of [user_msg, bot_msg])
+            session_id: Browser session (default session if None)
 
         Returns:
             Tuple of (updated_history, empty_string_for_input)
@@ -136,9 +250,11 @@ class MetonWebUI:
         if not message or not message.strip():
             return history, ""
 
+        session_id = session_id or DEFAULT_SESSION
+
         try:
-            # Initialize agent if needed
-            if self.agent is None or self.agent_status == "Not initialized":
+            # Initialize shared components if needed
+            if self.model_manager is None:
                 init_msg = self.initialize_agent()
                 if "Failed" in init_msg:
                     history.append((message, f"❌ {init_msg}"))
@@ -147,8 +263,9 @@ class MetonWebUI:
             # Update status
             self.agent_status = "Processing..."
 
-            # Process message with real agent
-            agent_response = self.agent.run(message)
+            # Process message with the session's agent
+            with self.agents.session(session_id) as agent:
+                agent_response = agent.run(message)
 
             # Extract output from agent response
             if isinstance(agent_response, dict):
@@ -169,7 +286,8 @@ class MetonWebUI:
                 timestamp=datetime.now().isoformat(),
                 metadata={"tools_enabled": self.tools_enabled.copy()}
             )
-            self.conversation_history.append(msg_record)
+            conversation_history = self.histories.setdefault(session_id, [])
+            conversation_history.append(msg_record)
 
             response_record = ConversationMessage(
                 role="assistant",
@@ -177,7 +295,8 @@ class MetonWebUI:
                 timestamp=datetime.now().isoformat(),
                 metadata=response_metadata
             )
-            self.conversation_history.append(response_record)
+            conversation_history.append(response_record)
+            self._save_history(session_id)
 
             # Update Gradio history (chatbot expects string, not dict)
             history.append((message, response_text))
@@ -193,6 +312,18 @@ class MetonWebUI:
             self.agent_status = "Error"
             return history, ""
 
+    def _save_history(self, session_id: str) -> None:
+        """Store a browser session's conversation in the SessionManager."""
+        if self.session_manager is None or session_id == DEFAULT_SESSION:
+            return
+        try:
+            self.session_manager.update_session(
+                session_id,
+                conversation_history=[asdict(msg) for msg in self.histories.get(session_id, [])]
+            )
+        except KeyError:
+            pass  # Deleted elsewhere (e.g. expired); the agent keeps its own copy
+
     def _simulate_agent_response(self, message: str) -> str:
         """
         Simulate agent response for testing.
@@ -349,27 +480,40 @@ Use the settings panel to enable additional tools like web search and reflection
         self.current_model = model_name
         return f"✅ Model updated: {model_name}"
 
-    def clear_conversation(self) -> List[Tuple[str, str]]:
+    def clear_conversation(self, session_id: Optional[str] = None) -> List[Tuple[str, str]]:
         """
         Clear conversation history.
 
+        Args:
+            session_id: Browser session (default session if None)
+
         Returns:
             Empty conversation history
         """
-        self.conversation_history = []
+        session_id = session_id or DEFAULT_SESSION
+        self.histories[session_id] = []
+        self._save_history(session_id)
+
+        agent = self.agents.get(session_id)
+        if agent is not None:
+            agent.conversation.clear()
+
         self.agent_status = "Ready"
         return []
 
-    def export_conversation(self, format: str = "markdown") -> str:
+    def export_conversation(self, format: str = "markdown", session_id: Optional[str] = None) -> str:
         """
         Export conversation to file.
 
         Args:
             format: Export format (markdown, json, txt)
+            session_id: Browser session (default session if None)
 
         Returns:
             Path to exported file
         """
+        conversation_history = self.histories.get(session_id or DEFAULT_SESSION, [])
+
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -380,7 +524,7 @@ Use the settings panel to enable additional tools like web search and reflection
                 with open(filepath, 'w') as f:
                     f.write(f"# Meton Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
 
-                    for msg in self.conversation_history:
+                    for msg in conversation_history:
                         role_emoji = "👤" if msg.role == "user" else "🤖"
                         f.write(f"## {role_emoji} {msg.role.title()}\n")
                         f.write(f"*{msg.timestamp}*\n\n")
@@ -391,7 +535,7 @@ Use the settings panel to enable additional tools like web search and reflection
                 filename = f"conversation_{timestamp}.json"
                 filepath = Path(self.temp_dir) / filename
 
-                data = [asdict(msg) for msg in self.conversation_history]
+                data = [asdict(msg) for msg in conversation_history]
 
                 with open(filepath, 'w') as f:
                     json.dump(data, f, indent=2)
@@ -404,7 +548,7 @@ Use the settings panel to enable additional tools like web search and reflection
                     f.write(f"Meton Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                     f.write("=" * 60 + "\n\n")
 
-                    for msg in self.conversation_history:
+                    for msg in conversation_history:
                         f.write(f"[{msg.role.upper()}] {msg.timestamp}\n")
                         f.write(f"{msg.content}\n")
                         f.write("-" * 60 + "\n\n")
@@ -417,23 +561,104 @@ Use the settings panel to enable additional tools like web search and reflection
         except Exception as e:
             return f"❌ Export failed: {str(e)}"
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self, session_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get current UI status.
 
+        Args:
+            session_id: Browser session (default session if None)
+
         Returns:
-            Status dictionary
+            Status dictionary, with agent queue statistics and the
+            session's latency under "queue"
         """
+        session_id = session_id or DEFAULT_SESSION
         return {
             "agent_status": self.agent_status,
             "current_model": self.current_model,
             "tools_enabled": self.tools_enabled.copy(),
             "uploaded_files_count": len(self.uploaded_files),
-            "conversation_messages": len(self.conversation_history)
+            "conversation_messages": len(self.histories.get(session_id, [])),
+            "queue": self.agents.get_stats(session_id)
         }
 
+    def format_status(self, session_id: Optional[str] = None) -> str:
+        """
+        Status panel text: agent status, queue wait and the session's latency.
+
+        Args:
+            session_id: Browser session (default session if None)
+
+        Returns:
+            Multi-line status text
+        """
+        stats = self.agents.get_stats(session_id or DEFAULT_SESSION)
+        session = stats["session"]
+
+        def ms(value: Optional[float]) -> str:
+            return f"{value / 1000:.1f}s" if value is not None else "-"
+
+        return "\n".join([
+            self.agent_status,
+            f"Queue: {stats['running']}/{stats['max_concurrent']} running, {stats['waiting']} waiting, "
+            f"wait p50 {ms(stats['wait_p50_ms'])} / p95 {ms(stats['wait_p95_ms'])}",
+            f"This session: {session['requests']} requests, avg {ms(session['avg_ms'])}, "
+            f"p95 {ms(session['p95_ms'])}, last wait {ms(session['last_wait_ms'])}",
+            f"Agents: {stats['agents']}/{stats['max_agents']} live, {stats['evicted']} evicted"
+        ])
+
+    def get_visualizations(self) -> Optional[MetonVisualizations]:
+        """
+        Get the dashboard charts (lazy-initialized).
+
+        Returns:
+            MetonVisualizations over the shared analytics store, or None if
+            analytics or the web UI dashboard is disabled
+        """
+        analytics_config = self.config.config.analytics
+        dashboard_config = self.config.config.web_ui.analytics
+        if not (analytics_config.enabled and dashboard_config.enabled):
+            return None
+
+        with self._init_lock:
+            if self.visualizations is None:
+                analytics = PerformanceAnalytics(
+                    storage_path=analytics_config.storage_path,
+                    config=analytics_config.model_dump()
+                )
+                self.visualizations = MetonVisualizations(
+                    analytics,
+                    refresh_interval=dashboard_config.refresh_interval
+                )
+            return self.visualizations
+
+    def refresh_analytics(self) -> Tuple[Any, Any, Any, Any]:
+        """
+        Render the dashboard charts.
+
+        All charts of one refresh read the same analytics snapshot, which is
+        rebuilt only when metrics changed (at most once per refresh_interval).
+
+        Returns:
+            Tuple of (performance chart, tool usage chart, success rate gauge,
+            bottleneck table)
+        """
+        viz = self.get_visualizations()
+        if viz is None:
+            return None, None, None, None
+
+        return (
+            viz.create_performance_chart(),
+            viz.create_tool_usage_chart(),
+            viz.create_success_rate_gauge(),
+            viz.create_bottleneck_table()
+        )
+
     def cleanup(self):
         """Clean up temporary files."""
+        if self.session_manager is not None:
+            self.session_manager.close()
+
         try:
             if os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir)
@@ -522,34 +747,51 @@ Use the settings panel to enable additional tools like web search and reflection
                     status_text = gr.Textbox(
                         label="Agent Status",
                         value="Not initialized",
-                        interactive=False
+                        interactive=False,
+                        lines=4
                     )
 
+            # Analytics dashboard
+            dashboard_enabled = (
+                self.config.config.analytics.enabled
+                and self.config.config.web_ui.analytics.enabled
+            )
+            with gr.Accordion("📈 Analytics", open=False, visible=dashboard_enabled):
+                with gr.Row():
+                    performance_plot = gr.Plot(label="Response Time")
+                    success_plot = gr.Plot(label="Success Rate")
+                with gr.Row():
+                    tool_usage_plot = gr.Plot(label="Tool Usage")
+                    bottleneck_table = gr.Dataframe(label="Bottlenecks", interactive=False)
+                refresh_analytics_btn = gr.Button("🔄 Refresh", size="sm")
+
             # Hidden components for exports
             export_file = gr.File(label="Download", visible=False)
 
-            # Event handlers
-            def send_message(msg, history):
-                result_history, empty = self.process_message(msg, history)
-                return result_history, empty, self.agent_status
-
-            # Send button
-            send_btn.click(
-                fn=send_message,
-                inputs=[msg, chatbot],
-                outputs=[chatbot, msg, status_text]
-            )
+            # Per-tab session ID; the agent is released when the tab closes
+            session_state = gr.State(None, delete_callback=self.close_session)
 
-            # Enter key
-            msg.submit(
-                fn=send_message,
-                inputs=[msg, chatbot],
-                outputs=[chatbot, msg, status_text]
-            )
+            # Event handlers
+            def send_message(msg, history, session_id):
+                if session_id is None:
+                    session_id = self.open_session()
+                result_history, empty = self.process_message(msg, history, session_id)
+                return result_history, empty, self.format_status(session_id), session_id
+
+            # Agent runs are bounded by the session agent registry (which
+            # measures the queue wait), not by Gradio's worker limit
+            for trigger in (send_btn.click, msg.submit):
+                trigger(
+                    fn=send_message,
+                    inputs=[msg, chatbot, session_state],
+                    outputs=[chatbot, msg, status_text, session_state],
+                    concurrency_limit=None
+                )
 
             # Clear conversation
             clear_btn.click(
                 fn=self.clear_conversation,
+                inputs=[session_state],
                 outputs=[chatbot]
             )
 
@@ -597,15 +839,15 @@ Use the settings panel to enable additional tools like web search and reflection
             )
 
             # Export handlers
-            def export_md():
-                filepath = self.export_conversation("markdown")
+            def export_md(session_id):
+                filepath = self.export_conversation("markdown", session_id)
                 if not filepath.startswith("❌"):
                     return gr.File.update(value=filepath, visible=True)
                 else:
                     return gr.File.update(visible=False)
 
-            def export_json():
-                filepath = self.export_conversation("json")
+            def export_json(session_id):
+                filepath = self.export_conversation("json", session_id)
                 if not filepath.startswith("❌"):
                     return gr.File.update(value=filepath, visible=True)
                 else:
@@ -613,14 +855,22 @@ Use the settings panel to enable additional tools like web search and reflection
 
             export_md_btn.click(
                 fn=export_md,
+                inputs=[session_state],
                 outputs=[export_file]
             )
 
             export_json_btn.click(
                 fn=export_json,
+                inputs=[session_state],
                 outputs=[export_file]
             )
 
+            # Analytics dashboard
+            if dashboard_enabled:
+                analytics_outputs = [performance_plot, tool_usage_plot, success_plot, bottleneck_table]
+                refresh_analytics_btn.click(fn=self.refresh_analytics, outputs=analytics_outputs)
+                demo.load(fn=self.refresh_analytics, outputs=analytics_outputs)
+
         return demo
 
     def launch(
@@ -650,7 +900,8 @@ Use the settings panel to enable additional tools like web search and reflection
 
         # Launch
         try:
-            demo.queue()  # Enable queueing for better concurrency
+            # Bounded request queue; agent runs are capped at web_ui.max_concurrent
+            demo.queue(max_size=self.config.config.web_ui.queue_size)
             demo.launch(
                 server_name=host,
                 server_port=port,
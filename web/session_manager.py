@@ -7,18 +7,42 @@ Handles multiple concurrent user sessions with:
 - File uploads per session
 - Settings and agent state per session
 - Automatic cleanup of expired sessions
+- Optional full-text indexing of conversation history
+
+Persistence:
+    Startup reads only ``sessions_index.jsonl``: one small line of metadata
+    (timestamps, message and file counts) per session, later lines win.
+    Session bodies are parsed on first access and kept in a bounded LRU.
+
+    Each session is a ``session_<id>.json`` snapshot plus a
+    ``session_<id>.history.jsonl`` log of messages added since the
+    snapshot, so a new message is one append instead of a rewrite of the
+    whole history. The snapshot is only rewritten for settings, files or
+    agent state changes, history edits other than appends, and
+    ``save_session()``. Activity timestamps from ``get_session()`` are kept
+    in memory and written to the index every ``flush_interval`` seconds.
 """
 
+import atexit
 import json
+import os
 import uuid
 import shutil
 import tempfile
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import threading
 
+from core.conversation import SessionIndex
+from core.conversation_index import ConversationSearchIndex, ConversationIndexError
+
+# Source name for Web UI sessions in the conversation search index
+SEARCH_SOURCE = "web"
+
 
 @dataclass
 class Session:
@@ -36,27 +60,178 @@ class Session:
         self.last_activity = datetime.now().isoformat()
 
 
+def _history_path(session_file: Path) -> Path:
+    """History log belonging to a session snapshot."""
+    return session_file.with_name(session_file.stem + ".history.jsonl")
+
+
+def _read_session_data(path: Path) -> Dict[str, Any]:
+    """
+    Read a session snapshot and replay its history log.
+
+    Log records from an older snapshot generation (left behind when a
+    process stopped between rewriting the snapshot and removing the log)
+    are ignored.
+
+    Args:
+        path: Session snapshot file
+
+    Returns:
+        Session fields plus ``log_generation``
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    data.setdefault("log_generation", 0)
+
+    log_path = _history_path(path)
+    if log_path.exists():
+        current = False
+        with open(log_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted write
+                if record.get("type") == "log":
+                    current = record.get("generation") == data["log_generation"]
+                elif current and record.get("type") == "message":
+                    data.setdefault("conversation_history", []).append(record["message"])
+    return data
+
+
+def read_session_file(path: Path) -> Tuple[str, List[Dict]]:
+    """
+    Read a persisted session for the search index.
+
+    Args:
+        path: Session file
+
+    Returns:
+        Tuple of (session ID, conversation history)
+    """
+    data = _read_session_data(path)
+    return data["id"], data.get("conversation_history", [])
+
+
+class WebSessionIndex(SessionIndex):
+    """Session metadata index; deletions are recorded as ``deleted`` entries."""
+
+    def live_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Latest metadata of sessions that weren't deleted."""
+        return {sid: entry for sid, entry in self.entries().items() if not entry.get("deleted")}
+
+    def compact(self) -> None:
+        """Rewrite the index keeping only the latest entry per live session."""
+        entries = self.live_entries()
+        with self._lock:
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+
+    def rebuild(self) -> int:
+        """
+        Build the index by reading every session file (once, on upgrade).
+
+        Returns:
+            Number of sessions indexed
+        """
+        entries = []
+        for session_file in self.save_path.glob("session_*.json"):
+            try:
+                data = _read_session_data(session_file)
+            except Exception as e:
+                print(f"Warning: Failed to load session {session_file}: {e}")
+                continue
+            entries.append(_summarize(data))
+
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return len(entries)
+
+
+def _summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Index entry for a session (Session or its dict form)."""
+    if isinstance(data, Session):
+        data = asdict(data)
+    return {
+        "session_id": data["id"],
+        "created_at": data["created_at"],
+        "last_activity": data["last_activity"],
+        "message_count": len(data.get("conversation_history", [])),
+        "file_count": len(data.get("uploaded_files", []))
+    }
+
+
+# Managers with unflushed activity, flushed at interpreter exit
+_live_managers: "weakref.WeakSet[SessionManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    """Write pending activity updates before the interpreter exits."""
+    for manager in list(_live_managers):
+        try:
+            manager.flush()
+        except Exception:
+            pass
+
+
 class SessionManager:
     """Manages multiple concurrent user sessions."""
 
-    def __init__(self, storage_path: str = "./web_sessions"):
+    def __init__(
+        self,
+        storage_path: str = "./web_sessions",
+        search_index: Optional[ConversationSearchIndex] = None,
+        flush_interval: float = 5.0,
+        max_loaded: int = 256
+    ):
         """
         Initialize session manager.
 
         Args:
             storage_path: Directory for session storage
+            search_index: Optional index fed with conversation history updates
+            flush_interval: Seconds activity updates are coalesced before
+                being written (0 writes immediately)
+            max_loaded: Session bodies kept in memory
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.search_index = search_index
+        self.flush_interval = flush_interval
+        self.max_loaded = max_loaded
+
+        # Metadata of every session, from the index
+        self.index = WebSessionIndex(self.storage_path)
+        self.summaries: Dict[str, Dict[str, Any]] = {}
+
+        # Session bodies loaded so far (LRU)
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
 
-        # In-memory session cache
-        self.sessions: Dict[str, Session] = {}
+        # Sessions whose activity hasn't been written to the index yet
+        self._dirty: set = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._index_lines = 0
 
-        # Thread lock for concurrent access
-        self.lock = threading.Lock()
+        # Thread lock for concurrent access (re-entrant: public methods
+        # call each other while holding it)
+        self.lock = threading.RLock()
 
-        # Load existing sessions
+        # Load the session index
         self._load_all_sessions()
+        _live_managers.add(self)
+
+    def _session_file(self, session_id: str) -> Path:
+        return self.storage_path / f"session_{session_id}.json"
 
     def create_session(self, initial_settings: Optional[Dict] = None) -> str:
         """
@@ -82,7 +257,7 @@ class SessionManager:
                 agent_state={}
             )
 
-            self.sessions[session_id] = session
+            self._cache(session)
             self.save_session(session_id)
 
             return session_id
@@ -91,6 +266,9 @@ class SessionManager:
         """
         Get session by ID.
 
+        Loads the session body on first access. The activity timestamp is
+        updated in memory and written with the next flush.
+
         Args:
             session_id: Session ID
 
@@ -101,16 +279,9 @@ class SessionManager:
             KeyError: If session not found
         """
         with self.lock:
-            if session_id not in self.sessions:
-                # Try loading from disk
-                try:
-                    self._load_session_from_disk(session_id)
-                except FileNotFoundError:
-                    raise KeyError(f"Session {session_id} not found")
-
-            session = self.sessions[session_id]
+            session = self._load(session_id)
             session.update_activity()
-            self.save_session(session_id)
+            self._touch(session)
 
             return session
 
@@ -122,6 +293,9 @@ class SessionManager:
         """
         Update session fields.
 
+        Messages appended to ``conversation_history`` are appended to the
+        session's history log; other changes rewrite the session snapshot.
+
         Args:
             session_id: Session ID
             **kwargs: Fields to update
@@ -130,22 +304,54 @@ class SessionManager:
             KeyError: If session not found
         """
         with self.lock:
-            session = self.get_session(session_id)
+            session = self._load(session_id)
 
             # Update allowed fields
             allowed_fields = {
-                'conversation_history',
                 'uploaded_files',
                 'settings',
                 'agent_state'
             }
 
+            rewrite = False
             for key, value in kwargs.items():
                 if key in allowed_fields:
                     setattr(session, key, value)
+                    rewrite = True
 
             session.update_activity()
-            self.save_session(session_id)
+
+            if 'conversation_history' in kwargs:
+                history = list(kwargs['conversation_history'])
+                old = session.conversation_history
+                new_messages = history[len(old):]
+                session.conversation_history = history
+                if len(history) < len(old) or history[:len(old)] != old:
+                    rewrite = True  # Cleared or edited
+                elif new_messages and not rewrite:
+                    self._append_history(session, new_messages)
+
+            if rewrite:
+                self.save_session(session_id)
+            else:
+                # One index line next to the log append, so counts stay current
+                self._dirty.discard(session_id)
+                self.summaries[session_id] = _summarize(session)
+                self._write_index(self.summaries[session_id])
+
+            if 'conversation_history' in kwargs:
+                self._index_history(session)
+
+    def _append_history(self, session: Session, messages: List[Dict]) -> None:
+        """Append messages to a session's history log."""
+        log_path = _history_path(self._session_file(session.id))
+        lines = []
+        if not log_path.exists():
+            lines.append(json.dumps({"type": "log", "generation": self._generations.get(session.id, 0)}))
+        lines.extend(json.dumps({"type": "message", "message": message}) for message in messages)
+
+        with open(log_path, 'a') as f:
+            f.write("\n".join(lines) + "\n")
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -159,23 +365,34 @@ class SessionManager:
         """
         with self.lock:
             try:
-                # Remove from memory
-                if session_id in self.sessions:
-                    session = self.sessions[session_id]
+                session_file = self._session_file(session_id)
+                if session_id not in self.summaries and not session_file.exists():
+                    return False
 
-                    # Clean up uploaded files
-                    for file_path in session.uploaded_files:
-                        try:
-                            Path(file_path).unlink(missing_ok=True)
-                        except Exception:
-                            pass
+                # Clean up uploaded files
+                try:
+                    uploaded_files = self._load(session_id).uploaded_files
+                except Exception:
+                    uploaded_files = []
+                for file_path in uploaded_files:
+                    try:
+                        Path(file_path).unlink(missing_ok=True)
+                    except Exception:
+                        pass
 
-                    del self.sessions[session_id]
+                # Remove from memory
+                self.sessions.pop(session_id, None)
+                self.summaries.pop(session_id, None)
+                self._generations.pop(session_id, None)
+                self._dirty.discard(session_id)
 
                 # Remove from disk
-                session_file = self.storage_path / f"session_{session_id}.json"
-                if session_file.exists():
-                    session_file.unlink()
+                session_file.unlink(missing_ok=True)
+                _history_path(session_file).unlink(missing_ok=True)
+                self._write_index({"session_id": session_id, "deleted": True})
+
+                if self.search_index is not None:
+                    self.search_index.delete_session(SEARCH_SOURCE, session_id)
 
                 return True
 
@@ -192,13 +409,13 @@ class SessionManager:
         with self.lock:
             summaries = []
 
-            for session_id, session in self.sessions.items():
+            for session_id, summary in self._current_summaries().items():
                 summaries.append({
                     'id': session_id,
-                    'created_at': session.created_at,
-                    'last_activity': session.last_activity,
-                    'message_count': len(session.conversation_history),
-                    'file_count': len(session.uploaded_files)
+                    'created_at': summary['created_at'],
+                    'last_activity': summary['last_activity'],
+                    'message_count': summary['message_count'],
+                    'file_count': summary['file_count']
                 })
 
             # Sort by last activity (most recent first)
@@ -222,8 +439,8 @@ class SessionManager:
 
             # Find expired sessions
             expired_ids = []
-            for session_id, session in self.sessions.items():
-                last_activity = datetime.fromisoformat(session.last_activity)
+            for session_id, summary in self._current_summaries().items():
+                last_activity = datetime.fromisoformat(summary['last_activity'])
                 if last_activity < cutoff:
                     expired_ids.append(session_id)
 
@@ -238,17 +455,22 @@ class SessionManager:
         """
         Persist session to disk.
 
+        Writes a full snapshot (including conversation history) and drops
+        the history log it replaces.
+
         Args:
             session_id: Session ID
 
         Raises:
-            KeyError: If session not found
+            KeyError: If session not loaded
         """
         if session_id not in self.sessions:
             raise KeyError(f"Session {session_id} not found")
 
         session = self.sessions[session_id]
-        session_file = self.storage_path / f"session_{session_id}.json"
+        session_file = self._session_file(session_id)
+        generation = self._generations.get(session_id, 0) + 1
+        data = dict(asdict(session), log_generation=generation)
 
         # Atomic write using temp file
         with tempfile.NamedTemporaryFile(
@@ -256,11 +478,53 @@ class SessionManager:
             dir=self.storage_path,
             delete=False
         ) as tmp_file:
-            json.dump(asdict(session), tmp_file, indent=2)
+            json.dump(data, tmp_file, indent=2)
             tmp_path = tmp_file.name
 
-        # Atomic rename
+        # Atomic rename; a log surviving a crash here is from an older generation
         shutil.move(tmp_path, session_file)
+        _history_path(session_file).unlink(missing_ok=True)
+        self._generations[session_id] = generation
+
+        self._dirty.discard(session_id)
+        self.summaries[session_id] = _summarize(session)
+        self._write_index(self.summaries[session_id])
+
+    def _index_history(self, session: Session) -> None:
+        """
+        Replace a session's indexed conversation history.
+
+        Args:
+            session: Session whose history changed
+        """
+        if self.search_index is None:
+            return
+
+        try:
+            self.search_index.add_messages(
+                SEARCH_SOURCE, session.id, session.conversation_history, replace=True
+            )
+            self.search_index.record_file(
+                SEARCH_SOURCE, session.id, self._session_file(session.id)
+            )
+        except ConversationIndexError as e:
+            print(f"Warning: Failed to index session {session.id}: {e}")
+
+    def sync_search_index(self) -> int:
+        """
+        Index persisted sessions the search index hasn't seen yet.
+
+        Returns:
+            Number of session files (re)indexed
+        """
+        if self.search_index is None:
+            return 0
+
+        return self.search_index.sync_files(
+            SEARCH_SOURCE,
+            self.storage_path.glob("session_*.json"),
+            read_session_file
+        )
 
     def load_session(self, session_id: str) -> Session:
         """
@@ -275,7 +539,27 @@ class SessionManager:
         Raises:
             FileNotFoundError: If session file not found
         """
-        self._load_session_from_disk(session_id)
+        with self.lock:
+            self.sessions.pop(session_id, None)
+            self._load_session_from_disk(session_id)
+            return self.sessions[session_id]
+
+    def _load(self, session_id: str) -> Session:
+        """
+        Get a loaded session, reading it from disk if needed.
+
+        Raises:
+            KeyError: If session not found
+        """
+        session = self.sessions.get(session_id)
+        if session is not None:
+            self.sessions.move_to_end(session_id)
+            return session
+
+        try:
+            self._load_session_from_disk(session_id)
+        except FileNotFoundError:
+            raise KeyError(f"Session {session_id} not found")
         return self.sessions[session_id]
 
     def _load_session_from_disk(self, session_id: str) -> None:
@@ -288,29 +572,108 @@ class SessionManager:
         Raises:
             FileNotFoundError: If session file not found
         """
-        session_file = self.storage_path / f"session_{session_id}.json"
+        session_file = self._session_file(session_id)
 
         if not session_file.exists():
+            if self.summaries.pop(session_id, None) is not None:
+                self._write_index({"session_id": session_id, "deleted": True})
             raise FileNotFoundError(f"Session file not found: {session_file}")
 
-        with open(session_file, 'r') as f:
-            data = json.load(f)
+        data = _read_session_data(session_file)
+        self._generations[session_id] = data.pop("log_generation")
 
         session = Session(**data)
-        self.sessions[session_id] = session
+        summary = self.summaries.get(session_id)
+        if summary and summary["last_activity"] > session.last_activity:
+            session.last_activity = summary["last_activity"]  # Flushed to the index only
+        if summary is None:
+            self.summaries[session_id] = _summarize(session)
+            self._write_index(self.summaries[session_id])
+        self._cache(session)
+
+    def _cache(self, session: Session) -> None:
+        """Keep a session body in memory, dropping the least recently used."""
+        self.sessions[session.id] = session
+        self.sessions.move_to_end(session.id)
+        while len(self.sessions) > self.max_loaded:
+            session_id, evicted = self.sessions.popitem(last=False)
+            if session_id in self._dirty:
+                self.summaries[session_id] = _summarize(evicted)
 
     def _load_all_sessions(self) -> None:
-        """Load all existing sessions from disk."""
-        if not self.storage_path.exists():
-            return
+        """Load the session index (built from session files the first time)."""
+        if not self.index.path.exists():
+            self.index.rebuild()
+
+        self.summaries = self.index.live_entries()
+        self._index_lines = len(self.summaries)
+
+    # ========== Index ==========
+
+    def _current_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Index entries, updated from session bodies loaded in memory."""
+        summaries = dict(self.summaries)
+        for session_id, session in self.sessions.items():
+            if session_id in summaries:
+                summaries[session_id] = _summarize(session)
+        return summaries
+
+    def _touch(self, session: Session) -> None:
+        """Record a session's activity in the index with the next flush."""
+        self.summaries[session.id] = _summarize(session)
+        self._dirty.add(session.id)
+
+        if self.flush_interval <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _write_index(self, entry: Dict[str, Any]) -> None:
+        """Append an index entry, compacting the index when it's mostly stale."""
+        self.index.update(entry)
+        self._index_lines += 1
+        if self._index_lines > 2 * len(self.summaries) + 100:
+            self.index.compact()
+            self._index_lines = len(self.summaries)
+
+    def flush(self) -> int:
+        """
+        Write pending activity updates to the index.
 
-        for session_file in self.storage_path.glob("session_*.json"):
-            try:
-                # Extract session ID from filename
-                session_id = session_file.stem.replace("session_", "")
-                self._load_session_from_disk(session_id)
-            except Exception as e:
-                print(f"Warning: Failed to load session {session_file}: {e}")
+        Returns:
+            Number of sessions written
+        """
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            dirty, self._dirty = self._dirty, set()
+            if not self.storage_path.is_dir():
+                return 0  # Storage removed; nothing left to update
+
+            for session_id in dirty:
+                if session_id in self.sessions:
+                    self.summaries[session_id] = _summarize(self.sessions[session_id])
+                if session_id in self.summaries:
+                    self._write_index(self.summaries[session_id])
+            return len(dirty)
+
+    def close(self) -> None:
+        """Stop the flush timer and flush pending updates."""
+        with self.lock:
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+            if timer is not threading.current_thread():
+                timer.join()  # Already fired: let its flush finish first
+
+        self.flush()
+        _live_managers.discard(self)
+
+    # ========== Statistics ==========
 
     def get_session_count(self) -> int:
         """
@@ -320,7 +683,7 @@ class SessionManager:
             Session count
         """
         with self.lock:
-            return len(self.sessions)
+            return len(self.summaries)
 
     def clear_all_sessions(self) -> int:
         """
@@ -330,8 +693,8 @@ class SessionManager:
             Number of sessions deleted
         """
         with self.lock:
-            count = len(self.sessions)
-            session_ids = list(self.sessions.keys())
+            count = len(self.summaries)
+            session_ids = list(self.summaries.keys())
 
             for session_id in session_ids:
                 self.delete_session(session_id)
@@ -346,7 +709,8 @@ class SessionManager:
             Statistics dictionary
         """
         with self.lock:
-            if not self.sessions:
+            summaries = list(self._current_summaries().values())
+            if not summaries:
                 return {
                     'total_sessions': 0,
                     'total_messages': 0,
@@ -356,23 +720,16 @@ class SessionManager:
                     'newest_session': None
                 }
 
-            total_messages = sum(
-                len(s.conversation_history) for s in self.sessions.values()
-            )
-            total_files = sum(
-                len(s.uploaded_files) for s in self.sessions.values()
-            )
+            total_messages = sum(s['message_count'] for s in summaries)
+            total_files = sum(s['file_count'] for s in summaries)
 
-            sessions_by_date = sorted(
-                self.sessions.values(),
-                key=lambda s: s.created_at
-            )
+            created = sorted(s['created_at'] for s in summaries)
 
             return {
-                'total_sessions': len(self.sessions),
+                'total_sessions': len(summaries),
                 'total_messages': total_messages,
                 'total_files': total_files,
-                'avg_messages_per_session': total_messages / len(self.sessions),
-                'oldest_session': sessions_by_date[0].created_at if sessions_by_date else None,
-                'newest_session': sessions_by_date[-1].created_at if sessions_by_date else None
+                'avg_messages_per_session': total_messages / len(summaries),
+                'oldest_session': created[0],
+                'newest_session': created[-1]
             }
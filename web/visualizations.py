@@ -7,6 +7,9 @@ Generates interactive Plotly charts for:
 - Success rates
 - Reflection scores
 - Bottleneck analysis
+
+All charts of one refresh read the same memoized analytics snapshot
+(``PerformanceAnalytics.get_snapshot``) instead of rescanning the metrics.
 """
 
 import plotly.graph_objects as go
@@ -18,14 +21,21 @@ from typing import Dict, List, Any, Optional
 class MetonVisualizations:
     """Generate visualizations for web UI."""
 
-    def __init__(self, analytics=None):
+    def __init__(self, analytics=None, refresh_interval: float = 0.0):
         """
         Initialize visualizations.
 
         Args:
             analytics: PerformanceAnalytics instance (optional for testing)
+            refresh_interval: Seconds a snapshot is reused while metrics change
+                (web_ui.analytics.refresh_interval)
         """
         self.analytics = analytics
+        self.refresh_interval = refresh_interval
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Get the analytics snapshot shared by all charts."""
+        return self.analytics.get_snapshot(min_interval=self.refresh_interval)
 
     def create_performance_chart(self) -> go.Figure:
         """
@@ -38,7 +48,7 @@ class MetonVisualizations:
             return self._create_empty_chart("No analytics data available")
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             trend = dashboard.get("trends", {}).get("response_time_trend", [])
 
             if not trend:
@@ -89,7 +99,7 @@ class MetonVisualizations:
             return self._create_empty_chart("No analytics data available")
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             tools = dashboard.get("tools", {})
 
             if not tools:
@@ -130,7 +140,7 @@ class MetonVisualizations:
             return self._create_empty_gauge(0, "No Data")
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             success_rate = dashboard.get("overview", {}).get("success_rate", 0)
 
             # Convert to percentage
@@ -190,7 +200,7 @@ class MetonVisualizations:
             # Note: This requires analytics to track reflection scores over time
             # For now, we'll create a placeholder
 
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             reflection = dashboard.get("reflection", {})
             avg_score = reflection.get("avg_score", 0)
             count = reflection.get("count", 0)
@@ -241,7 +251,7 @@ class MetonVisualizations:
             })
 
         try:
-            bottlenecks = self.analytics.get_bottlenecks()
+            bottlenecks = self._snapshot()["bottlenecks"]
 
             if not bottlenecks:
                 return pd.DataFrame({
@@ -285,7 +295,7 @@ class MetonVisualizations:
             }
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             overview = dashboard.get("overview", {})
 
             return {
@@ -316,7 +326,7 @@ class MetonVisualizations:
             return self._create_empty_chart("No analytics data available")
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             query_types = dashboard.get("query_types", {})
 
             if not query_types:
@@ -359,7 +369,7 @@ class MetonVisualizations:
             })
 
         try:
-            dashboard = self.analytics.get_dashboard()
+            dashboard = self._snapshot()["dashboard"]
             tools = dashboard.get("tools", {})
 
             if not tools: